@@ -1,15 +1,14 @@
-import glob
+"""Turn escaped backticks and ${ back into template syntax in ebook-pack.
 
-for file in glob.glob('/home/rk13/RK13CODE/POWERPOST/CYBER-CANVAS-ELECTRON/src/packs/ebook-pack/*.js'):
-    with open(file, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    # Replace literal \` with `
-    content = content.replace('\\`', '`')
-    # Replace literal \${ with ${
-    content = content.replace('\\${', '${')
-    
-    with open(file, 'w', encoding='utf-8') as f:
-        f.write(content)
-    
-print("Fixed all files")
+Shortcut for ``python -m packtools rewrite --passes unescape_literals src/packs/ebook-pack``;
+files of 64 MB and more are streamed in chunks rather than read whole.
+"""
+import os
+import sys
+
+from packtools.cli import main
+from packtools.engine import PACKS_DIR
+
+if __name__ == "__main__":
+    args = sys.argv[1:] or [os.path.join(PACKS_DIR, "ebook-pack")]
+    sys.exit(main(["rewrite", "--passes", "unescape_literals", *args]))
@@ -99,15 +99,39 @@ app.whenReady().then(() => {
 // ─── TikTok Intelligence Bridge (WebSocket Server) ─────────────────────────
 
 let tiktokBridgeWss = null;
+let tiktokCoalescer = null;
 const TIKTOK_BRIDGE_PORT = 7890;
+// Ventana en ms para agrupar y deduplicar VIDEO/PROFILE/TREND_DATA (0: un IPC por mensaje)
+const TIKTOK_COALESCE_MS = Number(process.env.CYBERCANVAS_TIKTOK_COALESCE_MS ?? 100);
+const TIKTOK_STATS_INTERVAL_MS = 10000;
 
 function startTikTokBridge() {
     try {
         const { WebSocketServer } = require('ws');
+        const BridgeCoalescer = require('./src/services/BridgeCoalescer');
         tiktokBridgeWss = new WebSocketServer({ port: TIKTOK_BRIDGE_PORT });
+        tiktokCoalescer = new BridgeCoalescer(forwardExtensionEvents, {
+            windowMs: TIKTOK_COALESCE_MS,
+            onFlush: acknowledgeProbes
+        });
+
+        // Mensajes crudos de la extensión, para reproducirlos con `python -m packtools bridge-load`
+        const recordPath = process.env.CYBERCANVAS_TIKTOK_RECORD;
+        const recorder = recordPath ? fs.createWriteStream(recordPath, { flags: 'a' }) : null;
+
+        // Un resumen periódico en lugar de un log por mensaje
+        let lastReceived = 0;
+        setInterval(() => {
+            const stats = tiktokCoalescer.stats;
+            if (stats.received === lastReceived) return;
+            lastReceived = stats.received;
+            console.log(`[TikTok Bridge] ${stats.received} messages → ${stats.delivered} events in ` +
+                `${stats.batches} IPC sends (${stats.duplicates} duplicates merged)`);
+        }, TIKTOK_STATS_INTERVAL_MS).unref();
 
         tiktokBridgeWss.on('listening', () => {
-            console.log(`[TikTok Bridge] ✅ WebSocket server running on ws://localhost:${TIKTOK_BRIDGE_PORT}`);
+            console.log(`[TikTok Bridge] ✅ WebSocket server running on ws://localhost:${TIKTOK_BRIDGE_PORT}` +
+                ` (coalescing: ${TIKTOK_COALESCE_MS > 0 ? TIKTOK_COALESCE_MS + ' ms' : 'off'})`);
         });
 
         tiktokBridgeWss.on('connection', (ws) => {
@@ -122,13 +146,21 @@ function startTikTokBridge() {
             ws.send(JSON.stringify({ type: 'APP_READY', version: '1.0.0' }));
 
             ws.on('message', (rawData) => {
+                let msg;
                 try {
-                    const msg = JSON.parse(rawData.toString());
-                    console.log('[TikTok Bridge] Message received:', msg.type);
-                    handleExtensionMessage(ws, msg);
+                    msg = JSON.parse(rawData.toString());
                 } catch (e) {
                     console.error('[TikTok Bridge] Bad message:', e.message);
+                    return;
                 }
+                if (recorder) recorder.write(rawData.toString() + '\n');
+
+                if (msg.type === 'EXTENSION_HELLO') {
+                    console.log('[TikTok Bridge] Extension hello, version:', msg.version);
+                    return;
+                }
+                // probeId: mensajes del generador de carga, que espera un BRIDGE_ACK
+                tiktokCoalescer.push(msg, msg.probeId !== undefined ? { ws, probeId: msg.probeId } : undefined);
             });
 
             ws.on('close', () => {
@@ -152,39 +184,51 @@ function startTikTokBridge() {
     }
 }
 
-function handleExtensionMessage(ws, msg) {
+// Entrega de BridgeCoalescer: TREND_DATA, VIDEO_DATA y PROFILE_DATA salen como un lote
+// por IPC; los tipos sin clave (VIRAL_VIDEO, GENERATE_REQUEST) el coalescer ya los
+// entrega de uno en uno, así que siguen yendo mensaje a mensaje por su canal de siempre
+function forwardExtensionEvents(type, items) {
     if (!mainWindow) return;
+    const send = (channel) => items.forEach(msg => mainWindow.webContents.send(channel, msg));
 
-    switch (msg.type) {
-        case 'EXTENSION_HELLO':
-            console.log('[TikTok Bridge] Extension hello, version:', msg.version);
-            break;
-
+    switch (type) {
         case 'TREND_DATA':
             // Forward trend data to renderer (Studio will inject into AI prompt)
-            mainWindow.webContents.send('tiktok-trend-data', msg);
+            mainWindow.webContents.send('tiktok-trend-batch', items);
             break;
 
         case 'VIRAL_VIDEO':
             // Forward viral video hook/data to renderer
-            mainWindow.webContents.send('tiktok-viral-video', msg);
+            send('tiktok-viral-video');
             break;
 
         case 'VIDEO_DATA':
-            mainWindow.webContents.send('tiktok-video-data', msg);
+            mainWindow.webContents.send('tiktok-video-batch', items);
             break;
 
         case 'PROFILE_DATA':
-            mainWindow.webContents.send('tiktok-profile-data', msg);
+            mainWindow.webContents.send('tiktok-profile-batch', items);
             break;
 
         case 'GENERATE_REQUEST':
             // Extension requests content generation with trend signal
-            mainWindow.webContents.send('tiktok-generate-request', msg);
+            send('tiktok-generate-request');
             break;
 
         default:
-            console.log('[TikTok Bridge] Unknown message type:', msg.type);
+            console.log('[TikTok Bridge] Unknown message type:', type);
+    }
+}
+
+// Confirma al cliente los probeId cuyo evento ya se envió al renderer
+function acknowledgeProbes(tags) {
+    const byClient = new Map();
+    for (const { ws, probeId } of tags) {
+        if (!byClient.has(ws)) byClient.set(ws, []);
+        byClient.get(ws).push(probeId);
+    }
+    for (const [ws, probeIds] of byClient) {
+        if (ws.readyState === 1) ws.send(JSON.stringify({ type: 'BRIDGE_ACK', probeIds }));
     }
 }
 
@@ -206,7 +250,9 @@ ipcMain.handle('tiktok-bridge-status', () => {
     return {
         running: !!tiktokBridgeWss,
         port: TIKTOK_BRIDGE_PORT,
-        clients: tiktokBridgeWss ? tiktokBridgeWss.clients.size : 0
+        clients: tiktokBridgeWss ? tiktokBridgeWss.clients.size : 0,
+        coalesceMs: TIKTOK_COALESCE_MS,
+        stats: tiktokCoalescer ? { ...tiktokCoalescer.stats } : null
     };
 });
 
@@ -256,6 +302,160 @@ ipcMain.handle('save-env-key', async (event, { provider, key }) => {
     return true;
 });
 
+// ─── Helper: Assets locales → data URIs (memoizado) ───
+// Los templates referencian ../assets/kr-clidn-logo.png o ../assets/store/<hash>.png
+// (assets des-inlineados por `python -m packtools`). Se codifican una vez por archivo
+// y mtime, no en cada slide exportado.
+const ASSET_URL_REGEX = /\.{1,2}\/assets\/((?:store\/)?[\w.-]+\.(?:png|jpe?g|gif|webp|avif|svg|ico|woff2?|ttf|otf))/g;
+const ASSET_MIME = {
+    png: 'image/png', jpg: 'image/jpeg', jpeg: 'image/jpeg', gif: 'image/gif', webp: 'image/webp',
+    avif: 'image/avif', svg: 'image/svg+xml', ico: 'image/x-icon',
+    woff: 'font/woff', woff2: 'font/woff2', ttf: 'font/ttf', otf: 'font/otf'
+};
+const assetDataURICache = new Map(); // ruta -> { mtimeMs, uri }
+
+function assetDataURI(relPath) {
+    return fileDataURI(path.join(__dirname, 'assets', relPath));
+}
+
+function fileDataURI(assetPath) {
+    let stat;
+    try {
+        stat = fs.statSync(assetPath);
+    } catch (e) {
+        return null;
+    }
+    const cached = assetDataURICache.get(assetPath);
+    if (cached && cached.mtimeMs === stat.mtimeMs) return cached.uri;
+
+    const ext = path.extname(assetPath).slice(1).toLowerCase();
+    const uri = `data:${ASSET_MIME[ext] || 'application/octet-stream'};base64,` + fs.readFileSync(assetPath).toString('base64');
+    assetDataURICache.set(assetPath, { mtimeMs: stat.mtimeMs, uri });
+    return uri;
+}
+
+function inlineAssetURLs(html) {
+    if (!html.includes('assets/')) return html;
+    return html.replace(ASSET_URL_REGEX, (match, relPath) => assetDataURI(relPath) || match);
+}
+
+// ─── Helper: Fuentes locales subseteadas para exportación ───
+// `python -m packtools fonts` recorta las fuentes de src/assets/fonts a los caracteres
+// que usan los packs (WOFF2 en src/assets/fonts/subset + manifest.json). Cada slide
+// lleva como data URI solo el subset de las familias que nombra; la fuente completa
+// se añade únicamente si el slide tiene caracteres fuera del subset que la fuente sí
+// tiene (font_ranges): para emoji o CJK no aporta nada y el navegador usa otra fuente.
+const FONT_DIR = path.join(__dirname, 'src', 'assets', 'fonts');
+const FONT_MANIFEST = path.join(FONT_DIR, 'subset', 'manifest.json');
+let fontManifestCache = { mtimeMs: null, fonts: [] };
+
+function loadFontManifest() {
+    let stat;
+    try {
+        stat = fs.statSync(FONT_MANIFEST);
+    } catch (e) {
+        return [];
+    }
+    if (fontManifestCache.mtimeMs === stat.mtimeMs) return fontManifestCache.fonts;
+
+    let fonts = [];
+    try {
+        const manifest = JSON.parse(fs.readFileSync(FONT_MANIFEST, 'utf8'));
+        fonts = Object.entries(manifest.fonts || {}).map(([file, entry]) => ({ file, ...entry }));
+    } catch (e) {
+        console.warn('[Fonts] manifest.json inválido, se exporta sin subsets:', e.message);
+    }
+    fontManifestCache = { mtimeMs: stat.mtimeMs, fonts };
+    return fonts;
+}
+
+function rangesCover(ranges, cp) {
+    let lo = 0, hi = ranges.length - 1;
+    while (lo <= hi) {
+        const mid = (lo + hi) >> 1;
+        if (cp < ranges[mid][0]) hi = mid - 1;
+        else if (cp > ranges[mid][1]) lo = mid + 1;
+        else return true;
+    }
+    return false;
+}
+
+function exportFontFaces(html) {
+    const fonts = loadFontManifest().filter(font => font.families.some(family => html.includes(family)));
+    if (fonts.length === 0) return '';
+
+    // Caracteres no ASCII del slide (el ASCII imprimible siempre está en el subset)
+    const extra = new Set();
+    for (const ch of html) {
+        const cp = ch.codePointAt(0);
+        if (cp > 0x7e) extra.add(cp);
+    }
+
+    const rules = [];
+    for (const font of fonts) {
+        const face = (family, src, range) => `@font-face { font-family: '${family}'; src: ${src}; ` +
+            `font-weight: ${font.weight}; font-style: ${font.style}; font-display: block;${range ? ` unicode-range: ${range};` : ''} }`;
+        const subsetURI = fileDataURI(path.join(FONT_DIR, 'subset', font.output));
+        if (!subsetURI) continue;
+        // Manifiestos antiguos sin font_ranges: cualquier carácter fuera del subset cuenta
+        const complete = [...extra].every(cp => rangesCover(font.ranges, cp) ||
+            (font.font_ranges !== undefined && !rangesCover(font.font_ranges, cp)));
+        const fullURI = complete ? null : fileDataURI(path.join(FONT_DIR, font.file));
+        for (const family of font.families) {
+            // Orden: completa primero; el navegador prefiere la última cara cuyo unicode-range cubre el carácter
+            if (fullURI) rules.push(face(family, `url(${fullURI})`));
+            rules.push(face(family, `url(${subsetURI}) format('woff2')`, font.unicode_range));
+        }
+    }
+    return rules.length ? `<style id="export-fonts">\n${rules.join('\n')}\n</style>` : '';
+}
+
+// ─── Helper: Sprite SVG de iconos offline ───
+// El pass icon_sprite convierte Iconify y Material Icons en <svg><use href="#kr-i-NOMBRE">;
+// `python -m packtools icons` genera assets/icons/sprite.svg con esos símbolos. Al exportar
+// se incrustan solo los símbolos que usa el slide: cero peticiones de red para iconos.
+const ICON_SPRITE_PATH = path.join(__dirname, 'assets', 'icons', 'sprite.svg');
+const ICON_REF_REGEX = /href="#(kr-i-\w+)"/g;
+let iconSpriteCache = { mtimeMs: null, symbols: new Map() };
+
+function loadIconSprite() {
+    let stat;
+    try {
+        stat = fs.statSync(ICON_SPRITE_PATH);
+    } catch (e) {
+        return iconSpriteCache.symbols;
+    }
+    if (iconSpriteCache.mtimeMs === stat.mtimeMs) return iconSpriteCache.symbols;
+
+    const symbols = new Map();
+    const sprite = fs.readFileSync(ICON_SPRITE_PATH, 'utf8');
+    for (const match of sprite.matchAll(/<symbol id="([^"]+)"[\s\S]*?<\/symbol>/g)) {
+        symbols.set(match[1], match[0]);
+    }
+    iconSpriteCache = { mtimeMs: stat.mtimeMs, symbols };
+    return symbols;
+}
+
+function exportIconSprite(html) {
+    if (!html.includes('#kr-i-')) return '';
+    const symbols = loadIconSprite();
+    const used = new Map();
+    const pending = [...html.matchAll(ICON_REF_REGEX)].map(m => m[1]);
+    while (pending.length) {
+        const id = pending.pop();
+        if (used.has(id) || !symbols.has(id)) continue;
+        const symbol = symbols.get(id);
+        used.set(id, symbol);
+        // Los duplicados del sprite son <use> de otro símbolo
+        for (const m of symbol.matchAll(ICON_REF_REGEX)) pending.push(m[1]);
+    }
+    if (used.size === 0) {
+        console.warn('[Icons] El slide usa iconos del sprite pero assets/icons/sprite.svg no los tiene (python -m packtools icons)');
+        return '';
+    }
+    return `<svg xmlns="http://www.w3.org/2000/svg" style="display:none" aria-hidden="true">${[...used.values()].join('')}</svg>`;
+}
+
 // ─── Helper: Preparar HTML para exportación (idéntico al previsualizador) ───
 function prepareExportHTML(html, width, height) {
     // Inyectar estilos de reset directamente en el HTML del usuario
@@ -279,29 +479,29 @@ function prepareExportHTML(html, width, height) {
     ::-webkit-scrollbar { display: none !important; }
 </style>`;
 
-    // ── LOGO REPLACEMENT: Convert relative paths to Base64 data URIs ──
-    // This ensures logos render correctly in Puppeteer's isolated context
-    let finalHTML = html;
+    // ── ASSETS: ../assets/... (logos y assets/store) → data URIs ──
+    // Puppeteer no resuelve rutas relativas; cada archivo se codifica una sola vez
+    let finalHTML = inlineAssetURLs(html);
 
-    // IMPORTANT: Replace small logo FIRST (its name is a superset of the full logo name)
-    const logoSmallPath = path.join(__dirname, 'assets', 'kr-clidn-logo-small.png');
-    if (fs.existsSync(logoSmallPath) && finalHTML.includes('kr-clidn-logo-small.png')) {
-        const logoSmallB64 = 'data:image/png;base64,' + fs.readFileSync(logoSmallPath).toString('base64');
-        finalHTML = finalHTML.replace(/\.\.\/assets\/kr-clidn-logo-small\.png/g, logoSmallB64);
-    }
-
-    // Then replace full-size logo
-    const logoPath = path.join(__dirname, 'assets', 'kr-clidn-logo.png');
-    if (fs.existsSync(logoPath) && finalHTML.includes('kr-clidn-logo.png')) {
-        const logoB64 = 'data:image/png;base64,' + fs.readFileSync(logoPath).toString('base64');
-        finalHTML = finalHTML.replace(/\.\.\/assets\/kr-clidn-logo\.png/g, logoB64);
+    // ── FUENTES: subsets WOFF2 locales de las familias que usa el slide ──
+    const fontFaces = exportFontFaces(html);
+    if (fontFaces) {
+        if (finalHTML.includes('<head>')) {
+            finalHTML = finalHTML.replace('<head>', '<head>' + fontFaces);
+        } else {
+            finalHTML = fontFaces + finalHTML;
+        }
     }
 
-    // --- PATCH: Ensure Iconify is present for export ---
-    const iconifyScript = '<script src="https://code.iconify.design/3/3.1.0/iconify.min.js"></script>';
+    // ── ICONOS: símbolos del sprite offline; Iconify (CDN) solo si quedan spans sin convertir ──
+    const iconSprite = exportIconSprite(finalHTML);
+    const usesIconify = finalHTML.includes('class="iconify"') || finalHTML.includes('data-icon=');
+    const iconifyScript = usesIconify
+        ? '<script src="https://code.iconify.design/3/3.1.0/iconify.min.js"></script>'
+        : '';
 
     // 1. Inyectar Script si falta
-    if (!finalHTML.includes('iconify.min.js')) {
+    if (usesIconify && !finalHTML.includes('iconify.min.js')) {
         if (finalHTML.includes('<head>')) {
             finalHTML = finalHTML.replace('<head>', '<head>' + iconifyScript);
         } else if (finalHTML.includes('<body>')) {
@@ -312,13 +512,13 @@ function prepareExportHTML(html, width, height) {
     // 2. Inyectar Estilos
     if (finalHTML.includes('<!DOCTYPE') || finalHTML.includes('<html')) {
         if (finalHTML.includes('</body>')) {
-            finalHTML = finalHTML.replace('</body>', exportStyles + '</body>');
+            finalHTML = finalHTML.replace('</body>', exportStyles + iconSprite + '</body>');
         } else {
-            finalHTML = finalHTML + exportStyles;
+            finalHTML = finalHTML + exportStyles + iconSprite;
         }
     } else {
         // Fallback for raw content: Wrap in full HTML + Script + Styles
-        finalHTML = `<!DOCTYPE html><html><head><meta charset="UTF-8">${iconifyScript}</head><body>${html}${exportStyles}</body></html>`;
+        finalHTML = `<!DOCTYPE html><html><head><meta charset="UTF-8">${iconifyScript}</head><body>${finalHTML}${exportStyles}${iconSprite}</body></html>`;
     }
 
     return finalHTML;
@@ -422,7 +622,7 @@ ipcMain.handle('save-canvas-png', async (event, { dataURL, folderName, fileName
     }
 });
 
-ipcMain.handle('export-batch', async (event, { slides, width, height, format, title }) => {
+ipcMain.handle('export-batch', async (event, { slides, width, height, format, title, concurrency }) => {
     const puppeteer = require('puppeteer');
     const fs = require('fs');
     const path = require('path');
@@ -442,66 +642,85 @@ ipcMain.handle('export-batch', async (event, { slides, width, height, format, ti
             fs.mkdirSync(outputDir, { recursive: true });
         }
 
-        // 2. Iniciar navegador (una sola vez)
-        const browser = await puppeteer.launch({
-            headless: 'new',
-            args: ['--no-sandbox', '--disable-setuid-sandbox', '--font-render-hinting=none']
-        });
-
-        const page = await browser.newPage();
-
-        // Configuración de viewport exacta
-        await page.setViewport({
-            width,
-            height,
-            deviceScaleFactor: 1
-        });
+        // 2. Caché de renders: los slides cuyo HTML final no cambió se copian sin Puppeteer
+        const RenderCache = require('./src/services/RenderCache');
+        const ExportScheduler = require('./src/services/ExportScheduler');
+        const { SlideRenderer } = require('./src/services/BrowserRenderers');
+        const cache = RenderCache.open();
+        const saveCache = () => {
+            try {
+                cache.save();
+            } catch (e) {
+                console.warn('[Batch] No se pudo escribir el índice de la caché de renders:', e.message);
+            }
+        };
 
         let count = 0;
+        let cached = 0;
         const total = slides.length;
         const ext = format.toLowerCase();
 
         console.log(`[Batch] Exportando ${total} imágenes a ${outputDir}...`);
 
-        // 3. Iterar y renderizar
+        // 3. Preparar cada slide; los que no están en caché van al scheduler
+        const tasks = [];
         for (let i = 0; i < total; i++) {
-            const html = slides[i];
             const slideNum = String(i + 1).padStart(2, '0');
             const filename = `slide_${slideNum}.${ext}`;
             const outputPath = path.join(outputDir, filename);
 
             // ─── Renderizado directo (idéntico al previsualizador) ───
-            const finalHTML = prepareExportHTML(html, width, height);
-
-            // Optimización: Usar 'domcontentloaded' + espera explícita de fuentes es más seguro que 'networkidle0' para evitar timeouts
-            await page.setContent(finalHTML, { waitUntil: 'domcontentloaded', timeout: 30000 });
-
-            // Esperar carga de fuentes y renderizado completo
-            await page.evaluate(async () => {
-                await document.fonts.ready;
-                // Double check for Black Ops One specifically if present
-                if (document.fonts.check('1em "Black Ops One"')) return;
-                // Force wait if not ready
-                await new Promise(r => setTimeout(r, 1000));
-            }).catch(() => { });
-
-            // Optimización de tiempos de espera
-            if (i === 0) await new Promise(resolve => setTimeout(resolve, 3000)); // Primera vez: 3s suficentes
-            else await new Promise(resolve => setTimeout(resolve, 500));  // Siguientes: 0.5s (muy rápido)
+            const finalHTML = prepareExportHTML(slides[i], width, height);
+
+            const cacheKey = RenderCache.key(finalHTML, width, height, ext);
+            const hit = cache.get(cacheKey);
+            if (hit) {
+                fs.copyFileSync(hit, outputPath);
+                console.log(`[Batch] Guardado (caché): ${filename}`);
+                cached++;
+                count++;
+                continue;
+            }
+            tasks.push({ html: finalHTML, outputPath, filename, cacheKey });
+        }
 
-            await page.screenshot({
-                path: outputPath,
-                type: ext === 'jpg' ? 'jpeg' : ext,
-                quality: ext === 'png' ? undefined : 100,
-                omitBackground: false
+        // 4. Renderizar en paralelo: una página por worker, resultados en orden
+        if (tasks.length > 0) {
+            const browser = await puppeteer.launch({
+                headless: 'new',
+                args: ['--no-sandbox', '--disable-setuid-sandbox', '--font-render-hinting=none']
             });
-
-            console.log(`[Batch] Guardado: ${filename}`);
-            count++;
+            try {
+                const scheduler = new ExportScheduler(
+                    new SlideRenderer(browser, { width, height, format: ext }),
+                    {
+                        concurrency,
+                        onProgress: ({ worker, done, workerDone }) => {
+                            event.sender.send('export-progress', {
+                                kind: 'batch', worker, workerDone, done: cached + done, total
+                            });
+                        }
+                    }
+                );
+                const { perWorker } = await scheduler.run(tasks, (outputPath, index) => {
+                    const task = tasks[index];
+                    try {
+                        cache.put(task.cacheKey, outputPath, { width, height, format: ext });
+                    } catch (e) {
+                        console.warn('[Batch] No se pudo guardar en la caché de renders:', e.message);
+                    }
+                    console.log(`[Batch] Guardado: ${task.filename}`);
+                    count++;
+                });
+                console.log(`[Batch] Slides por worker: ${perWorker.join(', ')}`);
+            } finally {
+                await browser.close();
+                saveCache();
+            }
         }
-
-        await browser.close();
-        return { success: true, count, path: outputDir };
+        saveCache();
+        console.log(`[Batch] ${count - cached} renderizados, ${cached} desde la caché`);
+        return { success: true, count, cached, path: outputDir };
 
     } catch (error) {
         console.error("Batch Export Error:", error);
@@ -510,14 +729,16 @@ ipcMain.handle('export-batch', async (event, { slides, width, height, format, ti
 });
 
 // IPC: Exportar video (FRAME-BY-FRAME HD)
-ipcMain.handle('export-video', async (event, { html, width, height, duration }) => {
+ipcMain.handle('export-video', async (event, { html, width, height, duration, concurrency }) => {
     const { chromium } = require('playwright');
-    const { execSync } = require('child_process');
+    const { spawn } = require('child_process');
+    const ExportScheduler = require('./src/services/ExportScheduler');
+    const { FrameRenderer } = require('./src/services/BrowserRenderers');
 
+    const tempDir = path.join(require('os').tmpdir(), `cybercanvas_${Date.now()}`);
+    let browser = null;
     try {
-        const tempDir = path.join(require('os').tmpdir(), `cybercanvas_${Date.now()}`);
-        const framesDir = path.join(tempDir, 'frames');
-        fs.mkdirSync(framesDir, { recursive: true });
+        fs.mkdirSync(tempDir, { recursive: true });
 
         // HTML optimizado
         const professionalHTML = `
@@ -548,8 +769,68 @@ ${html}
         const htmlPath = path.join(tempDir, 'content.html');
         fs.writeFileSync(htmlPath, professionalHTML);
 
+        // Salida
+        const outputDir = path.join(require('os').homedir(), 'Videos', 'CyberCanvas');
+        if (!fs.existsSync(outputDir)) {
+            fs.mkdirSync(outputDir, { recursive: true });
+        }
+
+        const timestamp = new Date().toISOString().replace(/[:.]/g, '-').slice(0, 19);
+        const outputPath = path.join(outputDir, `cybercanvas_${width}x${height}_${timestamp}.mp4`);
+
+        // 30fps para calidad óptima; los frames se reparten en bloques entre varias páginas
+        const fps = 30;
+        const totalFrames = duration * fps;
+        const FRAMES_PER_CHUNK = 8;
+        const chunks = [];
+        for (let start = 0; start < totalFrames; start += FRAMES_PER_CHUNK) {
+            chunks.push({ start, count: Math.min(FRAMES_PER_CHUNK, totalFrames - start) });
+        }
+
+        // FFmpeg: PNG por stdin (sin frames temporales en disco) → MP4 HD con colores vibrantes
+        const ffmpeg = spawn('ffmpeg', [
+            '-y',
+            '-f', 'image2pipe',
+            '-framerate', String(fps),
+            '-c:v', 'png',
+            '-i', '-',
+            // Filtro para mejorar color y nitidez
+            '-vf', 'eq=saturation=1.1:contrast=1.05,unsharp=3:3:0.5',
+            '-c:v', 'libx264',
+            '-preset', 'slow',
+            '-crf', '12',                 // Más calidad (menor = mejor)
+            '-pix_fmt', 'yuv420p',
+            '-profile:v', 'high',
+            '-level:v', '4.2',
+            '-b:v', '25M',                // Bitrate alto
+            '-maxrate', '30M',
+            '-bufsize', '40M',
+            '-colorspace', 'bt709',       // Preservar colores
+            '-color_primaries', 'bt709',
+            '-color_trc', 'bt709',
+            '-movflags', '+faststart',
+            outputPath
+        ], { stdio: ['pipe', 'ignore', 'pipe'] });
+
+        let ffmpegLog = '';
+        ffmpeg.stderr.on('data', chunk => { ffmpegLog = (ffmpegLog + chunk).slice(-2000); });
+        const ffmpegDone = new Promise((resolve, reject) => {
+            ffmpeg.on('error', reject);
+            ffmpeg.on('close', code => (code === 0
+                ? resolve()
+                : reject(new Error(`ffmpeg terminó con código ${code}: ${ffmpegLog.trim().split('\n').pop()}`))));
+        });
+        ffmpegDone.catch(() => { }); // Se espera más abajo; evita el rechazo sin manejar
+        ffmpeg.stdin.on('error', () => { }); // EPIPE si ffmpeg muere: lo reporta ffmpegDone
+
+        // Respeta la contrapresión del pipe: no se acumulan frames en memoria
+        const writeFrame = (buffer) => new Promise((resolve, reject) => {
+            if (ffmpeg.stdin.destroyed) return reject(new Error('ffmpeg cerró la entrada'));
+            ffmpeg.stdin.write(buffer, error => (error ? reject(error) : resolve()));
+        });
+
         // Lanzar navegador SIN grabación de video nativa
-        const browser = await chromium.launch({
+        browser = await chromium.launch({
             headless: true,
             args: [
                 '--no-sandbox',
@@ -566,69 +847,38 @@ ${html}
             viewport: { width, height }
         });
 
-        const page = await context.newPage();
-        await page.goto(`file://${htmlPath}`, { waitUntil: 'networkidle' });
-
-        // Esperar carga completa
-        await page.waitForTimeout(2000);
-
-        // Capturar frames (30fps para calidad óptima)
-        const fps = 30;
-        const totalFrames = duration * fps;
-        const frameInterval = 1000 / fps;
+        const scheduler = new ExportScheduler(
+            new FrameRenderer(context, { url: `file://${htmlPath}`, fps }),
+            {
+                concurrency,
+                onProgress: ({ worker, workerDone, done, total }) => {
+                    event.sender.send('export-progress', {
+                        kind: 'video', worker, workerDone,
+                        done: Math.min(totalFrames, done * FRAMES_PER_CHUNK), total: totalFrames,
+                        chunks: { done, total }
+                    });
+                }
+            }
+        );
 
-        for (let i = 0; i < totalFrames; i++) {
-            const framePath = path.join(framesDir, `frame_${String(i).padStart(5, '0')}.png`);
-            await page.screenshot({
-                path: framePath,
-                type: 'png'
+        try {
+            // Los bloques llegan en orden: cada frame va directo al encoder
+            await scheduler.run(chunks, async (frames) => {
+                for (const frame of frames) await writeFrame(frame);
             });
-            await page.waitForTimeout(frameInterval);
+        } catch (error) {
+            ffmpeg.kill('SIGKILL');
+            throw error;
         }
-
-        await browser.close();
-
-        // Crear video HD con FFmpeg
-        const outputDir = path.join(require('os').homedir(), 'Videos', 'CyberCanvas');
-        if (!fs.existsSync(outputDir)) {
-            fs.mkdirSync(outputDir, { recursive: true });
-        }
-
-        const timestamp = new Date().toISOString().replace(/[:.]/g, '-').slice(0, 19);
-        const outputPath = path.join(outputDir, `cybercanvas_${width}x${height}_${timestamp}.mp4`);
-
-        // FFmpeg: PNG frames → MP4 HD con colores vibrantes
-        const ffmpegCmd = [
-            'ffmpeg',
-            '-y',
-            `-framerate ${fps}`,
-            `-i "${framesDir}/frame_%05d.png"`,
-            // Filtro para mejorar color y nitidez
-            '-vf "eq=saturation=1.1:contrast=1.05,unsharp=3:3:0.5"',
-            '-c:v libx264',
-            '-preset slow',
-            '-crf 12',                    // Más calidad (menor = mejor)
-            '-pix_fmt yuv420p',
-            '-profile:v high',
-            '-level:v 4.2',
-            '-b:v 25M',                   // Bitrate alto
-            '-maxrate 30M',
-            '-bufsize 40M',
-            '-colorspace bt709',          // Preservar colores
-            '-color_primaries bt709',
-            '-color_trc bt709',
-            '-movflags +faststart',
-            `"${outputPath}"`
-        ].join(' ');
-
-        execSync(ffmpegCmd, { stdio: 'ignore' });
-
-        // Limpiar
-        fs.rmSync(tempDir, { recursive: true, force: true });
+        ffmpeg.stdin.end();
+        await ffmpegDone;
 
         return { success: true, path: outputPath };
     } catch (error) {
         return { success: false, error: error.message };
+    } finally {
+        if (browser) await browser.close().catch(() => { });
+        fs.rmSync(tempDir, { recursive: true, force: true });
     }
 });
 
@@ -785,90 +1035,90 @@ ipcMain.handle('generate-seo', async (event, { tema, nicho, apiKey }) => {
     }
 });
 
-// IPC: Cargar Packs (nueva estructura plana)
-// IPC: Cargar Packs (nueva estructura plana) - Robustez mejorada
-ipcMain.handle('load-packs', async () => {
-    try {
-        // En producción (asar) o desarrollo, ajustar ruta correctamente
-        // Se asume que src/packs está al mismo nivel que main.js o dentro de resources
-        const packsDir = path.join(__dirname, 'src', 'packs');
+// Escaneo directo de src/packs: solo si falta el bundle o está desactualizado
+function scanPacksDir(packsDir) {
+    const packFolders = fs.readdirSync(packsDir, { withFileTypes: true })
+        .filter(e => e.isDirectory());
 
-        if (!fs.existsSync(packsDir)) {
-            console.error('Directorio de packs no encontrado:', packsDir);
-            return [];
-        }
+    const packs = [];
 
-        const packFolders = fs.readdirSync(packsDir, { withFileTypes: true })
-            .filter(e => e.isDirectory());
+    for (const folder of packFolders) {
+        const packPath = path.join(packsDir, folder.name);
+        const packJsonPath = path.join(packPath, 'pack.json');
 
-        const packs = [];
+        // 1. Cada pack DEBE tener un pack.json
+        if (!fs.existsSync(packJsonPath)) continue;
 
-        for (const folder of packFolders) {
-            const packPath = path.join(packsDir, folder.name);
-            const packJsonPath = path.join(packPath, 'pack.json');
+        try {
+            const packMeta = JSON.parse(fs.readFileSync(packJsonPath, 'utf8'));
+            // Validar ID
+            if (!packMeta.id) packMeta.id = folder.name;
 
-            console.log(`[DEBUG] Revisando pack folder: ${folder.name} en ${packPath}`);
+            // 2. Escanear templates (.json + .js)
+            const files = fs.readdirSync(packPath);
+            // Buscar archivos .json que NO sean pack.json
+            const templateManifests = files.filter(f => f.endsWith('.json') && f !== 'pack.json');
 
-            // 1. Cada pack DEBE tener un pack.json
-            if (!fs.existsSync(packJsonPath)) {
-                console.warn(`[DEBUG] Pack ${folder.name} ignorado (sin pack.json).`);
-                continue;
-            }
+            const templates = [];
 
-            try {
-                const packMeta = JSON.parse(fs.readFileSync(packJsonPath, 'utf8'));
-                // Validar ID
-                if (!packMeta.id) packMeta.id = folder.name;
-
-                // 2. Escanear templates (.json + .js)
-                const files = fs.readdirSync(packPath);
-                console.log(`[DEBUG] Pack ${packMeta.name} tiene ${files.length} archivos en total.`);
-                // Buscar archivos .json que NO sean pack.json
-                const templateManifests = files.filter(f => f.endsWith('.json') && f !== 'pack.json');
-                console.log(`[DEBUG] Pack ${packMeta.name} tiene ${templateManifests.length} manifestos de template.`);
-
-                const templates = [];
-
-                for (const manifestFile of templateManifests) {
-                    const tid = manifestFile.replace('.json', '');
-                    const manifestPath = path.join(packPath, manifestFile);
-                    const jsPath = path.join(packPath, `${tid}.js`);
-
-                    if (!fs.existsSync(jsPath)) {
-                        console.warn(`Template ${tid} tiene manifiesto pero falta el JS.`);
-                        continue;
-                    }
+            for (const manifestFile of templateManifests) {
+                const tid = manifestFile.replace('.json', '');
+                const manifestPath = path.join(packPath, manifestFile);
+                const jsPath = path.join(packPath, `${tid}.js`);
 
-                    try {
-                        const manifest = JSON.parse(fs.readFileSync(manifestPath, 'utf8'));
-                        const jsContent = fs.readFileSync(jsPath, 'utf8');
-
-                        templates.push({
-                            id: manifest.id || tid,
-                            manifest: manifest,
-                            code: jsContent
-                        });
-                    } catch (err) {
-                        console.error(`Error leyendo template ${tid} en ${packMeta.name}:`, err.message);
-                    }
+                if (!files.includes(`${tid}.js`)) {
+                    console.warn(`Template ${tid} tiene manifiesto pero falta el JS.`);
+                    continue;
                 }
 
-                // Solo añadir packs con al menos 1 template o si es intencional
-                packs.push({
-                    id: packMeta.id,
-                    name: packMeta.name || folder.name,
-                    description: packMeta.description || '',
-                    icon: packMeta.icon || 'layers',
-                    templates: templates
-                });
+                try {
+                    const manifest = JSON.parse(fs.readFileSync(manifestPath, 'utf8'));
+                    const jsContent = fs.readFileSync(jsPath, 'utf8');
+
+                    templates.push({
+                        id: manifest.id || tid,
+                        manifest: manifest,
+                        code: jsContent
+                    });
+                } catch (err) {
+                    console.error(`Error leyendo template ${tid} en ${packMeta.name}:`, err.message);
+                }
+            }
 
-                console.log(`[Main] Pack cargado: "${packMeta.name}" (${templates.length} templates)`);
+            // Solo añadir packs con al menos 1 template o si es intencional
+            packs.push({
+                id: packMeta.id,
+                name: packMeta.name || folder.name,
+                description: packMeta.description || '',
+                icon: packMeta.icon || 'layers',
+                templates: templates
+            });
+        } catch (err) {
+            console.error(`Error procesando pack ${folder.name}:`, err.message);
+        }
+    }
 
-            } catch (err) {
-                console.error(`Error procesando pack ${folder.name}:`, err.message);
-            }
+    return packs;
+}
+
+// IPC: Cargar Packs (nueva estructura plana). Con src/packs.bundle (python -m packtools bundle) basta una lectura
+ipcMain.handle('load-packs', async () => {
+    try {
+        // En producción (asar) o desarrollo, ajustar ruta correctamente
+        // Se asume que src/packs está al mismo nivel que main.js o dentro de resources
+        const packsDir = path.join(__dirname, 'src', 'packs');
+
+        if (!fs.existsSync(packsDir)) {
+            console.error('Directorio de packs no encontrado:', packsDir);
+            return [];
         }
 
+        const PackBundle = require('./src/services/PackBundle');
+        const bundle = PackBundle.load(path.join(__dirname, 'src', 'packs.bundle'), packsDir);
+        const packs = bundle ? bundle.packs() : scanPacksDir(packsDir);
+
+        const templateCount = packs.reduce((n, p) => n + p.templates.length, 0);
+        console.log(`[Main] ${packs.length} packs cargados (${templateCount} templates) desde ${bundle ? 'bundle' : 'src/packs'}`);
         return packs;
     } catch (error) {
         console.error('[Main] Error crítico cargando packs:', error);
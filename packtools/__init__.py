@@ -0,0 +1,7 @@
+"""Tooling for the template packs under ``src/packs``.
+
+Run ``python -m packtools --help`` from the repository root.
+"""
+from .engine import PASSES, Document, FileResult, Pass, get_passes, register, rewrite_file, run_pack
+
+__all__ = ['PASSES', 'Document', 'FileResult', 'Pass', 'get_passes', 'register', 'rewrite_file', 'run_pack']
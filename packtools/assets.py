@@ -0,0 +1,76 @@
+"""Content-addressed store for binary assets pulled out of templates.
+
+Inline ``data:...;base64,`` URIs make every template that carries one as
+large as the asset itself, and that text is read by ``load-packs`` and sent
+over IPC for every template. The store keeps each distinct payload once as
+``assets/store/<sha256 prefix>.<ext>``; templates refer to it with the same
+``../assets/...`` URL the app already uses for its logos, and ``main.js``
+inlines it only when a slide is exported.
+"""
+import base64
+import binascii
+import hashlib
+import os
+import re
+
+from .engine import REPO_ROOT
+
+ASSET_STORE_DIR = os.path.join(REPO_ROOT, 'assets', 'store')
+# URL of the store as seen from the app page (src/index.html)
+ASSET_STORE_URL = '../assets/store'
+HASH_LENGTH = 16
+
+DATA_URI = re.compile(r'data:([\w.+-]+/[\w.+-]+)((?:;[\w.+-]+=[\w.+-]+)*);base64,([A-Za-z0-9+/]+={0,2})')
+
+EXTENSIONS = {
+    'image/png': 'png',
+    'image/jpeg': 'jpg',
+    'image/gif': 'gif',
+    'image/webp': 'webp',
+    'image/avif': 'avif',
+    'image/svg+xml': 'svg',
+    'image/x-icon': 'ico',
+    'font/woff': 'woff',
+    'font/woff2': 'woff2',
+    'font/ttf': 'ttf',
+    'font/otf': 'otf',
+    'application/font-woff': 'woff',
+    'application/font-woff2': 'woff2',
+}
+
+
+class AssetStore:
+    """Files named after the hash of their content, written once."""
+
+    def __init__(self, root=ASSET_STORE_DIR, url=ASSET_STORE_URL):
+        self.root = root
+        self.url = url
+
+    @staticmethod
+    def name_for(data, mime):
+        digest = hashlib.sha256(data).hexdigest()[:HASH_LENGTH]
+        return f"{digest}.{EXTENSIONS.get(mime, 'bin')}"
+
+    def path(self, name):
+        return os.path.join(self.root, name)
+
+    def put(self, data, mime, dry_run=False):
+        """Store ``data`` (if it is not there yet) and return its URL."""
+        name = self.name_for(data, mime)
+        path = self.path(name)
+        if not dry_run and not os.path.exists(path):
+            os.makedirs(self.root, exist_ok=True)
+            # Unique temp name: several workers may store the same payload at once
+            tmp_path = f'{path}.{os.getpid()}.tmp'
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        return f'{self.url}/{name}'
+
+    def replacement(self, match, dry_run=False):
+        """Store URL for a ``DATA_URI`` match (the match itself if it is not valid base64)."""
+        try:
+            data = base64.b64decode(match.group(3), validate=True)
+        except (binascii.Error, ValueError):
+            return match.group(0)
+        return self.put(data, match.group(1).lower(), dry_run)
@@ -0,0 +1,164 @@
+"""Benchmarks for the rewrite pipeline on synthetic packs.
+
+For every pack size each pass is timed on its own and then the whole
+pipeline, always on a fresh copy of the generated pack with the state cache
+off. Every measurement runs in a freshly spawned process so its peak RSS
+(including pool workers) is its own. The pathological suite times the
+footer passes, and the ``[\\s\\S]*?`` regexes they replaced, on single
+files built to make lazy scans go quadratic.
+"""
+import datetime
+import multiprocessing
+import os
+import platform
+import re
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from .engine import REPO_ROOT, Document, get_passes, run_packs
+from .synth import DEFAULT_DENSITIES, PATHOLOGICAL, generate_pack
+
+BENCH_VERSION = 1
+
+# The regexes remove_footer.py and remove_footer_force.py used before the lexer
+LEGACY_FOOTERS = {
+    'remove_footer': [
+        re.compile(r'(\s*<!-- Footer -->)?\s*<div style="margin-top:\s*auto;[^"]*">[\s\S]*?</div>', re.IGNORECASE),
+    ],
+    'remove_footer_force': [
+        re.compile(r'<div style="[^"]*opacity:0\.5;[^"]*">\s*<div style="width:40px; height:4px;[\s\S]*?</div>\s*</div>',
+                   re.IGNORECASE),
+        re.compile(r'<div style="[^"]*justify-content:space-between;[^"]*opacity:0\.5;[^"]*">[\s\S]*?</div>',
+                   re.IGNORECASE),
+    ],
+}
+
+
+def _peak_rss_kb():
+    """Peak RSS of this process and of its largest finished child, in KB."""
+    scale = 1024 if sys.platform == 'darwin' else 1  # bytes on macOS, KB elsewhere
+    own = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss // scale
+    children = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss // scale
+    return own, children
+
+
+def _measure(job):
+    """Run the passes over ``pack_dir`` in this (fresh) process."""
+    pack_dir, pass_names, jobs = job
+    passes = get_passes(pass_names)
+    start = time.perf_counter()
+    changed = sum(result.changed for result in run_packs([pack_dir], passes, jobs=jobs, use_cache=False))
+    wall = time.perf_counter() - start
+    own, children = _peak_rss_kb()
+    return wall, changed, max(own, children)
+
+
+def _spawned(job):
+    with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context('spawn')) as pool:
+        return pool.submit(_measure, job).result()
+
+
+def _git_revision():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=REPO_ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _row(name, templates, size, wall, changed, rss):
+    return {
+        'pass': name,
+        'templates': templates,
+        'bytes': size,
+        'changed': changed,
+        'wall_s': round(wall, 6),
+        'files_per_s': round(templates / wall, 1) if wall else None,
+        'mb_per_s': round(size / wall / 1e6, 2) if wall else None,
+        'peak_rss_kb': rss,
+    }
+
+
+def bench_synthetic(sizes, densities=None, pass_names=None, jobs=1, seed=0, workdir=None, log=print):
+    """Time each pass and the full pipeline on packs of each size."""
+    if pass_names is None:
+        pass_names = [p.name for p in get_passes()]
+    rows = []
+    root = tempfile.mkdtemp(prefix='packtools-bench-', dir=workdir)
+    try:
+        for templates in sizes:
+            pristine = os.path.join(root, f'pack-{templates}')
+            size = generate_pack(pristine, templates, densities, seed)
+            for name, names in [(name, [name]) for name in pass_names] + [('pipeline', pass_names)]:
+                run_dir = os.path.join(root, 'run')
+                shutil.rmtree(run_dir, ignore_errors=True)
+                shutil.copytree(pristine, run_dir)
+                wall, changed, rss = _spawned((run_dir, names, jobs))
+                row = _row(name, templates, size, wall, changed, rss)
+                rows.append(row)
+                log(f"{templates:>6} {name:<22} {wall:9.3f}s {row['files_per_s'] or 0:10.1f} files/s "
+                    f"{row['mb_per_s'] or 0:8.2f} MB/s {rss / 1024:8.1f} MB peak")
+            shutil.rmtree(pristine)
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+    return rows
+
+
+def _time(func):
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def bench_pathological(size, legacy=True, log=print):
+    """Time the footer passes (and the legacy regexes) on each pathological input."""
+    passes = {p.name: p for p in get_passes(['remove_footer', 'remove_footer_force'])}
+    rows = []
+    for case, build in PATHOLOGICAL.items():
+        text = build(size)
+        for name, p in passes.items():
+            doc = Document('pathological.js', text)
+            wall, matches = _time(lambda: p.apply(doc))
+            rows.append({'case': case, 'size': size, 'bytes': len(text), 'pass': name,
+                         'impl': 'lexer', 'matches': matches, 'wall_s': round(wall, 6)})
+            log(f'{case:<18} {name:<20} lexer  {wall:9.4f}s')
+            if not legacy:
+                continue
+
+            def run_legacy():
+                out, count = text, 0
+                for pattern in LEGACY_FOOTERS[name]:
+                    out, n = pattern.subn('', out)
+                    count += n
+                return count
+            wall, matches = _time(run_legacy)
+            rows.append({'case': case, 'size': size, 'bytes': len(text), 'pass': name,
+                         'impl': 'legacy_regex', 'matches': matches, 'wall_s': round(wall, 6)})
+            log(f'{case:<18} {name:<20} legacy {wall:9.4f}s')
+    return rows
+
+
+def run_benchmarks(sizes, densities=None, pass_names=None, jobs=1, seed=0, pathological_size=1000,
+                   legacy=True, workdir=None, log=print):
+    """Run both suites and return the JSON-ready report."""
+    densities = {**DEFAULT_DENSITIES, **(densities or {})}
+    report = {
+        'version': BENCH_VERSION,
+        'created': datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds'),
+        'revision': _git_revision(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpus': os.cpu_count(),
+        'settings': {'sizes': list(sizes), 'densities': densities, 'jobs': jobs, 'seed': seed,
+                     'pathological_size': pathological_size},
+        'synthetic': bench_synthetic(sizes, densities, pass_names, jobs, seed, workdir, log),
+        'pathological': [],
+    }
+    if pathological_size:
+        report['pathological'] = bench_pathological(pathological_size, legacy, log)
+    return report
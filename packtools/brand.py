@@ -0,0 +1,45 @@
+"""Markup injected by the ``add_brand_header`` pass."""
+
+# Same bytes as the logo kr-clidn-09 carried inline; main.js inlines it on export
+LOGO_SRC = '../assets/kr-clidn-logo-small.png'
+
+# HTML & CSS to Inject
+BRAND_HTML = f"""
+        <!-- BRAND HEADER -->
+        <div class="brand-header">
+            <div class="brand-logo-container">
+                <div class="brand-logo-glow"></div>
+                <img src="{LOGO_SRC}" class="brand-logo-img">
+            </div>
+            <div class="brand-text">DOMINION</div>
+        </div>
+"""
+
+BRAND_CSS = """
+        /* BRAND HEADER */
+        .brand-header {
+            display: flex;
+            align-items: center;
+            justify-content: center;
+            gap: 12px;
+            margin-bottom: 20px;
+            width: 100%;
+            z-index: 10;
+        }
+        .brand-logo-container { position: relative; width: 40px; height: 40px; }
+        .brand-logo-glow {
+            position: absolute; inset: -10px;
+            background: radial-gradient(circle, rgba(37, 99, 235, 0.4) 0%, transparent 70%);
+            filter: blur(8px);
+        }
+        .brand-logo-img { width: 100%; height: 100%; object-fit: contain; position: relative; z-index: 1; }
+        .brand-text {
+            font-family: 'JetBrains Mono', monospace;
+            font-size: 16px;
+            font-weight: 700;
+            letter-spacing: 4px;
+            color: #00D9FF;
+            text-shadow: 0 0 10px rgba(0, 217, 255, 0.3);
+            text-transform: uppercase;
+        }
+"""
@@ -0,0 +1,339 @@
+"""Load generator for the TikTok bridge (``main.js``, ws://localhost:7890).
+
+Replays extractor payloads -- a JSONL recording made with
+``CYBERCANVAS_TIKTOK_RECORD`` or synthetic ones shaped like
+``tiktok_extractor.js`` output -- at a fixed rate over one or more
+connections, and measures how the bridge keeps up. Every ``probe_every``-th
+message carries a ``probeId``; the bridge answers with a ``BRIDGE_ACK`` once
+that message (or the one it was merged into) has gone out over IPC, so the
+latency includes the coalescing window, which is what the UI feels.
+
+The WebSocket client is the minimum RFC 6455 needs from a client: the
+upgrade handshake, masked text frames out, and text, ping and close frames
+in. The standard library has none and the generator should not need an
+install to run.
+"""
+import asyncio
+import base64
+import hashlib
+import json
+import os
+import random
+import struct
+import time
+from urllib.parse import urlsplit
+
+DEFAULT_URL = 'ws://localhost:7890'
+WS_GUID = '258EAFA5-E914-47DA-95CA-C5AB0DC85B11'
+CONNECT_TIMEOUT = 5.0
+
+OP_CONT, OP_TEXT, OP_BINARY, OP_CLOSE, OP_PING, OP_PONG = 0x0, 0x1, 0x2, 0x8, 0x9, 0xA
+
+
+class WebSocketError(Exception):
+    """The server broke the protocol or refused the upgrade."""
+
+
+# ── WebSocket client ─────────────────────────────────────────────────
+
+def _mask(data, key):
+    """XOR ``data`` with the 4-byte ``key`` as one big integer, far faster than per byte."""
+    n = len(data)
+    if not n:
+        return data
+    stream = (key * (n // 4 + 1))[:n]
+    return (int.from_bytes(data, 'big') ^ int.from_bytes(stream, 'big')).to_bytes(n, 'big')
+
+
+def encode_frame(payload, opcode=OP_TEXT):
+    """One final, masked client frame."""
+    n = len(payload)
+    if n < 126:
+        header = struct.pack('!BB', 0x80 | opcode, 0x80 | n)
+    elif n < 1 << 16:
+        header = struct.pack('!BBH', 0x80 | opcode, 0x80 | 126, n)
+    else:
+        header = struct.pack('!BBQ', 0x80 | opcode, 0x80 | 127, n)
+    key = os.urandom(4)
+    return header + key + _mask(payload, key)
+
+
+class WebSocket:
+    """A client connection; build it with ``await WebSocket.connect(url)``."""
+
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+        self.closed = False
+
+    @classmethod
+    async def connect(cls, url, timeout=CONNECT_TIMEOUT):
+        parts = urlsplit(url)
+        if parts.scheme != 'ws':
+            raise ValueError(f'Only ws:// URLs are supported: {url}')
+        host = parts.hostname or 'localhost'
+        port = parts.port or 80
+        reader, writer = await asyncio.wait_for(asyncio.open_connection(host, port), timeout)
+        key = base64.b64encode(os.urandom(16)).decode('ascii')
+        writer.write((f'GET {parts.path or "/"} HTTP/1.1\r\n'
+                      f'Host: {host}:{port}\r\n'
+                      'Upgrade: websocket\r\n'
+                      'Connection: Upgrade\r\n'
+                      f'Sec-WebSocket-Key: {key}\r\n'
+                      'Sec-WebSocket-Version: 13\r\n\r\n').encode('ascii'))
+        head = await asyncio.wait_for(reader.readuntil(b'\r\n\r\n'), timeout)
+        lines = head.decode('latin-1').split('\r\n')
+        if lines[0].split(' ')[1:2] != ['101']:
+            writer.close()
+            raise WebSocketError(f'Upgrade refused: {lines[0]}')
+        headers = {}
+        for line in lines[1:]:
+            name, _, value = line.partition(':')
+            headers[name.strip().lower()] = value.strip()
+        expected = base64.b64encode(hashlib.sha1((key + WS_GUID).encode('ascii')).digest()).decode('ascii')
+        if headers.get('sec-websocket-accept') != expected:
+            writer.close()
+            raise WebSocketError('Bad Sec-WebSocket-Accept in the upgrade response')
+        return cls(reader, writer)
+
+    async def send(self, text):
+        self.writer.write(encode_frame(text.encode('utf-8')))
+        await self.writer.drain()
+
+    async def _read_frame(self):
+        first, second = await self.reader.readexactly(2)
+        length = second & 0x7F
+        if length == 126:
+            length, = struct.unpack('!H', await self.reader.readexactly(2))
+        elif length == 127:
+            length, = struct.unpack('!Q', await self.reader.readexactly(8))
+        key = await self.reader.readexactly(4) if second & 0x80 else None
+        payload = await self.reader.readexactly(length)
+        if key:
+            payload = _mask(payload, key)
+        return bool(first & 0x80), first & 0x0F, payload
+
+    async def recv(self):
+        """Next text message, or ``None`` once the server has closed."""
+        parts = []
+        while True:
+            try:
+                fin, opcode, payload = await self._read_frame()
+            except (asyncio.IncompleteReadError, ConnectionError):
+                self.closed = True
+                return None
+            if opcode == OP_PING:
+                self.writer.write(encode_frame(payload, OP_PONG))
+                continue
+            if opcode == OP_PONG:
+                continue
+            if opcode == OP_CLOSE:
+                if not self.closed:
+                    self.closed = True
+                    self.writer.write(encode_frame(payload[:2], OP_CLOSE))
+                return None
+            if opcode not in (OP_CONT, OP_TEXT, OP_BINARY):
+                raise WebSocketError(f'Unknown opcode {opcode:#x}')
+            parts.append(payload)
+            if fin:
+                return b''.join(parts).decode('utf-8', 'replace')
+
+    async def close(self):
+        if not self.closed:
+            self.closed = True
+            try:
+                self.writer.write(encode_frame(struct.pack('!H', 1000), OP_CLOSE))
+                await self.writer.drain()
+            except ConnectionError:
+                pass
+        self.writer.close()
+
+
+# ── Payloads ─────────────────────────────────────────────────────────
+
+def load_payloads(path):
+    """Extension messages of a JSONL recording (one JSON object per line)."""
+    payloads = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                msg = json.loads(line)
+            except ValueError as e:
+                raise ValueError(f'{path}:{number}: {e}') from None
+            if isinstance(msg, dict) and msg.get('type') and msg['type'] != 'EXTENSION_HELLO':
+                payloads.append(msg)
+    if not payloads:
+        raise ValueError(f'No extension messages in {path}')
+    return payloads
+
+
+def synthetic_payloads(count=2000, videos=300, profiles=30, seed=0):
+    """Payloads like the extractor's, drawn from a pool of ``videos`` and ``profiles``.
+
+    Scrolling a feed sends the same videos and profiles many times over with
+    fresher metrics; drawing from a small pool reproduces those repeats.
+    """
+    rng = random.Random(seed)
+    users = [f'creator_{i:03d}' for i in range(max(profiles, 1))]
+    video_ids = [str(7300000000000000000 + rng.randrange(10 ** 15)) for _ in range(max(videos, 1))]
+    tags = ['#fyp', '#viral', '#ia', '#hacking', '#linux', '#python', '#ciberseguridad', '#tips']
+    payloads = []
+    for _ in range(count):
+        kind = rng.random()
+        if kind < 0.85:
+            index = rng.randrange(len(video_ids))
+            author = users[index % len(users)]
+            caption = f'Tip {index}: lo que nadie te cuenta. {" ".join(rng.sample(tags, 3))}'
+            payloads.append({
+                'type': 'VIDEO_DATA',
+                'url': f'https://www.tiktok.com/@{author}/video/{video_ids[index]}',
+                'author': author,
+                'caption': caption,
+                'hook': caption.split('.')[0],
+                'hashtags': rng.sample(tags, 3),
+                'sound': f'sonido original - {author}',
+                'metrics': {
+                    'likes': rng.randrange(100, 2_000_000),
+                    'comments': rng.randrange(0, 20_000),
+                    'shares': rng.randrange(0, 50_000),
+                    'saves': rng.randrange(0, 80_000),
+                },
+            })
+        elif kind < 0.97:
+            author = rng.choice(users)
+            payloads.append({
+                'type': 'PROFILE_DATA',
+                'username': author,
+                'followers': rng.randrange(1_000, 5_000_000),
+                'following': rng.randrange(0, 2_000),
+                'likes': rng.randrange(10_000, 90_000_000),
+                'bio': f'Contenido diario sobre {rng.choice(tags)[1:]}',
+            })
+        else:
+            payloads.append({
+                'type': 'TREND_DATA',
+                'hashtags': [{'tag': tag, 'views': rng.randrange(10 ** 6, 10 ** 9)} for tag in rng.sample(tags, 5)],
+                'sounds': [f'sonido {rng.randrange(100)}' for _ in range(3)],
+                'url': f'https://www.tiktok.com/search?q={rng.choice(tags)[1:]}',
+            })
+    return payloads
+
+
+# ── Load run ─────────────────────────────────────────────────────────
+
+def percentile(sorted_values, q):
+    """Nearest-rank percentile of an already sorted list (``None`` if empty)."""
+    if not sorted_values:
+        return None
+    return sorted_values[min(int(len(sorted_values) * q), len(sorted_values) - 1)]
+
+
+async def run_load(url, payloads, rate=500, count=None, duration=10.0, connections=1, burst=1,
+                   probe_every=10, timeout=5.0):
+    """Send ``payloads`` round-robin at ``rate`` messages/s and return a report dict.
+
+    Stops after ``count`` messages, or after ``duration`` seconds without a
+    count. Messages go out ``burst`` at a time on an absolute schedule, so a
+    slow send is caught up on rather than slowing the whole run; ``rate`` 0
+    sends as fast as the connections accept. After the last send the run
+    waits up to ``timeout`` seconds for outstanding acks.
+    """
+    sockets = [await WebSocket.connect(url) for _ in range(connections)]
+    probes = {}  # probeId -> perf_counter at send
+    latencies = []
+    acked = set()
+    all_acked = asyncio.Event()
+    sending_done = False
+    counters = {'sent': 0, 'bytes': 0, 'lag': 0.0}
+
+    async def receive(ws):
+        while True:
+            text = await ws.recv()
+            if text is None:
+                return
+            try:
+                msg = json.loads(text)
+            except ValueError:
+                continue
+            if not isinstance(msg, dict) or msg.get('type') != 'BRIDGE_ACK':
+                continue
+            now = time.perf_counter()
+            for probe_id in msg.get('probeIds', []):
+                sent = probes.get(probe_id)
+                if sent is not None and probe_id not in acked:
+                    acked.add(probe_id)
+                    latencies.append((now - sent) * 1000)
+            if sending_done and len(acked) == len(probes):
+                all_acked.set()
+
+    receivers = [asyncio.ensure_future(receive(ws)) for ws in sockets]
+    start = time.perf_counter()
+    deadline = None if count else start + duration
+    interval = burst / rate if rate > 0 else 0
+    index = 0
+    try:
+        while True:
+            if count is not None and index >= count:
+                break
+            now = time.perf_counter()
+            if deadline is not None and now >= deadline:
+                break
+            if interval:
+                due = start + (index // burst) * interval
+                if due > now:
+                    await asyncio.sleep(due - now)
+                else:
+                    counters['lag'] = max(counters['lag'], now - due)
+            for _ in range(burst if count is None else min(burst, count - index)):
+                msg = dict(payloads[index % len(payloads)])
+                msg['timestamp'] = int(time.time() * 1000)
+                if probe_every and index % probe_every == 0:
+                    msg['probeId'] = index
+                data = json.dumps(msg, ensure_ascii=False, separators=(',', ':'))
+                ws = sockets[index % connections]
+                if probe_every and index % probe_every == 0:
+                    probes[index] = time.perf_counter()
+                await ws.send(data)
+                counters['sent'] += 1
+                counters['bytes'] += len(data.encode('utf-8'))
+                index += 1
+            if all(ws.closed for ws in sockets):
+                break
+        seconds = time.perf_counter() - start
+        sending_done = True
+        if len(acked) < len(probes):
+            try:
+                await asyncio.wait_for(all_acked.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+    finally:
+        for ws in sockets:
+            await ws.close()
+        for task in receivers:
+            task.cancel()
+        await asyncio.gather(*receivers, return_exceptions=True)
+
+    latencies.sort()
+    return {
+        'url': url,
+        'connections': connections,
+        'target_rate': rate,
+        'sent': counters['sent'],
+        'seconds': seconds,
+        'rate': counters['sent'] / seconds if seconds else 0.0,
+        'mb_per_s': counters['bytes'] / seconds / 1e6 if seconds else 0.0,
+        'bytes': counters['bytes'],
+        'max_lag_ms': counters['lag'] * 1000,
+        'probes': len(probes),
+        'acked': len(latencies),
+        'lost': len(probes) - len(latencies),
+        'latency_ms': {
+            'p50': percentile(latencies, 0.50),
+            'p90': percentile(latencies, 0.90),
+            'p99': percentile(latencies, 0.99),
+            'max': latencies[-1] if latencies else None,
+        },
+    }
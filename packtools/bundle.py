@@ -0,0 +1,173 @@
+"""Compile ``src/packs`` into one indexed bundle for the ``load-packs`` IPC.
+
+Layout::
+
+    PKBUNDLE 1\\n
+    <index length in bytes>\\n
+    <index JSON>
+    <template code, back to back>
+
+The index holds every pack's metadata, every parsed template manifest and
+the ``[offset, length]`` of each template's code in the payload, so the app
+loads all packs with a single read. It also records the size and mtime of
+every source file and the mtime of every pack directory. The build is
+skipped while all of them still match; ``main.js`` only checks the
+directories, which is enough for files added, removed or replaced (as
+``rewrite`` does) and leaves files edited in place to the next build.
+"""
+import json
+import os
+
+from .engine import PACKS_DIR
+
+BUNDLE_PATH = os.path.join(os.path.dirname(PACKS_DIR), 'packs.bundle')
+MAGIC = b'PKBUNDLE 1\n'
+BUNDLE_VERSION = 2
+
+
+class BuildResult:
+    """What ``build_bundle`` did."""
+
+    def __init__(self, path):
+        self.path = path
+        self.built = False
+        self.packs = 0
+        self.templates = 0
+        self.size = 0
+        self.messages = []
+
+
+def _pack_dirs(packs_dir):
+    for entry in sorted(os.scandir(packs_dir), key=lambda entry: entry.name):
+        if entry.is_dir():
+            yield entry
+
+
+def scan_sources(packs_dir=PACKS_DIR):
+    """``(dirs, sources)``: stat signatures of everything a bundle is built from.
+
+    ``dirs`` maps each pack directory (and ``packs_dir`` itself, as ``.``)
+    to its mtime in nanoseconds, as a string so JavaScript can compare it
+    exactly; ``sources`` maps ``pack/filename`` to ``[size, mtime_ns]``
+    (the mtime a string as well) for ``pack.json`` and every template
+    manifest and script.
+    """
+    dirs = {'.': str(os.stat(packs_dir).st_mtime_ns)}
+    sources = {}
+    for pack in _pack_dirs(packs_dir):
+        dirs[pack.name] = str(pack.stat().st_mtime_ns)
+        for entry in os.scandir(pack.path):
+            if entry.name.endswith(('.json', '.js')) and entry.is_file():
+                st = entry.stat()
+                sources[f'{pack.name}/{entry.name}'] = [st.st_size, str(st.st_mtime_ns)]
+    return dirs, dict(sorted(sources.items()))
+
+
+def read_index(path=BUNDLE_PATH):
+    """``(index, payload offset)`` of the bundle at ``path``, or ``(None, 0)``."""
+    try:
+        with open(path, 'rb') as f:
+            if f.readline() != MAGIC:
+                return None, 0
+            length = int(f.readline())
+            index = json.loads(f.read(length))
+            return index, f.tell()
+    except (OSError, ValueError):
+        return None, 0
+
+
+def is_stale(path=BUNDLE_PATH, packs_dir=PACKS_DIR):
+    index, _ = read_index(path)
+    if index is None or index.get('version') != BUNDLE_VERSION:
+        return True
+    dirs, sources = scan_sources(packs_dir)
+    return index['dirs'] != dirs or index['sources'] != sources
+
+
+def _read_json(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _compile(packs_dir, result):
+    """Mirror of the old ``load-packs`` scan: ``(packs, code chunks)``."""
+    packs = []
+    chunks = []
+    offset = 0
+    for pack in _pack_dirs(packs_dir):
+        pack_json = os.path.join(pack.path, 'pack.json')
+        # Every pack must have a pack.json
+        if not os.path.isfile(pack_json):
+            continue
+        try:
+            meta = _read_json(pack_json)
+        except (OSError, ValueError) as e:
+            result.messages.append(f'Error reading {pack.name}/pack.json: {e}')
+            continue
+
+        templates = []
+        filenames = sorted(os.listdir(pack.path))
+        for filename in filenames:
+            if not filename.endswith('.json') or filename == 'pack.json':
+                continue
+            tid = filename[:-len('.json')]
+            if f'{tid}.js' not in filenames:
+                result.messages.append(f'Template {tid} has a manifest but no JS in {pack.name}')
+                continue
+            try:
+                manifest = _read_json(os.path.join(pack.path, filename))
+                with open(os.path.join(pack.path, f'{tid}.js'), 'rb') as f:
+                    code = f.read()
+                code.decode('utf-8')
+            except (OSError, ValueError) as e:
+                result.messages.append(f'Error reading template {tid} in {pack.name}: {e}')
+                continue
+            templates.append({
+                'id': manifest.get('id') or tid,
+                'file': f'{tid}.js',
+                'manifest': manifest,
+                'code': [offset, len(code)],
+            })
+            chunks.append(code)
+            offset += len(code)
+
+        packs.append({
+            'id': meta.get('id') or pack.name,
+            'name': meta.get('name') or pack.name,
+            'description': meta.get('description') or '',
+            'icon': meta.get('icon') or 'layers',
+            'templates': templates,
+        })
+        result.packs += 1
+        result.templates += len(templates)
+    return packs, chunks
+
+
+def build_bundle(path=BUNDLE_PATH, packs_dir=PACKS_DIR, force=False):
+    """Write the bundle for ``packs_dir`` unless the one at ``path`` is up to date."""
+    result = BuildResult(path)
+    if not force and not is_stale(path, packs_dir):
+        return result
+
+    # Signatures first: a file edited during the build makes the next check rebuild
+    dirs, sources = scan_sources(packs_dir)
+    packs, chunks = _compile(packs_dir, result)
+    index = json.dumps({
+        'version': BUNDLE_VERSION,
+        'dirs': dirs,
+        'sources': sources,
+        'packs': packs,
+    }, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(MAGIC)
+        f.write(b'%d\n' % len(index))
+        f.write(index)
+        for chunk in chunks:
+            f.write(chunk)
+    os.replace(tmp_path, path)
+    result.built = True
+    result.size = os.path.getsize(path)
+    return result
+
@@ -0,0 +1,850 @@
+"""Command line entry point: ``python -m packtools <command>``."""
+import argparse
+import json
+import os
+import signal
+import sqlite3
+import sys
+import time
+
+from .bundle import BUNDLE_PATH, build_bundle, is_stale
+from .engine import DEFAULT_PACK, PACKS_DIR, PASSES, STREAM_ABOVE, get_passes, iter_pack_dirs, run_packs
+from .report import RunReport
+from .synth import DEFAULT_DENSITIES
+
+
+def _split_names(value):
+    return [name.strip() for name in value.split(',') if name.strip()]
+
+
+def _resolve_packs(args):
+    """Pack directories to work on, or ``None`` once a missing one has been reported."""
+    if args.all:
+        if not os.path.isdir(PACKS_DIR):
+            print(f'Packs directory not found: {PACKS_DIR}', file=sys.stderr)
+            return None
+        return list(iter_pack_dirs())
+    pack_dirs = args.packs or [DEFAULT_PACK]
+    for pack_dir in pack_dirs:
+        if not os.path.isdir(pack_dir):
+            print(f'Pack directory not found: {pack_dir}', file=sys.stderr)
+            return None
+    return pack_dirs
+
+
+def _pass_options(args):
+    options = {}
+    if args.colour_map:
+        with open(args.colour_map, 'r', encoding='utf-8') as f:
+            options['whitewash'] = {'colours': json.load(f)}
+    return options
+
+
+def cmd_rewrite(args):
+    try:
+        passes = get_passes(args.passes, _pass_options(args))
+    except (OSError, ValueError) as e:
+        print(e, file=sys.stderr)
+        return 2
+
+    pack_dirs = _resolve_packs(args)
+    if pack_dirs is None:
+        return 1
+
+    store = None
+    if not args.dry_run and not args.no_snapshot:
+        from .snapshots import SnapshotStore
+
+        store = SnapshotStore()
+
+    candidates = None
+    if args.use_index:
+        from .index import TemplateIndex, pass_candidates
+
+        with TemplateIndex() as index:
+            index.update(pack_dirs)
+            candidates = pass_candidates(index, passes)
+
+    profile_top = args.profile_top if args.profile else 0
+    report = RunReport({
+        'packs': pack_dirs,
+        'passes': {p.name: p.fingerprint for p in passes},
+        'jobs': args.jobs,
+        'dry_run': args.dry_run,
+        'cache': not args.no_cache,
+        'prefilter': not args.no_prefilter,
+        'index': args.use_index,
+        'stream_above_mb': args.stream_above,
+    }, profile_top=profile_top)
+
+    count = skipped = filtered = 0
+    stored = 0
+    # Recorded before the first write, so an interrupted run can still be rolled back
+    run = None
+    if store is not None:
+        run = store.begin(command='rewrite', packs=[os.path.abspath(p) for p in pack_dirs],
+                          passes=[p.name for p in passes])
+    results = run_packs(pack_dirs, passes, jobs=args.jobs, dry_run=args.dry_run,
+                        use_cache=not args.no_cache, prefilter=not args.no_prefilter, profile=profile_top,
+                        candidates=candidates, store=store, stream_above=int(args.stream_above * 1024 * 1024))
+    try:
+        for result in results:
+            report.add(result)
+            for message in result.messages:
+                print(message)
+            if result.changed:
+                print(result.summary())
+                count += 1
+                stored += result.stored
+            elif result.skipped:
+                skipped += 1
+            elif result.filtered:
+                filtered += 1
+    except BaseException:
+        if run is not None:
+            results.close()  # stop the workers before reading the journal
+            run = store.finish(run, stored=stored)
+            if run is not None:
+                print(f"Run stopped after writing {len(run['files'])} files; they are in snapshot {run['id']} "
+                      f"(undo with: python -m packtools snapshots rollback {run['id']})", file=sys.stderr)
+        raise
+    report.finish()
+
+    verb = 'would be updated' if args.dry_run else 'updated'
+    print(f'Total files {verb}: {count}')
+    if skipped:
+        print(f'Unchanged since last run (cached): {skipped}')
+    if filtered:
+        print(f'Ruled out by the template index: {filtered}')
+    if run is not None:
+        run = store.finish(run, stored=stored)
+    if run is not None:
+        print(f"Snapshot {run['id']}: {len(run['files'])} files, {stored / 1024:.1f} KB stored "
+              f"(undo with: python -m packtools snapshots rollback {run['id']})")
+    if args.profile:
+        _print_profile(report, args.profile)
+    if args.report:
+        report.write(args.report)
+        print(f'Run report written to {args.report}')
+    return 0
+
+
+def cmd_snapshots(args):
+    from .snapshots import RollbackConflict, SnapshotStore
+
+    store = SnapshotStore(args.dir) if args.dir else SnapshotStore()
+    try:
+        if args.action == 'list':
+            return _list_snapshots(store)
+        if args.action == 'diff':
+            return _diff_snapshots(store, args)
+        if args.action == 'rollback':
+            if len(args.runs) != 1:
+                print('rollback takes one run', file=sys.stderr)
+                return 2
+            run = store.rollback(args.runs[0], force=args.force)
+            if run is None:
+                print('Nothing to roll back: every file already has its old content')
+            else:
+                print(f"Restored {len(run['files'])} files; recorded as {run['id']} "
+                      f"(undo with: python -m packtools snapshots rollback {run['id']})")
+            return 0
+        removed, objects, freed = store.prune(args.keep)
+        print(f'Removed {removed} runs and {objects} objects ({freed / 1024:.1f} KB)')
+        return 0
+    except KeyError as e:
+        print(e.args[0], file=sys.stderr)
+        return 2
+    except RollbackConflict as e:
+        print(f'{e}\nRoll back the later runs first, or use --force to overwrite', file=sys.stderr)
+        return 1
+
+
+def _list_snapshots(store):
+    runs = store.runs()
+    for run in reversed(runs):
+        created = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(run['created']))
+        if run.get('command') == 'rollback':
+            what = f"rollback of {run['rolled_back']}"
+        else:
+            what = ', '.join(run.get('passes', []))
+            if run.get('command') == 'watch':
+                what = f'watch: {what}'
+        if not run.get('complete', True):
+            what += ' (interrupted or still running)'
+        print(f"{run['id']}  {created}  {len(run['files']):5} files  {run.get('stored', 0) / 1024:8.1f} KB  {what}")
+    print(f'{store.root}: {len(runs)} runs, {store.total_bytes() / 1024:.1f} KB')
+    return 0
+
+
+def _diff_snapshots(store, args):
+    if not 1 <= len(args.runs) <= 2:
+        print('diff takes one run (its own changes) or two', file=sys.stderr)
+        return 2
+    changes = store.changes(*args.runs)
+    labels = ('before', 'after') if len(args.runs) == 1 else tuple(args.runs)
+    for path, old, new in changes:
+        if args.stat:
+            added = removed = 0
+            for line in store.diff(path, old, new):
+                if line.startswith('+') and not line.startswith('+++'):
+                    added += 1
+                elif line.startswith('-') and not line.startswith('---'):
+                    removed += 1
+            print(f'{path}  +{added} -{removed}')
+        else:
+            sys.stdout.writelines(store.diff(path, old, new, *labels))
+    print(f'{len(changes)} files differ', file=sys.stderr)
+    return 0
+
+
+def cmd_watch(args):
+    from .watch import Watcher
+
+    try:
+        passes = get_passes(args.passes, _pass_options(args))
+    except (OSError, ValueError) as e:
+        print(e, file=sys.stderr)
+        return 2
+
+    pack_dirs = _resolve_packs(args)
+    if pack_dirs is None:
+        return 1
+
+    store = None
+    if not args.no_snapshot:
+        from .snapshots import SnapshotStore
+
+        store = SnapshotStore()
+
+    if args.initial:
+        run = store.begin(command='rewrite', packs=[os.path.abspath(p) for p in pack_dirs],
+                          passes=[p.name for p in passes]) if store is not None else None
+        try:
+            count = sum(1 for result in run_packs(pack_dirs, passes, store=store) if result.changed)
+        finally:
+            if run is not None:
+                store.finish(run)
+        print(f'Initial run: {count} files updated')
+
+    watcher = Watcher(pack_dirs, passes, debounce=args.debounce / 1000, poll=args.poll,
+                      interval=args.interval / 1000, store=store)
+    print(f'Watching {len(pack_dirs)} pack(s) with {watcher.source.name}, '
+          f'{len(passes)} passes, {args.debounce:g} ms debounce (Ctrl-C to stop)', flush=True)
+    latencies = []
+    # Stopped as a daemon: finish like Ctrl-C so the pack state gets written
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+
+    def on_event(event):
+        result = event.result
+        if result.changed:
+            passes_run = ', '.join(f'{name}({matches})' for name, matches in result.applied)
+            line = f'{result.label}: {passes_run}'
+        else:
+            line = f'{result.label}: already normalised'
+        for message in result.messages:
+            print(message)
+        latencies.append(event.latency_ms)
+        print(f'{line} [{event.latency_ms:.1f} ms since save, {result.seconds * 1000:.1f} ms of passes]',
+              flush=True)
+
+    try:
+        watcher.run(on_event)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        watcher.close()
+
+    if latencies:
+        latencies.sort()
+        p50 = latencies[len(latencies) // 2]
+        p95 = latencies[min(int(len(latencies) * 0.95), len(latencies) - 1)]
+        print(f'\n{len(latencies)} events, save to normalised: p50 {p50:.1f} ms, '
+              f'p95 {p95:.1f} ms, max {latencies[-1]:.1f} ms; '
+              f'{watcher.ignored} own writes ignored')
+    if watcher.runs:
+        print(f'{watcher.runs} snapshot runs recorded (see: python -m packtools snapshots list)')
+    return 0
+
+
+def cmd_bridge_load(args):
+    import asyncio
+
+    from .bridgeload import load_payloads, run_load, synthetic_payloads
+
+    try:
+        if args.payloads:
+            payloads = load_payloads(args.payloads)
+        else:
+            payloads = synthetic_payloads(videos=args.videos, profiles=args.profiles, seed=args.seed)
+    except (OSError, ValueError) as e:
+        print(e, file=sys.stderr)
+        return 2
+
+    source = args.payloads or f'{len(payloads)} synthetic payloads'
+    limit = f'{args.count} messages' if args.count else f'{args.duration:g} s'
+    rate = f'{args.rate:g} msg/s' if args.rate > 0 else 'max rate'
+    print(f'Replaying {source} to {args.url}: {rate}, {limit}, {args.connections} connection(s)', flush=True)
+    try:
+        report = asyncio.run(run_load(args.url, payloads, rate=args.rate, count=args.count,
+                                      duration=args.duration, connections=args.connections, burst=args.burst,
+                                      probe_every=args.probe_every, timeout=args.timeout))
+    except (OSError, asyncio.TimeoutError) as e:
+        print(f'Bridge not reachable at {args.url} (is the app running?): {e}', file=sys.stderr)
+        return 1
+    except Exception as e:  # WebSocketError, or a server that closed mid-handshake
+        print(f'{args.url}: {e}', file=sys.stderr)
+        return 1
+
+    print(f"Sent {report['sent']} messages in {report['seconds']:.2f}s: {report['rate']:.0f} msg/s, "
+          f"{report['mb_per_s']:.2f} MB/s (max {report['max_lag_ms']:.1f} ms behind schedule)")
+    latency = report['latency_ms']
+    if report['acked']:
+        print(f"Probes acked {report['acked']}/{report['probes']}, send to IPC: p50 {latency['p50']:.1f} ms, "
+              f"p90 {latency['p90']:.1f} ms, p99 {latency['p99']:.1f} ms, max {latency['max']:.1f} ms")
+    elif report['probes']:
+        print(f"No BRIDGE_ACK for {report['probes']} probes (bridge without coalescing support?)")
+    if report['lost']:
+        print(f"{report['lost']} probe(s) not acked within {args.timeout:g}s")
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=1)
+        print(f'Results written to {args.output}')
+    return 0 if not report['lost'] else 1
+
+
+def _print_profile(report, path):
+    print(f'\nRun took {report.seconds:.3f}s')
+    print('\nSlowest files:')
+    for result in report.slowest_files(report.profile_top):
+        worst = max(result.stats, key=lambda stat: stat.seconds)
+        print(f'  {result.seconds:9.4f}s  {result.label}  (slowest pass: {worst.name} {worst.seconds:.4f}s)')
+    print('\nPasses by total time:')
+    totals = sorted(report.pass_totals(slowest=1).items(), key=lambda item: item[1]['seconds'], reverse=True)
+    for name, total in totals:
+        slowest = total['slowest'][0]
+        print(f"  {total['seconds']:9.4f}s  {name:<22} {total['files']:>6} files {total['matches']:>7} matches"
+              f"  slowest: {slowest['file']} {slowest['seconds']:.4f}s")
+    table = report.format_profile()
+    if table:
+        print(f'\ncProfile of the {len(report.profiles)} slowest files:')
+        print(table)
+        report.dump_profile(path)
+        print(f'Profile stats written to {path} (python -m pstats {path})')
+
+
+def cmd_passes(args):
+    get_passes()
+    for p in PASSES.values():
+        marker = '*' if p.default else ' '
+        print(f'{marker} {p.name:<22} v{p.version}  {p.description}')
+    print('\n* = part of the default pipeline')
+    return 0
+
+
+def cmd_bundle(args):
+    if not os.path.isdir(args.packs_dir):
+        print(f'Packs directory not found: {args.packs_dir}', file=sys.stderr)
+        return 1
+    if args.check:
+        stale = is_stale(args.output, args.packs_dir)
+        print(f"Bundle {'is stale' if stale else 'up to date'}: {args.output}")
+        return 1 if stale else 0
+
+    result = build_bundle(args.output, args.packs_dir, force=args.force)
+    for message in result.messages:
+        print(message)
+    if not result.built:
+        print(f'Bundle up to date: {result.path}')
+    else:
+        print(f'Bundle written: {result.path} ({result.packs} packs, {result.templates} templates, '
+              f'{result.size / 1024:.0f} KB)')
+    return 0
+
+
+def _parse_densities(value):
+    densities = {}
+    for item in _split_names(value):
+        key, _, number = item.partition('=')
+        if key not in DEFAULT_DENSITIES:
+            raise argparse.ArgumentTypeError(f"unknown density {key!r} (known: {', '.join(DEFAULT_DENSITIES)})")
+        try:
+            densities[key] = float(number)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f'not a number: {item!r}')
+    return densities
+
+
+def cmd_bench(args):
+    from .bench import run_benchmarks
+
+    try:
+        get_passes(args.passes)
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return 2
+    report = run_benchmarks(args.sizes, args.density, args.passes, jobs=args.jobs, seed=args.seed,
+                            pathological_size=args.pathological_size, legacy=not args.no_legacy,
+                            workdir=args.workdir)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=1)
+        print(f'Results written to {args.output}')
+    return 0
+
+
+def cmd_render(args):
+    from .render import CompiledTemplate, iter_rows, render_rows
+
+    if (args.output is None) == (args.bundle is None):
+        print('Give exactly one of -o/--output DIR or --bundle FILE', file=sys.stderr)
+        return 2
+    try:
+        template = CompiledTemplate.load(args.template, args.manifest)
+    except (OSError, ValueError) as e:
+        print(e, file=sys.stderr)
+        return 2
+
+    start = time.perf_counter()
+    rows = iter_rows(args.rows, args.format)
+    count = issues = size = 0
+    bundle = open(args.bundle, 'w', encoding='utf-8') if args.bundle else None
+    try:
+        for result in render_rows(template, rows, out_dir=args.output, jobs=args.jobs,
+                                  batch_size=args.batch_size, name_field=args.name_field):
+            count += 1
+            size += result.size
+            if bundle is not None:
+                bundle.write(json.dumps({'name': result.name, 'html': result.html}, ensure_ascii=False))
+                bundle.write('\n')
+            if not result.ok:
+                issues += 1
+                problems = []
+                if result.missing:
+                    problems.append(f"missing {', '.join(map(str, result.missing))}")
+                if result.unknown:
+                    problems.append(f"unknown {', '.join(map(str, result.unknown))}")
+                problems.extend(result.errors)
+                print(f"Row {result.index + 1} ({result.name}): {'; '.join(problems)}")
+    except (OSError, ValueError) as e:
+        print(e, file=sys.stderr)
+        return 1
+    finally:
+        if bundle is not None:
+            bundle.close()
+
+    seconds = time.perf_counter() - start
+    rate = count / seconds if seconds else 0
+    print(f'Rendered {count} posts ({size / 1e6:.1f} MB) in {seconds:.2f}s ({rate:.0f} posts/s) '
+          f'to {args.output or args.bundle}')
+    if issues:
+        print(f'Rows with missing, unknown or invalid placeholders: {issues}')
+        if args.strict:
+            return 1
+    return 0
+
+
+def cmd_fonts(args):
+    from .fonts import SUBSET_DIR, build_fonts
+
+    out_dir = args.output or SUBSET_DIR
+    try:
+        result = build_fonts(args.paths or None, out_dir, force=args.force, check=args.check)
+    except (OSError, RuntimeError) as e:
+        print(e, file=sys.stderr)
+        return 1
+
+    if not result.plans:
+        print('No bundled font is used by the scanned files')
+        return 0
+    entries = result.manifest['fonts']
+    for plan in result.plans:
+        font = plan.font
+        if plan in result.built:
+            entry = entries[font.filename]
+            print(f"Built {entry['output']}: {entry['codepoints']} codepoints, "
+                  f"{entry['source_size'] / 1024:.0f} KB -> {entry['size'] / 1024:.1f} KB ({plan.reason})")
+        elif plan.stale:
+            print(f'Stale {font.filename}: {plan.reason}, {len(plan.codepoints)} codepoints')
+        else:
+            print(f"Up to date {entries[font.filename]['output']} ({entries[font.filename]['codepoints']} codepoints)")
+    if args.check and any(plan.stale for plan in result.plans):
+        return 1
+    return 0
+
+
+def cmd_metrics(args):
+    from .metrics import METRICS_JS, build_metrics
+
+    out_path = args.output or METRICS_JS
+    try:
+        result = build_metrics(out_path, force=args.force, check=args.check)
+    except (OSError, RuntimeError) as e:
+        print(e, file=sys.stderr)
+        return 1
+
+    if result.written:
+        faces = result.data['faces']
+        pairs = sum(sum(1 for value in face['kern']['values'] if value) for face in faces)
+        print(f'Wrote {os.path.relpath(out_path)}: {len(faces)} faces, {pairs} kerning class pairs, '
+              f'{result.size / 1024:.1f} KB ({result.reason})')
+    elif result.stale:
+        print(f'Stale {os.path.relpath(out_path)}: {result.reason}')
+        return 1
+    else:
+        print(f'Up to date {os.path.relpath(out_path)} ({len(result.data["faces"])} faces)')
+    return 0
+
+
+def cmd_index(args):
+    from .index import INDEX_PATH, TemplateIndex
+
+    try:
+        with TemplateIndex(args.db or INDEX_PATH) as index:
+            if args.rebuild:
+                index.clear()
+            result = index.update(args.packs or None)
+    except (OSError, sqlite3.Error) as e:
+        print(e, file=sys.stderr)
+        return 1
+    if args.verbose:
+        for label, paths in (('Indexed', result.added), ('Re-indexed', result.updated), ('Dropped', result.removed)):
+            for path in paths:
+                print(f'{label} {path}')
+    print(f'{len(result.added)} added, {len(result.updated)} updated, {len(result.removed)} removed, '
+          f'{result.unchanged} unchanged in {result.seconds:.2f}s')
+    return 0
+
+
+def _query_rows(index, args):
+    """``(rows, columns)`` answering ``python -m packtools query``."""
+    from .colours import canonical
+    from .icons import normalize
+    from .index import colour_name
+
+    kind, value = args.kind, args.value
+    if kind == 'sql':
+        if not value:
+            raise ValueError('query sql needs a SELECT statement')
+        cursor = index.db.execute(value)
+        return cursor.fetchall(), [column[0] for column in cursor.description or ()]
+    if kind == 'packs':
+        return index.pack_stats(), ['pack', 'templates', 'bytes', 'small fonts', 'inline assets', 'editable']
+    if kind == 'asset':
+        return index.assets(int(args.min_kb * 1024)), ['path', 'kind', 'mime', 'bytes', 'name']
+
+    table, column = {'field': ('fields', 'name'), 'editable': ('editables', 'name'),
+                     'colour': ('colours', 'name'), 'font-size': ('font_sizes', 'px'),
+                     'family': ('font_families', 'name'), 'icon': ('icons', 'name')}[kind]
+    where, params = [], []
+    if value is not None:
+        if kind == 'colour':
+            key = canonical(value.strip())
+            if key is None or isinstance(key, str):
+                raise ValueError(f'Not a hex or rgb() colour (the only ones indexed): {value!r}')
+            value = colour_name(key)
+        elif kind == 'icon':
+            value = normalize(value)
+        elif kind == 'font-size':
+            value = float(value)
+        where.append(f't.{column} = ?')
+        params.append(value)
+    if args.below is not None:
+        where.append(f't.{column} < ?')
+        params.append(args.below)
+    if args.above is not None:
+        where.append(f't.{column} > ?')
+        params.append(args.above)
+    if args.bare:
+        where.append('t.escaped > t.wrapped')
+    where = ' AND '.join(where) or '1'
+    if value is None:
+        return index.inventory(table, column, where, tuple(params)), ['value', 'templates', 'refs']
+    return index.paths(table, where, tuple(params), pack=args.pack), ['path', 'refs']
+
+
+def cmd_query(args):
+    from .index import INDEX_PATH, TemplateIndex
+
+    if args.bare and args.kind != 'field':
+        print('--bare only applies to field queries', file=sys.stderr)
+        return 2
+    if (args.below is not None or args.above is not None) and args.kind != 'font-size':
+        print('--below and --above only apply to font-size queries', file=sys.stderr)
+        return 2
+    try:
+        with TemplateIndex(args.db or INDEX_PATH) as index:
+            if not args.no_update:
+                index.update()
+            rows, columns = _query_rows(index, args)
+    except (ValueError, sqlite3.Error) as e:
+        print(e, file=sys.stderr)
+        return 2
+
+    if args.json:
+        print(json.dumps([dict(zip(columns, row)) for row in rows], indent=1))
+        return 0
+    if columns == ['path', 'refs']:
+        for path, refs in rows:
+            print(f'{refs:>6}  {path}')
+        print(f'{len(rows)} templates')
+    elif columns == ['value', 'templates', 'refs']:
+        print(f"{'templates':>9} {'refs':>6}  value")
+        for value, files, refs in rows:
+            print(f'{files:>9} {refs:>6}  {value:g}' if isinstance(value, float) else f'{files:>9} {refs:>6}  {value}')
+    else:
+        print('\t'.join(columns))
+        for row in rows:
+            print('\t'.join('' if cell is None else str(cell) for cell in row))
+    return 0
+
+
+def cmd_icons(args):
+    from .icons import SPRITE_PATH, compile_sprite
+
+    try:
+        result = compile_sprite(args.paths or None, args.output or SPRITE_PATH, check=args.check)
+    except OSError as e:
+        print(e, file=sys.stderr)
+        return 1
+
+    usage = result.usage
+    for name, files in sorted(usage.unresolved.items()):
+        print(f"Unknown icon {name!r} in {', '.join(sorted(os.path.basename(f) for f in files))}")
+    print(f'Scanned {usage.files} files: {sum(usage.static.values())} static references to '
+          f'{len(usage.static)} icons, {len(usage.dynamic)} files choosing the icon at render time')
+    state = 'would change' if args.check and result.written else 'written' if result.written else 'unchanged'
+    print(f'Sprite: {len(result.names)} symbols, {result.size / 1024:.1f} KB ({state})')
+    if args.check and (result.written or usage.unresolved):
+        return 1
+    return 0
+
+
+def _format_ms(ms):
+    return time.strftime('%Y-%m-%d %H:%M', time.localtime(ms / 1000)) if ms else '-'
+
+
+def cmd_export_cache(args):
+    from .export_cache import RenderCache
+
+    cache = RenderCache(args.dir)
+    if not os.path.isdir(cache.root):
+        print(f'No render cache at {cache.root}')
+        return 0
+
+    changed = False
+    if args.clear:
+        print(f'Removed {cache.clear()} entries')
+        changed = True
+    if args.prune_to is not None or args.older_than is not None:
+        max_bytes = int(args.prune_to * 1024 * 1024) if args.prune_to is not None else None
+        older_than = args.older_than * 86400 if args.older_than is not None else None
+        removed = cache.prune(max_bytes, older_than)
+        freed = sum(entry['size'] for _, entry in removed)
+        print(f'Pruned {len(removed)} entries ({freed / 1e6:.1f} MB)')
+        changed = True
+    if args.repair or changed:
+        missing, orphans = cache.repair()
+        if missing or orphans:
+            print(f'Forgot {len(missing)} entries with no file, deleted {len(orphans)} orphan files')
+        changed = changed or bool(missing)
+    if changed:
+        cache.save()
+
+    if args.list:
+        for key, entry in reversed(cache.by_age()):
+            print(f"{key[:16]}  {entry.get('width')}x{entry.get('height')} {entry.get('format', ''):<4} "
+                  f"{entry['size'] / 1024:8.1f} KB  hits {entry.get('hits', 0):<4} "
+                  f"used {_format_ms(entry.get('lastUsed'))}")
+    entries = cache.entries.values()
+    hits = sum(entry.get('hits', 0) for entry in entries)
+    print(f'{cache.root}: {len(cache.entries)} renders, {cache.total_bytes() / 1e6:.1f} MB, {hits} cache hits')
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='packtools', description='Template pack tooling')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    rewrite = sub.add_parser('rewrite', help='run rewrite passes over template packs')
+    rewrite.add_argument('packs', nargs='*', help=f'pack directories (default: {DEFAULT_PACK})')
+    rewrite.add_argument('--all', action='store_true', help='rewrite every pack under src/packs')
+    rewrite.add_argument('-j', '--jobs', type=int, default=1,
+                         help='worker processes to spread files over, 0 = one per CPU (default: 1)')
+    rewrite.add_argument('--passes', type=_split_names,
+                         help='comma separated passes to run, in order (default: the default pipeline)')
+    rewrite.add_argument('--colour-map', metavar='JSON',
+                         help='JSON object of {colour: replacement} for the whitewash pass')
+    rewrite.add_argument('--dry-run', action='store_true', help='report changes without writing files')
+    rewrite.add_argument('--no-cache', action='store_true',
+                         help='ignore and do not update the per-pack state file; process every template')
+    rewrite.add_argument('--no-prefilter', action='store_true',
+                         help='decode and run every pass on every template, ignoring pass triggers')
+    rewrite.add_argument('--report', metavar='JSON',
+                         help='write per-file, per-pass timings, matches and bytes changed to this file')
+    rewrite.add_argument('--profile', nargs='?', const='packtools.prof', metavar='PATH',
+                         help='profile the slowest files with cProfile, print the hot spots and save the '
+                              'stats to PATH (default: packtools.prof)')
+    rewrite.add_argument('--use-index', action='store_true',
+                         help='update the template index and skip templates it rules out for '
+                              'fix_min_fonts, whitewash and deinline_assets')
+    rewrite.add_argument('--profile-top', type=int, default=10, metavar='N',
+                         help='how many of the slowest files to profile (default: 10)')
+    rewrite.add_argument('--stream-above', type=float, default=STREAM_ABOVE / 1024 / 1024, metavar='MB',
+                         help='stream files this large in fixed-size chunks when every pass allows it '
+                              f'(default: {STREAM_ABOVE // 1024 // 1024})')
+    rewrite.add_argument('--no-snapshot', action='store_true',
+                         help='do not record the run in the snapshot store (no rollback)')
+    rewrite.set_defaults(func=cmd_rewrite)
+
+    snapshots = sub.add_parser('snapshots', help='list, diff and roll back recorded rewrite runs')
+    snapshots.add_argument('action', choices=('list', 'diff', 'rollback', 'prune'),
+                           help='diff RUN: what RUN changed; diff A B: files after A against after B')
+    snapshots.add_argument('runs', nargs='*', help='run ids, unique id prefixes or "last"')
+    snapshots.add_argument('--stat', action='store_true', help='diff: only list files with added/removed lines')
+    snapshots.add_argument('--force', action='store_true',
+                           help='rollback: overwrite files that changed since the run (still snapshotted)')
+    snapshots.add_argument('--keep', type=int, default=20, help='prune: runs to keep (default: 20)')
+    snapshots.add_argument('--dir', help='snapshot store (default: .packtools-snapshots)')
+    snapshots.set_defaults(func=cmd_snapshots)
+
+    watch = sub.add_parser('watch', help='re-run passes on templates as they are saved')
+    watch.add_argument('packs', nargs='*', help=f'pack directories (default: {DEFAULT_PACK})')
+    watch.add_argument('--all', action='store_true', help='watch every pack under src/packs')
+    watch.add_argument('--passes', type=_split_names,
+                       help='comma separated passes to run, in order (default: the default pipeline)')
+    watch.add_argument('--colour-map', metavar='JSON',
+                       help='JSON object of {colour: replacement} for the whitewash pass')
+    watch.add_argument('--debounce', type=float, default=20, metavar='MS',
+                       help='wait until a file has been quiet this long before rewriting it (default: 20)')
+    watch.add_argument('--poll', action='store_true', help='poll file stats instead of using inotify')
+    watch.add_argument('--interval', type=float, default=100, metavar='MS',
+                       help='poll interval with --poll or without inotify (default: 100)')
+    watch.add_argument('--initial', action='store_true', help='rewrite the packs once before watching')
+    watch.add_argument('--no-snapshot', action='store_true',
+                       help='do not record rewritten batches in the snapshot store (no rollback)')
+    watch.set_defaults(func=cmd_watch)
+
+    bridge_load = sub.add_parser('bridge-load', help='replay extractor payloads against the TikTok bridge')
+    bridge_load.add_argument('payloads', nargs='?',
+                             help='JSONL recording (CYBERCANVAS_TIKTOK_RECORD); synthetic payloads without it')
+    bridge_load.add_argument('--url', default='ws://localhost:7890', help='bridge URL (default: ws://localhost:7890)')
+    bridge_load.add_argument('--rate', type=float, default=500, help='messages per second, 0 = as fast as possible '
+                             '(default: 500)')
+    bridge_load.add_argument('--count', type=int, help='stop after this many messages')
+    bridge_load.add_argument('--duration', type=float, default=10, metavar='S',
+                             help='seconds to send for without --count (default: 10)')
+    bridge_load.add_argument('-c', '--connections', type=int, default=1, help='parallel connections (default: 1)')
+    bridge_load.add_argument('--burst', type=int, default=1, help='messages sent back to back per tick (default: 1)')
+    bridge_load.add_argument('--probe-every', type=int, default=10, metavar='N',
+                             help='time every Nth message until its BRIDGE_ACK, 0 = none (default: 10)')
+    bridge_load.add_argument('--timeout', type=float, default=5, metavar='S',
+                             help='wait this long for outstanding acks at the end (default: 5)')
+    bridge_load.add_argument('--videos', type=int, default=300, help='distinct videos in synthetic payloads')
+    bridge_load.add_argument('--profiles', type=int, default=30, help='distinct profiles in synthetic payloads')
+    bridge_load.add_argument('--seed', type=int, default=0, help='synthetic payload seed (default: 0)')
+    bridge_load.add_argument('-o', '--output', help='write the report as JSON to this file')
+    bridge_load.set_defaults(func=cmd_bridge_load)
+
+    bundle = sub.add_parser('bundle', help='compile src/packs into the indexed bundle load-packs reads')
+    bundle.add_argument('--packs-dir', default=PACKS_DIR, help=f'packs to compile (default: {PACKS_DIR})')
+    bundle.add_argument('-o', '--output', default=BUNDLE_PATH, help=f'bundle file (default: {BUNDLE_PATH})')
+    bundle.add_argument('--force', action='store_true', help='rebuild even if no source changed')
+    bundle.add_argument('--check', action='store_true', help='only report whether the bundle is stale (exit 1 if so)')
+    bundle.set_defaults(func=cmd_bundle)
+
+    bench = sub.add_parser('bench', help='time every pass and the pipeline on synthetic packs')
+    bench.add_argument('--sizes', type=lambda v: [int(n) for n in _split_names(v)], default=[10, 100, 1000],
+                       help='comma separated pack sizes in templates (default: 10,100,1000)')
+    bench.add_argument('--density', type=_parse_densities, default={},
+                       help=f"per-template counts, e.g. footers=0.5,greys=8 (keys: {', '.join(DEFAULT_DENSITIES)})")
+    bench.add_argument('--passes', type=_split_names, help='passes to time (default: the default pipeline)')
+    bench.add_argument('-j', '--jobs', type=int, default=1, help='worker processes per run, 0 = one per CPU')
+    bench.add_argument('--seed', type=int, default=0, help='generator seed (default: 0)')
+    bench.add_argument('--pathological-size', type=int, default=1000,
+                       help='repetitions in each pathological input, 0 to skip that suite (default: 1000)')
+    bench.add_argument('--no-legacy', action='store_true',
+                       help='do not time the legacy footer regexes on the pathological inputs')
+    bench.add_argument('--workdir', help='where to generate the packs (default: system temp dir)')
+    bench.add_argument('-o', '--output', metavar='JSON', help='write the results to this file')
+    bench.set_defaults(func=cmd_bench)
+
+    render = sub.add_parser('render', help='fill a {{PLACEHOLDER}} HTML template from JSONL or CSV rows')
+    render.add_argument('template', help='template HTML, e.g. templates/instagram/modern-module-card/template.html')
+    render.add_argument('rows', help='rows as .jsonl or .csv, - for standard input')
+    render.add_argument('-o', '--output', metavar='DIR', help='write one <name>.html per row here')
+    render.add_argument('--bundle', metavar='FILE', help='write every post to one JSONL file of {name, html}')
+    render.add_argument('--manifest', help='template manifest (default: template.json next to the template)')
+    render.add_argument('--format', choices=('jsonl', 'csv'), help='row format (default: from the extension)')
+    render.add_argument('--name-field', default='id',
+                        help='row field naming the output file (default: id; rows without it are numbered)')
+    render.add_argument('-j', '--jobs', type=int, default=1, help='worker processes, 0 = one per CPU (default: 1)')
+    render.add_argument('--batch-size', type=int, default=256, help='rows per worker batch (default: 256)')
+    render.add_argument('--strict', action='store_true', help='exit 1 if any row has missing, unknown or invalid values')
+    render.set_defaults(func=cmd_render)
+
+    fonts = sub.add_parser('fonts', help='subset the bundled fonts to the text the packs use (WOFF2)')
+    fonts.add_argument('paths', nargs='*',
+                       help='files or directories to scan (default: src/packs, templates and the sample scene)')
+    fonts.add_argument('-o', '--output', help='subset directory (default: src/assets/fonts/subset)')
+    fonts.add_argument('--force', action='store_true', help='rebuild every subset')
+    fonts.add_argument('--check', action='store_true', help='only report; exit 1 if a subset needs rebuilding')
+    fonts.set_defaults(func=cmd_fonts)
+
+    metrics = sub.add_parser('metrics', help='write advance-width and kerning tables of the bundled fonts')
+    metrics.add_argument('-o', '--output', help='data file (default: src/engine/FontMetricsData.js)')
+    metrics.add_argument('--force', action='store_true', help='rebuild even if no font changed')
+    metrics.add_argument('--check', action='store_true', help='only report; exit 1 if the tables are out of date')
+    metrics.set_defaults(func=cmd_metrics)
+
+    icons = sub.add_parser('icons', help='compile the offline SVG icon sprite the templates reference')
+    icons.add_argument('paths', nargs='*', help='files or directories to scan (default: src/packs and templates)')
+    icons.add_argument('-o', '--output', help='sprite path (default: assets/icons/sprite.svg)')
+    icons.add_argument('--check', action='store_true',
+                       help='only report; exit 1 if the sprite is out of date or an icon is unknown')
+    icons.set_defaults(func=cmd_icons)
+
+    export_cache = sub.add_parser('export-cache', help="inspect and prune export-batch's render cache")
+    export_cache.add_argument('--dir', help='cache directory (default: $CYBERCANVAS_RENDER_CACHE or '
+                                            '~/.cache/cyber-canvas/render-cache)')
+    export_cache.add_argument('--list', action='store_true', help='list the entries, most recently used first')
+    export_cache.add_argument('--prune-to', type=float, metavar='MB',
+                              help='evict least recently used renders until the cache fits in MB')
+    export_cache.add_argument('--older-than', type=float, metavar='DAYS',
+                              help='evict renders not used for DAYS days')
+    export_cache.add_argument('--repair', action='store_true',
+                              help='forget entries whose file is gone and delete unindexed files more than a day old')
+    export_cache.add_argument('--clear', action='store_true', help='remove every render')
+    export_cache.set_defaults(func=cmd_export_cache)
+
+    index = sub.add_parser('index', help='update the SQLite inventory of template fields, colours, fonts and icons')
+    index.add_argument('packs', nargs='*', help='pack directories (default: every pack under src/packs)')
+    index.add_argument('--db', help='index database (default: src/packs.index.sqlite)')
+    index.add_argument('--rebuild', action='store_true', help='forget everything and index every template again')
+    index.add_argument('-v', '--verbose', action='store_true', help='list the templates indexed or dropped')
+    index.set_defaults(func=cmd_index)
+
+    query = sub.add_parser('query', help='look templates up in the index (updated incrementally first)')
+    query.add_argument('kind', choices=('field', 'editable', 'colour', 'font-size', 'family', 'icon', 'asset',
+                                        'packs', 'sql'),
+                       help='what to look up; without VALUE, list every value with how many templates use it')
+    query.add_argument('value', nargs='?', help='field name, editable id, colour, px, family, icon or SQL')
+    query.add_argument('--below', type=float, metavar='PX', help='font-size: values below PX')
+    query.add_argument('--above', type=float, metavar='PX', help='font-size: values above PX')
+    query.add_argument('--bare', action='store_true',
+                       help='field: only ${esc(d.X)} interpolations not wrapped in renderEditable')
+    query.add_argument('--min-kb', type=float, default=0, help='asset: only assets of at least this size')
+    query.add_argument('--pack', help='only templates of this pack')
+    query.add_argument('--json', action='store_true', help='print the rows as JSON')
+    query.add_argument('--db', help='index database (default: src/packs.index.sqlite)')
+    query.add_argument('--no-update', action='store_true', help='query the index as it is')
+    query.set_defaults(func=cmd_query)
+
+    passes = sub.add_parser('passes', help='list the registered passes')
+    passes.set_defaults(func=cmd_passes)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    return args.func(args)
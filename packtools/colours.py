@@ -0,0 +1,226 @@
+"""One-scan colour rewriting for template CSS and inline styles.
+
+A ``ColourMap`` compiles its keys into a single regex that finds hex,
+``rgb()``/``rgba()`` and named colours, in any letter case, as whole tokens
+in one linear pass. Hex and rgb tokens are compared by the colour they denote, so
+``#888``, ``#888888``, ``#888888ff`` and ``rgb(136, 136, 136)`` are the same
+key, while ``#8888aa`` or ``&#888;`` are never touched. Because tokens never
+overlap, the result does not depend on the order of the map.
+
+Named colours are also words, so they are only replaced where CSS expects
+a value: after ``property:`` in a ``<style>`` block or a ``style=""``
+attribute, or as the whole value of ``fill``, ``stroke`` and the like.
+"Red Team" in a heading stays as it is.
+"""
+import bisect
+import functools
+import re
+
+from .engine import icase
+from .lexer import ATTR, CSS, lex
+
+# Greys to replace with White ("cambialos a blanco" -> #ffffff)
+GREYS_TO_WHITE = {
+    '#94a3b8': '#ffffff',  # Slate 400
+    '#64748b': '#ffffff',  # Slate 500
+    '#475569': '#ffffff',  # Slate 600
+    '#888888': '#ffffff',
+    '#777777': '#ffffff',
+    '#666666': '#ffffff',
+    '#aaaaaa': '#ffffff',
+    '#555555': '#ffffff',
+}
+
+# Every branch starts with a rare literal ('#' or '(') and case is spelled
+# out with character classes instead of re.IGNORECASE, which would turn
+# every 'r' in the file into a candidate. Boundaries are checked with
+# lookbehinds only once a candidate is found: '&' keeps numeric entities
+# such as &#888; out, '\w' keeps ids like a#fff out.
+NOT_AFTER = r'[\w&#-]'
+HEX_START = r'#(?<!%s#)' % NOT_AFTER
+# Matched from the '(' so sre can skip ahead; sub() widens the span back over
+# 'rgb'/'rgba'. No nested parens, so rgb(${r}, ...) is left alone.
+RGB = (r'\((?:(?<=(?<!{0})[rR][gG][bB]\()|(?<=(?<!{0})[rR][gG][bB][aA]\())[^()]*\)'
+       .format(NOT_AFTER))
+
+NUMBER = re.compile(r'^([+-]?(?:\d+\.?\d*|\.\d+))(%?)$')
+
+# Attributes whose whole value is a colour
+COLOUR_ATTRIBUTES = frozenset(('fill', 'stroke', 'color', 'bgcolor', 'stop-color', 'flood-color',
+                               'lighting-color'))
+# Searched up to a named colour: it follows 'property:' in the same declaration, outside quotes
+PROPERTY_VALUE = re.compile(r'[\w-]+\s*:[^;:{}\'"]*$')
+ATTR_NAME = re.compile(r'([\w:-]+)\s*=\s*["\']$')
+LOOKBACK = 200
+
+
+def _channel(value, scale):
+    match = NUMBER.match(value)
+    if not match:
+        return None
+    number = float(match.group(1))
+    if match.group(2):
+        number = number * scale / 100
+    return number
+
+
+def canonical(token):
+    """Hashable identity of a colour token, or ``None`` if it is not one we understand.
+
+    Hex and rgb colours become ``(r, g, b, alpha)``; names become their
+    lower-case spelling.
+    """
+    token = token.lower()
+    if token.startswith('#'):
+        digits = token[1:]
+        if len(digits) in (3, 4):
+            digits = ''.join(c * 2 for c in digits)
+        if len(digits) == 6:
+            digits += 'ff'
+        if len(digits) != 8:
+            return None
+        r, g, b, a = (int(digits[i:i + 2], 16) for i in range(0, 8, 2))
+        return (r, g, b, round(a / 255, 3))
+
+    if token.startswith('rgb'):
+        body = token[token.index('(') + 1:-1]
+        # rgb(1, 2, 3, .5) and rgb(1 2 3 / 50%) are both valid CSS
+        body = body.replace('/', ' ').replace(',', ' ')
+        parts = body.split()
+        if len(parts) not in (3, 4):
+            return None
+        channels = [_channel(part, 255) for part in parts[:3]]
+        alpha = _channel(parts[3], 1) if len(parts) == 4 else 1.0
+        if None in channels or alpha is None:
+            return None
+        return tuple(round(c) for c in channels) + (round(alpha, 3),)
+
+    return token
+
+
+class ColourMap:
+    """Compiled ``{colour: replacement}`` mapping."""
+
+    def __init__(self, mapping):
+        self.replacements = {}
+        hex_spellings = set()
+        self.names = names = []
+        for colour, replacement in mapping.items():
+            key = canonical(colour.strip())
+            if key is None:
+                raise ValueError(f'Not a colour: {colour!r}')
+            self.replacements[key] = replacement
+            if isinstance(key, str):
+                names.append(key)
+            else:
+                hex_spellings.update(_hex_spellings(key))
+
+        # Hex keys are spelled out so other hex colours never reach Python code
+        alternatives = [RGB]
+        if hex_spellings:
+            spellings = sorted(hex_spellings, key=len, reverse=True)
+            alternatives.append(HEX_START + r'(?:%s)(?![\w-])' % '|'.join(map(_any_case, spellings)))
+        for name in names:
+            first = _any_case(name[0])
+            alternatives.append(first + '(?<!%s%s)' % (NOT_AFTER, first) + _any_case(name[1:]) + r'(?![\w-])')
+        self.pattern = re.compile('|'.join(alternatives))
+
+    def edits(self, text, lexed=None):
+        """``(start, end, replacement)`` for every mapped colour in ``text``, in order.
+
+        ``lexed`` is ``lex(text)`` when the caller already has it; otherwise
+        the text is lexed on the first named-colour candidate.
+        """
+        starts = None
+        for match in self.pattern.finditer(text):
+            start = match.start()
+            if text[start] == '(':
+                start -= 4 if text[start - 1] in 'aA' else 3
+            key = canonical(text[start:match.end()])
+            replacement = self.replacements.get(key)
+            if replacement is None:
+                continue
+            if isinstance(key, str):
+                if starts is None:
+                    lexed = lexed if lexed is not None else lex(text)
+                    starts = [span.start for span in lexed.spans]
+                if not _css_value(text, lexed, starts, start):
+                    continue
+            yield start, match.end(), replacement
+
+    def sub(self, text):
+        """Return ``(new_text, replacements made)``."""
+        parts = []
+        pos = count = 0
+        for start, end, replacement in self.edits(text):
+            parts.append(text[pos:start])
+            parts.append(replacement)
+            pos = end
+            count += 1
+        if not count:
+            return text, 0
+        parts.append(text[pos:])
+        return ''.join(parts), count
+
+
+def _css_value(text, lexed, starts, pos):
+    """Whether ``pos`` is where a CSS value goes, see the module docstring."""
+    # Nested spans follow the INTERP that encloses them, so the last span
+    # starting at or before pos is the innermost one
+    i = bisect.bisect_right(starts, pos) - 1
+    if i < 0:
+        return False
+    span = lexed.spans[i]
+    if pos >= span.end or span.kind not in (CSS, ATTR):
+        return False
+    if span.kind == ATTR:
+        name = ATTR_NAME.search(text, max(0, span.start - 64), span.start)
+        name = name.group(1).lower() if name else None
+        if name in COLOUR_ATTRIBUTES:
+            return not text[span.start:pos].strip()
+        if name != 'style':
+            return False
+    return PROPERTY_VALUE.search(text, max(span.start, pos - LOOKBACK), pos) is not None
+
+
+def _hex_spellings(key):
+    """Every hex digit string (without '#') that denotes the colour ``key``."""
+    r, g, b, alpha = key
+    a = round(alpha * 255)
+    if round(a / 255, 3) != alpha:
+        return []
+    spellings = ['%02x%02x%02x%02x' % (r, g, b, a)]
+    if a == 255:
+        spellings.append('%02x%02x%02x' % (r, g, b))
+    if all(c % 17 == 0 for c in (r, g, b, a)):
+        spellings.append('%x%x%x%x' % (r // 17, g // 17, b // 17, a // 17))
+        if a == 255:
+            spellings.append('%x%x%x' % (r // 17, g // 17, b // 17))
+    return spellings
+
+
+def _any_case(literal):
+    return ''.join(f'[{c.lower()}{c.upper()}]' if c.isalpha() else re.escape(c) for c in literal)
+
+
+def colour_triggers(colours):
+    """Triggers for a pass rewriting ``colours``: '#', 'rgb' or one of the names."""
+    triggers = []
+    names = []
+    for colour in colours:
+        key = canonical(colour.strip())
+        if isinstance(key, str):
+            names.append(icase(key.encode('utf-8')))
+        elif not triggers:
+            triggers = [b'#', icase(b'rgb')]
+    return triggers + names
+
+
+@functools.lru_cache(maxsize=16)
+def _compiled(items):
+    return ColourMap(dict(items))
+
+
+def compile_map(mapping):
+    """Cached ``ColourMap`` for ``mapping`` (one compile per worker process)."""
+    return _compiled(tuple(sorted(mapping.items())))
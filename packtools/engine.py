@@ -0,0 +1,676 @@
+"""Single-pass rewrite engine for template packs.
+
+Each template is read once, run through an ordered list of passes on the
+in-memory text and written back at most once.
+"""
+import cProfile
+import copy
+import fnmatch
+import hashlib
+import heapq
+import mmap
+import os
+import shutil
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from .lexer import apply_edits, lex, select_edits
+from .state import PackState, pass_set, sha256_bytes, sha256_file
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PACKS_DIR = os.path.join(REPO_ROOT, 'src', 'packs')
+DEFAULT_PACK = os.path.join(PACKS_DIR, 'kr-edu-pack')
+
+# name -> Pass, in registration order (which is also the default run order)
+PASSES = {}
+
+STREAM_ABOVE = 64 * 1024 * 1024  # files this large are streamed when every pass can be
+STREAM_CHUNK = 1024 * 1024
+
+
+class icase(bytes):
+    """A trigger that matches in any letter case."""
+
+
+class Haystack:
+    """Trigger lookups over a mapped file or a decoded text.
+
+    Case-insensitive triggers are found in a lower-cased copy made on first
+    use, which is still several times faster than an IGNORECASE scan.
+    """
+
+    def __init__(self, buffer):
+        self.buffer = buffer
+        self.is_text = isinstance(buffer, str)
+        self._lower = None
+
+    def contains(self, trigger):
+        folded = isinstance(trigger, icase)
+        if self.is_text:
+            trigger = trigger.decode('utf-8')
+        if not folded:
+            return self.buffer.find(trigger) != -1
+        if self._lower is None:
+            self._lower = self.buffer[:].lower()
+        return self._lower.find(trigger.lower()) != -1
+
+
+class Pass:
+    """A named rewrite applied to every template whose filename matches.
+
+    ``func(doc, **options)`` edits ``doc.text`` in place and returns the
+    number of matches it rewrote.
+
+    ``triggers`` are cheap necessary conditions: byte strings, ``icase``
+    byte strings for case-insensitive patterns, or a callable building them
+    from the options. A pass with triggers only runs on text containing one
+    of them; ``None`` means the pass always has to look.
+
+    ``stream`` declares that the pass is nothing but literal replacements:
+    ``(old, new)`` byte pairs applied in order, as ``doc.replace`` would.
+    Such a pass can run over a file in chunks (``rewrite_stream``).
+    """
+
+    def __init__(self, name, func, files=('*.js',), exclude=(), version=1,
+                 default=True, options=None, triggers=None, stream=None):
+        self.name = name
+        self.func = func
+        self.files = tuple(files)
+        self.exclude = tuple(exclude)
+        self.version = version
+        self.default = default
+        self.options = dict(options or {})
+        self.trigger_spec = triggers
+        self.stream = None if stream is None else tuple(stream)
+        self.description = (func.__doc__ or '').strip().split('\n')[0]
+        self._build_triggers()
+        for old, _ in self.stream or ():
+            # Occurrences that cannot overlap are all matches, which lets a chunk end anywhere
+            if any(old[:i] == old[-i:] for i in range(1, len(old))):
+                raise ValueError(f'{name}: stream literal {old!r} can overlap itself')
+
+    def __repr__(self):
+        return f'<Pass {self.name} v{self.version}>'
+
+    @property
+    def fingerprint(self):
+        """Changes whenever the pass version or its options change."""
+        if not self.options:
+            return str(self.version)
+        options = repr(sorted(self.options.items())).encode('utf-8')
+        return f'{self.version}:{hashlib.sha1(options).hexdigest()[:12]}'
+
+    def _build_triggers(self):
+        spec = self.trigger_spec
+        if callable(spec):
+            spec = spec(**self.options)
+        self.triggers = None if spec is None else tuple(spec)
+
+    def triggered_by(self, haystack):
+        """True if the pass has no triggers or one of them is in ``haystack``."""
+        if self.triggers is None:
+            return True
+        return any(haystack.contains(trigger) for trigger in self.triggers)
+
+    def with_options(self, **options):
+        """Copy of this pass with ``options`` overriding the registered ones."""
+        configured = copy.copy(self)
+        configured.options = {**self.options, **options}
+        configured._build_triggers()
+        return configured
+
+    def applies_to(self, filename):
+        if any(fnmatch.fnmatch(filename, pattern) for pattern in self.exclude):
+            return False
+        return any(fnmatch.fnmatch(filename, pattern) for pattern in self.files)
+
+    def apply(self, doc):
+        return self.func(doc, **self.options)
+
+
+def register(name, files=('*.js',), exclude=(), version=1, default=True, triggers=None, stream=None, **options):
+    """Decorator registering ``func`` as a pass under ``name``."""
+    def decorator(func):
+        PASSES[name] = Pass(name, func, files, exclude, version, default, options, triggers, stream)
+        return func
+    return decorator
+
+
+def get_passes(names=None, options=None):
+    """Resolve pass names (in the given order) or the default pipeline.
+
+    ``options`` maps pass name to option overrides, e.g.
+    ``{'whitewash': {'colours': {...}}}``.
+    """
+    # Importing registers the built-in passes
+    from . import passes  # noqa: F401
+
+    options = options or {}
+    for name in options:
+        if name not in PASSES:
+            raise ValueError(f"Unknown pass: {name} (available: {', '.join(PASSES)})")
+    if names is None:
+        names = [p.name for p in PASSES.values() if p.default]
+
+    selected = []
+    for name in names:
+        if name not in PASSES:
+            raise ValueError(f"Unknown pass: {name} (available: {', '.join(PASSES)})")
+        p = PASSES[name]
+        selected.append(p.with_options(**options[name]) if name in options else p)
+    return selected
+
+
+class Document:
+    """In-memory template text shared by every pass run on one file.
+
+    ``lexed`` tokenises the text on first use and is reused by every later
+    pass until one of them assigns a new ``text``. ``dry_run`` tells passes
+    with side effects outside the template to hold them back.
+
+    Passes should edit through ``sub``, ``replace`` and ``apply_edits``,
+    which count the bytes each edit removes and adds; a pass that assigns
+    ``text`` directly is credited with the net change in size instead.
+    """
+
+    def __init__(self, path, text, dry_run=False):
+        self.path = path
+        self.filename = os.path.basename(path)
+        self.dry_run = dry_run
+        self.messages = []
+        self._lexed = None
+        self.text = text
+        self.reset_counts()
+
+    @property
+    def text(self):
+        return self._text
+
+    @text.setter
+    def text(self, value):
+        if self._lexed is not None and value != self._text:
+            self._lexed = None
+        self._text = value
+
+    @property
+    def lexed(self):
+        if self._lexed is None:
+            self._lexed = lex(self._text)
+        return self._lexed
+
+    def warn(self, message):
+        self.messages.append(f'Warning: {message}')
+
+    def reset_counts(self):
+        self.added = self.removed = 0
+        self.counted = False
+
+    def _count(self, old, new):
+        self.removed += len(old.encode('utf-8'))
+        self.added += len(new.encode('utf-8'))
+        self.counted = True
+
+    def sub(self, pattern, repl):
+        """``pattern.subn`` on the text; returns how many matches were actually changed."""
+        count = 0
+
+        def replacer(match):
+            nonlocal count
+            new = repl(match) if callable(repl) else match.expand(repl)
+            old = match.group(0)
+            if new != old:
+                count += 1
+                self._count(old, new)
+            return new
+
+        self.text = pattern.sub(replacer, self.text)
+        return count
+
+    def replace(self, old, new):
+        """``str.replace`` on the text; returns the number of occurrences replaced."""
+        count = self.text.count(old)
+        if count and old != new:
+            self.removed += count * len(old.encode('utf-8'))
+            self.added += count * len(new.encode('utf-8'))
+            self.counted = True
+            self.text = self.text.replace(old, new)
+        return count
+
+    def apply_edits(self, edits):
+        """Apply ``(start, end, replacement)`` edits (see ``lexer.apply_edits``); return how many."""
+        edits = list(select_edits(edits))
+        text = self.text
+        for start, end, replacement in edits:
+            self._count(text[start:end], replacement)
+        if edits:
+            self.text = apply_edits(text, edits)
+        return len(edits)
+
+
+class PassStat:
+    """What one pass did to one file."""
+    __slots__ = ('name', 'seconds', 'matches', 'added', 'removed')
+
+    def __init__(self, name, seconds, matches, added, removed):
+        self.name = name
+        self.seconds = seconds
+        self.matches = matches
+        self.added = added
+        self.removed = removed
+
+    def to_dict(self):
+        return {'pass': self.name, 'seconds': round(self.seconds, 6), 'matches': self.matches,
+                'bytes_added': self.added, 'bytes_removed': self.removed}
+
+
+class FileResult:
+    """Outcome of running the pipeline over one template."""
+
+    def __init__(self, path):
+        self.path = path
+        self.changed = False
+        self.written = False
+        self.skipped = False  # left alone because the state cache says it is fresh
+        self.filtered = False  # left alone because the template index rules out every pass
+        self.sha256 = None  # of the file as it is on disk after this run
+        self.previous_sha256 = None  # of the file before this run, when it was written
+        self.stored = 0  # bytes added to the snapshot store
+        self.applied = []  # [(pass name, matches)]
+        self.stats = []  # PassStat of every pass that ran
+        self.size = None  # bytes before the run, None if never read
+        self.new_size = None
+        self.seconds = 0.0  # read, passes and write
+        self.profile = None  # cProfile stats dict when profiling
+        self.messages = []
+
+    @property
+    def filename(self):
+        return os.path.basename(self.path)
+
+    @property
+    def label(self):
+        """``pack/filename``, unambiguous when several packs run together."""
+        return os.path.join(os.path.basename(os.path.dirname(self.path)), self.filename)
+
+    def summary(self):
+        passes = ', '.join(f'{name}({matches})' for name, matches in self.applied)
+        return f'Updated {self.label}: {passes}'
+
+
+def rewrite_text(doc, passes, triggered=None):
+    """Run ``passes`` over ``doc`` and return a ``PassStat`` for each one that ran.
+
+    ``triggered`` holds the names of the passes whose triggers were found in
+    the original bytes; once an earlier pass has changed the text, triggers
+    are checked again on the new text.
+    """
+    original = doc.text
+    stats = []
+    for p in passes:
+        if not p.applies_to(doc.filename):
+            continue
+        if triggered is not None and doc.text == original:
+            if p.name not in triggered:
+                continue
+        elif not p.triggered_by(Haystack(doc.text)):
+            continue
+        before = doc.text
+        doc.reset_counts()
+        start = time.perf_counter()
+        matches = p.apply(doc)
+        seconds = time.perf_counter() - start
+        added, removed = doc.added, doc.removed
+        if not doc.counted and doc.text != before:
+            delta = len(doc.text.encode('utf-8')) - len(before.encode('utf-8'))
+            added, removed = max(delta, 0), max(-delta, 0)
+        stats.append(PassStat(p.name, seconds, matches, added, removed))
+    return stats
+
+
+def _read_template(path, passes, known_hash, prefilter, ruled_out=()):
+    """Return ``(sha256, size, raw bytes or None, triggered pass names)``.
+
+    The file is mapped rather than read so that hashing and the trigger
+    scan never copy or decode it; ``raw`` is ``None`` when nothing can
+    change and the file does not need decoding at all. Passes named in
+    ``ruled_out`` count as not triggered.
+    """
+    passes = [p for p in passes if p.name not in ruled_out]
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return sha256_bytes(b''), 0, b'', {p.name for p in passes}
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            digest = hashlib.sha256(buffer).hexdigest()
+            if digest == known_hash:
+                return digest, size, None, set()
+            if not prefilter:
+                return digest, size, buffer[:], {p.name for p in passes}
+            haystack = Haystack(buffer)
+            triggered = {p.name for p in passes if p.triggered_by(haystack)}
+            return digest, size, (buffer[:] if triggered else None), triggered
+
+
+def rewrite_file(path, passes, dry_run=False, known_hash=None, prefilter=True, profile=False, store=None,
+                 stream_above=None, ruled_out=()):
+    """Read ``path`` once, run the passes and write it back if it changed.
+
+    ``known_hash`` is the sha256 recorded after the last run with the same
+    passes; a file still matching it is skipped without running anything.
+    With ``prefilter`` a file in which no pass finds a trigger is never
+    decoded. With ``profile`` the passes run under cProfile and the stats
+    end up in ``result.profile``. With a ``store``
+    (``snapshots.ObjectStore``) the old and new bytes of a file that gets
+    written are put in it first, and the file is logged to the run in
+    progress. Files of at least ``stream_above`` bytes go through
+    ``rewrite_stream`` when every pass is a streaming one.
+    ``ruled_out`` names passes known to have nothing to change in the file
+    as it is on disk (``index.pass_candidates``); they are skipped unless an
+    earlier pass edits the text, and then their triggers decide as usual.
+    """
+    result = FileResult(path)
+    passes = [p for p in passes if p.applies_to(result.filename)]
+    if not passes:
+        return result
+    messages = []
+    if stream_above is not None:
+        size = os.path.getsize(path)
+        if size >= stream_above:
+            if all(p.stream for p in passes):
+                return rewrite_stream(path, passes, dry_run=dry_run, known_hash=known_hash, store=store)
+            names = ', '.join(p.name for p in passes if not p.stream)
+            messages.append(f'{result.label}: {size / 1e6:.0f} MB read into memory, {names} cannot stream')
+
+    start = time.perf_counter()
+    result.sha256, result.size, raw, triggered = _read_template(path, passes, known_hash, prefilter, ruled_out)
+    result.new_size = result.size
+    if result.sha256 == known_hash:
+        result.skipped = True
+        return result
+    if raw is None:
+        result.seconds = time.perf_counter() - start
+        return result
+
+    # Bytes in and out keep CRLF files byte-for-byte intact
+    original = raw.decode('utf-8')
+    doc = Document(path, original, dry_run=dry_run)
+    profiler = cProfile.Profile() if profile else None
+    if profiler is not None:
+        profiler.enable()
+    try:
+        result.stats = rewrite_text(doc, passes, triggered)
+    finally:
+        if profiler is not None:
+            profiler.disable()
+            profiler.create_stats()
+            result.profile = profiler.stats
+    result.applied = [(stat.name, stat.matches) for stat in result.stats if stat.matches]
+    result.messages = messages + doc.messages
+
+    if doc.text != original:
+        result.changed = True
+        data = doc.text.encode('utf-8')
+        result.new_size = len(data)
+        if not dry_run:
+            new_sha = sha256_bytes(data)
+            if store is not None:
+                result.stored = store.put(raw, result.sha256) + store.put(data, new_sha)
+                store.log(path, result.sha256, new_sha)
+            _replace_file(path, data)
+            result.written = True
+            result.previous_sha256 = result.sha256
+            result.sha256 = new_sha
+    result.seconds = time.perf_counter() - start
+    return result
+
+
+def _replace_file(path, data):
+    """Write ``data`` to a temporary file next to ``path`` and ``os.replace`` it.
+
+    A reader never sees half a file, and the directory mtime moves, which is
+    what ``PackBundle`` checks at load.
+    """
+    tmp = tempfile.NamedTemporaryFile('wb', dir=os.path.dirname(path) or '.',
+                                      prefix=f'.{os.path.basename(path)}.', suffix='.tmp', delete=False)
+    try:
+        with tmp:
+            tmp.write(data)
+            tmp.flush()
+            os.fsync(tmp.fileno())
+        shutil.copymode(path, tmp.name)
+        os.replace(tmp.name, path)
+    except BaseException:
+        os.remove(tmp.name)
+        raise
+
+
+class _StreamReplace:
+    """One ``(old, new)`` literal of a streaming pass, fed chunk by chunk.
+
+    The last ``len(old) - 1`` bytes of a chunk are held back, as is an
+    occurrence crossing the cut, so no match is ever split between chunks.
+    """
+
+    def __init__(self, old, new):
+        self.old = old
+        self.new = new
+        self.carry = b''
+        self.matches = 0
+        self.seconds = 0.0
+
+    def feed(self, data, final=False):
+        start = time.perf_counter()
+        data = self.carry + data
+        cut = len(data)
+        if not final:
+            cut = max(cut - len(self.old) + 1, 0)
+            crossing = data.find(self.old, max(cut - len(self.old) + 1, 0))
+            if crossing != -1 and crossing < cut:
+                cut = crossing
+        head, self.carry = data[:cut], data[cut:]
+        count = head.count(self.old)
+        if count:
+            self.matches += count
+            head = head.replace(self.old, self.new)
+        self.seconds += time.perf_counter() - start
+        return head
+
+
+def rewrite_stream(path, passes, dry_run=False, known_hash=None, store=None, chunk_size=STREAM_CHUNK):
+    """Run streaming passes (``Pass.stream``) over ``path`` ``chunk_size`` bytes at a time.
+
+    Memory stays at a few chunks however large the file is. The output goes
+    to a temporary file next to ``path`` that replaces it, with ``os.replace``,
+    only if something changed. A ``known_hash`` costs an extra read: the
+    file is hashed before anything runs.
+    """
+    result = FileResult(path)
+    start = time.perf_counter()
+    result.size = os.path.getsize(path)
+    if known_hash is not None and sha256_file(path, chunk_size) == known_hash:
+        result.sha256 = known_hash
+        result.skipped = True
+        return result
+
+    stages = [(p.name, _StreamReplace(old, new)) for p in passes for old, new in p.stream]
+    old_digest = hashlib.sha256()
+    new_digest = hashlib.sha256()
+    result.new_size = 0
+    tmp = None
+    if not dry_run:
+        tmp = tempfile.NamedTemporaryFile('wb', dir=os.path.dirname(path) or '.',
+                                          prefix=f'.{result.filename}.', suffix='.tmp', delete=False)
+    try:
+        with open(path, 'rb') as f:
+            while True:
+                chunk = f.read(chunk_size)
+                final = not chunk
+                old_digest.update(chunk)
+                for _, stage in stages:
+                    chunk = stage.feed(chunk, final)
+                new_digest.update(chunk)
+                result.new_size += len(chunk)
+                if tmp is not None:
+                    tmp.write(chunk)
+                if final:
+                    break
+        result.sha256 = old_digest.hexdigest()
+        result.changed = any(stage.matches for _, stage in stages)
+        if tmp is not None:
+            tmp.flush()
+            os.fsync(tmp.fileno())
+            tmp.close()
+            if result.changed:
+                new_sha = new_digest.hexdigest()
+                if store is not None:
+                    result.stored = store.put_file(path, result.sha256) + store.put_file(tmp.name, new_sha)
+                    store.log(path, result.sha256, new_sha)
+                shutil.copymode(path, tmp.name)
+                os.replace(tmp.name, path)
+                result.written = True
+                result.previous_sha256 = result.sha256
+                result.sha256 = new_sha
+    finally:
+        if tmp is not None:
+            tmp.close()
+            if not result.written:
+                os.remove(tmp.name)
+
+    for p in passes:
+        own = [stage for name, stage in stages if name == p.name]
+        matches = sum(stage.matches for stage in own)
+        delta = sum(stage.matches * (len(stage.new) - len(stage.old)) for stage in own)
+        result.stats.append(PassStat(p.name, sum(stage.seconds for stage in own), matches,
+                                     max(delta, 0), max(-delta, 0)))
+    result.applied = [(stat.name, stat.matches) for stat in result.stats if stat.matches]
+    result.seconds = time.perf_counter() - start
+    return result
+
+
+def iter_templates(pack_dir):
+    """Sorted paths of every ``.js`` file directly inside ``pack_dir``."""
+    for filename in sorted(os.listdir(pack_dir)):
+        path = os.path.join(pack_dir, filename)
+        if filename.endswith('.js') and os.path.isfile(path):
+            yield path
+
+
+def repo_relpath(path):
+    """``path`` relative to the repository, or absolute if it is outside."""
+    path = os.path.abspath(path)
+    if os.path.commonpath([path, REPO_ROOT]) != REPO_ROOT:
+        return path
+    return os.path.relpath(path, REPO_ROOT)
+
+
+def iter_pack_dirs(packs_dir=PACKS_DIR):
+    """Every pack directory under ``src/packs``, sorted by name."""
+    for name in sorted(os.listdir(packs_dir)):
+        path = os.path.join(packs_dir, name)
+        if os.path.isdir(path):
+            yield path
+
+
+def run_pack(pack_dir, passes, dry_run=False, use_cache=True, prefilter=True, profile=0):
+    """Rewrite every template in ``pack_dir``, yielding a FileResult each."""
+    return run_packs([pack_dir], passes, dry_run=dry_run, use_cache=use_cache, prefilter=prefilter,
+                     profile=profile)
+
+
+# Seconds of the slowest files this process has profiled in the current run
+_profiled = []
+
+
+def _rewrite_job(job):
+    path, passes, dry_run, known_hash, prefilter, profile, store, stream_above, ruled_out = job
+    result = rewrite_file(path, passes, dry_run=dry_run, known_hash=known_hash, prefilter=prefilter,
+                          profile=bool(profile), store=store, stream_above=stream_above, ruled_out=ruled_out)
+    # Only stats that can make the overall top ``profile`` go back to the parent
+    if result.profile is not None:
+        if len(_profiled) < profile:
+            heapq.heappush(_profiled, result.seconds)
+        elif result.seconds > _profiled[0]:
+            heapq.heapreplace(_profiled, result.seconds)
+        else:
+            result.profile = None
+    return result
+
+
+def run_packs(pack_dirs, passes, jobs=1, dry_run=False, use_cache=True, prefilter=True, profile=0,
+              candidates=None, store=None, stream_above=None):
+    """Rewrite every template in ``pack_dirs``, spreading files over ``jobs`` processes.
+
+    Results are yielded in file order whatever the pool finishes first, so
+    logs read the same as a serial run. With ``use_cache`` each pack's
+    state file lets templates that are unchanged since the last run with
+    the same passes be skipped after a single ``stat``. With ``profile`` the
+    ``profile`` slowest files come back with their cProfile stats.
+    ``candidates`` (``index.pass_candidates``) maps a pass name to the only
+    absolute paths it can change as they are now; on every other file that
+    pass only runs if an earlier pass edits the text, and a file every pass
+    is ruled out for is never opened. ``store`` and ``stream_above`` are
+    handed to ``rewrite_file``.
+    """
+    _profiled.clear()
+    if jobs == 0:
+        jobs = os.cpu_count() or 1
+
+    states = {}
+    paths = []
+    for pack_dir in pack_dirs:
+        pack_paths = list(iter_templates(pack_dir))
+        if use_cache:
+            state = states[pack_dir] = PackState.load(pack_dir)
+            state.forget_missing(os.path.basename(path) for path in pack_paths)
+        paths.extend((pack_dir, path) for path in pack_paths)
+
+    # Fresh files never leave this process; the rest go to the workers
+    todo = []
+    fresh = set()
+    filtered = set()
+    for pack_dir, path in paths:
+        if not pass_set(passes, os.path.basename(path)):
+            continue
+        state = states.get(pack_dir)
+        if state is not None and state.is_fresh(path, passes):
+            fresh.add(path)
+            continue
+        ruled_out = frozenset()
+        if candidates is not None:
+            abs_path = os.path.abspath(path)
+            ruled_out = frozenset(name for name, paths in candidates.items() if abs_path not in paths)
+            if not set(pass_set(passes, os.path.basename(path))) - ruled_out:
+                filtered.add(path)
+                continue
+        known_hash = state.known_hash(path, passes) if state is not None else None
+        todo.append((path, passes, dry_run, known_hash, prefilter, profile, store, stream_above, ruled_out))
+
+    if jobs <= 1 or len(todo) < 2:
+        done = map(_rewrite_job, todo)
+        pool = None
+    else:
+        # Large chunks keep pickling overhead low; several per worker keep the pool balanced
+        pool = ProcessPoolExecutor(max_workers=jobs)
+        done = pool.map(_rewrite_job, todo, chunksize=max(1, len(todo) // (jobs * 4)))
+
+    stale = {job[0] for job in todo}
+    try:
+        for pack_dir, path in paths:
+            if path not in stale:
+                result = FileResult(path)
+                result.skipped = path in fresh
+                result.filtered = path in filtered
+                yield result
+                continue
+            result = next(done)
+            state = states.get(pack_dir)
+            if state is not None and not dry_run and result.sha256 is not None:
+                state.record(path, passes, result.sha256)
+            yield result
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+        if not dry_run:
+            for state in states.values():
+                state.save()
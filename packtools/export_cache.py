@@ -0,0 +1,133 @@
+"""Inspect and prune the export render cache ``main.js`` keeps.
+
+``export-batch`` stores every slide it renders under the sha256 of its
+prepared HTML plus size and format (``src/services/RenderCache.js``), so a
+re-export only renders the slides that changed. The layout is::
+
+    <dir>/index.json                  {"version": 1, "entries": {key: {...}}}
+    <dir>/objects/<ab>/<key>.<ext>
+
+Entries carry ``size`` and ``lastUsed`` (ms since the epoch); eviction is
+least recently used first, as in the app.
+
+The app renames each render into ``objects/`` as soon as it is written but
+saves ``index.json`` only when the batch ends, so a file missing from the
+index may belong to an export still running. ``repair`` leaves such files
+alone until they are ``ORPHAN_GRACE`` seconds old.
+"""
+import json
+import os
+import time
+
+CACHE_VERSION = 1
+# Unindexed files (and .tmp leftovers) younger than this may be an export in progress
+ORPHAN_GRACE = 24 * 3600
+
+
+def default_dir():
+    """Same lookup as ``RenderCache.defaultDir``."""
+    if os.environ.get('CYBERCANVAS_RENDER_CACHE'):
+        return os.environ['CYBERCANVAS_RENDER_CACHE']
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'cyber-canvas', 'render-cache')
+
+
+class RenderCache:
+
+    def __init__(self, root=None):
+        self.root = root or default_dir()
+        self.entries = {}
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            return
+        if index.get('version') == CACHE_VERSION:
+            self.entries = index.get('entries') or {}
+
+    @property
+    def index_path(self):
+        return os.path.join(self.root, 'index.json')
+
+    @property
+    def objects_dir(self):
+        return os.path.join(self.root, 'objects')
+
+    def object_path(self, entry):
+        return os.path.join(self.objects_dir, entry['file'])
+
+    def total_bytes(self):
+        return sum(entry['size'] for entry in self.entries.values())
+
+    def by_age(self):
+        """``(key, entry)`` pairs, least recently used first."""
+        return sorted(self.entries.items(), key=lambda item: item[1].get('lastUsed', 0))
+
+    def _remove(self, key):
+        entry = self.entries.pop(key)
+        try:
+            os.remove(self.object_path(entry))
+        except FileNotFoundError:
+            pass
+        return entry
+
+    def prune(self, max_bytes=None, older_than=None):
+        """Drop entries unused for ``older_than`` seconds, then LRU down to ``max_bytes``.
+
+        Returns the removed ``(key, entry)`` pairs.
+        """
+        removed = []
+        if older_than is not None:
+            cutoff = (time.time() - older_than) * 1000
+            for key, entry in self.by_age():
+                if entry.get('lastUsed', 0) >= cutoff:
+                    break
+                removed.append((key, self._remove(key)))
+        if max_bytes is not None:
+            total = self.total_bytes()
+            for key, entry in self.by_age():
+                if total <= max_bytes:
+                    break
+                removed.append((key, self._remove(key)))
+                total -= entry['size']
+        return removed
+
+    def repair(self, grace=ORPHAN_GRACE):
+        """Forget entries whose file is gone and delete files no entry points to.
+
+        Files modified less than ``grace`` seconds ago are kept. Returns
+        ``(missing entries, orphan files)``.
+        """
+        missing = [key for key, entry in self.entries.items() if not os.path.isfile(self.object_path(entry))]
+        for key in missing:
+            del self.entries[key]
+        known = {os.path.normpath(entry['file']) for entry in self.entries.values()}
+        cutoff = time.time() - grace
+        orphans = []
+        for dirpath, _, filenames in os.walk(self.objects_dir):
+            for filename in filenames:
+                path = os.path.join(dirpath, filename)
+                if os.path.relpath(path, self.objects_dir) in known:
+                    continue
+                try:
+                    if os.stat(path).st_mtime > cutoff:
+                        continue
+                    os.remove(path)
+                except FileNotFoundError:  # renamed or removed by the app meanwhile
+                    continue
+                orphans.append(path)
+        return missing, orphans
+
+    def clear(self):
+        count = len(self.entries)
+        for key in list(self.entries):
+            self._remove(key)
+        self.repair(grace=0)
+        return count
+
+    def save(self):
+        os.makedirs(self.root, exist_ok=True)
+        tmp_path = f'{self.index_path}.{os.getpid()}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': CACHE_VERSION, 'entries': self.entries}, f)
+        os.replace(tmp_path, self.index_path)
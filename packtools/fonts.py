@@ -0,0 +1,305 @@
+"""Subset the bundled fonts to the text the packs actually use.
+
+Every pack template, ``templates/`` HTML file and slide data file is
+scanned for the font families it names and the characters it contains.
+Each font in ``src/assets/fonts`` that is used is cut down to those
+codepoints (plus ``BASE_TEXT``, so AI-written slides rarely step outside
+it) and saved as WOFF2 under ``src/assets/fonts/subset``, with a manifest
+recording what each subset covers and what the full font has glyphs for
+(so the export only embeds the full font for characters it can draw). A font is only rebuilt when the codepoint
+set it needs grows beyond what it covers or its source file changes; the
+new subset covers the union, so coverage never shrinks.
+
+Subsetting needs ``fontTools`` and ``brotli`` (``pip install fonttools
+brotli``); scanning and ``--check`` work without them.
+"""
+import fnmatch
+import io
+import json
+import os
+
+from .engine import PACKS_DIR, REPO_ROOT
+from .state import sha256_bytes
+
+try:
+    from fontTools import subset as ft_subset
+except ImportError:  # optional: only needed to build subsets
+    ft_subset = None
+
+FONT_DIR = os.path.join(REPO_ROOT, 'src', 'assets', 'fonts')
+SUBSET_DIR = os.path.join(FONT_DIR, 'subset')
+MANIFEST_NAME = 'manifest.json'
+CSS_NAME = 'fonts.css'
+MANIFEST_VERSION = 2
+
+TEMPLATES_DIR = os.path.join(REPO_ROOT, 'templates')
+SOURCE_PATTERNS = ('*.js', '*.json', '*.html', '*.css')
+# Scanned for characters only: the scene JSON the canvas editor starts from
+DEFAULT_DATA = (os.path.join(REPO_ROOT, 'src', 'engine', 'sample-scene.json'),)
+
+# Always kept: printable ASCII, Latin-1 (Spanish accents, ¿¡, «»), the
+# typographic punctuation and arrows slides use, and the replacement glyph.
+BASE_TEXT = (''.join(map(chr, range(0x20, 0x7f))) + ''.join(map(chr, range(0xa0, 0x100)))
+             + '‐‑–—―‘’‚“”„•…′″‹›€™←↑→↓↔✓✔✕✗★☆●○■□▶►▸◆◇' + '�')
+
+
+class FontSource:
+    """One font file in ``FONT_DIR`` and the CSS family names that select it."""
+
+    def __init__(self, filename, families, weight='400', style='normal'):
+        self.filename = filename
+        self.families = tuple(families)
+        self.weight = weight
+        self.style = style
+
+    def __repr__(self):
+        return f'<FontSource {self.filename}>'
+
+    @property
+    def family(self):
+        return self.families[0]
+
+    @property
+    def path(self):
+        return os.path.join(FONT_DIR, self.filename)
+
+    @property
+    def output(self):
+        stem = os.path.splitext(self.filename)[0]
+        return ''.join(c if c.isalnum() or c in '-_' else '-' for c in stem) + '.subset.woff2'
+
+    def used_in(self, text):
+        return any(family in text for family in self.families)
+
+
+# The families BrandingSystem, CanvasRenderer and shell.css declare
+FONTS = [
+    FontSource('BlackOpsOne-Regular.ttf', ('BlackOpsOne', 'Black Ops One')),
+    FontSource('MPLUSCodeLatin-VariableFont_wdth,wght.ttf', ('MPLUS Code Latin',), weight='100 900'),
+    FontSource('CODE Bold.otf', ('CODE Bold',), weight='700'),
+    FontSource('newcomictitle.ttf', ('NewComicTitle',), weight='900'),
+]
+
+
+# ── Codepoint ranges ─────────────────────────────────────────────────
+
+def to_ranges(codepoints):
+    """Sorted ``[[start, end], ...]`` (inclusive) covering ``codepoints``."""
+    ranges = []
+    for cp in sorted(codepoints):
+        if ranges and cp == ranges[-1][1] + 1:
+            ranges[-1][1] = cp
+        else:
+            ranges.append([cp, cp])
+    return ranges
+
+
+def from_ranges(ranges):
+    return {cp for start, end in ranges for cp in range(start, end + 1)}
+
+
+def unicode_range(ranges):
+    """CSS ``unicode-range`` value for ``ranges``."""
+    return ', '.join(f'U+{start:X}' if start == end else f'U+{start:X}-{end:X}' for start, end in ranges)
+
+
+# ── Scanning ─────────────────────────────────────────────────────────
+
+def iter_sources(roots=None):
+    """Template and data files under ``roots`` (default: the packs, ``templates/`` and ``DEFAULT_DATA``)."""
+    for root in roots or (PACKS_DIR, TEMPLATES_DIR, *DEFAULT_DATA):
+        if os.path.isfile(root):
+            yield root
+            continue
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames.sort()
+            for filename in sorted(filenames):
+                if any(fnmatch.fnmatch(filename, pattern) for pattern in SOURCE_PATTERNS):
+                    yield os.path.join(dirpath, filename)
+
+
+def scan_usage(paths, fonts=FONTS):
+    """``{font filename: set of codepoints}`` for the fonts ``paths`` use.
+
+    A file's characters count for every font it names; files that name none
+    (slide data) count for every font used anywhere.
+    """
+    usage = {}
+    shared = set()
+    for path in paths:
+        try:
+            with open(path, 'r', encoding='utf-8', errors='replace') as f:
+                text = f.read()
+        except OSError:
+            continue
+        codepoints = {ord(c) for c in text if c >= ' '}
+        used = [font for font in fonts if font.used_in(text)]
+        for font in used:
+            usage.setdefault(font.filename, set()).update(codepoints)
+        if not used:
+            shared.update(codepoints)
+    for codepoints in usage.values():
+        codepoints.update(shared)
+    return usage
+
+
+# ── Manifest and build ───────────────────────────────────────────────
+
+def read_manifest(out_dir=SUBSET_DIR):
+    try:
+        with open(os.path.join(out_dir, MANIFEST_NAME), 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {'version': MANIFEST_VERSION, 'fonts': {}}
+    if manifest.get('version') != MANIFEST_VERSION:
+        return {'version': MANIFEST_VERSION, 'fonts': {}}
+    return manifest
+
+
+def _write_atomic(path, data):
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+class FontPlan:
+    """What one font needs: its codepoints and whether the subset must be rebuilt."""
+
+    def __init__(self, font, needed, entry, source_sha, out_dir):
+        self.font = font
+        self.entry = entry
+        self.source_sha = source_sha
+        covered = from_ranges(entry['requested']) if entry else set()
+        self.missing = needed - covered
+        if entry is None:
+            self.reason = 'new'
+        elif entry.get('source_sha256') != source_sha:
+            self.reason = 'source changed'
+        elif not os.path.exists(os.path.join(out_dir, entry['output'])):
+            self.reason = 'output missing'
+        elif self.missing:
+            self.reason = f'{len(self.missing)} new codepoints'
+        else:
+            self.reason = None
+        # Keep everything already covered unless the font itself changed
+        keep = covered if self.reason != 'source changed' else set()
+        self.codepoints = needed | keep
+
+    @property
+    def stale(self):
+        return self.reason is not None
+
+
+def plan_fonts(usage, out_dir=SUBSET_DIR, fonts=FONTS, manifest=None):
+    """A ``FontPlan`` per used font whose source file exists."""
+    manifest = manifest or read_manifest(out_dir)
+    base = {ord(c) for c in BASE_TEXT}
+    plans = []
+    for font in fonts:
+        if font.filename not in usage or not os.path.isfile(font.path):
+            continue
+        with open(font.path, 'rb') as f:
+            source_sha = sha256_bytes(f.read())
+        plans.append(FontPlan(font, usage[font.filename] | base, manifest['fonts'].get(font.filename),
+                              source_sha, out_dir))
+    return plans
+
+
+def subset_font(source_path, codepoints):
+    """``(woff2 bytes, codepoints it has glyphs for, codepoints the full font has)``.
+
+    The subset is ``source_path`` cut to ``codepoints``. Needs fontTools and brotli.
+    """
+    if ft_subset is None:
+        raise RuntimeError('Font subsetting needs fontTools and brotli: pip install fonttools brotli')
+    options = ft_subset.Options()
+    options.flavor = 'woff2'
+    options.layout_features = ['*']  # keep kerning, ligatures and variable-font axes
+    options.name_IDs = ['*']
+    options.notdef_outline = True
+    options.drop_tables += ['DSIG']
+    font = ft_subset.load_font(source_path, options)
+    try:
+        available = set(font.getBestCmap() or ())
+        subsetter = ft_subset.Subsetter(options)
+        subsetter.populate(unicodes=codepoints)
+        subsetter.subset(font)
+        covered = set(font.getBestCmap() or ())
+        out = io.BytesIO()
+        ft_subset.save_font(font, out, options)
+    finally:
+        font.close()
+    return out.getvalue(), covered, available
+
+
+def font_face_css(manifest):
+    """``@font-face`` rules for the subsets: the full font first, then the subset.
+
+    Browsers try faces in reverse order and only fetch one whose
+    ``unicode-range`` holds the character, so text the subset covers never
+    loads the full file and anything else still renders.
+    """
+    rules = []
+    for filename, entry in sorted(manifest['fonts'].items()):
+        for family in entry['families']:
+            for src, extra in ((f"url('../{filename}')", ''),
+                               (f"url('{entry['output']}') format('woff2')",
+                                f"\n    unicode-range: {entry['unicode_range']};")):
+                rules.append(f"@font-face {{\n    font-family: '{family}';\n    src: {src};\n"
+                             f"    font-weight: {entry['weight']};\n    font-style: {entry['style']};\n"
+                             f"    font-display: swap;{extra}\n}}\n")
+    return '\n'.join(rules)
+
+
+class BuildResult:
+
+    def __init__(self, plans, built, manifest):
+        self.plans = plans
+        self.built = built
+        self.manifest = manifest
+
+
+def build_fonts(paths=None, out_dir=SUBSET_DIR, force=False, check=False, fonts=FONTS):
+    """Scan ``paths`` and rebuild the subsets whose coverage must grow.
+
+    With ``check`` nothing is written; the plans say what would be rebuilt.
+    """
+    usage = scan_usage(list(iter_sources(paths)), fonts)
+    manifest = read_manifest(out_dir)
+    plans = plan_fonts(usage, out_dir, fonts, manifest)
+    if force:
+        for plan in plans:
+            plan.reason = plan.reason or 'forced'
+    built = []
+    if check or not any(plan.stale for plan in plans):
+        return BuildResult(plans, built, manifest)
+
+    os.makedirs(out_dir, exist_ok=True)
+    for plan in plans:
+        if not plan.stale:
+            continue
+        font = plan.font
+        data, covered, available = subset_font(font.path, plan.codepoints)
+        _write_atomic(os.path.join(out_dir, font.output), data)
+        ranges = to_ranges(covered)
+        manifest['fonts'][font.filename] = {
+            'output': font.output,
+            'families': list(font.families),
+            'weight': font.weight,
+            'style': font.style,
+            'source_sha256': plan.source_sha,
+            'source_size': os.path.getsize(font.path),
+            'size': len(data),
+            'codepoints': len(covered),
+            # What was asked for (drives rebuilds), what the subset and the full font have glyphs for
+            'requested': to_ranges(plan.codepoints),
+            'ranges': ranges,
+            'font_ranges': to_ranges(available),
+            'unicode_range': unicode_range(ranges),
+        }
+        built.append(plan)
+
+    _write_atomic(os.path.join(out_dir, MANIFEST_NAME), json.dumps(manifest, indent=1).encode('utf-8'))
+    _write_atomic(os.path.join(out_dir, CSS_NAME), font_face_css(manifest).encode('utf-8'))
+    return BuildResult(plans, built, manifest)
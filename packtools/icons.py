@@ -0,0 +1,222 @@
+"""Offline SVG sprite for the icons templates use.
+
+Templates used to draw icons through the Iconify CDN script
+(``data-icon="material-symbols:..."``) or the Google Fonts Material Icons
+font (``<i class="material-icons">``), so every export waited on the
+network. The ``icon_sprite`` pass rewrites both into
+``<svg class="kr-icon"><use href="#kr-i-<name>"></use></svg>``, and
+``python -m packtools icons`` compiles the symbols those references need
+from the paths ``src/services/Icons.js`` already ships (plus any SVG in
+``assets/icons/local``) into one deduplicated ``assets/icons/sprite.svg``.
+``main.js`` inlines the symbols a slide uses when it is exported.
+
+Icon names are normalised the same way at runtime for ``d.ICON`` style
+references: the part after the last ``:``, lower-cased, ``-`` turned into
+``_``. Templates that pick the icon at runtime pull the whole set into the
+sprite.
+"""
+import collections
+import functools
+import html
+import os
+import re
+
+from .engine import PACKS_DIR, REPO_ROOT
+
+ICONS_JS = os.path.join(REPO_ROOT, 'src', 'services', 'Icons.js')
+LOCAL_ICON_DIR = os.path.join(REPO_ROOT, 'assets', 'icons', 'local')
+SPRITE_PATH = os.path.join(REPO_ROOT, 'assets', 'icons', 'sprite.svg')
+TEMPLATES_DIR = os.path.join(REPO_ROOT, 'templates')
+ID_PREFIX = 'kr-i-'
+
+# Same expression in JS, for names only known when the slide renders
+JS_ICON_ID = "String({expr}).split(':').pop().toLowerCase().replace(/-/g, '_')"
+
+ICON_OBJECT = re.compile(r'^const (MATERIAL_ICONS|LUCIDE_ICONS) = \{(.*?)^\};', re.MULTILINE | re.DOTALL)
+ICON_ENTRY = re.compile(r"'([\w-]+)':\s*(?:`([^`]*)`|'([^']*)')")
+SVG_ROOT = re.compile(r'<svg\b([^>]*)>(.*)</svg>', re.DOTALL | re.IGNORECASE)
+SVG_ATTR = re.compile(r'([\w:-]+)\s*=\s*"([^"]*)"')
+# Root attributes a local SVG keeps on its symbol
+SYMBOL_ATTRS = ('viewBox', 'fill', 'stroke', 'stroke-width', 'stroke-linecap', 'stroke-linejoin')
+# Style variants Icons.js does not have separately
+VARIANT_SUFFIXES = ('_outline', '_outlined', '_rounded', '_sharp', '_filled')
+
+MATERIAL_VIEWBOX = {'viewBox': '0 0 24 24'}
+LUCIDE_ATTRS = {'viewBox': '0 0 24 24', 'fill': 'none', 'stroke': 'currentColor', 'stroke-width': '2',
+                'stroke-linecap': 'round', 'stroke-linejoin': 'round'}
+
+
+class Icon:
+
+    def __init__(self, name, body, attrs, source):
+        self.name = name
+        self.body = body.strip()
+        self.attrs = attrs
+        self.source = source
+
+    def __repr__(self):
+        return f'<Icon {self.name} from {self.source}>'
+
+    @property
+    def key(self):
+        """What makes two icons draw the same thing."""
+        return (self.body, tuple(sorted(self.attrs.items())))
+
+
+def normalize(name):
+    return name.strip().rsplit(':', 1)[-1].lower().replace('-', '_')
+
+
+def icon_id(name):
+    return ID_PREFIX + normalize(name)
+
+
+def _local_icons(local_dir):
+    icons = {}
+    if not os.path.isdir(local_dir):
+        return icons
+    for filename in sorted(os.listdir(local_dir)):
+        if not filename.lower().endswith('.svg'):
+            continue
+        with open(os.path.join(local_dir, filename), 'r', encoding='utf-8') as f:
+            match = SVG_ROOT.search(f.read())
+        if not match:
+            continue
+        root = dict(SVG_ATTR.findall(match.group(1)))
+        attrs = {name: root[name] for name in SYMBOL_ATTRS if name in root}
+        attrs.setdefault('viewBox', '0 0 24 24')
+        name = normalize(os.path.splitext(filename)[0])
+        icons[name] = Icon(name, match.group(2), attrs, filename)
+    return icons
+
+
+@functools.lru_cache(maxsize=None)
+def load_icons(icons_js=ICONS_JS, local_dir=LOCAL_ICON_DIR):
+    """``{normalised name: Icon}``: Material over Lucide (as ``ALL_ICONS``), then local SVGs."""
+    with open(icons_js, 'r', encoding='utf-8') as f:
+        source = f.read()
+    tables = {name: body for name, body in ICON_OBJECT.findall(source)}
+    icons = {}
+    for table, attrs in (('LUCIDE_ICONS', LUCIDE_ATTRS), ('MATERIAL_ICONS', MATERIAL_VIEWBOX)):
+        for name, backtick, quoted in ICON_ENTRY.findall(tables.get(table, '')):
+            key = normalize(name)
+            icons[key] = Icon(key, backtick or quoted, attrs, table)
+    for name, icon in _local_icons(local_dir).items():
+        icons.setdefault(name, icon)
+    return icons
+
+
+def resolve(name, icons):
+    """The normalised name ``name`` draws with, or ``None``."""
+    key = normalize(name)
+    if key in icons:
+        return key
+    for suffix in VARIANT_SUFFIXES:
+        if key.endswith(suffix) and key[:-len(suffix)] in icons:
+            return key[:-len(suffix)]
+    return None
+
+
+# ── Usage ────────────────────────────────────────────────────────────
+
+STATIC_DATA_ICON = re.compile(r'data-icon="([\w-]+:[\w-]+)"')
+STATIC_MATERIAL = re.compile(r'<i class="material-icons[^"]*"[^>]*>\s*([\w-]+)\s*</i>')
+SPRITE_REF = re.compile(r'href="#' + ID_PREFIX + r'(\w+)"')
+DYNAMIC_REF = re.compile(r'\bd\.ICON\b|data-icon="\$\{|class="material-icons[^"]*"[^>]*>\$\{|href="#'
+                         + ID_PREFIX + r'\$\{')
+
+
+class IconUsage:
+
+    def __init__(self):
+        self.static = collections.Counter()  # resolved name -> references
+        self.unresolved = collections.defaultdict(set)  # name as written -> files
+        self.dynamic = []  # files choosing the icon at render time
+        self.files = 0
+
+
+def iter_sources(roots=None):
+    for root in roots or (PACKS_DIR, TEMPLATES_DIR):
+        if os.path.isfile(root):
+            yield root
+            continue
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames.sort()
+            for filename in sorted(filenames):
+                if filename.endswith(('.js', '.html')):
+                    yield os.path.join(dirpath, filename)
+
+
+def scan_usage(paths, icons):
+    usage = IconUsage()
+    for path in paths:
+        with open(path, 'r', encoding='utf-8', errors='replace') as f:
+            text = f.read()
+        usage.files += 1
+        for pattern in (STATIC_DATA_ICON, STATIC_MATERIAL, SPRITE_REF):
+            for name in pattern.findall(text):
+                resolved = resolve(name, icons)
+                if resolved is None:
+                    usage.unresolved[name].add(path)
+                else:
+                    usage.static[resolved] += 1
+        if DYNAMIC_REF.search(text):
+            usage.dynamic.append(path)
+    return usage
+
+
+# ── Sprite ───────────────────────────────────────────────────────────
+
+def _attrs(attrs):
+    return ''.join(f' {name}="{html.escape(value)}"' for name, value in attrs.items())
+
+
+def build_sprite(names, icons):
+    """SVG sprite with a ``<symbol>`` per name; identical drawings are stored once.
+
+    A duplicate becomes a symbol that ``<use>``s the first one, so every
+    name still has its own id.
+    """
+    lines = ['<svg xmlns="http://www.w3.org/2000/svg" style="display:none">']
+    first = {}
+    for name in sorted(names):
+        icon = icons[name]
+        original = first.setdefault(icon.key, name)
+        if original != name:
+            lines.append(f'<symbol id="{ID_PREFIX}{name}" viewBox="{icon.attrs["viewBox"]}">'
+                         f'<use href="#{ID_PREFIX}{original}"/></symbol>')
+        else:
+            lines.append(f'<symbol id="{ID_PREFIX}{name}"{_attrs(icon.attrs)}>{icon.body}</symbol>')
+    lines.append('</svg>')
+    return '\n'.join(lines) + '\n'
+
+
+class SpriteResult:
+
+    def __init__(self, usage, names, written, size):
+        self.usage = usage
+        self.names = names
+        self.written = written
+        self.size = size
+
+
+def compile_sprite(paths=None, out_path=SPRITE_PATH, check=False):
+    """Scan the templates and (re)write the sprite if its content changed."""
+    icons = load_icons()
+    usage = scan_usage(iter_sources(paths), icons)
+    names = set(icons) if usage.dynamic else set(usage.static)
+    sprite = build_sprite(names, icons).encode('utf-8')
+
+    try:
+        with open(out_path, 'rb') as f:
+            current = f.read()
+    except OSError:
+        current = None
+    written = current != sprite
+    if written and not check:
+        os.makedirs(os.path.dirname(out_path), exist_ok=True)
+        tmp_path = out_path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(sprite)
+        os.replace(tmp_path, out_path)
+    return SpriteResult(usage, names, written, len(sprite))
@@ -0,0 +1,337 @@
+"""SQLite inventory of what every pack template uses.
+
+Questions like "which templates use ``d.COMMAND_STRUCTURE``", "where is
+``#94a3b8`` still used" or "which slides set text below 34px" used to mean
+another regex sweep over every pack. ``python -m packtools index`` records
+per template its data fields (``d.X``), ``renderEditable`` ids, colours,
+``font-size`` px values, font families, icons and embedded assets in
+``src/packs.index.sqlite``; ``python -m packtools query`` answers from it.
+
+Updates are incremental: a template whose size and mtime still match is not
+opened, one whose sha256 still matches is not re-parsed, and templates that
+disappeared from an indexed pack are dropped. Extraction uses the same
+patterns as the passes, so ``PASS_FILTERS`` can tell ``rewrite
+--use-index`` which templates a pass can possibly change.
+"""
+import os
+import re
+import sqlite3
+import time
+
+from .assets import DATA_URI
+from .colours import HEX_START, RGB, canonical
+from .engine import PACKS_DIR, REPO_ROOT, iter_pack_dirs, iter_templates, repo_relpath
+from .icons import DYNAMIC_REF, SPRITE_REF, STATIC_DATA_ICON, STATIC_MATERIAL, normalize
+from .passes import FONT_SIZE, MIN_FONT_SIZE
+from .state import sha256_bytes
+
+INDEX_PATH = os.path.join(os.path.dirname(PACKS_DIR), 'packs.index.sqlite')
+# Bump when extraction changes: an index from another version is rebuilt
+INDEX_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS files (
+    id INTEGER PRIMARY KEY,
+    path TEXT UNIQUE NOT NULL,
+    pack TEXT NOT NULL,
+    sha256 TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    dynamic_icons INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS fields (
+    file_id INTEGER NOT NULL REFERENCES files(id) ON DELETE CASCADE,
+    name TEXT NOT NULL, refs INTEGER NOT NULL, escaped INTEGER NOT NULL, wrapped INTEGER NOT NULL);
+CREATE TABLE IF NOT EXISTS editables (
+    file_id INTEGER NOT NULL REFERENCES files(id) ON DELETE CASCADE,
+    name TEXT NOT NULL, refs INTEGER NOT NULL);
+CREATE TABLE IF NOT EXISTS colours (
+    file_id INTEGER NOT NULL REFERENCES files(id) ON DELETE CASCADE,
+    name TEXT NOT NULL, refs INTEGER NOT NULL);
+CREATE TABLE IF NOT EXISTS font_sizes (
+    file_id INTEGER NOT NULL REFERENCES files(id) ON DELETE CASCADE,
+    px REAL NOT NULL, refs INTEGER NOT NULL);
+CREATE TABLE IF NOT EXISTS font_families (
+    file_id INTEGER NOT NULL REFERENCES files(id) ON DELETE CASCADE,
+    name TEXT NOT NULL COLLATE NOCASE, refs INTEGER NOT NULL);
+CREATE TABLE IF NOT EXISTS icons (
+    file_id INTEGER NOT NULL REFERENCES files(id) ON DELETE CASCADE,
+    name TEXT NOT NULL, refs INTEGER NOT NULL);
+CREATE TABLE IF NOT EXISTS assets (
+    file_id INTEGER NOT NULL REFERENCES files(id) ON DELETE CASCADE,
+    kind TEXT NOT NULL, mime TEXT, bytes INTEGER, name TEXT);
+CREATE INDEX IF NOT EXISTS fields_name ON fields(name);
+CREATE INDEX IF NOT EXISTS editables_name ON editables(name);
+CREATE INDEX IF NOT EXISTS colours_name ON colours(name);
+CREATE INDEX IF NOT EXISTS font_sizes_px ON font_sizes(px);
+CREATE INDEX IF NOT EXISTS font_families_name ON font_families(name);
+CREATE INDEX IF NOT EXISTS icons_name ON icons(name);
+CREATE INDEX IF NOT EXISTS assets_bytes ON assets(bytes);
+"""
+
+# ── Extraction ───────────────────────────────────────────────────────
+
+FIELD_REF = re.compile(r'(?<![\w.$])d\.([A-Za-z_]\w*)')
+ESCAPED_FIELD = re.compile(r'\$\{esc\(d\.([A-Za-z_]\w*)\)\}')
+WRAPPED_FIELD = re.compile(r"renderEditable\('[\w-]+',\s*`\$\{esc\(d\.([A-Za-z_]\w*)\)\}`")
+EDITABLE_ID = re.compile(r"renderEditable\(\s*['\"`]([\w-]+)['\"`]")
+# Every hex or rgb() colour, with the boundaries ColourMap uses
+HEX_COLOUR = re.compile(HEX_START + r'[0-9a-fA-F]{3,8}(?![\w-])')
+RGB_COLOUR = re.compile(RGB)
+FONT_FAMILY = re.compile(r'font-family\s*:\s*([^;{}<>"`\n]+)', re.IGNORECASE)
+GENERIC_FAMILIES = {'serif', 'sans-serif', 'monospace', 'cursive', 'fantasy', 'system-ui', 'inherit',
+                    'initial', 'unset', '-apple-system', 'blinkmacsystemfont'}
+ASSET_URL = re.compile(r'\.\./assets/([\w./-]+\.(?:png|jpe?g|gif|webp|avif|svg|ico|woff2?|ttf|otf))\b')
+ASSETS_DIR = os.path.join(REPO_ROOT, 'assets')
+
+
+def colour_name(key):
+    """Stored spelling of a ``colours.canonical`` key: ``#rrggbb`` or ``rgba(...)``."""
+    if isinstance(key, str):
+        return key
+    r, g, b, alpha = key
+    if alpha == 1:
+        return '#%02x%02x%02x' % (r, g, b)
+    return f'rgba({r}, {g}, {b}, {alpha:g})'
+
+
+def _count(counter, key):
+    counter[key] = counter.get(key, 0) + 1
+
+
+def _colours(text):
+    found = {}
+    for match in HEX_COLOUR.finditer(text):
+        key = canonical(match.group(0))
+        if key is not None:
+            _count(found, colour_name(key))
+    for match in RGB_COLOUR.finditer(text):
+        start = match.start() - (4 if text[match.start() - 1] in 'aA' else 3)
+        key = canonical(text[start:match.end()])
+        if key is not None:
+            _count(found, colour_name(key))
+    return found
+
+
+def _families(text):
+    found = {}
+    for match in FONT_FAMILY.finditer(text):
+        for family in match.group(1).split(','):
+            family = family.strip().strip('\'"').strip()
+            if family and '${' not in family and not family.startswith('var(') \
+                    and family.lower() not in GENERIC_FAMILIES:
+                _count(found, family)
+    return found
+
+
+def _assets(text):
+    assets = []
+    for match in DATA_URI.finditer(text):
+        payload = match.group(3)
+        assets.append(('inline', match.group(1).lower(), len(payload) * 3 // 4 - payload.count('='), None))
+    for match in ASSET_URL.finditer(text):
+        path = os.path.join(ASSETS_DIR, match.group(1))
+        size = os.path.getsize(path) if os.path.isfile(path) else None
+        assets.append(('file', None, size, match.group(1)))
+    return assets
+
+
+def extract(text):
+    """Everything the index records about one template, as ``{table: rows}``."""
+    fields = {}
+    for name in FIELD_REF.findall(text):
+        _count(fields, name)
+    escaped, wrapped = {}, {}
+    for name in ESCAPED_FIELD.findall(text):
+        _count(escaped, name)
+    for name in WRAPPED_FIELD.findall(text):
+        _count(wrapped, name)
+    editables, sizes, icons = {}, {}, {}
+    for name in EDITABLE_ID.findall(text):
+        _count(editables, name)
+    for match in FONT_SIZE.finditer(text):
+        _count(sizes, float(match.group(2)))
+    for pattern in (STATIC_DATA_ICON, STATIC_MATERIAL, SPRITE_REF):
+        for name in pattern.findall(text):
+            _count(icons, normalize(name))
+    return {
+        'fields': [(name, refs, escaped.get(name, 0), wrapped.get(name, 0)) for name, refs in fields.items()],
+        'editables': list(editables.items()),
+        'colours': list(_colours(text).items()),
+        'font_sizes': list(sizes.items()),
+        'font_families': list(_families(text).items()),
+        'icons': list(icons.items()),
+        'assets': _assets(text),
+        'dynamic_icons': bool(DYNAMIC_REF.search(text)),
+    }
+
+
+# ── Database ─────────────────────────────────────────────────────────
+
+class UpdateResult:
+
+    def __init__(self):
+        self.added = []
+        self.updated = []
+        self.removed = []
+        self.unchanged = 0
+        self.seconds = 0.0
+
+
+class TemplateIndex:
+    """The index database; use as a context manager or call ``close``."""
+
+    def __init__(self, path=INDEX_PATH):
+        self.path = path
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.db = sqlite3.connect(path)
+        self.db.execute('PRAGMA foreign_keys = ON')
+        self.db.executescript(SCHEMA)
+        version = self.db.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+        if version is None or version[0] != str(INDEX_VERSION):
+            self.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.db.close()
+
+    def clear(self):
+        with self.db:
+            self.db.execute('DELETE FROM files')
+            self.db.execute("INSERT OR REPLACE INTO meta VALUES ('version', ?)", (str(INDEX_VERSION),))
+
+    def _store(self, file_id, facts):
+        self.db.executemany('INSERT INTO fields VALUES (?, ?, ?, ?, ?)',
+                            [(file_id, *row) for row in facts['fields']])
+        for table in ('editables', 'colours', 'font_sizes', 'font_families', 'icons'):
+            self.db.executemany(f'INSERT INTO {table} VALUES (?, ?, ?)', [(file_id, *row) for row in facts[table]])
+        self.db.executemany('INSERT INTO assets VALUES (?, ?, ?, ?, ?)', [(file_id, *row) for row in facts['assets']])
+
+    def update(self, pack_dirs=None, force=False):
+        """Bring the index up to date with ``pack_dirs`` (default: every pack)."""
+        if pack_dirs is None:
+            pack_dirs = list(iter_pack_dirs()) if os.path.isdir(PACKS_DIR) else []
+        result = UpdateResult()
+        start = time.perf_counter()
+        with self.db:
+            for pack_dir in pack_dirs:
+                pack = repo_relpath(pack_dir)
+                known = {path: (file_id, sha, size, mtime) for file_id, path, sha, size, mtime in self.db.execute(
+                    'SELECT id, path, sha256, size, mtime_ns FROM files WHERE pack = ?', (pack,))}
+                for path in iter_templates(pack_dir):
+                    rel = repo_relpath(path)
+                    st = os.stat(path)
+                    row = known.pop(rel, None)
+                    if row and not force and (row[2], row[3]) == (st.st_size, st.st_mtime_ns):
+                        result.unchanged += 1
+                        continue
+                    with open(path, 'rb') as f:
+                        data = f.read()
+                    sha = sha256_bytes(data)
+                    if row and not force and row[1] == sha:
+                        self.db.execute('UPDATE files SET size = ?, mtime_ns = ? WHERE id = ?',
+                                        (st.st_size, st.st_mtime_ns, row[0]))
+                        result.unchanged += 1
+                        continue
+                    facts = extract(data.decode('utf-8', errors='replace'))
+                    if row:
+                        self.db.execute('DELETE FROM files WHERE id = ?', (row[0],))
+                        result.updated.append(rel)
+                    else:
+                        result.added.append(rel)
+                    file_id = self.db.execute(
+                        'INSERT INTO files (path, pack, sha256, size, mtime_ns, dynamic_icons) '
+                        'VALUES (?, ?, ?, ?, ?, ?)',
+                        (rel, pack, sha, st.st_size, st.st_mtime_ns, facts['dynamic_icons'])).lastrowid
+                    self._store(file_id, facts)
+                for rel, row in known.items():
+                    self.db.execute('DELETE FROM files WHERE id = ?', (row[0],))
+                    result.removed.append(rel)
+        result.seconds = time.perf_counter() - start
+        return result
+
+    # ── Lookups ──────────────────────────────────────────────────────
+
+    def query(self, sql, params=()):
+        return self.db.execute(sql, params).fetchall()
+
+    def paths(self, table, where, params=(), pack=None):
+        """``[(path, refs)]`` of the templates with a ``table`` row matching ``where``."""
+        sql = (f'SELECT files.path, SUM(t.refs) FROM {table} t JOIN files ON files.id = t.file_id '
+               f'WHERE {where}')
+        if pack:
+            sql += ' AND files.pack LIKE ?'
+            params = (*params, f'%{pack}')
+        return self.query(sql + ' GROUP BY files.path ORDER BY files.path', params)
+
+    def inventory(self, table, column='name', where='1', params=()):
+        """``[(value, templates, refs)]`` over every template, most used first."""
+        return self.query(f'SELECT t.{column}, COUNT(DISTINCT t.file_id), SUM(t.refs) FROM {table} t '
+                          f'WHERE {where} GROUP BY t.{column} ORDER BY 2 DESC, 1', params)
+
+    def assets(self, min_bytes=0):
+        """``[(path, kind, mime, bytes, name)]`` of embedded or referenced assets, largest first."""
+        return self.query('SELECT files.path, a.kind, a.mime, a.bytes, a.name FROM assets a '
+                          'JOIN files ON files.id = a.file_id WHERE COALESCE(a.bytes, 0) >= ? '
+                          'ORDER BY a.bytes DESC', (min_bytes,))
+
+    def pack_stats(self):
+        """Per pack: templates, bytes, and how many use small fonts, greys and inline assets."""
+        return self.query("""
+            SELECT pack, COUNT(*), SUM(size),
+                   (SELECT COUNT(DISTINCT s.file_id) FROM font_sizes s JOIN files f ON f.id = s.file_id
+                    WHERE f.pack = files.pack AND s.px < ?),
+                   (SELECT COUNT(DISTINCT a.file_id) FROM assets a JOIN files f ON f.id = a.file_id
+                    WHERE f.pack = files.pack AND a.kind = 'inline'),
+                   (SELECT COUNT(DISTINCT e.file_id) FROM editables e JOIN files f ON f.id = e.file_id
+                    WHERE f.pack = files.pack)
+            FROM files GROUP BY pack ORDER BY pack""", (MIN_FONT_SIZE,))
+
+
+# ── Pass selection ───────────────────────────────────────────────────
+
+def _small_fonts(index, options):
+    return index.paths('font_sizes', 't.px < ?', (options['min_size'],))
+
+
+def _mapped_colours(index, options):
+    names = set()
+    for colour in options['colours']:
+        key = canonical(colour.strip())
+        if key is None or isinstance(key, str):
+            return None  # named colours are not indexed
+        names.add(colour_name(key))
+    marks = ', '.join('?' * len(names))
+    return index.paths('colours', f't.name IN ({marks})', tuple(sorted(names)))
+
+
+def _inline_assets(index, options):
+    return index.query("SELECT DISTINCT files.path, 1 FROM assets a JOIN files ON files.id = a.file_id "
+                       "WHERE a.kind = 'inline'")
+
+
+# pass name -> f(index, options) -> [(path, refs)] of the only templates it can change, or None
+PASS_FILTERS = {
+    'fix_min_fonts': _small_fonts,
+    'whitewash': _mapped_colours,
+    'deinline_assets': _inline_assets,
+}
+
+
+def pass_candidates(index, passes):
+    """``{pass name: set of absolute paths}`` for the passes the index can narrow down."""
+    candidates = {}
+    for p in passes:
+        lookup = PASS_FILTERS.get(p.name)
+        rows = lookup(index, p.options) if lookup else None
+        if rows is not None:
+            candidates[p.name] = {os.path.abspath(os.path.join(REPO_ROOT, path)) for path, _ in rows}
+    return candidates
+
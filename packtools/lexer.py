@@ -0,0 +1,345 @@
+"""Linear-time lexer for pack template files.
+
+Templates are JavaScript whose template literals hold HTML (and CSS inside
+``<style>``). ``lex(text)`` walks the file once, jumping between the few
+characters that can change state, and returns:
+
+* ``spans``: ``Span(kind, start, end, context, depth)`` in file order, where
+  kind is one of JS, TEXT, TAG, ATTR, CSS, SCRIPT, COMMENT or INTERP. An
+  INTERP span covers a whole ``${...}`` (its ``context`` is the HTML state
+  it sits in) and encloses the spans of any literal nested inside it.
+* ``tags``: every HTML tag found in a template literal, even when a
+  ``${...}`` sits inside its attributes.
+* ``elements``: open/close tag pairs matched within the same literal, so a
+  pass can remove or wrap a whole element instead of guessing with
+  ``[\\s\\S]*?</div>``.
+"""
+import re
+
+JS = 'js'
+TEXT = 'text'  # HTML character data
+TAG = 'tag'  # tag markup outside quoted attribute values
+ATTR = 'attr'  # quoted attribute value, quotes excluded
+CSS = 'css'  # <style> contents
+SCRIPT = 'script'  # <script> contents
+COMMENT = 'comment'  # <!-- ... -->
+INTERP = 'interp'  # ${...}, delimiters included
+
+VOID_ELEMENTS = frozenset(('area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input',
+                           'link', 'meta', 'source', 'track', 'wbr'))
+
+# Characters that can change state, per state. '$' only matters before '{'.
+JS_SPECIAL = re.compile(r"[`'\"{}/]")
+STATE_SPECIAL = {
+    TEXT: re.compile(r'[`\\$<]'),
+    TAG: re.compile(r'[`\\$"\'>]'),
+    ('attr', '"'): re.compile(r'[`\\$"]'),
+    ('attr', "'"): re.compile(r"[`\\$']"),
+    COMMENT: re.compile(r'[`\\$]|-->'),
+    CSS: re.compile(r'[`\\$]|</style', re.IGNORECASE),
+    SCRIPT: re.compile(r'[`\\$]|</script', re.IGNORECASE),
+}
+TAG_NAME = re.compile(r'</?([a-zA-Z][\w-]*)')
+STRINGS = {"'": re.compile(r"'(?:[^'\\\n]|\\.)*'?"), '"': re.compile(r'"(?:[^"\\\n]|\\.)*"?')}
+LINE_COMMENT = re.compile(r'//[^\n]*')
+BLOCK_COMMENT = re.compile(r'/\*[\s\S]*?(?:\*/|$)')
+REGEX_LITERAL = re.compile(r'/(?:[^/\\\[\n]|\\.|\[(?:[^\]\\\n]|\\.)*\])+/[a-z]*')
+# A '/' after one of these (or a keyword) starts a regex literal, not a division
+REGEX_PRECEDERS = frozenset('(,=:[!&|?{};+-*%<>~^')
+REGEX_KEYWORDS = re.compile(r'(?<![\w$])(?:return|typeof|case|do|else|in|of|void|yield)$')
+
+
+class Span:
+    __slots__ = ('kind', 'start', 'end', 'context', 'depth')
+
+    def __init__(self, kind, start, end, context=None, depth=0):
+        self.kind = kind
+        self.start = start
+        self.end = end
+        self.context = context
+        self.depth = depth
+
+    def __repr__(self):
+        context = f' in {self.context}' if self.context else ''
+        return f'<Span {self.kind}{context} {self.start}:{self.end}>'
+
+
+class Tag:
+    __slots__ = ('name', 'start', 'end', 'closing', 'literal')
+
+    def __init__(self, name, start, end, closing, literal):
+        self.name = name
+        self.start = start
+        self.end = end
+        self.closing = closing
+        self.literal = literal
+
+    def __repr__(self):
+        return f'<Tag {"/" if self.closing else ""}{self.name} {self.start}:{self.end}>'
+
+
+class Element:
+    """An open tag and its matching close tag."""
+    __slots__ = ('open', 'close')
+
+    def __init__(self, open_tag, close_tag):
+        self.open = open_tag
+        self.close = close_tag
+
+    @property
+    def name(self):
+        return self.open.name
+
+    @property
+    def start(self):
+        return self.open.start
+
+    @property
+    def end(self):
+        return self.close.end
+
+    @property
+    def inner_start(self):
+        return self.open.end
+
+    @property
+    def inner_end(self):
+        return self.close.start
+
+
+class Lexed:
+    """Result of ``lex``: spans, tags and matched elements of one text."""
+
+    def __init__(self, text, spans, tags):
+        self.text = text
+        self.spans = spans
+        self.tags = tags
+        self._elements = None
+
+    def interpolations(self, context=None):
+        for span in self.spans:
+            if span.kind == INTERP and (context is None or span.context == context):
+                yield span
+
+    @property
+    def elements(self):
+        if self._elements is None:
+            self._elements = match_elements(self.tags)
+        return self._elements
+
+    def find_elements(self, name, open_tag=None):
+        """Elements called ``name`` whose open tag source fully matches ``open_tag``."""
+        for element in self.elements:
+            if element.name != name:
+                continue
+            if open_tag is not None and not open_tag.fullmatch(self.text, element.open.start, element.open.end):
+                continue
+            yield element
+
+
+class _Lexer:
+
+    def __init__(self, text):
+        self.text = text
+        self.spans = []
+        self.tags = []
+        self.literals = 0
+
+    def emit(self, kind, start, end, depth, context=None):
+        if start >= end:
+            return
+        last = self.spans[-1] if self.spans else None
+        # Merge runs of the same kind split only by skipped characters
+        if last is not None and last.kind == kind and last.end == start and last.depth == depth \
+                and kind != INTERP and last.context == context:
+            last.end = end
+            return
+        self.spans.append(Span(kind, start, end, context, depth))
+
+    def js(self, pos, depth, in_interp):
+        """Scan JS from ``pos``; inside an interpolation, return just past its '}'."""
+        text = self.text
+        n = len(text)
+        braces = 0
+        start = pos
+        while True:
+            match = JS_SPECIAL.search(text, pos)
+            if match is None:
+                self.emit(JS, start, n, depth)
+                return n
+            i = match.start()
+            char = text[i]
+            if char in '\'"':
+                pos = STRINGS[char].match(text, i).end()
+            elif char == '/':
+                pos = self._slash(i)
+            elif char == '{':
+                braces += 1
+                pos = i + 1
+            elif char == '}':
+                if in_interp and braces == 0:
+                    self.emit(JS, start, i, depth)
+                    return i + 1
+                braces -= 1
+                pos = i + 1
+            else:  # '`'
+                self.emit(JS, start, i + 1, depth)
+                pos = start = self.template(i + 1, depth)
+                # The closing backtick belongs to the JS around the literal
+                if pos <= n and text[pos - 1:pos] == '`':
+                    start = pos - 1
+
+    def _slash(self, i):
+        text = self.text
+        following = text[i + 1:i + 2]
+        if following == '/':
+            return LINE_COMMENT.match(text, i).end()
+        if following == '*':
+            return BLOCK_COMMENT.match(text, i).end()
+        j = i - 1
+        while j >= 0 and text[j] in ' \t\r\n':
+            j -= 1
+        if j < 0 or text[j] in REGEX_PRECEDERS or REGEX_KEYWORDS.search(text, max(0, j - 6), j + 1):
+            match = REGEX_LITERAL.match(text, i)
+            if match:
+                return match.end()
+        return i + 1
+
+    def template(self, pos, depth):
+        """Scan a template literal body from ``pos``; return just past its closing '`'."""
+        text = self.text
+        n = len(text)
+        literal = self.literals
+        self.literals += 1
+        depth += 1
+
+        state = TEXT
+        quote = None
+        tag_start = tag_name = None
+        tag_closing = False
+        start = pos
+
+        def kind():
+            return ATTR if state == 'attr' else state
+
+        while True:
+            special = STATE_SPECIAL[(state, quote) if state == 'attr' else state]
+            match = special.search(text, pos)
+            if match is None:
+                self.emit(kind(), start, n, depth)
+                return n
+            i = match.start()
+            char = text[i]
+
+            if char == '`':
+                self.emit(kind(), start, i, depth)
+                return i + 1
+            if char == '\\':
+                pos = i + 2
+                continue
+            if char == '$':
+                if text[i + 1:i + 2] != '{':
+                    pos = i + 1
+                    continue
+                self.emit(kind(), start, i, depth)
+                span = Span(INTERP, i, i, kind(), depth)
+                self.spans.append(span)
+                pos = start = span.end = self.js(i + 2, depth, in_interp=True)
+                continue
+
+            if state == TEXT:  # '<'
+                if text.startswith('<!--', i):
+                    self.emit(TEXT, start, i, depth)
+                    state, start, pos = COMMENT, i, i + 4
+                    continue
+                name = TAG_NAME.match(text, i)
+                if name is None:
+                    pos = i + 1
+                    continue
+                self.emit(TEXT, start, i, depth)
+                state, start, pos = TAG, i, name.end()
+                tag_start, tag_name = i, name.group(1).lower()
+                tag_closing = text[i + 1] == '/'
+            elif state == TAG:
+                if char == '>':
+                    self.emit(TAG, start, i + 1, depth)
+                    self.tags.append(Tag(tag_name, tag_start, i + 1, tag_closing, literal))
+                    state = TEXT
+                    if not tag_closing and tag_name in ('style', 'script'):
+                        state = CSS if tag_name == 'style' else SCRIPT
+                    start = pos = i + 1
+                else:  # opening quote
+                    self.emit(TAG, start, i + 1, depth)
+                    state, quote, start, pos = 'attr', char, i + 1, i + 1
+            elif state == 'attr':  # closing quote
+                self.emit(ATTR, start, i, depth)
+                state, quote, start, pos = TAG, None, i, i + 1
+            elif state == COMMENT:  # '-->'
+                self.emit(COMMENT, start, i + 3, depth)
+                state, start, pos = TEXT, i + 3, i + 3
+            else:  # '</style' or '</script'
+                self.emit(state, start, i, depth)
+                state, start, pos = TAG, i, match.end()
+                tag_start, tag_name, tag_closing = i, match.group(0)[2:].lower(), True
+
+
+def match_elements(tags):
+    """Pair open and close tags of the same literal, innermost first.
+
+    Stray close tags are skipped and unclosed open tags are dropped when an
+    outer element closes. Each literal keeps its open tags on a stack plus,
+    per name, the stack positions of those still open, so a close tag finds
+    its opener without walking the stack: linear in the number of tags.
+    """
+    elements = []
+    literals = {}
+    for tag in tags:
+        if tag.name in VOID_ELEMENTS:
+            continue
+        stack, positions = literals.setdefault(tag.literal, ([], {}))
+        if not tag.closing:
+            positions.setdefault(tag.name, []).append(len(stack))
+            stack.append(tag)
+            continue
+        open_positions = positions.get(tag.name)
+        if not open_positions:
+            continue
+        k = open_positions[-1]
+        elements.append(Element(stack[k], tag))
+        # Every tag above the opener is left unclosed; each is popped once
+        for dropped in stack[k:]:
+            positions[dropped.name].pop()
+        del stack[k:]
+    elements.sort(key=lambda element: element.start)
+    return elements
+
+
+def lex(text):
+    lexer = _Lexer(text)
+    lexer.js(0, 0, in_interp=False)
+    return Lexed(text, lexer.spans, lexer.tags)
+
+
+def select_edits(edits):
+    """``(start, end, replacement)`` edits in order, minus those nested in an earlier (outer) one."""
+    pos = 0
+    for start, end, replacement in sorted(edits, key=lambda edit: (edit[0], -edit[1])):
+        if start < pos:
+            continue
+        yield start, end, replacement
+        pos = end
+
+
+def apply_edits(text, edits):
+    """Apply non-overlapping ``(start, end, replacement)`` edits in one go.
+
+    Edits nested inside an earlier (outer) edit are dropped.
+    """
+    parts = []
+    pos = 0
+    for start, end, replacement in select_edits(edits):
+        parts.append(text[pos:start])
+        parts.append(replacement)
+        pos = end
+    parts.append(text[pos:])
+    return ''.join(parts)
@@ -0,0 +1,274 @@
+"""Advance-width and kerning tables for the bundled fonts.
+
+Text fitting used to be decided in the browser: ``TextFitter`` and
+``ContentValidator`` only count characters and words, and the auto-fit
+script shrinks fonts in the DOM until a slide stops overflowing.
+``python -m packtools metrics`` reads every font in ``fonts.FONTS`` and
+writes ``src/engine/FontMetricsData.js``: per face (family and weight), the
+advance of each ``BASE_TEXT`` character and the kerning between them as
+class tables, in 1/1000 em. ``src/engine/FontMetrics.js`` measures, wraps and fits text
+with those tables in plain JS, in the app and in Node.
+
+Variable fonts get one face per weight in ``VARIABLE_WEIGHTS``. The file
+records the sha256 of each source font and of the character set, so a
+re-run only rewrites it when one of them changed. Building needs
+``fontTools``; ``--check`` works without it.
+"""
+import json
+import os
+import re
+
+from .engine import REPO_ROOT
+from .fonts import BASE_TEXT, FONTS
+from .state import sha256_bytes
+
+try:
+    from fontTools.ttLib import TTFont
+    from fontTools.varLib import instancer
+except ImportError:  # optional: only needed to build the tables
+    TTFont = None
+
+METRICS_JS = os.path.join(REPO_ROOT, 'src', 'engine', 'FontMetricsData.js')
+METRICS_VERSION = 1
+UNITS_PER_EM = 1000
+VARIABLE_WEIGHTS = (400, 700)
+
+HEADER = """/**
+ * FontMetricsData.js — generated by `python -m packtools metrics`. Do not edit.
+ *
+ * Advance widths and kerning class tables of the bundled fonts in 1/1000 em,
+ * read by FontMetrics.js.
+ */
+"""
+DATA_LINE = re.compile(r'^const FONT_METRICS = (.*);$', re.MULTILINE)
+FOOTER = """
+if (typeof module !== 'undefined') module.exports = FONT_METRICS;
+else window.FONT_METRICS = FONT_METRICS;
+"""
+
+
+def charset_sha():
+    return sha256_bytes(BASE_TEXT.encode('utf-8'))
+
+
+def face_weights(font):
+    """Weights to build for ``font``: a ``'min max'`` range is a variable font."""
+    bounds = [int(w) for w in font.weight.split()]
+    if len(bounds) == 1:
+        return bounds
+    return [w for w in VARIABLE_WEIGHTS if bounds[0] <= w <= bounds[-1]]
+
+
+# ── Reading a font ───────────────────────────────────────────────────
+
+def _value(record):
+    if record is None:
+        return 0
+    return getattr(record, 'XAdvance', 0) or 0
+
+
+def _pair_subtables(table):
+    """PairPos subtables of each lookup the ``kern`` feature uses, in lookup order."""
+    if not table.FeatureList or not table.LookupList:
+        return []
+    indices = sorted({index for record in table.FeatureList.FeatureRecord if record.FeatureTag == 'kern'
+                      for index in record.Feature.LookupListIndex})
+    lookups = []
+    for index in indices:
+        lookup = table.LookupList.Lookup[index]
+        subtables = []
+        for sub in lookup.SubTable:
+            if lookup.LookupType == 9:  # extension
+                if sub.ExtensionLookupType != 2:
+                    continue
+                sub = sub.ExtSubTable
+            elif lookup.LookupType != 2:
+                continue
+            subtables.append(sub)
+        lookups.append(subtables)
+    return lookups
+
+
+def gpos_kerning(font, glyph_chars):
+    """``{(left char, right char): units}`` from GPOS pair positioning.
+
+    Within a lookup the first subtable that matches a pair wins (a class
+    table matches every pair whose first glyph it covers); values of
+    separate lookups add up.
+    """
+    pairs = {}
+    if 'GPOS' not in font:
+        return pairs
+    glyphs = set(glyph_chars)
+    for subtables in _pair_subtables(font['GPOS'].table):
+        matched = set()
+        for sub in subtables:
+            if sub.Format == 1:
+                for index, first in enumerate(sub.Coverage.glyphs):
+                    if first not in glyphs:
+                        continue
+                    for record in sub.PairSet[index].PairValueRecord:
+                        pair = (first, record.SecondGlyph)
+                        if record.SecondGlyph not in glyphs or pair in matched:
+                            continue
+                        matched.add(pair)
+                        if _value(record.Value1):
+                            pairs[pair] = pairs.get(pair, 0) + _value(record.Value1)
+            elif sub.Format == 2:
+                classes1 = sub.ClassDef1.classDefs
+                classes2 = sub.ClassDef2.classDefs
+                for first in (g for g in sub.Coverage.glyphs if g in glyphs):
+                    row = sub.Class1Record[classes1.get(first, 0)].Class2Record
+                    for second in glyphs:
+                        pair = (first, second)
+                        if pair in matched:
+                            continue
+                        matched.add(pair)
+                        value = _value(row[classes2.get(second, 0)].Value1)
+                        if value:
+                            pairs[pair] = pairs.get(pair, 0) + value
+    return {(glyph_chars[a], glyph_chars[b]): v for (a, b), v in pairs.items()}
+
+
+def legacy_kerning(font, glyph_chars):
+    pairs = {}
+    if 'kern' not in font:
+        return pairs
+    for subtable in font['kern'].kernTables:
+        for (left, right), value in getattr(subtable, 'kernTable', {}).items():
+            if left in glyph_chars and right in glyph_chars and value:
+                pairs.setdefault((glyph_chars[left], glyph_chars[right]), value)
+    return pairs
+
+
+def kern_classes(kerning):
+    """Factor ``{(left, right): value}`` into class strings and a value matrix.
+
+    Characters with identical rows (or columns) share a class, which is how
+    the fonts define most of their kerning anyway; the matrix is stored
+    row-major as ``values[left class * len(right) + right class]``.
+    """
+    lefts = sorted({left for left, _ in kerning})
+    rights = sorted({right for _, right in kerning})
+    rows, columns = {}, {}
+    for left in lefts:
+        rows.setdefault(tuple(kerning.get((left, right), 0) for right in rights), []).append(left)
+    for right in rights:
+        columns.setdefault(tuple(kerning.get((left, right), 0) for left in lefts), []).append(right)
+    left_classes = [''.join(chars) for chars in rows.values()]
+    right_classes = [''.join(chars) for chars in columns.values()]
+    values = [kerning.get((left[0], right[0]), 0) for left in left_classes for right in right_classes]
+    return {'left': left_classes, 'right': right_classes, 'values': values}
+
+
+def read_face(source, weight):
+    """Metrics of ``source`` at ``weight`` as stored in ``FontMetricsData.js``."""
+    if TTFont is None:
+        raise RuntimeError('Font metrics need fontTools: pip install fonttools')
+    font = TTFont(source.path)
+    try:
+        if 'fvar' in font:
+            axes = {axis.axisTag: axis.defaultValue for axis in font['fvar'].axes}
+            axes['wght'] = weight
+            font = instancer.instantiateVariableFont(font, axes)
+        scale = UNITS_PER_EM / font['head'].unitsPerEm
+        cmap = font.getBestCmap() or {}
+        hmtx = font['hmtx']
+
+        chars = [c for c in BASE_TEXT if ord(c) in cmap]
+        glyph_chars = {cmap[ord(c)]: c for c in chars}
+        advances = [round(hmtx[cmap[ord(c)]][0] * scale) for c in chars]
+        kerning = gpos_kerning(font, glyph_chars) or legacy_kerning(font, glyph_chars)
+        kerning = {pair: round(value * scale) for pair, value in kerning.items()}
+
+        hhea = font['hhea']
+        return {
+            'family': source.family,
+            'families': list(source.families),
+            'weight': weight,
+            'source': source.filename,
+            'ascent': round(hhea.ascent * scale),
+            'descent': round(-hhea.descent * scale),
+            'fallback': round(hmtx['.notdef'][0] * scale) if '.notdef' in hmtx.metrics else UNITS_PER_EM // 2,
+            'chars': ''.join(chars),
+            # Monospaced faces store a single number
+            'advances': advances[0] if len(set(advances)) == 1 else advances,
+            'kern': kern_classes({pair: value for pair, value in kerning.items() if value}),
+        }
+    finally:
+        font.close()
+
+
+# ── Data file ────────────────────────────────────────────────────────
+
+def read_metrics(path=METRICS_JS):
+    """The data ``path`` holds, or ``None`` if it is missing or from another version."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            match = DATA_LINE.search(f.read())
+        data = json.loads(match.group(1)) if match else None
+    except (OSError, ValueError):
+        return None
+    if not data or data.get('version') != METRICS_VERSION:
+        return None
+    return data
+
+
+def render_metrics(data):
+    body = json.dumps(data, ensure_ascii=False, separators=(',', ':'))
+    return f'{HEADER}\nconst FONT_METRICS = {body};\n{FOOTER}'
+
+
+class MetricsResult:
+
+    def __init__(self, data, reason, written, size):
+        self.data = data
+        self.reason = reason
+        self.written = written
+        self.size = size
+
+    @property
+    def stale(self):
+        return self.reason is not None
+
+
+def build_metrics(out_path=METRICS_JS, force=False, check=False, fonts=FONTS):
+    """(Re)write the metric tables if a font or the character set changed.
+
+    With ``check`` nothing is read beyond the source hashes or written.
+    """
+    fonts = [font for font in fonts if os.path.isfile(font.path)]
+    sources = {}
+    for font in fonts:
+        with open(font.path, 'rb') as f:
+            sources[font.filename] = sha256_bytes(f.read())
+
+    current = read_metrics(out_path)
+    if current is None:
+        reason = 'missing'
+    elif current.get('charset_sha256') != charset_sha():
+        reason = 'character set changed'
+    elif current.get('sources') != sources:
+        changed = sorted(set(sources) ^ set(current['sources'])
+                         | {name for name in sources if current['sources'].get(name) != sources[name]})
+        reason = f"{', '.join(changed)} changed"
+    else:
+        reason = 'forced' if force else None
+
+    if reason is None or check:
+        return MetricsResult(current, reason, False, os.path.getsize(out_path) if current else 0)
+
+    data = {
+        'version': METRICS_VERSION,
+        'unitsPerEm': UNITS_PER_EM,
+        'charset_sha256': charset_sha(),
+        'sources': sources,
+        'faces': [read_face(font, weight) for font in fonts for weight in face_weights(font)],
+    }
+    text = render_metrics(data).encode('utf-8')
+    os.makedirs(os.path.dirname(out_path), exist_ok=True)
+    tmp_path = out_path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(text)
+    os.replace(tmp_path, out_path)
+    return MetricsResult(data, reason, True, len(text))
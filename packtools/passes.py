@@ -0,0 +1,317 @@
+"""Built-in rewrite passes, one per legacy cleanup script.
+
+Registration order is the default pipeline order. The brand header goes in
+before whitewash and fix_min_fonts so a second run is a no-op.
+
+Each pass declares the literal triggers it cannot do anything without, so
+the runner can skip templates (or passes) after a ``find`` over the mapped
+file instead of decoding it and running the regexes.
+"""
+import re
+
+from .assets import DATA_URI, AssetStore
+from .brand import BRAND_CSS, BRAND_HTML
+from .colours import GREYS_TO_WHITE, colour_triggers, compile_map
+from .engine import icase, register
+from .icons import ID_PREFIX, JS_ICON_ID, load_icons, resolve
+from .lexer import TEXT
+
+# ── remove_watermark.py ──────────────────────────────────────────────
+
+# Matches: <span ...>CYBER-CANVAS // ...</span>
+WATERMARK_SPAN = re.compile(r'<span[^>]*>CYBER-CANVAS // [^<]*</span>', re.IGNORECASE)
+WATERMARK_TEXT = re.compile(r'POWERED BY CYBER-CANVAS', re.IGNORECASE)
+
+
+@register('remove_watermark', triggers=(icase(b'cyber-canvas'),))
+def remove_watermark(doc):
+    """Strip the CYBER-CANVAS watermark span and "POWERED BY" credit."""
+    return doc.sub(WATERMARK_SPAN, '') + doc.sub(WATERMARK_TEXT, '')
+
+
+# ── remove_footer.py ─────────────────────────────────────────────────
+
+# Removal works on whole elements matched by the lexer, so nested divs inside
+# a footer no longer leave a dangling </div> the way [\s\S]*?</div> did.
+FOOTER = re.compile(r'<div style="margin-top:\s*auto;[^"]*">', re.IGNORECASE)
+FOOTER_COMMENT = '<!-- Footer -->'
+
+
+def _before_whitespace(text, pos):
+    while pos > 0 and text[pos - 1].isspace():
+        pos -= 1
+    return pos
+
+
+def _remove_elements(doc, name, open_tag, strip_before=False, comment=None, first_child=None):
+    """Remove every ``name`` element whose open tag fully matches ``open_tag``.
+
+    ``strip_before`` also eats the whitespace (and optional ``comment``) in
+    front of it; ``first_child`` must match right after the open tag.
+    """
+    text = doc.text
+    edits = []
+    for element in doc.lexed.find_elements(name, open_tag):
+        if first_child is not None and not first_child.match(text, element.inner_start):
+            continue
+        start = element.start
+        if strip_before:
+            start = _before_whitespace(text, start)
+            if comment and text.endswith(comment, 0, start):
+                start = _before_whitespace(text, start - len(comment))
+        edits.append((start, element.end, ''))
+    return doc.apply_edits(edits)
+
+
+@register('remove_footer', version=2, triggers=(icase(b'margin-top'),))
+def remove_footer(doc):
+    """Remove the ``margin-top:auto`` footer block."""
+    return _remove_elements(doc, 'div', FOOTER, strip_before=True, comment=FOOTER_COMMENT)
+
+
+# ── remove_footer_force.py ───────────────────────────────────────────
+
+FADED_DIV = re.compile(r'<div style="[^"]*opacity:0\.5;[^"]*">', re.IGNORECASE)
+# the faded footer that opens with the 40x4 bar div
+FOOTER_BAR = re.compile(r'\s*<div style="width:40px; height:4px;', re.IGNORECASE)
+# the "space-between" variant, which might also contain the bar
+FOOTER_SPACE_BETWEEN = re.compile(r'<div style="[^"]*justify-content:space-between;[^"]*opacity:0\.5;[^"]*">',
+                                  re.IGNORECASE)
+
+
+@register('remove_footer_force', version=2, triggers=(icase(b'opacity:0.5'),))
+def remove_footer_force(doc):
+    """Remove the faded ``opacity:0.5`` footers the plain pass misses."""
+    bars = _remove_elements(doc, 'div', FADED_DIV, first_child=FOOTER_BAR)
+    rows = _remove_elements(doc, 'div', FOOTER_SPACE_BETWEEN)
+    return bars + rows
+
+
+# ── remove_swipe_arrows.py ───────────────────────────────────────────
+
+SWIPE_ARROWS = re.compile(r'<div class="swipe-arrows">')
+
+
+# Only templates 01 to 31 carried the arrows
+@register('remove_swipe_arrows', version=2, triggers=(b'swipe-arrows',),
+          files=('kr-clidn-0[1-9].js', 'kr-clidn-[12][0-9].js', 'kr-clidn-3[01].js'))
+def remove_swipe_arrows(doc):
+    """Remove the ``swipe-arrows`` hint div."""
+    return _remove_elements(doc, 'div', SWIPE_ARROWS, strip_before=True)
+
+
+# ── add_brand_header.py ──────────────────────────────────────────────
+
+# 09 is the CTA slide and keeps its own branding
+@register('add_brand_header', version=2, files=('kr-clidn-*.js',), exclude=('kr-clidn-09.js',),
+          triggers=(b'<div class="safe-zone">',))
+def add_brand_header(doc):
+    """Inject the DOMINION brand header into ``.safe-zone``."""
+    if 'class="brand-header"' in doc.text:
+        return 0
+
+    if '<div class="safe-zone">' not in doc.text:
+        doc.warn(f'.safe-zone not found in {doc.filename}')
+        return 0
+    if '</style>' not in doc.text:
+        doc.warn(f'</style> not found in {doc.filename}')
+        return 0
+
+    # Clean up old branding (brand-line) before injecting the new header
+    doc.replace('<div class="brand-line"></div>', '')
+    doc.replace('<div class="safe-zone">', '<div class="safe-zone">' + BRAND_HTML)
+    doc.replace('</style>', BRAND_CSS + '\n    </style>')
+    return 1
+
+
+# ── de-inline data URIs ──────────────────────────────────────────────
+
+# Right after add_brand_header so headers pasted by older runs get moved too. Opt-in:
+# it writes to the shared asset store, which snapshots and rollback do not cover
+@register('deinline_assets', default=False, triggers=(b';base64,',))
+def deinline_assets(doc):
+    """Move base64 ``data:`` URIs into the content-addressed asset store."""
+    store = AssetStore()
+    return doc.sub(DATA_URI, lambda match: store.replacement(match, dry_run=doc.dry_run))
+
+
+# ── whitewash_text.py ────────────────────────────────────────────────
+
+@register('whitewash', version=2, triggers=colour_triggers, colours=GREYS_TO_WHITE)
+def whitewash(doc, colours):
+    """Turn grey body text colours white (configurable colour map)."""
+    colour_map = compile_map(colours)
+    return doc.apply_edits(colour_map.edits(doc.text, doc.lexed if colour_map.names else None))
+
+
+# ── fix_min_fonts.py ─────────────────────────────────────────────────
+
+MIN_FONT_SIZE = 34
+FONT_SIZE = re.compile(r'(font-size:\s*)(\d+(?:\.\d+)?)\s*px', re.IGNORECASE)
+
+
+@register('fix_min_fonts', files=('_tiktok_base_template.js', 'kr-clidn-*.js'),
+          triggers=(icase(b'font-size'),), min_size=MIN_FONT_SIZE)
+def fix_min_fonts(doc, min_size):
+    """Raise every ``font-size`` below the minimum to the minimum."""
+    def replacer(match):
+        if float(match.group(2)) < min_size:
+            return f'{match.group(1)}{min_size}px'
+        return match.group(0)
+
+    return doc.sub(FONT_SIZE, replacer)
+
+
+# ── mass_editable_injector.py ────────────────────────────────────────
+
+# Map of Field -> ID
+EDITABLE_FIELDS = {
+    '${esc(d.TITLE)}': 'TITLE',
+    '${titleHtml}': 'TITLE',
+    '${esc(d.SUBTITLE)}': 'SUBTITLE',
+    '${esc(d.COMMAND)}': 'COMMAND',
+    '${esc(d.COMMAND_STRUCTURE)}': 'COMMAND_STRUCTURE',
+    '${esc(d.TIP)}': 'TIP',
+    '${esc(d.WARNING_TEXT)}': 'WARNING',
+    '${esc(d.context)}': 'CONTEXT',
+    '${esc(d.CONTEXT)}': 'CONTEXT',
+    '${esc(d.STORY)}': 'STORY',
+    '${esc(d.DESCRIPTION)}': 'DESCRIPTION',
+    '${esc(d.CODE)}': 'CODE',
+    '${esc(d.QUOTE)}': 'QUOTE',
+    '${esc(d.AUTHOR)}': 'AUTHOR',
+    '${esc(d.PROBLEM)}': 'PROBLEM',
+    '${esc(d.SOLUTION)}': 'SOLUTION',
+    '${esc(d.BEFORE_LABEL)}': 'BEFORE_LABEL',
+    '${esc(d.AFTER_LABEL)}': 'AFTER_LABEL',
+    '${esc(d.STAT_NUMBER)}': 'STAT_NUMBER',
+    '${esc(d.STAT_LABEL)}': 'STAT_LABEL',
+    '${esc(d.CHAPTER_TITLE)}': 'CHAPTER_TITLE',
+    '${esc(d.CHAPTER_SUBTITLE)}': 'CHAPTER_SUBTITLE',
+    '${esc(d.CHAPTER_NUMBER)}': 'CHAPTER_NUMBER',
+}
+
+
+@register('mass_editable', version=2, files=('kr-clidn-*.js',), triggers=(b'${esc(d.', b'${titleHtml}'))
+def mass_editable(doc):
+    """Wrap known ``${esc(d.FIELD)}`` interpolations in ``renderEditable``."""
+    # Templates with an editable TITLE have already been patched
+    if "TemplateUtils.renderEditable('TITLE'" in doc.text:
+        return 0
+
+    # Only interpolations in element content: wrapping one inside an
+    # attribute value (alt="${esc(d.TITLE)}") would inject markup there
+    text = doc.text
+    edits = []
+    for span in doc.lexed.interpolations(context=TEXT):
+        source = text[span.start:span.end]
+        field_id = EDITABLE_FIELDS.get(source)
+        if field_id is not None:
+            edits.append((span.start, span.end,
+                          f"${{TemplateUtils.renderEditable('{field_id}', `{source}`, data._overrides)}}"))
+    return doc.apply_edits(edits)
+
+
+# ── scripts/optimize_icons.py ────────────────────────────────────────
+
+# <span class="iconify" data-icon="${VAR.includes(':') ? VAR : 'material-symbols:' + VAR}"></span>
+ICONIFY_SPAN = re.compile(r'<span class="iconify" data-icon="\$\{(.+?)\.includes\(\':\'\)\s*\?\s*(.+?)\s*:'
+                          r'\s*\'material-symbols:\'\s*\+\s*(.+?)\}"></span>')
+STATIC_ICON = re.compile(r'<span class="iconify" data-icon="material-symbols:([\w-]+)"></span>')
+MATERIAL_LINK = re.compile(r'<link href="https://fonts.googleapis.com/icon\?family=Material\+Icons" rel="stylesheet">')
+MATERIAL_LINK_TAG = '<link href="https://fonts.googleapis.com/icon?family=Material+Icons" rel="stylesheet">'
+
+
+def _hybrid_icon(match):
+    var_expr = match.group(1)
+    return (f"${{({var_expr}).includes(':') ? '<span class=\"iconify\" data-icon=\"' + ({var_expr}) + "
+            f"'\"></span>' : '<i class=\"material-icons\">' + ({var_expr}) + '</i>'}}")
+
+
+def _static_icon(match):
+    # Google Fonts Material Icons use underscores: tips-and-updates -> tips_and_updates
+    return f'<i class="material-icons">{match.group(1).replace("-", "_")}</i>'
+
+
+# Superseded by icon_sprite, which needs no icon font; kept for scripts/optimize_icons.py
+@register('optimize_icons', files=('kr-clidn-*.js',), default=False,
+          triggers=(b'class="iconify"', b'</head>', b'rel="stylesheet">'))
+def optimize_icons(doc):
+    """Swap Iconify spans for Material Icons and link the icon font."""
+    count = 0
+    text = doc.text
+    if not MATERIAL_LINK.search(text):
+        if '</head>' in text:
+            doc.replace('</head>', f'    {MATERIAL_LINK_TAG}\n</head>')
+            count += 1
+        elif 'rel="stylesheet">' in text:
+            # Append after the last font link
+            last_link = text.rfind('rel="stylesheet">') + len('rel="stylesheet">')
+            doc.apply_edits([(last_link, last_link, f'\n    {MATERIAL_LINK_TAG}')])
+            count += 1
+
+    return count + doc.sub(ICONIFY_SPAN, _hybrid_icon) + doc.sub(STATIC_ICON, _static_icon)
+
+
+# ── offline icon sprite ──────────────────────────────────────────────
+
+# Output of optimize_icons: Iconify for "set:name", the Material font otherwise
+HYBRID_ICON = re.compile(r"\$\{\((.+?)\)\.includes\(':'\) \? '<span class=\"iconify\" data-icon=\"' \+ \(\1\) \+ "
+                         r"'\"></span>' : '<i class=\"material-icons\">' \+ \(\1\) \+ '</i>'\}")
+ICONIFY_ANY = re.compile(r'<span class="iconify" data-icon="([\w-]+:[\w-]+)"([^>]*)></span>')
+MATERIAL_STATIC = re.compile(r'<i class="material-icons([^"]*)"([^>]*)>\s*([\w-]+)\s*</i>')
+MATERIAL_DYNAMIC = re.compile(r'<i class="material-icons([^"]*)"([^>]*)>\$\{([^{}]+(?:\{[^{}]*\}[^{}]*)*)\}</i>')
+ICON_FONT_LINK = re.compile(r'[ \t]*<link href="https://fonts\.googleapis\.com/icon\?family=Material\+Icons" '
+                            r'rel="stylesheet">\n?')
+ICONIFY_SCRIPT = re.compile(r'[ \t]*<script src="https://code\.iconify\.design/[^"]*"></script>\n?')
+# The Material Icons stylesheet's 24px, behind a var() so fix_min_fonts (which runs
+# earlier) does not raise it to the minimum on the next run
+ICON_CSS = ('    <style id="kr-icons">.kr-icon { width: 1em; height: 1em; fill: currentColor; '
+            'vertical-align: middle; } :where(svg.kr-icon.material-icons) { font-size: var(--kr-icon-size, 24px); }'
+            '</style>\n')
+
+
+def _sprite_svg(ref, classes='', attrs=''):
+    return f'<svg class="kr-icon{classes}"{attrs}><use href="#{ref}"></use></svg>'
+
+
+def _dynamic_ref(expr):
+    return ID_PREFIX + '${' + JS_ICON_ID.format(expr=expr) + '}'
+
+
+@register('icon_sprite', triggers=(b'class="iconify"', b'class="material-icons', b'fonts.googleapis.com/icon'))
+def icon_sprite(doc):
+    """Draw Iconify and Material Icons from the offline sprite (``python -m packtools icons``)."""
+    icons = load_icons()
+
+    def static(name, classes='', attrs=''):
+        resolved = resolve(name, icons)
+        if resolved is None:
+            doc.warn(f'icon {name!r} is not in Icons.js or assets/icons/local ({doc.filename})')
+            return None
+        return _sprite_svg(ID_PREFIX + resolved, classes, attrs)
+
+    count = doc.sub(HYBRID_ICON, lambda m: _sprite_svg(_dynamic_ref(f'({m.group(1)})'), ' material-icons'))
+    count += doc.sub(ICONIFY_SPAN, lambda m: _sprite_svg(_dynamic_ref(m.group(3))))
+    count += doc.sub(ICONIFY_ANY, lambda m: static(m.group(1), '', m.group(2)) or m.group(0))
+    count += doc.sub(MATERIAL_STATIC, lambda m: static(m.group(3), ' material-icons' + m.group(1), m.group(2))
+                     or m.group(0))
+    count += doc.sub(MATERIAL_DYNAMIC, lambda m: _sprite_svg(_dynamic_ref(m.group(3)),
+                                                             ' material-icons' + m.group(1), m.group(2)))
+
+    text = doc.text
+    if 'class="iconify"' not in text and 'class="material-icons' not in text:
+        count += doc.sub(ICON_FONT_LINK, '') + doc.sub(ICONIFY_SCRIPT, '')
+    if 'class="kr-icon' in text and 'id="kr-icons"' not in text and '</head>' in text:
+        count += doc.replace('</head>', ICON_CSS + '</head>')
+    return count
+
+
+# ── fix.py ───────────────────────────────────────────────────────────
+
+# Only meant for ebook-pack, so it is not part of the default cleanup
+@register('unescape_literals', default=False, triggers=(b'\\`', b'\\${'),
+          stream=((b'\\`', b'`'), (b'\\${', b'${')))
+def unescape_literals(doc):
+    """Turn escaped backticks and ``${`` back into template syntax."""
+    return doc.replace('\\`', '`') + doc.replace('\\${', '${')
@@ -0,0 +1,273 @@
+"""Batch renderer for the ``{{PLACEHOLDER}}`` HTML templates under ``templates/``.
+
+A template is compiled once into its literal segments and the placeholder
+slot between each pair of them, so filling a row is a single ``join``
+instead of one ``str.replace`` per field. Rows are streamed from JSONL or
+CSV and rendered in fixed-size batches (spread over a process pool for big
+jobs, with a bounded number of batches in flight), so memory stays flat
+however many rows the campaign has; only the output names are kept, to
+catch rows that would overwrite each other's file.
+
+Values of ``text`` slots (and of placeholders the manifest does not know)
+are HTML-escaped; ``html`` slots are inserted as they are. An ``array``
+slot such as ``{{CARDS}}`` takes a list: with an ``itemTemplate`` in the
+manifest each item is an object rendered through it (its fields escaped),
+otherwise each item is an HTML string. Values that do not fit their slot
+render empty and are reported as row errors. Empty CSV cells count as
+missing values, and cells beyond the header are a row error.
+"""
+import collections
+import csv
+import html
+import json
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+PLACEHOLDER = re.compile(r'\{\{\s*([A-Za-z_]\w*)\s*\}\}')
+RAW_TYPES = frozenset(('html', 'array'))
+# template.json "colors" key -> placeholder suffix, where they differ
+COLOR_ALIASES = {'background': 'BG'}
+UNSAFE_NAME = re.compile(r'[^\w.-]+')
+# csv.DictReader key for the cells of a record longer than the header
+EXTRA_CELLS = '__extra_cells__'
+
+
+class CompiledTemplate:
+    """A template split into ``segments`` with a placeholder slot between each two."""
+
+    def __init__(self, text, manifest=None):
+        manifest = manifest or {}
+        parts = PLACEHOLDER.split(text)
+        self.segments = tuple(parts[0::2])
+        self.slots = tuple(parts[1::2])
+        self.names = frozenset(self.slots)
+
+        slots = manifest.get('slots', {})
+        self.defaults = {name: spec['default'] for name, spec in slots.items() if 'default' in spec}
+        for key, colour in manifest.get('colors', {}).items():
+            self.defaults.setdefault(f'COLOR_{COLOR_ALIASES.get(key, key).upper()}', colour)
+        self.optional = frozenset(name for name, spec in slots.items() if spec.get('optional'))
+        self.raw = frozenset(name for name, spec in slots.items() if spec.get('type') in RAW_TYPES)
+        self.items = {name: CompiledTemplate(spec['itemTemplate'])
+                      for name, spec in slots.items() if spec.get('itemTemplate')}
+
+    @classmethod
+    def load(cls, path, manifest_path=None):
+        """Compile ``path``; ``template.json`` next to it is the default manifest."""
+        with open(path, 'r', encoding='utf-8') as f:
+            text = f.read()
+        if manifest_path is None:
+            candidate = os.path.join(os.path.dirname(path), 'template.json')
+            manifest_path = candidate if os.path.isfile(candidate) else None
+        manifest = None
+        if manifest_path is not None:
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+        return cls(text, manifest)
+
+    def _items(self, name, items, errors, unknown):
+        item_template = self.items.get(name)
+        parts = []
+        for i, item in enumerate(items):
+            if item_template is not None:
+                if not isinstance(item, dict):
+                    errors.append(f'{name}[{i}]: expected an object, got {type(item).__name__}')
+                    continue
+                part, missing, item_unknown, item_errors = item_template.render(item)
+                errors.extend(f'{name}[{i}]: {problem}' for problem in item_errors)
+                unknown.extend(f'{name}[{i}].{key}' for key in item_unknown)
+                if missing:
+                    errors.append(f"{name}[{i}]: missing {', '.join(missing)}")
+                parts.append(part)
+            elif isinstance(item, str):
+                parts.append(item if name in self.raw else html.escape(item))
+            else:
+                errors.append(f'{name}[{i}]: {type(item).__name__} item, but the slot has no itemTemplate')
+        return ''.join(parts)
+
+    def _value(self, name, value, errors, unknown):
+        if isinstance(value, (list, tuple)):
+            return self._items(name, value, errors, unknown)
+        if value is None:
+            return ''
+        if isinstance(value, dict):
+            errors.append(f'{name}: expected text, got an object')
+            return ''
+        if not isinstance(value, str):
+            value = str(value)
+        return value if name in self.raw else html.escape(value)
+
+    def render(self, row):
+        """Return ``(html, missing, unknown, errors)`` for one row of values.
+
+        ``missing`` lists placeholders with no value and no default (they
+        render empty); ``unknown`` lists row keys the template never uses,
+        and item fields as ``CARDS[0].key``; ``errors`` describes values
+        that do not fit their slot.
+        """
+        values = {}
+        missing = []
+        errors = []
+        unknown = [key for key in row if key not in self.names and key != EXTRA_CELLS]
+        if row.get(EXTRA_CELLS):
+            errors.append(f'{len(row[EXTRA_CELLS])} cell(s) beyond the header')
+        for name in self.names:
+            if row.get(name) is not None:
+                values[name] = self._value(name, row[name], errors, unknown)
+            elif name in self.defaults:
+                values[name] = self._value(name, self.defaults[name], errors, unknown)
+            else:
+                values[name] = ''
+                if name not in self.optional:
+                    missing.append(name)
+
+        # Segment i is followed by slot i
+        out = [None] * (len(self.segments) + len(self.slots))
+        out[0::2] = self.segments
+        out[1::2] = [values[name] for name in self.slots]
+        return ''.join(out), sorted(missing), unknown, errors
+
+
+class RowResult:
+    """What rendering one row produced (the HTML itself only in bundle mode)."""
+    __slots__ = ('index', 'name', 'missing', 'unknown', 'errors', 'size', 'html')
+
+    def __init__(self, index, name, missing, unknown, errors, size, html=None):
+        self.index = index
+        self.name = name
+        self.missing = missing
+        self.unknown = unknown
+        self.errors = errors
+        self.size = size
+        self.html = html
+
+    @property
+    def ok(self):
+        return not self.missing and not self.unknown and not self.errors
+
+
+def iter_rows(path, fmt=None):
+    """Yield one dict per JSONL line or CSV record; ``-`` reads standard input.
+
+    Blank CSV cells, and those missing from a short record, come back as
+    ``None`` so they count as missing; cells beyond the header are listed
+    under ``EXTRA_CELLS``.
+    """
+    if fmt is None:
+        fmt = 'csv' if path.lower().endswith('.csv') else 'jsonl'
+    f = sys.stdin if path == '-' else open(path, 'r', encoding='utf-8', newline='')
+    try:
+        if fmt == 'csv':
+            for row in csv.DictReader(f, restkey=EXTRA_CELLS):
+                for key, value in row.items():
+                    if isinstance(value, str) and not value.strip():
+                        row[key] = None
+                yield row
+            return
+        for number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except ValueError as e:
+                raise ValueError(f'{path}:{number}: {e}') from None
+            if not isinstance(row, dict):
+                raise ValueError(f'{path}:{number}: expected a JSON object')
+            yield row
+    finally:
+        if f is not sys.stdin:
+            f.close()
+
+
+def _batches(rows, size, name_field):
+    """``(index, name, clash, row)`` batches, with a distinct file name per row.
+
+    A name already taken, ignoring case, gets the row number appended and
+    ``clash`` says which row had it first.
+    """
+    taken = {}
+    batch = []
+    for index, row in enumerate(rows):
+        name = _file_name(index, row, name_field)
+        clash = None
+        if name.lower() in taken:
+            first = taken[name.lower()]
+            clash = f'file name {name}.html is already used by row {first + 1}'
+            while name.lower() in taken:
+                name = f'{name}-{index:05d}'
+        taken[name.lower()] = index
+        batch.append((index, name, clash, row))
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _file_name(index, row, name_field):
+    name = row.get(name_field) if name_field else None
+    if name is None or str(name).strip() == '':
+        return f'{index:05d}'
+    return UNSAFE_NAME.sub('_', str(name)).strip('._') or f'{index:05d}'
+
+
+# Per-process job state, set once by _init_worker instead of pickled per batch
+_job = {}
+
+
+def _init_worker(template, out_dir, name_field):
+    _job.update(template=template, out_dir=out_dir, name_field=name_field)
+
+
+def _render_batch(batch):
+    template = _job['template']
+    out_dir = _job['out_dir']
+    name_field = _job['name_field']
+    results = []
+    for index, name, clash, row in batch:
+        if name_field in row and name_field not in template.names:
+            row = {key: value for key, value in row.items() if key != name_field}
+        page, missing, unknown, errors = template.render(row)
+        if clash:
+            errors.append(f'{clash}; written as {name}.html')
+        data = page.encode('utf-8')
+        if out_dir is None:
+            results.append(RowResult(index, name, missing, unknown, errors, len(data), page))
+            continue
+        with open(os.path.join(out_dir, f'{name}.html'), 'wb') as f:
+            f.write(data)
+        results.append(RowResult(index, name, missing, unknown, errors, len(data)))
+    return results
+
+
+def render_rows(template, rows, out_dir=None, jobs=1, batch_size=256, name_field='id'):
+    """Render ``rows`` in order, yielding a ``RowResult`` each.
+
+    With ``out_dir`` each row is written to ``<out_dir>/<name>.html`` by the
+    worker that rendered it; without it the HTML comes back on the result.
+    Rows whose names collide keep distinct files and get a row error.
+    At most ``2 * jobs`` batches are in flight, whatever the row count.
+    """
+    if out_dir is not None:
+        os.makedirs(out_dir, exist_ok=True)
+    if jobs == 0:
+        jobs = os.cpu_count() or 1
+    batches = _batches(rows, batch_size, name_field)
+
+    if jobs <= 1:
+        _init_worker(template, out_dir, name_field)
+        for batch in batches:
+            yield from _render_batch(batch)
+        return
+
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker,
+                             initargs=(template, out_dir, name_field)) as pool:
+        pending = collections.deque()
+        for batch in batches:
+            pending.append(pool.submit(_render_batch, batch))
+            if len(pending) >= 2 * jobs:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
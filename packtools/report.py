@@ -0,0 +1,154 @@
+"""Machine-readable report of one rewrite run.
+
+Collects the ``FileResult`` of every template with the time, matches and
+bytes added and removed by each pass, and, when profiling, the cProfile
+stats of the slowest files, so a slow sweep can be traced to a pass and a
+template.
+"""
+import datetime
+import heapq
+import io
+import json
+import os
+import pstats
+import time
+
+REPORT_VERSION = 1
+
+
+class _Stats:
+    """Lets ``pstats.Stats`` load a stats dict that came back from a worker."""
+
+    def __init__(self, stats):
+        self.stats = stats
+
+    def create_stats(self):
+        pass
+
+
+class RunReport:
+
+    def __init__(self, settings=None, profile_top=0):
+        self.settings = settings or {}
+        self.profile_top = profile_top
+        self.results = []
+        self.profiles = []  # heap of (seconds, label, stats): the slowest profiled files
+        self.created = datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds')
+        self._start = time.perf_counter()
+        self.seconds = None
+
+    def add(self, result):
+        if result.profile is not None:
+            item = (result.seconds, result.label, result.profile)
+            if len(self.profiles) < self.profile_top:
+                heapq.heappush(self.profiles, item)
+            elif item[0] > self.profiles[0][0]:
+                heapq.heapreplace(self.profiles, item)
+            result.profile = None
+        self.results.append(result)
+
+    def finish(self):
+        self.seconds = time.perf_counter() - self._start
+
+    def slowest_files(self, count=10):
+        return heapq.nlargest(count, (r for r in self.results if r.stats), key=lambda r: r.seconds)
+
+    def pass_totals(self, slowest=5):
+        """``{pass name: totals}`` in pipeline order, each with its ``slowest`` files."""
+        totals = {}
+        timings = {}
+        for result in self.results:
+            for stat in result.stats:
+                total = totals.setdefault(stat.name, {'files': 0, 'matches': 0, 'seconds': 0.0,
+                                                      'bytes_added': 0, 'bytes_removed': 0})
+                total['files'] += 1
+                total['matches'] += stat.matches
+                total['seconds'] += stat.seconds
+                total['bytes_added'] += stat.added
+                total['bytes_removed'] += stat.removed
+                timings.setdefault(stat.name, []).append((stat.seconds, result.label))
+        for name, total in totals.items():
+            total['seconds'] = round(total['seconds'], 6)
+            total['slowest'] = [{'file': label, 'seconds': round(seconds, 6)}
+                                for seconds, label in heapq.nlargest(slowest, timings[name])]
+        return totals
+
+    def profile_stats(self):
+        """Merged ``pstats.Stats`` of the slowest profiled files, or ``None``."""
+        stats = None
+        for _, _, profile in self.profiles:
+            if stats is None:
+                stats = pstats.Stats(_Stats(profile))
+            else:
+                stats.add(_Stats(profile))
+        return stats
+
+    def top_functions(self, count=25):
+        stats = self.profile_stats()
+        if stats is None:
+            return []
+        rows = []
+        for (filename, line, name), (_, ncalls, tottime, cumtime, _) in stats.stats.items():
+            rows.append({'function': f'{filename}:{line}({name})', 'ncalls': ncalls,
+                         'tottime': round(tottime, 6), 'cumtime': round(cumtime, 6)})
+        rows.sort(key=lambda row: row['cumtime'], reverse=True)
+        return rows[:count]
+
+    def format_profile(self, count=25):
+        """The cProfile table of the slowest files, as ``pstats`` prints it."""
+        stats = self.profile_stats()
+        if stats is None:
+            return ''
+        out = io.StringIO()
+        stats.stream = out
+        stats.sort_stats('cumulative').print_stats(count)
+        return out.getvalue()
+
+    def to_dict(self):
+        results = self.results
+        return {
+            'version': REPORT_VERSION,
+            'created': self.created,
+            'seconds': round(self.seconds, 6) if self.seconds is not None else None,
+            'settings': self.settings,
+            'totals': {
+                'files': len(results),
+                'cached': sum(r.skipped for r in results),
+                'filtered': sum(r.filtered for r in results),
+                'changed': sum(r.changed for r in results),
+                'written': sum(r.written for r in results),
+                'bytes_before': sum(r.size or 0 for r in results),
+                'bytes_after': sum(r.new_size or 0 for r in results),
+            },
+            'passes': self.pass_totals(),
+            'files': [{
+                'file': r.label,
+                'cached': r.skipped,
+                'filtered': r.filtered,
+                'changed': r.changed,
+                'written': r.written,
+                'seconds': round(r.seconds, 6),
+                'bytes_before': r.size,
+                'bytes_after': r.new_size,
+                'passes': [stat.to_dict() for stat in r.stats],
+            } for r in results],
+            'profile': {
+                'files': [{'file': label, 'seconds': round(seconds, 6)}
+                          for seconds, label, _ in sorted(self.profiles, reverse=True)],
+                'functions': self.top_functions(),
+            } if self.profile_top else None,
+        }
+
+    def write(self, path):
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, indent=1)
+        os.replace(tmp_path, path)
+
+    def dump_profile(self, path):
+        """Save the merged stats for ``python -m pstats`` or snakeviz; False if there are none."""
+        stats = self.profile_stats()
+        if stats is None:
+            return False
+        stats.dump_stats(path)
+        return True
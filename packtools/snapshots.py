@@ -0,0 +1,378 @@
+"""Content-addressed snapshots of what each rewrite run changed.
+
+Every ``rewrite`` (and every batch ``watch`` rewrites) is recorded as a
+small manifest listing ``{path: [sha256 before, sha256 after]}`` for the
+files it wrote, with both contents in an object store keyed by sha256.
+Templates the run left alone are not mentioned and identical contents are
+stored once, so a run costs about the bytes it changed. The manifest is
+written before the first file; each file is then appended to the run's
+journal, after its contents are stored and before it is replaced, so a run
+that crashes or is interrupted can still be rolled back. The layout is::
+
+    .packtools-snapshots/objects/<ab>/<sha256>     zlib-compressed content
+    .packtools-snapshots/runs/<run id>.json
+    .packtools-snapshots/runs/<run id>.journal     files of a run in progress
+
+``rollback`` restores the ``before`` content of every file a run wrote. All
+the new contents are staged next to their targets first and only then
+renamed over them, and the rollback is itself recorded as a run, so it can
+be rolled back in turn.
+"""
+import difflib
+import hashlib
+import json
+import os
+import time
+import zlib
+
+from .engine import REPO_ROOT, repo_relpath
+from .state import sha256_bytes, sha256_file
+
+SNAPSHOT_DIR = os.path.join(REPO_ROOT, '.packtools-snapshots')
+SNAPSHOT_VERSION = 1
+COMPRESS_LEVEL = 1
+CHUNK = 1024 * 1024
+
+
+class RollbackConflict(Exception):
+    """Files of the run have changed since; rolling back would lose that work."""
+
+    def __init__(self, run_id, paths):
+        super().__init__(f'{len(paths)} file(s) changed since run {run_id}: {", ".join(paths[:5])}'
+                         f'{" ..." if len(paths) > 5 else ""}')
+        self.paths = paths
+
+
+class ObjectStore:
+    """Deduplicated file contents under ``root/objects``.
+
+    Only holds paths, so it can be sent to the rewrite workers, which put
+    objects concurrently: each is written to a temporary file and renamed
+    into place.
+    """
+
+    def __init__(self, root=SNAPSHOT_DIR):
+        self.root = root
+        self.journal = None  # journal of the run in progress, see SnapshotStore.begin
+
+    @property
+    def objects_dir(self):
+        return os.path.join(self.root, 'objects')
+
+    def object_path(self, sha256):
+        return os.path.join(self.objects_dir, sha256[:2], sha256)
+
+    def has(self, sha256):
+        return os.path.isfile(self.object_path(sha256))
+
+    def put(self, data, sha256=None):
+        """Store ``data`` unless it is there already; return the bytes written."""
+        sha256 = sha256 or sha256_bytes(data)
+        path = self.object_path(sha256)
+        if os.path.isfile(path):
+            return 0
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        packed = zlib.compress(data, COMPRESS_LEVEL)
+        tmp_path = f'{path}.{os.getpid()}.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(packed)
+        os.replace(tmp_path, path)
+        return len(packed)
+
+    def put_file(self, path, sha256):
+        """``put`` for a file too large to read at once, compressed chunk by chunk."""
+        target = self.object_path(sha256)
+        if os.path.isfile(target):
+            return 0
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        compressor = zlib.compressobj(COMPRESS_LEVEL)
+        tmp_path = f'{target}.{os.getpid()}.tmp'
+        written = 0
+        with open(path, 'rb') as src, open(tmp_path, 'wb') as f:
+            for chunk in iter(lambda: src.read(CHUNK), b''):
+                written += f.write(compressor.compress(chunk))
+            written += f.write(compressor.flush())
+        os.replace(tmp_path, target)
+        return written
+
+    def copy_to(self, sha256, f):
+        """Write the content of ``sha256`` to the open file ``f`` chunk by chunk."""
+        decompressor = zlib.decompressobj()
+        digest = hashlib.sha256()
+        with open(self.object_path(sha256), 'rb') as src:
+            for chunk in iter(lambda: src.read(CHUNK), b''):
+                # Bounded output: highly compressible chunks would otherwise inflate at once
+                while chunk:
+                    data = decompressor.decompress(chunk, CHUNK)
+                    digest.update(data)
+                    f.write(data)
+                    chunk = decompressor.unconsumed_tail
+        data = decompressor.flush()
+        digest.update(data)
+        f.write(data)
+        if digest.hexdigest() != sha256:
+            raise ValueError(f'Snapshot object {sha256} is corrupt')
+
+    def get(self, sha256):
+        with open(self.object_path(sha256), 'rb') as f:
+            data = zlib.decompress(f.read())
+        if sha256_bytes(data) != sha256:
+            raise ValueError(f'Snapshot object {sha256} is corrupt')
+        return data
+
+    def log(self, path, before, after):
+        """Journal that ``path`` is about to go from ``before`` to ``after``.
+
+        Each entry is a single ``O_APPEND`` write, so workers can share the
+        journal. A no-op outside a run.
+        """
+        if self.journal is None:
+            return
+        line = json.dumps([repo_relpath(path), before, after]) + '\n'
+        fd = os.open(self.journal, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, line.encode('utf-8'))
+        finally:
+            os.close(fd)
+
+
+class SnapshotStore(ObjectStore):
+    """The object store plus the run manifests that point into it."""
+
+    @property
+    def runs_dir(self):
+        return os.path.join(self.root, 'runs')
+
+    def runs(self):
+        """Every run manifest, oldest first."""
+        try:
+            names = [name for name in os.listdir(self.runs_dir) if name.endswith('.json')]
+        except FileNotFoundError:
+            return []
+        runs = []
+        for name in names:
+            try:
+                with open(os.path.join(self.runs_dir, name), 'r', encoding='utf-8') as f:
+                    run = json.load(f)
+            except (OSError, ValueError):
+                continue
+            if run.get('version') != SNAPSHOT_VERSION:
+                continue
+            if not run.get('complete', True):  # still running, or it never finished
+                run['files'] = self._read_journal(run['id'])
+            runs.append(run)
+        # Ids only resolve to the second
+        return sorted(runs, key=lambda run: run['created'])
+
+    def find(self, ref, runs=None):
+        """Index in ``runs`` of the run ``ref`` names: an id, a unique id prefix or ``last``."""
+        runs = self.runs() if runs is None else runs
+        if ref == 'last' and runs:
+            return len(runs) - 1
+        matches = [i for i, run in enumerate(runs) if run['id'].startswith(ref)]
+        if len(matches) != 1:
+            raise KeyError(f'{"Ambiguous" if matches else "Unknown"} snapshot run: {ref}')
+        return matches[0]
+
+    def _run_path(self, run_id, ext='.json'):
+        return os.path.join(self.runs_dir, run_id + ext)
+
+    def _write_run(self, run):
+        os.makedirs(self.runs_dir, exist_ok=True)
+        path = self._run_path(run['id'])
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(run, f, indent=1)
+        os.replace(tmp_path, path)
+
+    def _read_journal(self, run_id):
+        """``{relpath: [before, after]}`` from the journal of ``run_id``."""
+        files = {}
+        try:
+            with open(self._run_path(run_id, '.journal'), 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        path, before, after = json.loads(line)
+                    except ValueError:
+                        continue  # torn last line of a killed run
+                    files[path] = [files[path][0] if path in files else before, after]
+        except FileNotFoundError:
+            pass
+        return dict(sorted(files.items()))
+
+    def record(self, files, **meta):
+        """Write the manifest of a run that changed ``{path: (before, after)}``.
+
+        Both contents of every file must already be in the store.
+        """
+        run = {
+            'version': SNAPSHOT_VERSION,
+            'id': time.strftime('%Y%m%d-%H%M%S') + '-' + os.urandom(3).hex(),
+            'created': time.time(),
+            **meta,
+            'files': {repo_relpath(path): list(shas) for path, shas in sorted(files.items())},
+        }
+        self._write_run(run)
+        return run
+
+    def begin(self, **meta):
+        """Start a run before writing anything; ``log`` then journals each file.
+
+        Until ``finish`` the manifest is marked incomplete and ``runs`` reads
+        its files from the journal, so an interrupted run can be rolled back.
+        """
+        run = self.record({}, complete=False, **meta)
+        self.journal = self._run_path(run['id'], '.journal')
+        return run
+
+    def finish(self, run, **meta):
+        """Fold the journal into the manifest of ``run``; ``None`` if it wrote nothing."""
+        self.journal = None
+        run_id = run['id']
+        files = self._read_journal(run_id)
+        if files:
+            run = {**run, **meta, 'complete': True, 'files': files}
+            self._write_run(run)
+        else:
+            run = None
+            os.remove(self._run_path(run_id))
+        self._remove_journal(run_id)
+        return run
+
+    def _remove_journal(self, run_id):
+        try:
+            os.remove(self._run_path(run_id, '.journal'))
+        except FileNotFoundError:
+            pass
+
+    # ── Comparing runs ──────────────────────────────────────────────
+
+    @staticmethod
+    def version_at(runs, index, path):
+        """sha256 of ``path`` right after ``runs[index]``, as far as the runs tell.
+
+        That is the content the last run up to ``index`` left, or else the
+        one the first later run found; ``None`` if no run touched ``path``.
+        """
+        for run in reversed(runs[:index + 1]):
+            if path in run['files']:
+                return run['files'][path][1]
+        for run in runs[index + 1:]:
+            if path in run['files']:
+                return run['files'][path][0]
+        return None
+
+    def changes(self, old_ref, new_ref=None):
+        """``[(path, old sha256, new sha256)]`` between two runs.
+
+        With one run, what that run did; with two, how the files differ
+        after the first and after the second.
+        """
+        runs = self.runs()
+        first = self.find(old_ref, runs)
+        if new_ref is None:
+            return [(path, before, after) for path, (before, after) in runs[first]['files'].items()]
+        second = self.find(new_ref, runs)
+        low, high = sorted((first, second))
+        paths = sorted({path for run in runs[low + 1:high + 1] for path in run['files']})
+        changes = []
+        for path in paths:
+            old = self.version_at(runs, first, path)
+            new = self.version_at(runs, second, path)
+            if old != new:
+                changes.append((path, old, new))
+        return changes
+
+    def diff(self, path, old, new, old_label='before', new_label='after'):
+        """Unified diff lines between two stored contents of ``path`` (``None``: no file)."""
+        a = self.get(old).decode('utf-8', 'replace').splitlines(keepends=True) if old else []
+        b = self.get(new).decode('utf-8', 'replace').splitlines(keepends=True) if new else []
+        return difflib.unified_diff(a, b, f'a/{path} ({old_label})', f'b/{path} ({new_label})')
+
+    # ── Rolling back ────────────────────────────────────────────────
+
+    def rollback(self, ref, force=False):
+        """Put back the content every file had before run ``ref``.
+
+        Refuses, with ``RollbackConflict``, when a file no longer holds what
+        the run wrote (a later run or an edit changed it) unless ``force``.
+        Returns the run recording the rollback, or ``None`` if every file
+        already had its old content.
+        """
+        runs = self.runs()
+        run = runs[self.find(ref, runs)]
+        todo = []
+        conflicts = []
+        for rel, (before, after) in run['files'].items():
+            path = os.path.join(REPO_ROOT, rel)
+            current_sha = sha256_file(path) if os.path.isfile(path) else None
+            if current_sha == before:
+                continue
+            if current_sha != after:
+                conflicts.append(rel)
+            todo.append((path, before, current_sha))
+        if conflicts and not force:
+            raise RollbackConflict(run['id'], conflicts)
+        if not todo:
+            return None
+
+        # Stage every file before replacing any, so a failure leaves the packs as they were
+        staged = []
+        stored = 0
+        try:
+            for path, before, current_sha in todo:
+                if current_sha is not None:
+                    stored += self.put_file(path, current_sha)
+                if before is None:  # rolling back a rollback that recreated a deleted file
+                    staged.append((None, path))
+                    continue
+                tmp_path = f'{path}.{os.getpid()}.rollback'
+                staged.append((tmp_path, path))
+                with open(tmp_path, 'wb') as f:
+                    self.copy_to(before, f)
+                    f.flush()
+                    os.fsync(f.fileno())
+        except BaseException:
+            for tmp_path, _ in staged:
+                if tmp_path is not None and os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+            raise
+
+        record = self.record({path: (current_sha, before) for path, before, current_sha in todo},
+                             command='rollback', rolled_back=run['id'], stored=stored)
+        for tmp_path, path in staged:
+            if tmp_path is None:
+                os.remove(path)
+            else:
+                os.replace(tmp_path, path)
+        return record
+
+    # ── Housekeeping ────────────────────────────────────────────────
+
+    def prune(self, keep):
+        """Forget all but the ``keep`` newest runs and delete objects no run uses.
+
+        Returns ``(runs removed, objects removed, bytes freed)``.
+        """
+        runs = self.runs()
+        removed = runs[:max(len(runs) - keep, 0)]
+        for run in removed:
+            os.remove(self._run_path(run['id']))
+            self._remove_journal(run['id'])
+        used = {sha for run in runs[len(removed):] for shas in run['files'].values() for sha in shas if sha}
+        objects = freed = 0
+        for dirpath, _, filenames in os.walk(self.objects_dir):
+            for filename in filenames:
+                if filename.endswith('.tmp') or filename in used:  # .tmp: a run writing right now
+                    continue
+                path = os.path.join(dirpath, filename)
+                freed += os.path.getsize(path)
+                os.remove(path)
+                objects += 1
+        return len(removed), objects, freed
+
+    def total_bytes(self):
+        total = 0
+        for dirpath, _, filenames in os.walk(self.objects_dir):
+            total += sum(os.path.getsize(os.path.join(dirpath, filename)) for filename in filenames)
+        return total
@@ -0,0 +1,123 @@
+"""On-disk record of what the rewrite pipeline last did to each template.
+
+Each pack keeps a small JSON file next to its templates mapping filename to
+the sha256 the file had after its last rewrite, its stat signature and the
+fingerprint of every pass that applied to it. A template is fresh when its
+bytes are still the ones we wrote and the passes that apply to it have not
+changed, so a re-run can skip it without running anything.
+"""
+import hashlib
+import json
+import os
+
+STATE_FILENAME = '.packtools-state'
+STATE_VERSION = 1
+
+
+def sha256_bytes(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def sha256_file(path, chunk_size=1024 * 1024):
+    """``sha256_bytes`` of a file, read ``chunk_size`` bytes at a time."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def pass_set(passes, filename):
+    """``{name: fingerprint}`` of the passes that apply to ``filename``."""
+    return {p.name: p.fingerprint for p in passes if p.applies_to(filename)}
+
+
+class PackState:
+    """Cached rewrite state for the templates of one pack directory."""
+
+    def __init__(self, pack_dir, files=None):
+        self.pack_dir = pack_dir
+        self.files = files or {}
+        self.dirty = False
+
+    @property
+    def path(self):
+        return os.path.join(self.pack_dir, STATE_FILENAME)
+
+    @classmethod
+    def load(cls, pack_dir):
+        path = os.path.join(pack_dir, STATE_FILENAME)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return cls(pack_dir)
+        # A state written by another format version is as good as none
+        if data.get('version') != STATE_VERSION:
+            return cls(pack_dir)
+        return cls(pack_dir, data.get('files', {}))
+
+    def save(self):
+        if not self.dirty:
+            return
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': STATE_VERSION, 'files': self.files}, f, indent=1, sort_keys=True)
+        os.replace(tmp_path, self.path)
+        self.dirty = False
+
+    def entry(self, filename, passes):
+        """The recorded entry for ``filename`` if every one of ``passes`` is in it.
+
+        Recorded content is a fixed point of the passes recorded with it, so
+        running any subset of them again cannot change it.
+        """
+        entry = self.files.get(filename)
+        if entry is None:
+            return None
+        recorded = entry['passes']
+        for name, fingerprint in pass_set(passes, filename).items():
+            if recorded.get(name) != fingerprint:
+                return None
+        return entry
+
+    def is_fresh(self, path, passes):
+        """True when ``path`` is untouched since we last recorded it.
+
+        Only stats the file: a matching size and mtime is trusted, anything
+        else is left to the hash check in the worker.
+        """
+        entry = self.entry(os.path.basename(path), passes)
+        if entry is None:
+            return False
+        try:
+            st = os.stat(path)
+        except OSError:
+            return False
+        return entry['size'] == st.st_size and entry['mtime_ns'] == st.st_mtime_ns
+
+    def known_hash(self, path, passes):
+        entry = self.entry(os.path.basename(path), passes)
+        return entry['sha256'] if entry else None
+
+    def record(self, path, passes, sha256):
+        filename = os.path.basename(path)
+        applied = pass_set(passes, filename)
+        # Same bytes as last time: what held for the earlier passes still holds
+        previous = self.files.get(filename)
+        if previous is not None and previous['sha256'] == sha256:
+            applied = {**previous['passes'], **applied}
+        st = os.stat(path)
+        self.files[filename] = {
+            'sha256': sha256,
+            'size': st.st_size,
+            'mtime_ns': st.st_mtime_ns,
+            'passes': applied,
+        }
+        self.dirty = True
+
+    def forget_missing(self, filenames):
+        """Drop entries for templates that no longer exist."""
+        for filename in set(self.files) - set(filenames):
+            del self.files[filename]
+            self.dirty = True
@@ -0,0 +1,189 @@
+"""Synthetic template packs for benchmarks.
+
+Templates are shaped like the ``kr-clidn-*.js`` slides (a ``render(data)``
+returning a template literal with a ``<style>`` block and ``${esc(d.X)}``
+fields) with the card layout of
+``templates/instagram/modern-module-card/template.html``. How often each
+thing the passes look for shows up is set per template by ``densities``;
+fractional densities are spread at random, so ``{'footers': 0.3}`` puts a
+footer in roughly 30% of the templates.
+"""
+import json
+import os
+import random
+
+DEFAULT_DENSITIES = {
+    'footers': 1.0,  # margin-top:auto footers, half of them with nested divs
+    'faded_footers': 0.5,  # opacity:0.5 footers (bar and space-between variants)
+    'watermarks': 1.0,  # CYBER-CANVAS spans and POWERED BY credits
+    'greys': 4.0,  # grey colours whitewash rewrites
+    'small_fonts': 3.0,  # font sizes below the minimum
+    'iconify': 2.0,  # iconify spans, static and hybrid
+    'swipe_arrows': 0.5,
+    'cards': 3.0,  # content cards; sets the bulk of the file size
+}
+
+GREYS = ('#888', '#888888', '#94A3B8', '#64748b', 'rgb(136, 136, 136)', '#aaaaaa', '#555')
+OTHER_COLOURS = ('#00D9FF', '#0A0E27', '#1E3A8A', '#3B82F6', '#ffffff', 'rgba(0, 217, 255, 0.3)', '#8888aa')
+ICONS = ('terminal', 'security', 'lock', 'bug-report', 'wifi', 'code', 'shield', 'visibility')
+FIELDS = ('TITLE', 'SUBTITLE', 'COMMAND', 'TIP', 'DESCRIPTION', 'CODE', 'WARNING_TEXT', 'STAT_LABEL')
+
+HEAD = """// {name} - synthetic benchmark template
+window.KR_TEMPLATES = window.KR_TEMPLATES || {{}};
+window.KR_TEMPLATES['{name}'] = {{
+    render(data) {{
+        const d = data || {{}};
+        const esc = TemplateUtils.esc;
+        const titleHtml = esc(d.TITLE).replace(/\\n/g, '<br>');
+        const cards = (d.CARDS || []).map(c => `<div class="command-card"><i class="material-icons">${{esc(c.icono)}}</i></div>`).join('');
+        return `<!DOCTYPE html>
+<html lang="es">
+<head>
+    <meta charset="UTF-8">
+    <link href="https://fonts.googleapis.com/css2?family=Montserrat:wght@400;600;700;900&family=JetBrains+Mono&display=swap" rel="stylesheet">
+    <style>
+        :root {{ --bg-color: {bg}; --accent-cyan: #00D9FF; --text-white: #FFFFFF; }}
+        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
+        .container {{ width: 1080px; height: 1350px; background-color: var(--bg-color); position: relative; overflow: hidden;
+            display: flex; flex-direction: column; justify-content: center; align-items: center; }}
+        .safe-zone {{ display: flex; flex-direction: column; height: 100%; padding: 60px; }}
+        .title {{ font-family: 'Montserrat', sans-serif; font-size: 88px; font-weight: 900; color: var(--text-white); }}
+        .command-card {{ background: rgba(30, 58, 138, 0.2); border: 2px solid {colour}; border-radius: 20px; padding: 25px; }}
+"""
+
+TAIL = """    </div>
+    </div>
+</body>
+</html>`;
+    }}
+}};
+"""
+
+
+def _count(rng, density):
+    """``density`` rounded up or down at random so the mean is ``density``."""
+    whole = int(density)
+    return whole + (rng.random() < density - whole)
+
+
+def synth_template(name, rng, densities=None):
+    densities = {**DEFAULT_DENSITIES, **(densities or {})}
+    n = {key: _count(rng, value) for key, value in densities.items()}
+    parts = [HEAD.format(name=name, bg=rng.choice(OTHER_COLOURS[:3]), colour=rng.choice(OTHER_COLOURS))]
+
+    css = []
+    for i in range(n['greys']):
+        css.append(f'        .muted-{i} {{ color: {rng.choice(GREYS)}; border-color: {rng.choice(OTHER_COLOURS)}; }}\n')
+    for i in range(n['small_fonts']):
+        css.append(f'        .small-{i} {{ font-size: {rng.choice((12, 14, 16, 18.5, 22, 28))}px; }}\n')
+    css.append(f'        .body-text {{ font-size: {rng.choice((34, 36, 40, 48))}px; line-height: 1.4; }}\n')
+    parts.extend(css)
+    parts.append('    </style>\n</head>\n<body>\n    <div class="container">\n    <div class="safe-zone">\n')
+    parts.append('        <div class="brand-line"></div>\n')
+    parts.append('        <h1 class="title">${titleHtml}</h1>\n')
+
+    for i in range(n['watermarks']):
+        if i % 2:
+            parts.append('        <small>POWERED BY CYBER-CANVAS</small>\n')
+        else:
+            parts.append('        <span class="wm" style="opacity:.3">CYBER-CANVAS // v2</span>\n')
+
+    for i in range(n['cards']):
+        field = rng.choice(FIELDS)
+        parts.append(f'        <div class="command-card card-{i}">\n'
+                     f'            <div class="small-{i % max(1, n["small_fonts"])}">${{esc(d.{field})}}</div>\n'
+                     f'            <p class="body-text" title="${{esc(d.{field})}}">Lorem ipsum dolor sit amet, '
+                     f'consectetur adipiscing elit, sed do eiusmod tempor incididunt ut labore.</p>\n'
+                     f'        </div>\n')
+
+    for i in range(n['iconify']):
+        if i % 2:
+            parts.append('        <span class="iconify" data-icon="${d.ICON.includes(\':\') ? d.ICON : '
+                         '\'material-symbols:\' + d.ICON}"></span>\n')
+        else:
+            parts.append(f'        <span class="iconify" data-icon="material-symbols:{rng.choice(ICONS)}"></span>\n')
+
+    for _ in range(n['swipe_arrows']):
+        parts.append('        <div class="swipe-arrows">&gt;&gt;</div>\n')
+
+    for i in range(n['footers']):
+        inner = '<div class="dot"></div><span>${esc(d.STAT_LABEL)}</span>' if i % 2 else '<span>kr-clidn</span>'
+        parts.append(f'        <!-- Footer -->\n        <div style="margin-top: auto; display:flex; gap:10px;">{inner}</div>\n')
+
+    for i in range(n['faded_footers']):
+        if i % 2:
+            parts.append('        <div style="display:flex; justify-content:space-between; opacity:0.5;">'
+                         '<span>01</span><span>→</span></div>\n')
+        else:
+            parts.append('        <div style="display:flex; flex-direction:column; opacity:0.5;">\n'
+                         '            <div style="width:40px; height:4px; background:#555;"></div>\n'
+                         '        </div>\n')
+
+    parts.append(TAIL.format())
+    return ''.join(parts)
+
+
+def generate_pack(pack_dir, count, densities=None, seed=0):
+    """Write ``count`` synthetic templates (plus manifests and pack.json) to ``pack_dir``.
+
+    Returns the total size of the templates in bytes.
+    """
+    rng = random.Random(seed)
+    os.makedirs(pack_dir, exist_ok=True)
+    pack_id = os.path.basename(os.path.normpath(pack_dir))
+    with open(os.path.join(pack_dir, 'pack.json'), 'w', encoding='utf-8') as f:
+        json.dump({'id': pack_id, 'name': pack_id, 'description': 'Synthetic benchmark pack'}, f)
+
+    width = max(2, len(str(count - 1)))
+    total = 0
+    for i in range(count):
+        name = f'kr-clidn-{i:0{width}d}'
+        data = synth_template(name, rng, densities).encode('utf-8')
+        with open(os.path.join(pack_dir, f'{name}.js'), 'wb') as f:
+            f.write(data)
+        with open(os.path.join(pack_dir, f'{name}.json'), 'w', encoding='utf-8') as f:
+            json.dump({'id': name, 'name': f'Synthetic {i}'}, f)
+        total += len(data)
+    return total
+
+
+# ── Pathological inputs ──────────────────────────────────────────────
+# Each one is a single template built around ``size`` repetitions of a
+# shape that sends ``[\s\S]*?</div>`` style regexes scanning to the end
+# of the file from every candidate: there is no ``</div>`` after them.
+
+def _wrap(body):
+    return ("window.KR_TEMPLATES['pathological'] = { render(d) { return `<!DOCTYPE html>\n"
+            "<html><body><section class=\"safe-zone\">\n" + body + "</section></body></html>`; } };\n")
+
+
+def unclosed_footers(size):
+    """Footer open tags that never close."""
+    return _wrap('        <div style="margin-top: auto; display:flex;"><span>x</span>\n' * size)
+
+
+def whitespace_run(size):
+    r"""One long whitespace run before a footer comment with no footer after it.
+
+    ``(\s*<!-- Footer -->)?\s*<div`` rescans the rest of the run from every
+    position in it.
+    """
+    return _wrap(' ' * (size * 10) + '<!-- Footer -->\n        <p>no footer here</p>\n')
+
+
+def faded_without_bar(size):
+    """opacity:0.5 divs whose first child is not the footer bar, never closed."""
+    return _wrap('        <div style="display:flex; opacity:0.5;"><div style="width:40px; height:4px;">\n' * size)
+
+
+def nested_footers(size):
+    """One footer holding ``size`` nested divs."""
+    return _wrap('        <div style="margin-top: auto;">' + '<div>' * size + 'x' + '</div>' * size + '</div>\n')
+
+
+PATHOLOGICAL = {
+    'unclosed_footers': unclosed_footers,
+    'whitespace_run': whitespace_run,
+    'faded_without_bar': faded_without_bar,
+    'nested_footers': nested_footers,
+}
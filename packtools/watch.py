@@ -0,0 +1,253 @@
+"""Re-run the pipeline on templates as they are saved.
+
+``python -m packtools watch`` keeps the pack directories open with inotify
+(or, where inotify is missing, a stat poll) and, once a burst of saves has
+been quiet for the debounce window, runs the passes over the templates that
+changed and nothing else. Each pack's ``PackState`` is updated as the
+files are, so a later ``rewrite`` still skips them; the state file itself is
+written once the packs go quiet, since dumping it costs more than a rewrite
+on large packs.
+
+Rewriting a file is itself a write the watcher sees. The sha256 of every
+file we wrote is remembered, and an event whose file still hashes to it is
+dropped before any pass runs.
+
+With a snapshot store every batch that writes something is recorded as a
+``watch`` run, so ``snapshots rollback`` can put back what was saved.
+"""
+import ctypes
+import ctypes.util
+import errno
+import os
+import select
+import struct
+import time
+
+from .engine import iter_templates, rewrite_file
+from .state import PackState, pass_set
+
+DEBOUNCE = 0.02
+MAX_DELAY = 0.2  # flush a burst that keeps going after this long
+SAVE_DELAY = 1.0  # write pack state once saves have been quiet this long
+POLL_INTERVAL = 0.1
+
+# <sys/inotify.h>
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+EVENT = struct.Struct('iIII')  # wd, mask, cookie, len; name follows
+
+
+def is_template(filename):
+    return filename.endswith('.js') and not filename.startswith('.')
+
+
+# ── Event sources ────────────────────────────────────────────────────
+
+class InotifySource:
+    """Close-after-write and rename-into events of the watched directories."""
+
+    name = 'inotify'
+
+    def __init__(self, pack_dirs):
+        libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+        if not hasattr(libc, 'inotify_init1'):
+            raise OSError(errno.ENOSYS, 'inotify is not available')
+        self.fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), 'inotify_init1 failed')
+        self.dirs = {}
+        for pack_dir in pack_dirs:
+            wd = libc.inotify_add_watch(self.fd, os.fsencode(pack_dir), IN_CLOSE_WRITE | IN_MOVED_TO)
+            if wd < 0:
+                err = ctypes.get_errno()
+                self.close()
+                raise OSError(err, f'cannot watch {pack_dir}: {os.strerror(err)}')
+            self.dirs[wd] = pack_dir
+
+    def wait(self, timeout):
+        """Paths written within ``timeout`` seconds (``None`` blocks).
+
+        A queue overflow reports every template of every pack: the hash
+        check makes the ones that did not change cheap.
+        """
+        readable, _, _ = select.select([self.fd], [], [], timeout)
+        if not readable:
+            return []
+        paths = []
+        while True:
+            try:
+                data = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                return paths
+            offset = 0
+            while offset < len(data):
+                wd, mask, _, length = EVENT.unpack_from(data, offset)
+                name = data[offset + EVENT.size:offset + EVENT.size + length].rstrip(b'\0')
+                offset += EVENT.size + length
+                if mask & IN_Q_OVERFLOW:
+                    paths.extend(path for pack_dir in self.dirs.values() for path in iter_templates(pack_dir))
+                elif wd in self.dirs and not mask & IN_IGNORED and is_template(os.fsdecode(name)):
+                    paths.append(os.path.join(self.dirs[wd], os.fsdecode(name)))
+
+    def close(self):
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+
+class PollingSource:
+    """Stat every template each ``interval`` and report those whose signature moved."""
+
+    name = 'polling'
+
+    def __init__(self, pack_dirs, interval=POLL_INTERVAL):
+        self.pack_dirs = pack_dirs
+        self.interval = interval
+        self.signatures = self._scan()
+
+    def _scan(self):
+        signatures = {}
+        for pack_dir in self.pack_dirs:
+            with os.scandir(pack_dir) as entries:
+                for entry in entries:
+                    if not is_template(entry.name):
+                        continue
+                    try:
+                        st = entry.stat()
+                    except OSError:
+                        continue
+                    signatures[entry.path] = (st.st_size, st.st_mtime_ns)
+        return signatures
+
+    def wait(self, timeout):
+        time.sleep(self.interval if timeout is None else min(timeout, self.interval))
+        current = self._scan()
+        changed = [path for path, signature in current.items() if self.signatures.get(path) != signature]
+        self.signatures = current
+        return changed
+
+    def close(self):
+        pass
+
+
+def open_source(pack_dirs, poll=False, interval=POLL_INTERVAL):
+    """inotify unless ``poll`` is set or the platform has none."""
+    if not poll:
+        try:
+            return InotifySource(pack_dirs)
+        except (OSError, AttributeError, TypeError):
+            pass
+    return PollingSource(pack_dirs, interval)
+
+
+# ── Watcher ──────────────────────────────────────────────────────────
+
+class WatchEvent:
+    """What one debounced save of one template led to."""
+
+    def __init__(self, result, saved_ns, queued):
+        self.result = result
+        self.saved_ns = saved_ns  # file mtime before we touched it
+        self.queued = queued  # monotonic time the first event for it was read
+        self.done = time.monotonic()
+        self.done_ns = time.time_ns()
+
+    @property
+    def latency_ms(self):
+        """Save to normalised file on disk, from the file's own mtime."""
+        return max(self.done_ns - self.saved_ns, 0) / 1e6
+
+    @property
+    def queued_ms(self):
+        """First event read to normalised file: debounce plus the passes."""
+        return (self.done - self.queued) * 1000
+
+
+class Watcher:
+    """Debounce template saves in ``pack_dirs`` and run ``passes`` over them."""
+
+    def __init__(self, pack_dirs, passes, debounce=DEBOUNCE, poll=False, interval=POLL_INTERVAL, store=None):
+        self.pack_dirs = [os.path.abspath(pack_dir) for pack_dir in pack_dirs]
+        self.passes = passes
+        self.debounce = debounce
+        self.store = store  # snapshots.SnapshotStore, one run per batch that writes
+        self.runs = 0
+        self.source = open_source(self.pack_dirs, poll=poll, interval=interval)
+        self.states = {pack_dir: PackState.load(pack_dir) for pack_dir in self.pack_dirs}
+        self.written = {}  # path -> sha256 of the bytes we last wrote there
+        self.ignored = 0
+
+    def save(self):
+        for state in self.states.values():
+            state.save()
+
+    def close(self):
+        self.source.close()
+        self.save()
+
+    def process(self, pending):
+        """Run the passes over ``{path: first event time}``; return a WatchEvent each."""
+        if self.store is None:
+            return self._process(pending)
+        run = self.store.begin(command='watch', packs=self.pack_dirs, passes=[p.name for p in self.passes])
+        events = []
+        try:
+            events = self._process(pending)
+        finally:
+            if self.store.finish(run, stored=sum(event.result.stored for event in events)) is not None:
+                self.runs += 1
+        return events
+
+    def _process(self, pending):
+        events = []
+        for path, queued in sorted(pending.items()):
+            pack_dir = os.path.dirname(path)
+            state = self.states.get(pack_dir)
+            if state is None or not pass_set(self.passes, os.path.basename(path)):
+                continue
+            try:
+                saved_ns = os.stat(path).st_mtime_ns
+            except FileNotFoundError:
+                continue
+            own = self.written.get(path)
+            result = rewrite_file(path, self.passes, known_hash=own or state.known_hash(path, self.passes),
+                                  store=self.store)
+            if result.skipped and own is not None:
+                # Our own write coming back, or a save of identical bytes
+                self.ignored += 1
+                continue
+            self.written.pop(path, None)
+            if result.written:
+                self.written[path] = result.sha256
+            state.record(path, self.passes, result.sha256)
+            events.append(WatchEvent(result, saved_ns, queued))
+        return events
+
+    def run(self, on_event, max_delay=MAX_DELAY):
+        """Watch until interrupted, calling ``on_event(event)`` for every rewrite."""
+        pending = {}
+        last = None
+        while True:
+            now = time.monotonic()
+            if pending:
+                first = min(pending.values())
+                timeout = max(min(last + self.debounce, first + max_delay) - now, 0)
+            elif any(state.dirty for state in self.states.values()):
+                timeout = SAVE_DELAY
+            else:
+                timeout = None
+            paths = self.source.wait(timeout)
+            now = time.monotonic()
+            if not paths and not pending and last is not None and now - last >= SAVE_DELAY:
+                self.save()
+            for path in paths:
+                pending.setdefault(path, now)
+                last = now
+            if pending and (now - last >= self.debounce or now - min(pending.values()) >= max_delay):
+                batch, pending = pending, {}
+                for event in self.process(batch):
+                    on_event(event)
@@ -10,6 +10,9 @@ contextBridge.exposeInMainWorld('cyberCanvas', {
     // Exportar batch
     exportBatch: (options) => ipcRenderer.invoke('export-batch', options),
 
+    // Progreso de export-batch / export-video por worker: { kind, worker, workerDone, done, total }
+    onExportProgress: (cb) => ipcRenderer.on('export-progress', (_, data) => cb(data)),
+
     // Save canvas PNG directly to disk
     saveCanvasPng: (options) => ipcRenderer.invoke('save-canvas-png', options),
 
@@ -33,9 +36,13 @@ contextBridge.exposeInMainWorld('cyberCanvas', {
     // Get bridge server status
     tiktokBridgeStatus: () => ipcRenderer.invoke('tiktok-bridge-status'),
     // Listen for incoming data from extension
-    onTiktokTrend: (cb) => ipcRenderer.on('tiktok-trend-data', (_, data) => cb(data)),
     onTiktokViral: (cb) => ipcRenderer.on('tiktok-viral-video', (_, data) => cb(data)),
     onTiktokGenerate: (cb) => ipcRenderer.on('tiktok-generate-request', (_, data) => cb(data)),
+    // TREND_DATA / VIDEO_DATA / PROFILE_DATA llegan agrupados y sin duplicados: un array por lote
+    onTiktokTrends: (cb) => ipcRenderer.on('tiktok-trend-batch', (_, items) => cb(items)),
+    onTiktokTrend: (cb) => ipcRenderer.on('tiktok-trend-batch', (_, items) => items.forEach(data => cb(data))),
+    onTiktokVideos: (cb) => ipcRenderer.on('tiktok-video-batch', (_, items) => cb(items)),
+    onTiktokProfiles: (cb) => ipcRenderer.on('tiktok-profile-batch', (_, items) => cb(items)),
     onTiktokStatus: (cb) => ipcRenderer.on('tiktok-extension-status', (_, data) => cb(data)),
 
     // ── JSON Popout Editor ──────────────────────────────────────────
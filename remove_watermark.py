@@ -1,36 +1,11 @@
-import os
-import re
+"""Remove the CYBER-CANVAS watermark from the kr-edu-pack templates.
 
-directory = '/home/rk13/RK13CODE/POWERPOST/CYBER-CANVAS-ELECTRON/src/packs/kr-edu-pack'
-count = 0
+Shortcut for ``python -m packtools rewrite --passes remove_watermark``; extra
+arguments (pack directories, --dry-run) are passed through.
+"""
+import sys
 
-# Regex to find the watermark span
-# Matches: <span ...>CYBER-CANVAS // ...</span>
-# We accept any attributes in the span tag
-pattern = re.compile(r'<span[^>]*>CYBER-CANVAS // [^<]*</span>', re.IGNORECASE)
+from packtools.cli import main
 
-# Regex for "POWERED BY CYBER-CANVAS"
-pattern2 = re.compile(r'POWERED BY CYBER-CANVAS', re.IGNORECASE)
-
-for filename in os.listdir(directory):
-    if filename.endswith(".js"):
-        filepath = os.path.join(directory, filename)
-        with open(filepath, 'r') as f:
-            content = f.read()
-        
-        new_content = content
-        
-        # Check and replace
-        if pattern.search(new_content):
-            new_content = pattern.sub('', new_content)
-            
-        if pattern2.search(new_content):
-            new_content = pattern2.sub('', new_content)
-            
-        if new_content != content:
-            with open(filepath, 'w') as f:
-                f.write(new_content)
-            print(f"Removed watermark from {filename}")
-            count += 1
-
-print(f"Total files updated: {count}")
+if __name__ == "__main__":
+    sys.exit(main(["rewrite", "--passes", "remove_watermark", *sys.argv[1:]]))
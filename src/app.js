@@ -117,9 +117,11 @@ class App {
     }
 
     setupTikTokListener() {
-        if (window.cyberCanvas && window.cyberCanvas.onTiktokTrend) {
-            window.cyberCanvas.onTiktokTrend((data) => {
-                console.log("🔥 App received TikTok Trend:", data);
+        if (window.cyberCanvas && window.cyberCanvas.onTiktokTrends) {
+            // Un lote por ventana del coalescer: solo cuenta la señal más reciente
+            window.cyberCanvas.onTiktokTrends((items) => {
+                const data = items[items.length - 1];
+                console.log(`🔥 App received ${items.length} TikTok Trend(s):`, data);
                 this.tiktokSignal = data;
 
                 // Update Studio View if active
@@ -72,6 +72,14 @@ class CanvasRenderer {
                 "}"
             ].join('\n');
             document.head.appendChild(style);
+
+            // Subsets WOFF2 (python -m packtools fonts): declarados después, el navegador los
+            // prefiere para los caracteres de su unicode-range y solo baja la fuente completa
+            // si aparece otro carácter. Si no se han generado, el link falla sin más.
+            const subsets = document.createElement('link');
+            subsets.rel = 'stylesheet';
+            subsets.href = './assets/fonts/subset/fonts.css';
+            document.head.appendChild(subsets);
         }
 
         const defaults = [
@@ -0,0 +1,281 @@
+/**
+ * FontMetrics.js — DOM-free text measurement from precomputed font tables
+ *
+ * Reads the advance widths and kerning classes that `python -m packtools metrics`
+ * writes to FontMetricsData.js and answers layout questions without a canvas:
+ * how wide a string is, how many lines it wraps to in a box, and the largest
+ * font size at which it still fits in maxLines.
+ *
+ * Word widths are measured once at 1em and scaled per candidate size, so
+ * fitting is a binary search over cheap greedy wraps.
+ * Only the bundled fonts have tables; face() returns null for anything else
+ * and callers keep their character-count fallback.
+ */
+
+class FontMetrics {
+
+    /**
+     * Raw tables: window.FONT_METRICS in the app, FontMetricsData.js in Node.
+     * @private
+     */
+    static _data() {
+        if (typeof window !== 'undefined' && window.FONT_METRICS) return window.FONT_METRICS;
+        try {
+            return require('./FontMetricsData');
+        } catch (e) {
+            return null;
+        }
+    }
+
+    /**
+     * Prepared faces, built on first use.
+     * @private
+     */
+    static _faces() {
+        if (this._prepared) return this._prepared;
+        const data = this._data();
+        this._prepared = data ? data.faces.map(face => this._prepare(face, data.unitsPerEm)) : [];
+        return this._prepared;
+    }
+
+    /** @private */
+    static _prepare(face, unitsPerEm) {
+        const advances = new Map();
+        const chars = Array.from(face.chars);
+        chars.forEach((ch, i) => {
+            const units = Array.isArray(face.advances) ? face.advances[i] : face.advances;
+            advances.set(ch, units / unitsPerEm);
+        });
+
+        const classIndex = (classes) => {
+            const index = new Map();
+            classes.forEach((members, i) => Array.from(members).forEach(ch => index.set(ch, i)));
+            return index;
+        };
+
+        return {
+            family: face.family,
+            families: face.families.map(name => name.toLowerCase()),
+            weight: face.weight,
+            advances,
+            fallback: face.fallback / unitsPerEm,
+            kernLeft: classIndex(face.kern.left),
+            kernRight: classIndex(face.kern.right),
+            kernColumns: face.kern.right.length,
+            kernValues: face.kern.values.map(value => value / unitsPerEm),
+        };
+    }
+
+    /**
+     * Find the face for a CSS font-family list and weight.
+     * @param {string} family - e.g. "'MPLUS Code Latin', monospace"
+     * @param {number} [weight=400] - Nearest available weight is used
+     * @returns {Object|null} Prepared face, or null if no bundled font matches
+     */
+    static face(family, weight = 400) {
+        if (!family) return null;
+        const faces = this._faces();
+        const names = String(family).split(',').map(name => name.trim().replace(/^["']|["']$/g, '').toLowerCase());
+
+        for (const name of names) {
+            const candidates = faces.filter(face => face.families.includes(name));
+            if (candidates.length === 0) continue;
+            const target = Number(weight) || 400;
+            // Nearest weight; on a tie the heavier face, as browsers do above 500
+            return candidates.reduce((best, face) => {
+                const d = Math.abs(face.weight - target);
+                const bestD = Math.abs(best.weight - target);
+                return d < bestD || (d === bestD && face.weight > best.weight) ? face : best;
+            });
+        }
+        return null;
+    }
+
+    /**
+     * Width of a single word in em, kerning included.
+     * @private
+     */
+    static _wordEm(face, word, letterSpacing) {
+        let width = 0;
+        let prev = null;
+        for (const ch of word) {
+            width += (face.advances.has(ch) ? face.advances.get(ch) : face.fallback) + letterSpacing;
+            if (prev !== null) {
+                const left = face.kernLeft.get(prev);
+                const right = face.kernRight.get(ch);
+                if (left !== undefined && right !== undefined) {
+                    width += face.kernValues[left * face.kernColumns + right];
+                }
+            }
+            prev = ch;
+        }
+        return width;
+    }
+
+    /**
+     * Words of `text` and their widths at 1em.
+     * @private
+     */
+    static _measureWords(face, text, letterSpacing = 0) {
+        const words = String(text).trim().split(/\s+/).filter(Boolean);
+        return {
+            words,
+            widths: words.map(word => this._wordEm(face, word, letterSpacing)),
+            space: (face.advances.has(' ') ? face.advances.get(' ') : face.fallback) + letterSpacing,
+        };
+    }
+
+    /**
+     * Greedy wrap of pre-measured words (same rule as TextFitter._countLines:
+     * a word that overflows an empty line keeps it to itself).
+     * @private
+     * @returns {number[]} Index of the first word of each line
+     */
+    static _breaks(measured, fontSize, maxWidth) {
+        const { widths, space } = measured;
+        const breaks = [];
+        let lineWidth = 0;
+        for (let i = 0; i < widths.length; i++) {
+            const width = widths[i] * fontSize;
+            if (breaks.length === 0 || lineWidth + space * fontSize + width > maxWidth) {
+                breaks.push(i);
+                lineWidth = width;
+            } else {
+                lineWidth += space * fontSize + width;
+            }
+        }
+        return breaks;
+    }
+
+    /**
+     * Resolve the face for fontOptions or throw (public helpers need tables).
+     * @private
+     */
+    static _require(fontOptions) {
+        const face = this.face(fontOptions.fontFamily, fontOptions.fontWeight);
+        if (!face) throw new Error(`[FontMetrics] No metrics for font "${fontOptions.fontFamily}"`);
+        return face;
+    }
+
+    /**
+     * Width of `text` on one line, in px.
+     * @param {string} text
+     * @param {number} fontSize
+     * @param {{ fontFamily: string, fontWeight?: number, letterSpacing?: number }} fontOptions - letterSpacing in em
+     * @returns {number}
+     */
+    static measure(text, fontSize, fontOptions) {
+        const face = this._require(fontOptions);
+        const spacing = fontOptions.letterSpacing || 0;
+        const { widths, space } = this._measureWords(face, text, spacing);
+        if (widths.length === 0) return 0;
+        return (widths.reduce((a, b) => a + b, 0) + space * (widths.length - 1)) * fontSize;
+    }
+
+    /**
+     * Wrap `text` into lines that fit `maxWidth` px.
+     * @param {string} text
+     * @param {number} fontSize
+     * @param {number} maxWidth
+     * @param {Object} fontOptions - See measure()
+     * @returns {string[]}
+     */
+    static wrap(text, fontSize, maxWidth, fontOptions) {
+        const face = this._require(fontOptions);
+        const measured = this._measureWords(face, text, fontOptions.letterSpacing || 0);
+        const breaks = this._breaks(measured, fontSize, maxWidth);
+        return breaks.map((start, i) => measured.words.slice(start, breaks[i + 1]).join(' '));
+    }
+
+    /**
+     * Largest font size in [minFontSize, defaultFontSize] at which `text` wraps
+     * to at most maxLines within maxWidth.
+     *
+     * @param {string} text
+     * @param {Object} options
+     * @param {string} options.fontFamily
+     * @param {number} [options.fontWeight=400]
+     * @param {number} [options.letterSpacing=0] - In em
+     * @param {number} [options.maxWidth=960]
+     * @param {number} [options.maxLines=Infinity]
+     * @param {number} [options.defaultFontSize=42]
+     * @param {number} [options.minFontSize=28]
+     * @returns {{ fontSize: number, lines: number, fits: boolean }}
+     *   fits is false when even minFontSize needs more than maxLines (fontSize is then minFontSize)
+     */
+    static fit(text, options) {
+        const {
+            maxWidth = 960,
+            maxLines = Infinity,
+            defaultFontSize = 42,
+            minFontSize = 28,
+            letterSpacing = 0,
+        } = options;
+        const face = this._require(options);
+        const measured = this._measureWords(face, text, letterSpacing);
+        const linesAt = (size) => this._breaks(measured, size, maxWidth).length;
+
+        const high = Math.max(minFontSize, defaultFontSize);
+        let lines = linesAt(high);
+        if (lines <= maxLines) return { fontSize: high, lines, fits: true };
+
+        // Line count never decreases as the size grows: binary search the boundary
+        lines = linesAt(minFontSize);
+        if (lines > maxLines) return { fontSize: minFontSize, lines, fits: false };
+        let lo = minFontSize;
+        let hi = high;
+        while (hi - lo > 1) {
+            const mid = Math.floor((lo + hi) / 2);
+            const midLines = linesAt(mid);
+            if (midLines <= maxLines) {
+                lo = mid;
+                lines = midLines;
+            } else {
+                hi = mid;
+            }
+        }
+        return { fontSize: lo, lines, fits: true };
+    }
+
+    /**
+     * Cut `text` at a word boundary so it fits maxLines at fontSize, adding "…".
+     * @param {string} text
+     * @param {number} fontSize
+     * @param {number} maxWidth
+     * @param {number} maxLines
+     * @param {Object} fontOptions - See measure()
+     * @returns {{ text: string, wasTruncated: boolean }}
+     */
+    static truncateToLines(text, fontSize, maxWidth, maxLines, fontOptions) {
+        const face = this._require(fontOptions);
+        const spacing = fontOptions.letterSpacing || 0;
+        const measured = this._measureWords(face, text, spacing);
+        if (this._breaks(measured, fontSize, maxWidth).length <= maxLines) {
+            return { text, wasTruncated: false };
+        }
+
+        const words = measured.words;
+        const fits = (count) => {
+            const candidate = words.slice(0, count).join(' ').replace(/[\s,;:.]+$/, '') + '…';
+            const lines = this._breaks(this._measureWords(face, candidate, spacing), fontSize, maxWidth).length;
+            return lines <= maxLines ? candidate : null;
+        };
+        let lo = 0;
+        let hi = words.length;
+        let best = '…';
+        while (lo < hi) {
+            const mid = Math.ceil((lo + hi) / 2);
+            const candidate = fits(mid);
+            if (candidate !== null) {
+                best = candidate;
+                lo = mid;
+            } else {
+                hi = mid - 1;
+            }
+        }
+        return { text: best, wasTruncated: true };
+    }
+}
+
+if (typeof module !== 'undefined') module.exports = FontMetrics;
+else window.FontMetrics = FontMetrics;
@@ -0,0 +1,11 @@
+/**
+ * FontMetricsData.js — generated by `python -m packtools metrics`. Do not edit.
+ *
+ * Advance widths and kerning class tables of the bundled fonts in 1/1000 em,
+ * read by FontMetrics.js.
+ */
+
+const FONT_METRICS = {"version":1,"unitsPerEm":1000,"charset_sha256":"dc8284dd8519fd83b1a16563d64a5dca64a1536b4f7540b3a9a5741e09a598f8","sources":{"BlackOpsOne-Regular.ttf":"282a825b5f294377387e3969f765408157dbea8da0f5d0aae68c6bc704b145b3","MPLUSCodeLatin-VariableFont_wdth,wght.ttf":"4b01ce1b86d60d64272b75dcaabfc63b076d79e49fb9ec874e41758f5ac04f23","CODE Bold.otf":"5316b73721ccec1480817bf9a5739a88b4ff8d570e9fd45f2086bf9fb7c63966","newcomictitle.ttf":"f79a8f615dccc1ff2f9c3b874253407a2f142a89d4ded9338bf981ddb3a78d8c"},"faces":[{"family":"BlackOpsOne","families":["BlackOpsOne","Black Ops One"],"weight":400,"source":"BlackOpsOne-Regular.ttf","ascent":914,"descent":336,"fallback":897,"chars":" !\"#$%&'()*+,-./0123456789:;<=>?@ABCDEFGHIJKLMNOPQRSTUVWXYZ[\\]^_`abcdefghijklmnopqrstuvwxyz{|}~ ¡¢£¤¥¦§¨©ª«¬­®¯°±²³´µ¶·¸¹º»¼½¾¿ÀÁÂÃÄÅÆÇÈÉÊËÌÍÎÏÐÑÒÓÔÕÖ×ØÙÚÛÜÝÞßàáâãäåæçèéêëìíîïðñòóôõö÷øùúûüýþÿ–—‘’‚“”„•…′″‹›€™","advances":[259,368,664,830,851,1168,813,377,478,478,680,703,359,613,359,364,732,570,715,730,680,731,732,634,752,732,359,359,703,703,703,687,774,732,730,703,726,691,649,730,740,440,668,669,622,902,736,714,713,711,726,721,613,729,669,941,655,633,621,478,364,478,630,650,536,650,659,646,667,650,443,654,662,319,319,641,368,993,662,675,659,659,615,642,455,659,582,901,557,596,572,478,342,478,728,259,368,786,851,713,849,341,768,690,774,559,841,792,0,774,604,573,703,529,525,536,659,786,354,492,440,561,840,1171,1245,1314,687,732,732,732,732,732,732,1125,703,691,691,691,691,440,440,440,440,730,736,714,714,714,714,714,650,710,729,729,729,729,633,715,705,650,650,650,650,650,650,991,646,650,650,650,650,319,319,319,319,661,662,675,675,675,675,675,703,663,659,659,659,659,596,659,596,792,972,397,397,397,694,692,686,448,1078,377,625,532,532,901,736],"kern":{"left":["!","\"","#","$","%","&","'","([",")","*","+÷",",.","-–—","/","09","1","2","38","4","5","6","7",":;","<","=",">","?","@","AÀÃÅ","B","CÇ","D","E","F","G","H","I","J","K","L","M","NÑ","O","P","Q","R","S","T","UÙÚÛÜ","V","W","X","Y","Z","\\","^","_","a","bóøþ","cç","d","e","f","g","h","i","j","k","l","m","n","o","p","q","r","s","t","uùú","v","w","x","y","z","{","}","~","¡","¢","£","¥","§","©®","ª","«‹","¬","°™","±","²","³","µ","¹","º","»","¿","Á","Â","Ä","Æ","ÈÉ","ÊË","ÌÍ","Î","Ï","Ð","ÒÓÔÕÖ","×€","Ø","Ý","Þ","ß","à","á","â","ãå","ä","æ","è","é","ê","ë","ì","í","î","ï","ð","ñ","ò","ô","õ","ö","û","ü","ý","ÿ","‘","’”","‚„","“","…","′","″","›"],"right":["!","\"","#","$","%","&","'","(",")","*","+",",","-",".","/","0","1","2","3","4","5","6","7","8","9",":",";","<","=",">","?","@©","A","BLP","C","D","E","F","G","HK","IÍ","J","M","N","O","Q","R","S","T","U","V","W","X","Y","Z","\\","]","^","_","a","b","c","d","e","f","g","h","i","j","k","l","m","n","o","p","q","r","s","t","u","v","w","x","y","z","{","}","~","¡","¢","£","¥","§","ª","«","¬","®","°","±","²","³","µ","¹","º","»","¿","À","Á","Â","Ã","Ä","Å","Æ","Ç","ÈÊ","É","Ë","Ì","Î","Ï","Ð","Ñ","ÒÕ","ÓÔ","Ö","×","Ø","Ù","Ú","ÛÜ","Ý","Þ","ß","à","á","â","ã","ä","å","æ","ç","è","é","ê","ë","ì","í","î","ï","ð","ñ","ò","ó","ô","õ","ö","÷","ø","ù","ú","û","ü","ý","þ","ÿ","–","—","‘","’","‚","“","”","„","…","′","″","‹","›","€","™"],"values":[-38,-68,0,0,-66,0,-68,0,-58,-79,-85,-55,-85,-55,0,-23,-43,-27,-31,-28,-19,-23,-8,-29,-31,-42,-42,-85,0,0,-40,0,-19,-23,-20,-23,-23,-23,-26,-23,-18,-31,-24,-24,-16,-16,-23,-25,-13,-19,-2,0,-3,-9,-7,0,-58,0,0,-42,-21,-30,-27,-30,-12,-30,-21,-21,-12,-21,-21,-22,-22,-30,-22,-30,-22,-34,-13,-20,-10,-10,-5,-10,-19,-40,-61,0,-55,-68,0,0,-61,0,-92,0,0,-40,0,-30,-35,0,-55,0,-90,-79,-19,-19,-19,-19,-19,-19,0,-20,-23,-23,-23,-18,-18,-18,0,-24,-16,-16,-16,0,-16,-19,-19,-19,-9,0,-21,-42,-42,-42,-42,-42,-42,-42,-30,0,0,0,0,-18,-18,0,-21,0,-22,0,0,0,0,0,-85,-30,-20,-20,-20,-20,-10,-21,-10,-85,-85,-66,-63,-63,-66,-63,-63,0,0,0,-92,-89,0,0,-68,-82,-117,-106,-81,-112,-82,-100,-84,-98,-112,-180,-112,-180,-123,-61,-86,-72,-69,-109,-47,-61,-32,-67,-66,-84,-84,-111,-101,-99,-64,-66,-125,-52,-56,-52,-52,-52,-64,-52,-59,-92,-54,-54,-50,-50,-52,-62,-36,-46,-17,-15,-33,-21,-48,-27,-84,-153,-325,-102,-51,-77,-74,-77,-41,-77,-51,-55,-55,-51,-51,-62,-62,-77,-62,-77,-62,-74,-39,-57,-32,-31,-34,-33,-68,-79,-87,-117,-78,-112,-123,-106,-87,-83,-125,0,-66,-74,-103,-68,-63,0,-81,-73,-114,-141,-125,-125,-125,-125,-124,-125,-149,-56,-52,-52,-52,-59,-59,-56,-45,-54,-50,-50,-50,-112,-50,-46,-46,-46,-21,-45,-54,-102,-102,-96,-100,-95,-102,-102,-77,-77,-77,-74,-74,-39,-48,1,0,-88,-62,-77,-77,-74,-77,-74,-112,-77,-57,-57,-57,-57,-33,-51,-33,-112,-112,-85,-80,-80,-85,-80,-80,-272,-104,-104,-125,-114,-105,-64,-81,-103,0,0,-89,0,-103,-104,-109,-96,0,-111,0,-111,-90,-64,-92,-69,-66,-60,-66,-64,-46,-64,-67,-83,-83,0,0,0,-63,0,-93,-65,-59,-65,-65,-65,-67,-65,-69,-64,-67,-67,-53,-53,-65,-63,-59,-62,-62,-55,-84,-69,-66,0,-109,0,0,-76,-62,-73,-71,-73,-38,-73,-62,-62,-62,-62,-62,-62,-62,-73,-62,-73,-62,-74,-38,-59,-28,-27,-32,-29,-64,-63,0,0,0,-103,0,0,0,0,-120,0,0,-63,0,0,0,0,0,0,-109,-96,-93,-93,-93,-93,-93,-93,0,-59,-65,-65,-65,-69,-69,-69,0,-67,-53,-53,-53,0,-53,-62,-62,-62,-69,0,-62,-76,-76,-76,-76,-76,-76,-76,-73,-73,-73,-73,-73,-62,-62,0,-62,0,-62,-73,-73,-73,-73,-73,0,-73,-59,-59,-59,-59,-29,-62,-29,0,0,-89,-96,-96,-89,-96,-96,0,0,0,-120,-109,0,0,-82,-113,0,0,-104,0,-113,-104,-108,-109,-116,-103,-116,-103,-78,-61,-97,-63,-68,-56,-65,-61,-62,-63,-76,-91,-91,-116,-104,0,-74,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,-108,0,-156,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,-74,0,0,-93,-113,0,0,0,0,-118,0,0,-74,0,-75,-78,0,-93,0,-114,-109,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,-116,0,0,0,0,0,0,0,0,-116,-116,-104,-108,-108,-104,-108,-108,0,0,0,-118,-114,0,0,-73,-124,0,0,-131,0,-124,0,-85,-131,-95,-77,-95,-77,-47,0,0,0,0,0,0,0,0,0,0,-77,-77,-95,0,0,-145,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,-85,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,-145,0,0,-71,-124,0,0,0,0,-97,0,0,-145,0,-55,-62,0,-71,0,-115,-131,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,-95,0,0,0,0,0,0,0,0,-95,-95,-131,-142,-142,-131,-142,-142,0,-164,-164,-97,-114,0,0,0,-100,0,0,-103,0,-100,0,-63,0,-69,0,-69,0,0,-35,-64,-42,-55,-27,-38,-35,-83,-42,-67,0,0,-69,0,0,0,0,-17,-32,-32,-32,-32,-32,-37,-32,-43,-21,-32,-32,-28,-28,-32,-59,-91,-33,-68,-57,-8,-83,-29,0,-63,0,0,-55,-28,-31,-31,-31,-44,-31,-28,-29,-14,-28,-32,-29,-29,-31,-29,-31,-29,-41,-41,-31,-56,-54,-14,-61,-44,0,0,0,0,-100,0,0,0,0,-77,0,0,0,0,0,0,0,0,0,-90,0,-17,-17,-17,-17,-17,-17,0,-32,-32,-32,-32,-43,-43,-43,-12,-32,-28,-28,-28,0,-28,-33,-33,-33,-83,0,-28,-55,-55,-55,-55,-55,-55,-55,-31,-31,-31,-31,-31,-29,-29,0,-29,0,-29,-31,-31,-31,-31,-31,-69,-31,-31,-31,-31,-31,-61,-28,-61,-69,-69,-103,-115,-115,-103,-115,-115,0,0,0,-77,0,0,0,-68,-81,-117,-106,-81,-112,-81,-99,-84,-97,-112,-180,-112,-180,-123,-61,-86,-72,-69,-109,-46,-61,-31,-67,-65,-84,-84,-112,-101,-99,-63,-65,-125,-51,-55,-51,-51,-51,-64,-51,-58,-92,-53,-53,-50,-50,-51,-62,-35,-46,-16,-14,-32,-20,-48,-27,-83,-153,-188,-102,-51,-76,-74,-76,-41,-76,-51,-55,-55,-51,-51,-61,-61,-76,-61,-76,-61,-74,-38,-56,-32,-31,-34,-32,-67,-78,-87,-117,-77,-111,-123,-105,-87,0,-125,0,-65,-73,0,-67,-63,0,-80,0,-114,-140,-125,-125,-125,-125,-124,-125,-149,-55,-51,-51,-51,-58,-58,-56,-45,-53,-50,-50,-50,-112,-50,-46,-46,-46,-20,-45,-54,-102,-102,-95,-100,-94,-102,-102,-76,-76,-76,-74,-74,-39,-47,2,0,-87,-61,-76,-76,-74,-76,-74,-112,-76,-56,-56,-56,-56,-32,-51,-32,-112,-112,-84,-80,-80,-84,-80,-80,-188,-97,-97,-125,-114,-105,-64,-58,-83,-109,-108,-84,-82,-83,-98,-38,-100,-125,-66,-129,-66,3,-61,-63,-46,-66,-68,-46,-61,-44,-61,-65,-66,-66,-125,-100,-98,-86,-63,-19,-38,-56,-38,-38,-38,-62,-38,-31,-64,-42,-42,-55,-55,-38,-60,-28,-45,-10,-10,-7,-10,-23,-4,-38,-88,-10,-61,-29,-69,-62,-69,-52,-69,-29,-29,3,-29,-41,-50,-50,-69,-40,-69,-50,-66,-57,-64,-69,-69,-12,-69,-43,-86,-40,-118,-57,-125,-94,-94,-68,0,-131,-128,-63,-83,-88,-63,-58,-34,-64,0,-96,-56,-19,-19,-19,-19,-19,-19,-19,-56,-38,-38,-38,-30,-27,-20,-37,-42,-55,-55,-55,-114,-53,-45,-45,-45,-10,-32,-44,-59,-61,-57,-59,-56,-61,-59,-69,-69,-69,-66,-62,-6,-30,12,33,-71,-46,-69,-69,-67,-69,-63,-125,-65,-62,-64,-61,-58,-69,-29,-57,-129,-129,-98,-73,-73,-98,-73,-73,-66,-103,-103,-131,-96,-116,-47,-65,-99,0,0,-91,0,-99,-97,-98,-103,-108,-98,-108,-98,-55,-53,-85,-58,-64,-59,-53,-53,-47,-56,-61,-75,-75,-108,-90,-89,-76,0,-67,-55,-50,-55,-55,-55,-54,-55,-59,-52,-55,-55,-47,-47,-55,-57,-64,-51,-57,-42,-51,-61,-49,0,-97,-108,0,-66,-51,-57,-55,-57,-45,-57,-51,-51,-48,-51,-51,-51,-51,-57,-51,-57,-51,-64,-47,-50,-46,-46,-45,-46,-62,-73,-99,0,-89,-99,0,0,-99,0,-110,0,0,-76,0,-60,-71,0,-89,0,-114,-103,-67,-67,-67,-67,-67,-67,-70,-50,-55,-55,-55,-59,-59,-59,-41,-55,-47,-47,-47,-107,-47,-51,-51,-51,-61,0,-51,-63,-63,-63,-63,-63,-63,-65,-57,-57,-57,-57,-57,-48,-48,-16,-51,-62,-51,-57,-57,-57,-57,-57,-108,-57,-50,-50,-50,-50,-46,-51,-46,-108,-108,-91,-97,-97,-91,-97,-97,0,-112,-112,-110,-114,0,0,-79,-97,0,0,-90,0,-97,-104,-100,-90,-133,-180,-133,-180,-133,-66,-86,-67,-65,-110,-63,-66,-41,-66,-67,-84,-84,-133,0,0,-56,0,-137,-66,-63,-66,-66,-66,-67,-66,-63,-97,-66,-66,-60,-60,-66,-63,-44,-63,-37,-33,-68,-51,-57,0,-100,0,0,-100,-63,-99,-94,-99,-39,-99,-63,-65,-65,-63,-63,-66,-66,-99,-66,-99,-66,-94,-39,-65,-28,-28,-29,-28,-66,-56,-102,0,0,-97,0,0,-102,0,-136,0,0,-56,0,0,0,0,0,0,-104,-90,-137,-137,-137,-137,-137,-137,0,-63,-66,-66,-66,-63,-63,-63,0,-66,-60,-60,-60,0,-60,-63,-63,-63,-51,0,-63,-100,-100,-100,-100,-100,-100,-100,-99,0,0,0,0,-63,-63,0,-65,0,-66,0,0,0,0,0,-133,-99,-65,-65,-65,-65,-28,-63,-28,-133,-133,-90,-90,-90,-90,-90,-90,0,0,0,-136,-103,0,0,-85,-113,-108,-121,-99,0,-113,-108,-125,-133,-93,-148,-93,-148,-101,-61,-143,-79,-78,-44,-67,-61,-95,-71,-83,-95,-95,-95,-105,-106,-134,-9,-101,-66,-55,-66,-66,-66,-65,-66,-106,-48,-66,-66,-49,-49,-66,-80,-156,-60,-104,-91,-126,-126,-105,0,-125,0,0,-74,-62,-58,-58,-58,-67,-58,-62,-63,-63,-62,-62,-62,-62,-58,-62,-58,-62,-64,-64,-58,-74,-72,-104,-81,-92,-58,-141,0,0,-106,-108,-157,-141,0,-103,0,-58,-58,0,0,0,0,0,0,-151,-51,-104,-104,-104,-104,-104,-104,0,-55,-66,-66,-66,-106,-106,-106,0,-66,-49,-49,-49,0,-49,-60,-60,-60,-122,0,-62,-77,-77,-77,-77,-77,-77,-77,-58,-58,-58,-58,-58,-63,-63,-63,-63,0,-62,-58,-58,-58,-58,-58,-93,-58,-58,-58,-58,-58,-78,-62,-78,-93,-93,-99,-112,-112,-99,-112,-112,0,0,0,-103,-151,-99,-130,-55,-180,0,0,-180,0,-180,-99,-66,-180,-148,-53,-148,-53,-10,-60,-55,-33,-58,-39,-60,-60,-137,-60,-60,-53,-53,-148,0,0,-152,0,-15,-37,-55,-37,-37,-37,-63,-37,-31,-35,-37,-37,-49,-49,-37,-55,-143,-59,-134,-116,-11,-150,-15,0,-66,0,0,-41,-36,-54,-52,-54,-51,-54,-36,-36,-20,-36,-57,-36,-36,-54,-36,-54,-36,-49,-66,-54,-114,-111,-13,-120,-36,-152,-68,0,-94,-180,0,0,-68,-131,-121,0,0,-152,0,-81,-123,0,-94,-133,-98,-180,-15,-15,-15,-15,-15,-15,0,-55,-37,-37,-37,-31,-31,-31,0,-37,-49,-49,-49,0,-49,-59,-59,-59,-150,0,-36,-41,-41,-41,-41,-41,-41,-41,-54,0,0,0,0,-36,-36,0,-36,0,-36,0,0,0,0,0,-148,-54,-54,-54,-54,-54,-120,-36,-120,-148,-148,-180,-180,-180,-180,-180,-180,0,-180,-180,-121,-97,0,0,-85,-111,-108,-121,-99,0,-111,-109,-130,-133,-93,-148,-93,-148,-101,-61,-147,-81,-80,-52,-67,-61,-95,-74,-81,-95,-95,-93,0,0,-134,0,-104,-66,-55,-66,-66,-66,-65,-66,-106,-51,-66,-66,-49,-49,-66,-77,-159,-60,-102,-89,-131,-122,-111,0,-129,0,0,-77,-62,-58,-58,-58,-62,-58,-62,-63,-63,-62,-62,-62,-62,-58,-62,-58,-62,-64,-62,-58,-74,-72,-99,-78,-85,-70,-141,0,-86,-106,-108,-157,-141,0,-103,0,0,-134,0,-59,-60,0,-86,0,-151,-89,-104,-104,-104,-104,-104,-104,-117,-55,-66,-66,-66,-106,-106,-106,-30,-66,-49,-49,-49,0,-49,-60,-60,-60,-122,-59,-62,-77,-77,-77,-77,-77,-77,-76,-58,-58,-58,-58,-58,-63,-63,-63,-63,-61,-62,-58,-58,-58,-58,-58,-93,-58,-58,-58,-58,-58,-78,-62,-78,-93,-93,-99,-112,-150,-99,-112,-150,0,0,0,-103,-151,-99,0,-10,-26,-91,-79,-48,0,-26,-62,-4,-54,-111,-149,-111,-149,-98,-26,-26,-33,-31,-84,0,-26,6,-28,-33,-54,-54,-109,-82,-73,-23,6,-100,-1,-21,-1,-1,-1,-28,-1,0,-37,-3,-3,-16,-16,-1,-28,20,0,50,51,25,40,7,67,-4,-135,-134,-78,4,-69,-65,-69,-2,-68,4,2,2,4,4,-33,-33,-69,-33,-68,-33,-66,-7,-30,-1,-1,-7,-1,-32,-23,-6,0,0,-90,-108,-45,-26,0,-122,0,6,-23,0,0,0,-30,0,0,-83,-54,-92,-100,-92,-88,-74,-95,-114,-21,-1,-1,-1,4,10,31,0,-3,-16,-16,-15,0,-16,0,0,0,40,0,-6,-60,-69,-53,-57,-36,-69,-78,-68,-58,-60,-51,-34,53,4,75,106,-72,-30,-59,-60,-52,-57,-39,-111,-68,-27,-30,-27,-22,-1,4,0,-111,-111,-48,-19,-154,-48,-19,-154,-149,0,0,-122,-83,-81,0,-23,-60,-63,-61,-43,-35,-60,-53,-61,-66,-61,-60,-61,-60,-24,-2,-44,-7,-6,0,-3,-2,-1,-3,-7,-29,-29,-61,-42,-42,-25,0,-21,-6,0,-6,-6,-6,-5,-6,-16,4,-6,-6,5,5,-6,-1,-19,-2,-4,0,-21,-22,-3,-26,-61,-76,-142,-18,-2,-3,-2,-3,0,-3,-2,-3,-2,-2,-2,-2,-2,-3,-2,-3,-2,-10,3,0,0,0,-2,0,-10,-33,-64,-47,-42,-60,-63,0,-64,-39,-71,0,0,-25,-52,-8,-21,0,-42,-26,-77,-66,-21,-21,-21,-21,-21,-21,0,0,-6,-6,-6,-16,-16,-16,0,-6,5,5,5,-67,5,-2,-2,-2,-22,0,-2,-18,-18,-18,-18,-18,-18,-18,-3,-3,-3,-3,-3,-2,-2,3,-3,0,-2,-3,-3,-3,-3,-3,-61,-3,0,0,0,0,0,-2,0,-61,-61,-38,-64,-64,-38,-64,-64,-60,-70,-70,-71,-77,-56,-67,-59,-134,-92,-99,-130,-72,-134,-95,-63,-141,-146,-54,-146,-54,-8,-57,-46,-31,-56,-42,-54,-57,-87,-58,-58,-54,-54,-145,-87,-86,-112,-53,-11,-34,-52,-34,-34,-34,-59,-34,-26,-35,-34,-34,-47,-47,-34,-52,-95,-53,-75,-62,-5,-90,-11,-87,-62,-84,-142,-42,-33,-56,-50,-56,-52,-56,-33,-34,-20,-33,-55,-33,-33,-56,-33,-56,-33,-51,-63,-53,-78,-76,-14,-84,-27,-89,-66,-124,-104,-121,-92,0,-66,-109,-124,0,-53,-122,-76,-88,-105,-29,-104,-108,-96,-141,-11,-11,-11,-11,-11,-11,0,-52,-34,-34,-34,-26,-26,-26,0,-34,-47,-47,-47,-93,-47,-53,-53,-53,-90,0,-33,-42,-42,-42,-42,-42,-42,-42,-56,-56,-56,-56,-56,-34,-34,-28,-34,0,-33,-56,-56,-56,-56,-56,-146,-56,-53,-53,-53,-53,-80,-33,-84,-146,-146,-132,-132,-132,-132,-132,-132,-54,-150,-150,-124,-95,-121,-121,-25,-64,-74,-68,-43,-56,-64,-60,-47,-67,-78,-41,-78,-41,0,-8,-31,-9,-16,-28,-7,-8,-1,-9,-9,-22,-22,-75,-56,-50,-25,-10,-3,-7,-3,-7,-7,-7,-12,-7,-6,-20,-7,-7,0,0,-7,-3,-19,-6,-8,0,0,-22,0,-34,-46,-70,-142,-28,-2,-26,-24,-26,0,-26,-2,-5,0,-2,-11,-6,-6,-26,-6,-26,-6,-24,0,-8,0,0,6,0,-6,-40,-50,-95,-66,-77,-74,0,-50,-46,-91,0,-10,-25,-45,-33,-32,-2,-66,-26,-76,-67,-3,-3,-3,-3,-3,-3,0,-3,-7,-7,-7,-6,-6,-6,0,-7,0,0,0,-74,0,-6,-6,-6,-22,0,-2,-28,-28,-28,-28,-28,-28,-28,-26,-26,-26,-26,-26,-3,-3,3,-5,0,-6,-26,-26,-26,-26,-26,-78,-26,-8,-8,-8,-8,0,-2,0,-78,-78,-38,-64,-64,-38,-64,-64,-42,-73,-73,-91,-76,-73,-67,-28,-67,-63,-63,-46,-36,-67,-57,-62,-66,-74,-60,-74,-60,-26,-3,-47,-7,-6,0,-4,-3,-1,-3,-8,-30,-30,-77,-43,-42,-25,0,-26,-6,0,-6,-6,-6,-7,-6,-16,3,-6,-6,1,1,-6,-2,-19,-2,-10,0,-21,-22,-3,-28,-61,-79,-142,-18,-2,-8,-8,-8,0,-8,-2,-3,-3,-2,-2,-3,-3,-8,-3,-8,-3,-24,1,0,0,0,-2,0,-10,-46,-64,-48,-46,-63,-63,0,-64,-54,-74,0,0,-34,-65,-21,-27,0,-46,-36,-78,-66,-26,-26,-26,-26,-26,-26,0,0,-6,-6,-6,-16,-16,-16,0,-6,1,1,1,-70,1,-2,-2,-2,-22,0,-2,-18,-18,-18,-18,-18,-18,-18,-8,-8,-8,-8,-8,-3,-3,3,-3,0,-3,-8,-8,-8,-8,-8,-74,-8,0,0,0,0,0,-2,0,-74,-74,-46,-64,-64,-46,-64,-64,-60,-76,-76,-74,-78,-61,-67,-29,-79,-48,-63,-77,-22,-79,-52,-54,-93,-67,-31,-67,-31,0,-3,-25,0,-3,16,-5,-3,-25,-3,-9,-31,-31,-71,-35,-32,-63,-5,0,-2,-1,-2,-2,-2,-4,-2,-7,13,-2,-2,0,0,-2,-5,-31,-3,-13,-7,0,-23,0,-31,-53,-59,-142,0,0,-5,0,-5,-10,-5,0,0,0,0,-7,0,0,-5,0,-5,0,-15,-8,-5,-26,-25,-7,-28,-13,-46,-54,-50,-34,-67,-48,0,-54,-64,-65,0,-5,-70,-44,-18,-46,0,-34,-59,-81,-93,0,0,0,0,0,0,0,-1,-2,-2,-2,-7,-7,-7,0,-2,0,0,0,-58,0,-3,-3,-3,-23,0,0,0,0,0,0,0,0,0,-5,-5,-5,-5,-5,0,0,12,0,0,0,-5,-5,-5,-5,-5,-67,-5,-5,-5,-5,-5,-28,0,-28,-67,-67,-78,-79,-79,-78,-79,-79,-32,-92,-92,-65,-80,-63,-70,-49,-92,-75,-88,-89,-51,-92,-72,-70,-97,-83,-68,-83,-68,-44,-19,-61,-22,-30,-9,-23,-19,-41,-23,-37,-67,-67,-85,-75,-74,-70,-20,-39,-19,-16,-19,-19,-19,-21,-19,-30,-4,-19,-19,-11,-11,-19,-29,-30,-16,-18,-12,-23,-21,-18,-30,-69,-86,-142,-31,-21,-20,-18,-20,-37,-20,-21,-21,-21,-21,-21,-22,-22,-20,-22,-20,-22,-45,-29,-20,-42,-40,-32,-47,-49,-54,-72,-61,-59,-86,-75,0,-72,-76,-86,0,-20,-83,-85,-35,-43,-18,-59,-75,-104,-97,-39,-39,-39,-39,-39,-39,0,-16,-19,-19,-19,-30,-30,-30,0,-19,-11,-11,-11,-85,-11,-16,-16,-16,-21,0,-21,-31,-31,-31,-31,-31,-31,-31,-20,-20,-20,-20,-20,-20,-20,2,-21,0,-22,-20,-20,-20,-20,-20,-83,-20,-20,-20,-20,-20,-47,-21,-47,-83,-83,-100,-83,-83,-100,-83,-83,-68,-104,-104,-86,-104,-76,-67,-35,-73,-67,-75,-62,-38,-73,-61,-65,-67,-70,-60,-70,-60,-31,-6,-47,-9,-13,0,-9,-6,-13,-7,-21,-49,-49,-72,-63,-57,-27,-8,-26,-8,-1,-8,-8,-8,-10,-8,-16,4,-8,-8,0,0,-8,-11,-19,-4,-13,-5,-21,-24,-3,-35,-65,-78,-142,-19,-9,-9,-8,-9,-8,-9,-9,-9,-9,-9,-9,-9,-9,-9,-9,-9,-9,-33,-3,-7,-4,-3,-4,-4,-26,-42,-68,-48,-43,-74,-67,0,-68,-67,-73,0,-8,-51,-71,-19,-26,-4,-43,-53,-78,-67,-26,-26,-26,-26,-26,-26,0,-1,-8,-8,-8,-16,-16,-16,0,-8,0,0,0,-73,0,-4,-4,-4,-24,0,-9,-19,-19,-19,-19,-19,-19,-19,-9,-9,-9,-9,-9,-9,-9,3,-9,0,-9,-9,-9,-9,-9,-9,-70,-9,-7,-7,-7,-7,-4,-9,-4,-70,-70,-62,-65,-65,-62,-65,-65,-60,-87,-87,-73,-78,-68,-70,-15,-36,-83,-68,-38,-70,-36,-63,-29,-47,-101,-136,-101,-136,-77,-5,-18,-13,-12,-75,0,-5,11,-9,-13,-37,-37,-99,-62,-57,-9,-22,-68,0,-2,0,0,0,-10,0,0,-38,0,0,0,0,0,-6,16,0,39,39,12,26,5,19,-28,-120,-154,-65,0,-58,-53,-58,0,-58,0,-3,-3,0,0,-20,-20,-58,-20,-58,-20,-53,0,-15,4,4,4,4,-18,-50,-31,-104,-22,-82,-83,0,-31,-43,-111,0,-22,-28,-79,-14,-9,-15,-22,-27,-67,-47,-68,-68,-68,-68,-68,-68,0,-2,0,0,0,0,0,0,0,0,0,0,0,-77,0,0,0,0,26,0,0,-65,-65,-65,-65,-65,-60,-65,-58,-46,-46,-42,-46,0,0,69,-3,0,-20,-46,-46,-46,-46,-46,-101,-58,-15,-15,-15,-15,4,0,4,-101,-101,-42,-22,-22,-42,-22,-22,-141,-61,-61,-111,-67,-77,-10,0,-83,0,0,-60,0,-83,-76,-63,-84,-95,0,-95,0,0,-29,-54,-23,-36,-39,-29,-29,-23,-30,-29,0,0,-95,0,0,-65,0,-15,-24,-24,-24,-24,-24,-34,-24,-25,-34,-24,-24,-21,-21,-24,-24,-44,-28,-40,-33,-11,-56,-13,0,-63,0,0,-41,-20,-48,-44,-48,-14,-48,-20,-20,-12,-20,-31,-20,-20,-48,-20,-48,-20,-42,-14,-29,-9,-9,-3,-9,-17,-65,-68,0,-88,-83,0,0,-68,0,-118,0,0,-65,0,-56,-53,0,-88,0,-88,-84,-15,-15,-15,-15,-15,-15,0,-24,-24,-24,-24,-25,-25,-25,0,-24,-21,-21,-21,0,-21,-28,-28,-28,-56,0,-20,-41,-41,-41,-41,-41,-41,-41,-48,0,0,0,0,-20,-20,0,-20,0,-20,0,0,0,0,0,-95,-48,-29,-29,-29,-29,-9,-20,-9,-95,-95,-60,-81,-81,-60,-81,-81,0,-85,-85,-118,-88,0,0,0,-99,0,0,-62,0,-99,-90,-99,0,-108,0,-108,0,0,-42,-86,-43,-42,-34,-42,-42,-37,-42,-45,0,0,-106,0,-71,0,0,-64,-44,-37,-45,-45,-44,-45,-45,-64,-38,-45,-45,-33,-32,-44,-40,-57,-41,-60,-53,-65,-75,-48,0,-69,0,0,-51,-41,-57,-54,-58,-30,-58,-40,-40,-40,-40,-41,-40,-40,-58,-40,-58,-41,-63,-29,-39,-26,-25,-29,-27,-46,0,0,0,0,-99,0,0,0,0,0,0,0,0,0,0,0,0,0,0,-90,0,-61,-61,-61,-61,-61,-61,0,-38,-45,-45,-45,-64,-64,-64,0,-44,-32,-32,-32,0,-32,-41,-41,-41,-85,0,-40,-54,-54,-54,-54,-54,-54,-54,-58,0,0,0,0,-40,-40,0,-40,0,-40,0,0,0,0,0,-108,-58,-39,-39,-39,-39,-32,-40,-32,-108,-108,-62,-83,-83,-62,-95,-83,0,0,0,0,0,0,0,-62,-102,-114,-95,-85,0,-80,-93,-100,-39,-105,-87,-101,-87,-88,-42,-87,-45,-43,-34,-43,-42,-42,-43,-46,-83,-83,-105,-72,0,-61,-9,-43,-46,-47,-46,-46,-46,-56,-46,-60,-52,-46,-46,-33,-33,-46,-60,-63,-42,-83,-61,-35,-85,-38,0,-88,0,0,-61,-41,-61,-54,-61,-40,-56,-41,-41,-41,-41,-51,-41,-41,-56,-41,-56,-41,-53,-33,-39,-45,-30,-36,-32,-48,-61,0,0,-66,-101,-114,-144,0,0,0,0,-9,-61,-91,-61,-53,0,-66,0,0,-39,-64,-64,-64,-64,-64,-64,0,-38,-46,-46,-46,-66,-66,-66,0,-46,-33,-33,-33,0,-33,-42,-42,-42,-85,0,-41,-54,-54,-54,-54,-54,-54,-54,-56,0,0,0,0,-41,-41,0,-41,0,-41,0,0,0,0,0,-105,-56,-39,-39,-39,-39,-32,-41,-32,-105,-105,-85,-98,-98,-85,-98,-98,0,0,0,0,-21,-101,0,-85,-113,-108,-121,-99,0,-113,-108,-125,-133,-93,-148,-93,-148,-101,-61,-145,-79,-78,-44,-67,-61,-96,-71,-83,-95,-95,-95,-105,-106,-134,-9,-101,-66,-55,-66,-66,-66,-65,-66,-106,-48,-66,-66,-49,-49,-66,-80,-156,-60,-104,-91,-126,-126,-105,0,-125,0,0,-74,-62,-58,-58,-58,-67,-58,-62,-63,-63,-62,-62,-62,-62,-58,-62,-58,-62,-64,-64,-58,-74,-72,-104,-81,-92,-58,-141,0,0,-106,-108,-157,-141,0,-103,0,-58,-58,0,0,0,0,0,0,-151,-51,-104,-104,-104,-104,-104,-104,0,-55,-66,-66,-66,-106,-106,-106,0,-66,-49,-49,-49,0,-49,-60,-60,-60,-122,0,-62,-77,-77,-77,-77,-77,-77,-77,-58,-58,-58,-58,-58,-63,-63,-63,-63,0,-62,-58,-58,-58,-58,-58,-93,-58,-58,-58,-58,-58,-78,-62,-78,-93,-93,-99,-112,-112,-99,-112,-112,0,0,0,-103,-151,-99,-130,-32,-61,0,0,-40,0,-61,-71,-78,-57,-84,-180,-84,-180,-89,0,0,0,0,0,0,0,0,0,0,-32,-32,-84,0,0,-16,0,-93,-16,-9,-16,-16,-16,-15,-16,-29,-75,-16,-16,-6,-6,-16,-9,-15,-11,-7,0,-49,-20,-22,0,-78,0,0,-55,-14,-30,-29,-30,0,-30,-14,-15,-15,-14,-14,-15,-15,-30,-15,-30,-15,-29,0,-11,5,6,4,4,-14,-16,-78,0,-41,-61,0,0,-78,0,-116,0,0,-16,0,-27,-23,0,-65,0,-76,-130,-93,-93,-93,-93,-93,-93,0,-9,-16,-16,-16,-29,-29,-29,0,-16,-6,-6,-6,0,-6,-11,-11,-11,-20,0,-14,-55,-55,-55,-55,-55,-55,-55,-30,0,0,0,0,-14,-14,0,-15,0,-15,0,0,0,0,0,-84,-30,-11,-11,-11,-11,4,-14,4,-84,-84,-40,-54,-54,-40,-54,-54,0,0,0,-116,-75,0,0,-24,-76,0,0,-48,0,-65,-63,-76,-64,-58,-54,-58,-54,-21,-1,-64,-24,-5,-7,-8,-1,-9,-5,-16,-32,-32,-58,0,0,-28,0,-56,-5,0,-5,-5,-5,-5,-5,-40,-9,-5,-5,1,1,-5,-10,-42,0,-21,-11,-52,-48,-36,0,-76,0,-124,-26,0,-3,-2,-3,-1,-3,0,-1,0,0,0,-33,-12,-3,0,-3,-1,-13,0,0,0,0,-7,0,-32,-21,0,0,-50,-65,0,0,0,0,-67,0,0,-21,0,-26,-28,0,-50,0,-75,-64,-24,-24,-24,-24,-24,-24,0,4,-3,-3,-3,-25,-25,-25,0,-5,9,9,9,0,9,0,0,0,-48,0,0,-26,-26,-26,-26,-26,-26,-26,-3,0,0,0,0,-1,-1,0,-1,0,-1,0,0,0,0,0,-58,-3,0,0,0,0,0,0,0,-58,-58,-48,-66,-65,-48,-66,-65,0,0,0,-67,-75,0,-83,-20,-130,-74,-87,-130,-52,-130,-69,-19,-141,-107,-15,-107,-15,35,-27,-12,-2,-27,-8,-28,-26,-84,-29,-31,-15,-15,-110,-66,-62,-108,-27,23,-3,-22,-3,-3,-3,-30,-3,0,-7,-3,-3,-17,-17,-3,-23,-90,-25,-64,-59,31,-88,20,-104,-19,-45,-142,-14,-1,-34,-29,-34,-12,-34,-1,-2,0,-1,-28,-1,-1,-34,-1,-34,-1,-25,-38,-29,-61,-59,25,-63,0,-111,-21,-87,-82,-130,-74,0,-21,-86,-98,-135,-27,-111,-43,-61,-81,0,-82,-83,-51,-141,23,23,23,23,23,23,17,-22,-3,-3,-3,0,0,0,0,-3,-17,-17,-17,-85,-9,-25,-25,-25,-83,-1,-1,-14,-14,-14,-14,-14,-14,-14,-34,-34,-34,-34,-34,-2,-2,-2,-2,-35,-1,-34,-34,-34,-34,-34,-107,-34,-27,-27,-27,-27,-63,-1,-63,-107,-107,-130,-140,-140,-130,-140,-140,-15,-138,-138,-98,-51,0,-129,-19,-60,-53,-53,-36,-29,-60,-50,-55,-60,-64,-50,-64,-50,-18,0,-37,0,0,5,0,0,0,0,0,-21,-21,-65,-35,-32,-16,1,-20,0,6,0,0,0,0,0,-6,10,0,0,11,11,0,4,-12,2,0,5,-11,-15,1,-20,-55,-72,-142,-8,0,0,0,0,7,0,0,0,0,0,0,0,0,0,0,0,0,-13,13,1,8,9,1,6,-1,-16,-58,-38,-39,-60,-53,0,-58,0,-67,-58,1,-16,0,-11,-19,0,-39,-25,-71,-60,-20,-20,-20,-20,-20,-20,-26,6,0,0,0,-6,-6,-6,6,0,11,11,11,-63,11,2,2,2,-15,3,0,-8,-8,-8,-8,-8,-8,-8,0,0,0,0,0,0,0,14,6,0,0,0,0,0,0,0,-64,0,1,1,1,1,6,0,6,-64,-64,-36,-57,-57,-36,-57,-57,-50,-59,-59,-67,-70,0,-64,-26,-65,-63,-57,-40,-40,-65,-59,-62,-63,-78,-54,-78,-54,-25,0,-41,-3,-1,0,0,0,0,0,-6,-24,-24,-77,-39,-36,-19,-2,-21,-3,0,-3,-3,-3,-3,-3,-11,0,-3,-3,5,5,-3,0,-14,0,-7,0,-15,-19,0,-27,-62,-77,-142,-16,0,-15,-10,-15,0,-15,0,-3,-1,0,-3,-4,-4,-15,-4,-15,-4,-24,3,-1,3,5,0,0,-5,-19,-64,-57,-50,-65,-63,0,-64,-47,-80,0,-2,-19,-62,-25,-28,0,-50,-29,-75,-63,-21,-21,-21,-21,-21,-21,-30,0,-3,-3,-3,-8,-11,-11,0,-3,5,5,5,-65,5,0,0,0,-19,0,0,-16,-16,-16,-16,-16,-16,-16,-15,-15,-15,-15,-15,-2,-1,10,-4,-3,-4,-15,-15,-15,-15,-15,-78,-15,-1,-1,-1,-1,0,0,0,-78,-78,-40,-61,-61,-40,-61,-61,-54,-62,-62,-80,-74,0,-65,-16,-50,-53,-53,-28,-27,-50,-47,-52,-60,-49,-30,-49,-30,0,5,-37,0,1,6,3,5,0,1,0,-14,-14,-49,-33,-32,-15,9,-10,0,10,0,0,0,1,0,-5,15,0,0,15,15,0,4,-8,5,3,8,-9,-15,2,-21,-52,-61,-9,-8,4,1,1,1,9,1,4,4,18,4,4,4,4,1,4,1,4,-3,14,9,10,11,1,8,-1,-16,-43,-38,-34,-50,-53,0,-57,-28,-66,-54,9,-16,-42,-2,-11,0,-32,-19,-69,-60,-6,-10,-6,-6,-6,-10,-23,10,0,0,0,-5,-5,-5,14,0,15,15,15,-59,15,5,5,5,-15,6,4,-8,-8,-8,-8,-8,-8,-8,1,1,1,1,1,4,4,14,11,-1,4,1,1,1,1,1,-49,1,9,9,9,9,7,4,8,-49,-49,-28,-56,-56,-28,-56,-56,-30,-59,-59,-66,-68,0,-64,-19,-58,-65,-69,-51,-50,-58,-59,-32,-61,-99,-24,-106,-31,11,-9,-16,-6,-5,-17,0,-9,0,-7,-13,-25,-23,-100,-51,-39,-28,-17,1,-3,-10,-3,-3,-3,-18,-3,4,-13,-3,-3,-5,-5,-3,-11,6,-5,18,18,19,5,15,0,-31,-64,-142,-22,22,-36,-30,-36,-11,-36,22,-4,2,22,-7,-11,-11,-36,-5,-36,-11,-27,0,-24,-5,-5,0,-6,-9,-18,-33,-72,-37,-47,-65,0,-33,-57,-103,-70,-17,-18,0,-25,-21,0,-37,-37,-80,-61,1,1,1,1,1,1,0,-10,-3,-3,-1,8,4,4,-1,-3,-5,-5,-5,-68,-5,-5,-5,-5,8,2,22,-13,-13,-13,-13,-13,-13,-13,-36,-21,-21,-36,-21,1,1,48,42,-22,-4,-21,-21,-21,-21,-21,-99,-21,-10,-10,-10,-10,-6,22,-6,-106,-106,-63,-40,-35,-63,-40,-35,-31,-65,-65,-103,-80,0,-25,0,-14,-60,-48,-21,-70,-14,-38,-19,-28,-109,-175,-109,-175,-87,0,-12,0,1,-99,29,0,44,0,0,-14,-14,-89,-35,-29,0,-6,-91,24,5,24,24,24,0,24,19,-22,19,18,10,10,24,5,44,29,52,52,24,39,31,32,-18,-119,-224,-36,17,-42,-32,-42,18,-42,17,17,17,17,17,-2,-2,-42,-2,-42,-2,-32,15,0,32,33,30,30,-1,0,-21,-111,-12,-14,-60,0,-21,-27,-120,0,-6,0,0,-2,0,0,-12,-7,-52,-28,-88,-91,-86,-85,-84,-90,-114,5,24,24,24,19,19,19,24,18,10,10,10,-44,10,29,29,29,39,30,17,-35,-36,-33,-35,-33,-36,-36,-42,-42,-42,-26,-26,15,16,82,76,0,-2,-42,-42,-26,-34,-26,-109,-42,0,0,0,0,30,17,30,-109,-109,-21,-8,-8,-21,-8,-8,-168,-33,-33,-120,-52,0,-2,-20,-67,-63,-63,-52,-25,-67,-51,-42,-63,-55,-27,-55,-27,3,0,-23,0,-2,0,-1,0,-2,-1,-6,-20,-20,-58,-42,-40,-19,0,0,-1,3,-1,-1,-1,-2,-1,-3,10,-1,-1,8,8,-1,-3,-12,0,-4,0,5,-19,6,-24,-41,-64,-142,-7,0,0,0,0,0,0,0,0,4,0,0,0,0,0,0,0,0,-12,0,4,0,0,11,0,-2,-19,-44,-42,-38,-67,-63,0,-44,0,-67,-68,0,-19,0,-5,-15,0,-38,0,-73,-63,0,0,0,0,0,0,0,3,-1,-1,-1,-3,-3,-3,8,-1,8,8,8,-68,8,0,0,0,-19,2,0,-5,-5,-5,-5,-5,-5,-5,0,0,0,0,0,0,0,14,7,-2,0,0,0,0,0,0,-55,0,4,4,4,4,0,0,0,-55,-55,-52,-62,-62,-52,-62,-62,-28,-65,-65,-67,-73,0,-65,-22,-50,-65,0,-41,-36,-50,-55,-38,-66,-65,-37,-65,-37,0,-6,-23,-6,-9,0,-5,-6,7,-6,-9,-24,-24,-65,-45,-44,-24,-3,-3,-9,-2,-9,-9,-9,-9,-9,-3,0,-9,-9,1,1,-9,-3,0,-5,9,19,12,0,5,-1,-38,-70,-142,-14,-4,-6,-3,-6,0,-6,-4,-4,0,-4,-4,-4,-4,-6,-4,-6,-4,-11,0,-2,0,0,3,0,-4,-24,-41,-51,-31,-50,-65,0,-41,0,-73,-67,-3,-24,-45,-9,-18,0,-31,-28,-73,-66,-3,-3,-3,-3,-3,-3,-5,-2,-9,-9,-9,-3,-3,0,0,-9,1,1,1,-68,1,-5,-5,-5,0,-4,-4,-14,-14,-14,-14,-14,-14,-12,-6,-6,-6,-6,-6,-3,-3,38,33,-9,-4,-6,-6,-6,-6,-6,-65,-6,-2,-2,-2,-2,0,-4,0,-65,-65,-41,-44,-44,-41,-44,-44,-38,-71,-71,-73,-73,0,-32,-19,-55,-69,-67,-63,-50,-55,-59,-30,-63,-106,-31,-106,-31,7,-16,-17,-6,-16,-17,-5,-16,-4,-16,-16,-25,-25,-106,-66,-64,-28,-25,0,0,-10,0,0,0,-18,0,3,-8,-1,-1,-5,-5,0,-11,6,0,17,18,19,5,15,0,-30,-64,-142,-22,0,-36,-30,-36,-11,-36,0,-1,11,0,-4,-11,-11,-36,-11,-36,-11,-27,-14,-24,-5,-5,0,-6,-9,-28,-35,-95,-38,-58,-69,0,-35,-58,-103,-88,-25,-28,0,-25,-22,0,-38,-47,-80,-63,0,0,0,0,0,0,0,-10,0,0,0,3,3,3,-2,-1,-5,-5,-5,-71,-5,0,0,-5,5,0,-6,-21,-22,-21,-22,-21,-22,-22,-36,-36,-36,-36,-36,21,21,47,71,-37,-11,-36,-36,-36,-36,-36,-106,-36,-24,-24,-24,-24,-6,0,-6,-106,-106,-63,-40,-40,-63,-40,-40,-31,-88,-88,-103,-80,0,-26,-18,-45,-62,-58,-36,-34,-45,-51,-25,-62,-59,-58,-59,-58,-22,-1,-33,-3,-2,0,0,-1,13,-2,-4,-27,-27,-59,-41,-40,-18,0,-18,-4,1,-4,-4,-4,-4,-4,-4,6,-4,-4,7,7,-4,0,6,-1,14,24,0,5,1,4,-25,-74,-142,-16,1,-1,0,-1,0,-1,1,-1,0,1,1,-1,-1,-1,-1,-1,-1,-8,6,0,0,3,-2,0,-9,-18,-27,-45,-25,-45,-62,0,-46,0,-70,0,0,-18,0,-3,-13,0,-25,0,-76,-62,-12,-18,-15,-15,-17,-16,-35,1,-4,-4,-4,0,7,0,5,-4,7,7,7,0,7,-1,-1,-1,5,0,0,-15,-15,-15,-15,-13,-15,-16,-1,0,-1,-1,0,1,3,44,39,0,-1,0,-1,-1,-1,0,-59,-1,0,0,0,0,0,0,0,-59,-59,-36,-39,-39,-36,-39,-39,-58,-65,-65,-70,-76,0,-29,2,-24,-65,-60,-64,-28,-24,-41,0,-57,-106,-2,-106,-2,51,-1,9,14,0,0,11,-1,6,-1,-3,-2,-2,-110,-52,-46,-36,-12,45,31,0,31,31,31,-3,31,41,11,27,27,0,0,31,0,25,11,49,49,74,49,51,39,0,-30,-142,0,24,-16,-11,-16,1,-16,24,23,23,24,0,11,11,-16,11,-16,11,-9,-5,-12,-14,-14,53,-18,16,-36,0,-87,-10,-24,-65,0,0,0,-95,-104,-12,-36,0,-21,-12,0,-10,0,-33,-57,45,45,45,45,45,45,42,0,31,31,31,41,41,41,31,27,0,0,0,-68,0,11,11,11,49,38,24,0,0,0,0,0,0,0,-16,-16,-16,-13,-11,38,28,78,23,0,11,-16,-16,-13,-13,-11,-106,-13,-12,-12,-11,-7,-17,24,-9,-106,-106,-64,-15,-15,-64,-15,-15,-2,-98,-98,-95,-32,0,0,-3,-186,-34,-48,-232,-12,-186,-37,-18,-120,-60,-2,-58,-2,39,0,-1,29,2,30,0,0,-103,0,-3,-2,-2,-66,-27,-21,-112,0,39,28,9,28,28,28,-1,28,22,28,28,28,14,14,28,0,-86,4,-86,-51,39,-93,36,-96,-15,-33,-142,9,18,3,0,3,0,3,18,21,21,18,0,18,21,0,18,3,18,0,-10,3,-50,-46,31,-61,5,-110,-20,-45,-22,-186,-34,0,-20,-90,-52,-222,0,-110,0,-11,-53,0,-24,-93,-51,-120,39,39,36,36,36,36,25,6,25,28,25,20,20,22,25,25,11,14,11,-43,11,1,4,1,-93,31,18,6,6,6,6,6,6,6,3,0,0,0,0,18,21,18,18,-1,18,0,0,0,0,0,-60,3,3,3,3,3,-61,18,-61,-60,-60,-232,-199,-234,-232,-234,-234,-2,-155,-155,-52,-51,0,-223,-22,-51,-65,-59,-42,-36,-51,-55,-32,-66,-66,-37,-66,-37,21,-6,-23,-7,-9,0,-5,-6,7,-6,-9,-24,-24,-66,-46,-45,-24,-3,-3,-9,-2,-9,-9,-9,-9,-9,-3,0,-9,-9,0,0,-9,-3,0,-5,8,18,11,0,5,-1,-32,-71,-142,-14,-4,-6,-3,-6,0,-6,-4,-5,0,-4,-4,-4,-4,-6,-4,-6,-4,-11,0,-2,0,0,2,0,-4,-24,-42,-51,-32,-51,-65,0,-42,-39,-74,-67,-3,-24,-46,-9,-19,0,-32,-29,-74,-66,-3,-3,-3,-3,-3,-3,-5,-2,-9,-9,-9,-3,-3,0,0,-9,0,0,0,-69,0,-5,-5,-5,0,-4,-4,-14,-14,-14,-14,-14,-14,-13,-6,-6,-6,-6,-6,-3,-3,38,33,-9,-4,-6,-6,-6,-6,-6,-66,-6,-2,-2,-2,-2,0,-4,0,-66,-66,-42,-44,-44,-42,-44,-44,-38,-71,-71,-74,-73,0,-33,-22,-51,-67,-60,-42,-36,-51,-55,-42,-66,-66,-51,-66,-51,-2,-6,-25,-8,-9,0,-5,-6,7,-6,-9,-26,-26,-66,-46,-45,-24,-3,-2,-9,-2,-9,-9,-9,-9,-9,-3,0,-9,-9,0,0,-9,-3,0,-5,8,18,9,0,1,-1,-42,-71,-142,-14,-4,-6,-3,-6,0,-6,-4,-5,0,-4,-4,-5,-5,-6,-5,-6,-5,-11,0,-2,0,0,0,0,-9,-24,-45,-51,-32,-51,-67,0,-45,-39,-74,-67,-3,-24,-46,-9,-19,0,-32,-29,-76,-66,-2,-2,-2,-2,-2,-2,-5,-2,-9,-9,-9,-3,-3,-1,0,-9,0,0,0,-69,0,-5,-5,-5,0,-4,-4,-14,-14,-14,-14,-14,-14,-13,-6,-6,-6,-6,-6,0,0,38,33,-9,-5,-6,-6,-6,-6,-6,-66,-6,-2,-2,-2,-2,0,-4,0,-66,-66,-42,-44,-44,-42,-44,-44,-51,-71,-71,-74,-75,0,-33,-16,-50,-53,-53,-28,-27,-50,-47,-52,-60,-49,-30,-49,-30,0,4,-37,0,1,6,3,1,0,1,0,-14,-14,-49,-44,-37,-15,9,-10,0,10,0,0,0,1,0,-6,15,0,0,15,15,0,4,-8,5,3,8,-9,-15,2,-17,-52,-61,-9,-8,4,1,1,1,9,1,4,4,18,4,4,4,4,1,4,1,4,-3,14,9,10,11,1,8,-1,-16,-58,-38,-34,-50,-53,0,-58,-28,-66,-54,9,-16,-42,-2,-11,0,-32,-19,-69,-60,-6,-10,-6,-6,-6,-10,-23,10,0,0,0,9,-6,-6,14,0,15,15,15,-65,15,5,5,5,-15,6,4,-8,-8,-8,-8,-8,-8,-8,1,1,1,1,1,4,4,14,11,-1,4,1,1,1,1,1,-49,1,9,9,9,9,7,4,8,-49,-49,-28,-56,-56,-28,-56,-56,-30,-59,-59,-66,-68,0,-64,-18,-45,-71,-64,-24,-61,-45,-51,-66,-56,-53,-128,-53,-128,-70,3,-43,-12,-11,-25,3,3,1,0,-4,-20,-20,-53,-45,-43,-13,0,-73,0,8,0,0,0,0,0,-21,-21,0,0,14,14,0,0,-9,4,6,13,-36,-12,-19,-19,-66,-100,-262,-47,6,-11,-9,-11,8,-11,6,0,0,6,0,0,0,-11,0,-11,0,-11,10,5,12,14,5,10,-8,-13,-71,-51,-45,-45,-71,0,-71,0,-72,-49,0,-13,-45,-7,-12,0,-45,-15,-74,-56,-73,-73,-73,-73,-73,-73,-82,8,0,0,0,-21,-21,-21,15,0,14,14,14,-66,14,4,4,4,-12,5,6,-47,-47,-47,-47,-47,-47,-47,-11,-11,-11,-11,-11,1,1,17,8,0,0,-11,-11,-11,-11,-11,-53,-11,5,5,5,5,10,6,10,-53,-53,-24,-52,-52,-24,-52,-52,-128,-55,-55,-72,-74,0,-61,-16,-50,-53,-53,-28,-27,-50,-47,-52,-60,-49,-30,-49,-30,0,4,-37,0,1,6,3,1,0,1,0,-14,-14,-49,-44,-37,-15,9,-6,0,10,0,0,0,1,0,-6,15,0,0,15,15,0,4,-8,5,3,8,-9,-15,2,-21,-52,-61,-9,-8,4,1,1,1,9,1,4,4,18,4,4,4,4,1,4,1,4,-3,14,9,10,11,1,8,-1,-16,-54,-38,-34,-50,-53,0,-54,-28,-66,-54,9,-16,-42,-2,-11,0,-32,-19,-69,-60,-6,-6,-6,-6,-6,-6,-23,10,0,0,0,9,-6,-6,14,0,15,15,15,-65,15,5,5,5,-15,6,4,-8,-8,-8,-8,-8,-8,-8,1,1,1,1,1,4,4,14,11,-1,4,1,1,1,1,1,-49,1,9,9,9,9,7,4,8,-49,-49,-28,-56,-56,-28,-56,-56,-30,-59,-59,-66,-68,0,-64,-15,-49,-72,-56,-28,-50,-49,-52,-30,-60,-63,-33,-63,-33,8,0,-21,0,-7,-27,0,0,0,-3,-3,-14,-14,-62,-49,-47,-15,0,1,3,2,3,3,3,-2,3,-1,-19,3,3,7,7,3,0,-11,0,2,9,16,-14,0,-23,-30,-62,-142,-25,0,-14,-10,-14,7,-14,0,0,0,0,-1,0,0,-14,0,-14,0,-12,6,0,9,10,21,6,0,-15,-34,-71,-56,-49,-72,0,-34,-32,-75,-53,0,-15,0,-16,-18,0,-56,-19,-62,-60,1,1,1,1,1,1,0,2,3,3,3,-1,-1,-1,13,3,7,7,7,-67,7,0,0,0,-14,10,0,-25,-25,-24,-25,-24,-25,-24,-14,-14,-14,-14,-14,0,0,15,8,-23,0,-14,-14,-14,-14,-14,-63,-13,0,0,0,0,6,0,6,-63,-63,-28,-56,-56,-28,-56,-56,-33,-59,-59,-75,-62,0,-64,-34,-78,-63,-72,-69,-33,-78,-59,-62,-72,-65,-55,-65,-55,-26,-6,-45,-6,-13,0,-5,-6,-14,-6,-17,-53,-53,-66,-62,-60,-34,-3,-21,-6,-2,-6,-6,-6,-7,-6,-17,10,-6,-6,0,0,-6,-5,-23,-4,-14,-5,-19,-26,0,-34,-62,-76,-142,-16,-2,-4,-4,-4,-10,-4,-2,-5,-5,-2,-3,-6,-6,-4,-6,-4,-6,-27,-2,-3,-12,-12,-11,-12,-25,-34,-65,-42,-38,-78,-63,0,-65,-63,-68,-87,-3,-34,-66,-15,-22,0,-38,0,-85,-72,-21,-21,-21,-21,-21,-21,-31,-2,-6,-6,-6,-17,-17,-17,0,-6,0,0,0,-69,0,-4,-4,-4,-26,-2,-2,-16,-16,-16,-16,-16,-16,-16,-4,-4,-4,-4,-4,-4,-4,7,0,-7,-6,-4,-4,-4,-4,-4,-65,-4,-3,-3,-3,-3,-12,-2,-12,-65,-65,-69,-71,-71,-69,-71,-71,-55,-81,-81,-68,-84,0,-67,-13,-35,-82,-71,-42,-89,-35,-65,-29,-44,-155,-142,-159,-142,-74,-19,-18,-19,-18,-100,5,-19,8,-19,-19,-44,-44,-156,-63,-57,-14,-42,-85,0,-15,0,0,0,-19,0,6,-34,-2,-2,-9,-11,0,-15,32,5,39,39,12,26,19,20,-28,-134,-142,-75,0,-93,-83,-93,0,-93,0,-11,-11,0,0,-26,-26,-93,-26,-93,-26,-83,0,-22,4,4,4,4,-24,-14,-31,-146,-22,-35,-82,0,-31,-57,-155,-69,-42,-14,-102,-13,-7,0,-22,-30,-65,-44,-85,-85,-85,-85,-85,-85,-101,-15,0,0,0,6,6,6,0,-2,-11,-11,-11,-79,-9,5,5,5,26,6,0,-69,-71,-65,-69,-63,-72,-73,-93,-81,-82,-69,-65,0,0,69,63,0,-26,-81,-86,-71,-76,-68,-153,-93,-22,-22,-22,-22,4,0,4,-159,-159,-42,-20,-20,-42,-20,-20,-143,-70,-70,-103,-65,0,-10,-19,-45,-62,-59,-36,-35,-45,-52,-42,-63,-60,-58,-60,-59,0,-2,-34,-3,-3,0,0,-2,12,-2,-5,-28,-28,-60,-42,-41,-19,0,-18,-5,0,-5,-5,-5,-5,-5,-5,5,-5,-5,6,6,-5,0,5,0,13,23,0,4,0,0,-42,-75,-142,-17,0,-2,-1,-2,0,-2,0,0,0,0,0,-1,-1,-2,-1,-2,-1,-9,5,0,0,2,-2,0,-9,-19,-47,-46,-25,-45,-62,0,-47,-36,-70,-63,0,-19,0,-4,-14,0,-25,0,-77,-63,-19,-19,-19,-19,-19,-19,-36,0,-5,-5,-5,-5,-5,0,3,-5,6,6,6,-67,6,0,0,0,4,0,0,-16,-16,-16,-17,-16,-16,-17,-2,-2,-2,-2,0,0,0,43,0,-7,-1,-2,-2,-2,-2,-2,-60,-2,0,0,0,0,0,0,0,-60,-60,-36,-40,-40,-36,-40,-40,-59,-66,-66,-70,-76,0,-29,-2,-16,-79,-68,-37,-64,-16,-56,-10,-37,-101,-133,-101,-133,-71,-3,-10,-12,-12,-70,13,-3,22,-8,-8,-40,-40,-98,-66,-60,-9,-20,-67,9,-1,9,9,9,-6,9,17,-21,7,7,2,2,9,-1,39,14,62,63,35,51,26,50,-10,-115,-155,-68,9,-59,-49,-59,3,-59,9,0,0,9,9,-21,-21,-59,-21,-59,-21,-54,2,-16,10,10,0,9,-18,-9,-11,-102,-5,-16,-79,0,-11,-38,-110,0,-20,-9,0,-6,0,0,-5,-24,-70,-37,-66,-67,-66,-66,-62,-67,-87,-1,9,9,9,17,17,17,17,7,2,2,2,-80,2,14,14,14,51,15,9,-54,-56,-40,-49,-34,-56,-68,-59,-46,-46,-35,-29,37,18,89,88,9,-21,-46,-46,-37,-42,-32,-101,-59,-14,-16,-13,-9,9,9,11,-101,-101,-37,-9,-9,-37,-9,-9,-135,-66,-66,-110,-70,0,1,0,-14,-73,-62,-27,-53,-14,-42,-10,-32,-87,-112,-87,-112,-54,0,-8,-2,0,-43,25,0,30,0,0,-31,-31,-83,-59,-52,-4,-8,-56,21,5,21,21,21,0,21,20,-13,20,20,10,10,21,4,39,25,63,63,36,57,26,50,-9,-101,-142,-53,15,-33,-27,-33,12,-33,15,9,9,15,15,-9,-9,-33,-9,-33,-9,-35,11,-7,20,20,7,20,-11,-4,-10,-87,-5,-14,-73,0,-10,0,-95,-62,-8,-4,-65,0,0,0,-5,0,-64,-32,-56,-56,-56,-56,-54,-56,-64,5,21,21,21,20,20,20,25,20,10,10,10,0,10,25,25,25,57,26,15,-47,-48,-35,-42,-29,-48,-53,-33,-29,-29,-21,-20,37,21,92,92,0,-9,-29,-29,-22,-29,-21,-87,-30,-4,-4,-4,-2,20,15,20,-87,-87,-27,-8,-8,-27,-8,-8,-112,-58,-58,-95,-64,0,1,-2,-29,-79,-72,-69,-49,-29,-51,-6,-63,-125,-11,-130,-11,41,-19,0,0,-16,-22,0,-19,0,-19,-21,-11,-11,-130,-67,-65,-44,-31,31,14,-13,14,14,14,-21,14,22,-3,12,12,-9,-9,14,-12,16,0,39,40,63,39,37,29,-6,-45,-142,-12,12,-39,-29,-39,-3,-37,12,10,12,12,-3,0,0,-39,0,-39,0,-28,-21,-30,-21,-21,42,-23,5,-44,-7,-111,-13,-29,-79,0,-7,-55,-114,-107,-31,-44,0,-28,-22,0,-13,-52,-45,-63,31,31,31,31,31,31,31,-13,14,14,14,22,22,22,14,12,-9,-9,-9,-84,-4,0,0,0,39,20,12,-12,-12,-12,-12,-12,-12,-12,-39,-34,-35,-31,-29,27,15,69,79,0,0,-34,-36,-32,-34,-30,-130,-39,-30,-30,-30,-26,-23,12,-23,-130,-130,-69,-23,-23,-69,-23,-23,-13,-102,-102,-114,-45,0,-4,-9,-20,-94,-80,-53,-84,-20,-62,-10,-52,-124,-152,-124,-152,-90,-23,-14,-24,-22,-92,1,-23,13,-23,-23,-58,-58,-121,-86,-75,-21,-50,-86,0,-20,0,0,0,-26,0,5,-27,0,0,-15,-15,0,-21,25,2,51,55,35,48,12,38,-10,-136,-146,-83,0,-79,-77,-79,-1,-79,0,0,0,0,0,-37,-37,-79,-37,-79,-37,-77,-6,-33,-6,-5,-8,-6,-35,-21,-11,-127,-8,-20,-94,0,-11,0,-138,-90,-50,-21,0,-12,-7,0,-8,0,-84,-52,-85,-86,-83,-83,-80,-86,-106,-20,0,0,0,5,6,5,0,0,-15,-15,-15,-96,-15,2,2,2,48,4,0,-75,-75,-57,-83,-41,-75,-83,-78,-65,-66,-50,-42,37,7,83,0,-82,-36,-66,-67,-51,-62,-47,-124,-78,-33,-33,-31,-30,-6,0,-6,-124,-124,-54,-13,-13,-54,-13,-13,-152,-87,-87,-138,-84,0,0,-7,-36,-64,-63,-43,-40,-113,-58,-10,-46,-129,-6,-129,-4,53,-2,-4,3,-1,-9,4,-2,10,-2,-2,-6,-6,-124,-56,-49,-93,-14,13,8,0,8,8,8,-6,8,17,10,8,8,4,4,8,-5,-73,-3,-60,39,48,-69,39,18,-10,-56,-142,-12,10,-24,-22,-24,1,-24,10,4,5,10,1,0,0,-24,0,-24,0,-20,0,-12,5,5,19,5,0,-10,-23,-105,-22,-36,-64,0,-23,0,-103,-75,-14,-10,-42,-39,-60,0,-60,0,-63,-46,13,13,13,13,13,13,3,0,8,8,8,17,17,18,8,5,4,4,4,0,4,5,5,5,26,0,10,-12,-12,-12,-12,-12,-12,-12,-24,-24,-24,-23,-24,8,8,69,4,0,0,-24,-24,-24,-24,-24,-124,-24,-12,-12,-10,-10,5,10,5,-129,-129,-43,-22,-22,-43,-22,-22,-19,-74,-74,-103,-63,0,-10,0,-122,0,0,-122,0,-122,0,3,-133,0,0,0,0,0,-23,-8,0,-29,-6,-25,-23,-83,-26,-32,0,0,0,0,0,0,0,35,0,-18,0,0,0,-27,0,2,-5,0,0,-14,-14,0,-24,-85,-22,-74,-56,41,-87,21,0,4,0,104,-7,0,-24,-20,-24,-8,-14,0,0,111,0,-21,0,0,-24,27,-24,0,-19,-34,-21,-59,-54,35,-49,3,0,0,0,0,-122,0,0,0,0,-91,0,0,0,0,0,0,0,0,0,-49,-133,35,35,35,35,35,35,0,-18,0,0,0,2,2,2,0,0,-14,-14,-14,0,-14,-22,-22,-22,-87,0,0,-7,-7,-7,-7,-7,-7,-7,-24,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,-24,-21,-21,-21,-21,-49,0,-49,0,0,-122,-127,-127,-122,-127,-127,0,0,0,-91,-48,0,0,-83,-156,0,0,0,0,-156,-108,-88,-169,-133,-89,-133,-89,-37,-79,-86,-68,-81,-64,-82,-79,-122,-81,-85,-89,-89,-133,0,0,-138,0,-44,-71,-75,-71,-71,-71,-81,-71,-65,-65,-71,-71,-72,-72,-71,-78,-140,-78,-125,-108,-46,-142,-47,0,-88,0,0,-66,-67,-78,-76,-78,-73,-78,-67,-67,-67,-67,-76,-67,-67,-78,-67,-78,-67,-74,-76,-77,-99,-98,-48,-103,-62,-138,0,0,0,-156,0,0,0,0,0,0,0,-138,0,0,0,0,0,0,-111,-169,-44,-44,-44,-44,-44,-44,0,-75,-71,-71,-71,-65,-65,-65,0,-71,-72,-72,-72,0,-72,-78,-78,-78,-142,0,-67,-66,-66,-66,-66,-66,-66,-66,-78,0,0,0,0,-67,-67,0,-67,0,-67,0,0,0,0,0,-133,-78,-77,-77,-77,-77,-103,-67,-103,-133,-133,0,-167,-167,0,-167,-167,0,0,0,0,0,0,0,0,-325,0,0,0,0,-188,-113,-11,-325,0,0,0,-150,104,-142,-142,-142,-142,-222,-142,-142,-142,-142,-142,-150,0,0,0,0,0,0,-142,-142,-142,-142,-142,-142,-142,-142,-142,-142,-142,-142,-142,-142,-142,-142,-142,-142,-149,-141,-142,-145,-142,0,-10,0,130,-142,-142,-142,-142,-142,-142,-34,-142,-142,121,-142,-142,-142,-142,-142,24,-142,-142,-142,-142,-142,-142,-142,-142,-34,-142,0,0,0,0,-325,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,-325,-142,-142,-142,-142,-142,-142,0,-142,-142,-142,-142,-142,-142,-142,0,-142,-142,-142,-142,0,-142,-142,-142,-142,-145,0,-142,-142,-142,-142,-142,-142,-142,-142,-142,-142,-142,-142,-142,-142,-142,0,-142,0,-142,-142,-142,-142,-142,-142,0,-142,-142,-142,-142,-142,-34,-142,-34,0,0,0,-325,-325,0,-325,-325,0,0,0,0,0,0,0,-23,-74,-63,-67,-62,-29,-74,-54,-46,-99,-58,-32,-58,-32,7,-1,-29,-3,-19,0,-8,-2,-41,-8,-22,-29,-29,-58,-48,-51,-65,0,0,-2,0,-2,-2,-2,-5,-2,-11,4,-2,-2,1,1,-2,-11,-85,0,-30,-32,2,-61,0,-61,-45,-64,-5,-7,0,0,0,0,-5,0,0,0,25,0,-1,0,0,0,0,0,0,-9,0,0,-17,-16,0,-21,-8,-67,-41,-41,-40,-76,-63,0,-49,-42,-67,-67,0,-67,-42,-9,-23,0,-40,-48,-73,-99,0,0,0,0,0,0,-2,0,-2,-2,-2,-11,-11,-11,0,-2,1,1,1,-68,1,0,0,0,-74,0,0,-7,-7,-7,-7,-7,-7,-6,0,0,0,0,0,0,0,0,0,-3,0,0,0,0,0,0,-58,0,0,0,0,0,-21,0,-21,-58,-58,-62,-82,-83,-62,-82,-83,-29,-88,-88,-67,-73,0,-100,-22,-74,-63,-75,-62,-35,-74,-54,-68,-99,-58,-52,-58,-54,-21,-3,-54,-17,-21,0,-8,-3,-27,-8,-22,-48,-45,-58,-56,-57,-65,0,-31,-6,0,-6,-6,0,-5,-6,-36,1,-6,-6,1,1,-6,-15,-79,-2,-39,-32,-38,-75,-16,-69,-68,-76,-142,-12,0,0,0,0,-5,0,0,0,0,0,0,-1,-1,0,-1,0,-1,-10,0,0,-16,-15,-24,-20,-24,-67,-74,-41,-40,-76,-63,0,-71,0,-67,-67,0,-67,-61,-9,-22,0,-25,-48,-90,-99,-31,-31,-31,-31,-31,-31,0,0,-6,-6,-6,-36,-36,-36,6,-6,1,1,1,-69,1,-2,-2,-2,-78,0,-1,-12,-12,-12,-12,-12,-12,-12,0,0,0,0,0,0,-1,0,0,-3,-1,0,0,0,0,0,-58,0,0,0,0,0,-23,-1,-23,-58,-58,-62,-80,-83,-62,-80,-83,-56,-88,-88,-67,-89,0,-100,-33,-68,-62,0,-54,-41,-68,-66,-74,-99,-60,-46,-60,-46,-21,-6,-49,-23,-20,-5,-5,-6,-34,-17,-18,-40,-40,-59,-55,-57,-61,-2,-24,-7,-1,-7,-7,-7,-9,-7,-28,-6,-7,-7,0,0,-7,-9,-78,-5,-43,-27,-37,-74,-10,-64,-74,-72,-142,-16,-5,-5,-2,-5,-5,-5,-5,-5,-5,-5,-5,-5,-5,-5,-5,-5,-5,-11,-2,-2,-17,-15,-22,-20,-21,-62,-76,-64,-55,-68,-62,0,-76,0,-76,0,-2,-62,0,-20,-26,0,-55,0,-93,-99,-24,-24,-24,-24,-24,-24,0,-1,-7,-7,-7,-28,-28,-28,0,-7,0,0,0,-65,0,-5,-5,-5,-74,0,-5,-16,-16,-16,-16,-16,-16,-16,-5,-5,-5,-5,-5,-5,-5,-5,-5,-14,-5,-5,-5,-5,-5,-5,-60,-5,-2,-2,-2,-2,-20,-5,-20,-60,-60,-54,-72,-76,-54,-72,-76,-48,-81,-81,-76,-93,0,-94,-22,-50,-61,-61,-39,-33,-50,-51,-29,-63,-62,-36,-62,-36,0,-2,-21,-3,-7,0,0,-2,4,-2,-9,-20,-20,-62,-41,-40,-23,0,-1,-4,0,-4,-4,-4,-5,-4,0,0,-4,-4,5,5,-4,0,0,0,8,14,10,0,9,4,-29,-66,-142,-10,1,-1,0,-1,0,-1,1,3,0,1,0,0,0,-1,0,-1,0,-9,2,0,0,0,7,0,-1,-23,-32,-45,-29,-50,-61,0,-32,0,-70,-62,0,-23,0,-6,-15,0,-29,0,-71,-63,-1,-1,-1,-1,-1,-1,0,0,-4,-4,-4,0,0,0,3,-4,5,5,5,-65,5,0,0,0,0,0,1,-10,-10,-10,-10,-10,-10,-10,-1,-1,-1,-1,-1,1,1,17,3,-6,0,-1,-1,-1,-1,-1,-62,-1,0,0,0,0,0,1,0,-62,-62,-39,-46,-46,-39,-46,-46,-34,-65,-65,-70,-71,0,-32,-28,-70,-65,-78,-57,-44,-70,-59,-66,-94,-53,-62,-53,-62,0,-3,-60,-27,-30,-4,-14,-3,-36,-19,-27,-47,-47,-53,-62,-63,-63,0,-24,-5,0,-5,-5,-5,-5,-5,-31,-6,-5,-4,0,0,-5,-21,-78,-2,-42,-27,-21,-64,-20,-65,-65,-77,-142,-23,-3,-1,0,-1,-2,-1,-3,-4,-1,0,0,-3,-3,-1,-3,-1,-3,-9,0,0,-15,-13,-18,-18,-26,-64,-67,-36,-36,-70,-65,0,-67,0,-63,-65,0,-64,0,-5,-20,0,-36,0,-88,-96,-24,-24,-24,-24,-24,-24,-29,0,-5,-5,-5,-34,-34,-34,0,-5,0,0,0,0,0,-2,-2,-2,-76,0,-3,-23,-23,-23,-23,-23,-23,-22,-1,-1,-1,-1,-1,-4,-4,0,-1,-8,-3,-1,-1,-1,-1,-1,-53,-1,0,0,0,0,-18,-3,-18,-53,-53,-57,-75,-78,-57,-75,-78,-62,-83,-83,-63,-87,0,-96,0,-14,-42,-33,-9,-60,-14,-31,-4,-24,-54,-119,-54,-119,-61,11,-17,0,7,-68,28,11,32,10,10,-7,-7,-52,-19,-16,1,4,-60,23,16,23,23,23,7,23,2,-30,19,19,21,21,23,16,21,28,48,52,22,42,7,52,-4,-97,-142,-19,14,-11,-4,-11,43,-11,14,14,14,14,14,2,2,-11,2,-11,2,-5,33,7,49,51,42,45,5,1,-7,-85,-15,-14,-42,0,-7,-11,-91,0,4,1,0,-3,0,0,-15,-1,-40,-24,-60,-60,-60,-60,-60,-60,0,16,23,23,23,2,2,2,0,19,21,21,21,0,21,28,28,28,42,0,11,-19,-19,-19,-19,-19,-19,-19,-11,-11,-11,-11,-9,23,13,56,42,-40,2,-11,-11,-11,-11,-9,-54,-11,7,7,7,10,45,14,45,-54,-54,-9,-11,-11,-9,-11,-11,-119,-23,-23,-91,-40,0,-1,-23,-74,-63,-67,-62,-29,-74,-54,-37,-99,-58,-32,-58,-32,24,-1,-29,-3,-19,0,-8,-2,-41,-8,-22,-29,-29,-58,-48,-51,-65,0,0,-2,0,-2,-2,-2,-5,-2,-11,4,-2,-2,1,1,-2,-11,-85,0,-50,-32,2,-61,0,-61,-36,-64,-5,-7,0,0,0,0,-5,0,0,0,25,0,-1,0,0,0,0,0,0,-9,0,0,-17,-16,0,-21,-8,-67,-41,-41,-40,-76,-63,0,-49,-42,-67,-67,0,-67,-42,-9,-23,0,-40,-48,-73,-99,0,0,0,0,0,0,-2,0,-2,-2,-2,-11,-11,-11,0,-2,1,1,1,-68,1,0,0,0,-74,0,0,-7,-7,-7,-7,-7,-7,-6,0,0,0,0,0,0,0,25,0,-3,0,0,0,0,0,0,-58,0,0,0,0,0,-21,0,-21,-58,-58,-62,-82,-83,-62,-82,-83,-29,-88,-88,-67,-73,0,-100,-26,-79,-64,0,-64,-32,-79,-57,-45,-101,-61,-36,-61,-36,0,-5,-32,-7,-20,0,-10,-5,-43,-10,-23,-30,-30,-61,-51,-54,-68,0,-1,-5,0,-5,-5,-5,-7,-5,-13,1,-5,-5,0,0,-5,-14,-94,-4,-48,-35,0,-77,0,-62,-45,-66,-142,-9,0,0,0,0,-7,0,0,0,0,0,-4,0,0,0,0,0,0,-12,-1,0,-20,-19,-1,-24,-10,-68,-52,-43,-42,-79,-64,0,-52,0,-69,-68,0,-68,0,-11,-25,0,-42,0,-75,-101,-1,-1,-1,-1,-1,-1,0,0,-5,-5,-5,-13,-13,-13,5,-5,0,0,0,-71,0,-4,-4,-4,-77,0,0,-9,-9,-9,-9,-9,-9,-8,0,0,0,0,0,0,0,0,0,-5,0,0,0,0,0,0,-61,0,0,0,0,0,-22,0,-22,-61,-61,-64,-85,-85,-64,-85,-85,-32,-89,-89,-69,-75,0,-102,8,0,-62,-61,-41,-34,0,-20,32,-67,-63,-33,-63,-36,23,-3,-34,-4,-9,0,-3,-3,-9,-3,-10,-19,-19,-63,-42,-40,0,0,-2,-5,0,-5,-5,-5,-7,-5,-7,0,-5,-5,4,4,-5,-1,-27,0,0,-11,7,-36,8,0,32,-67,-14,-11,3,-2,0,-2,5,-2,3,1,0,3,0,0,0,-2,0,-2,0,-9,6,0,0,0,7,0,0,-25,-37,-45,-37,-55,-62,0,-33,0,-70,-63,0,-25,0,11,19,0,7,-29,-72,-65,-2,-2,-2,-2,-2,-2,-5,0,-5,-5,-5,-1,0,70,2,-5,4,4,4,-68,4,0,0,0,-36,0,3,-11,-11,-8,-11,-7,-11,-9,-2,-2,-2,0,0,2,2,7,1,-6,0,-2,-2,0,-2,0,-63,-2,0,0,0,0,0,3,0,-63,-63,-16,0,-59,-16,0,-59,-34,-65,-65,-70,-71,0,-37,8,0,-62,-61,-41,-34,0,-20,32,-67,-63,-33,-63,-36,17,-3,-34,-4,-9,0,-3,-3,-9,-3,-10,-19,-19,-63,-42,-40,0,0,-2,-5,0,-5,-5,-5,-7,-5,-7,0,-5,-5,4,4,-5,-1,-27,0,0,-11,7,-36,8,1,32,-67,-14,-11,3,-2,0,-2,5,-2,3,1,17,3,0,0,0,-2,0,-2,0,-9,6,0,0,0,7,0,0,-25,-37,-45,-38,-55,-62,0,-33,0,-70,-63,0,-25,0,11,19,0,-38,-29,-72,-65,-2,-2,-2,-2,-2,-2,-5,0,-5,-5,-5,-1,0,70,2,-5,4,4,4,-68,4,0,0,0,-36,0,3,-11,-11,-8,-11,-7,-11,-9,-2,-2,-2,0,0,2,2,23,1,-6,0,-2,-2,0,-2,0,-63,-2,0,0,0,0,0,3,0,-63,-63,-16,-60,-60,-16,-60,-60,-34,-65,-65,-70,-71,0,-37,-20,-57,-72,-66,-39,-57,-57,-58,-23,-48,-117,-24,-117,-24,21,-20,-15,0,-18,-31,-19,-20,-2,-20,-20,-18,-18,-113,-57,-49,-13,-18,12,-3,-14,-3,-3,-3,-21,-3,-1,-25,-3,-3,-10,-10,-3,-14,-9,-19,-11,-7,29,-22,9,-23,-22,-51,-142,-21,0,-44,-36,-44,1,-43,0,0,0,0,-17,0,0,-44,0,-44,0,-33,0,-14,12,12,34,12,0,-13,-25,-104,-58,-57,-72,0,-25,0,-109,-67,-18,-13,0,-24,-19,0,-58,0,-49,-48,12,12,12,12,12,12,0,-14,-3,-3,-3,-1,-1,-1,0,-3,-10,-10,-10,-69,-8,-19,-19,-19,-22,0,0,-21,-21,-21,-21,-21,-21,-21,-44,-43,-43,-43,-43,0,0,0,0,-46,0,-43,-43,-43,-43,-43,-117,-39,-14,-14,-14,-14,12,0,12,-117,-117,-39,-48,-48,-39,-48,-48,-24,-66,-66,-109,-48,0,-67,-7,-85,-52,-56,-80,-22,-85,-44,-12,-94,-99,-6,-99,-9,43,-12,0,4,-11,-1,-12,-12,-31,-12,-12,-5,-5,-99,-35,-32,-65,-12,34,0,-9,0,0,0,-14,0,10,0,0,0,-6,-6,0,-7,-39,-12,-25,-21,44,-31,30,-26,-16,-29,-142,0,6,-12,-7,-12,0,-12,6,5,7,6,-13,6,6,-12,9,-12,6,-2,-14,-12,-28,-28,39,-30,11,-65,-18,-89,-62,-85,-52,0,-18,0,-84,-99,-12,-65,0,-49,-62,0,-62,-61,-44,-94,34,34,34,34,34,34,0,-9,0,0,0,12,12,10,0,0,-6,-6,-6,-51,-4,-12,-12,-12,-31,9,6,0,0,0,0,0,0,0,-12,-12,-12,-12,-12,8,8,9,10,-13,6,-12,-12,-12,-12,-12,-99,-6,-12,-12,-12,-12,-30,6,-30,-99,-99,-80,-87,-87,-80,-87,-87,-9,-101,-101,-84,-43,0,-74,-25,-74,-64,-71,-60,-32,-74,-56,-45,-90,-61,-36,-61,-36,0,-1,-32,-7,-18,0,-8,-1,-30,-9,-20,-30,-30,-61,-47,-50,-56,1,-1,-4,0,-4,-4,-4,-5,-4,-13,1,-4,-4,5,5,-4,-10,-76,0,-47,-30,0,-73,0,-63,-45,-66,-142,-9,0,0,2,0,-3,0,0,0,0,0,-1,0,0,0,0,0,0,-10,-1,0,-13,-11,0,-17,-9,-56,-52,-43,-42,-74,-64,0,-52,-42,-69,-66,1,-56,-42,-11,-25,0,-42,-48,-74,-90,-1,-1,-1,-1,-1,-1,0,0,-4,-4,-4,-13,-13,-13,0,-4,5,5,5,-70,5,0,0,0,-73,0,0,-9,-9,-9,-9,-9,-9,-8,0,0,0,0,0,0,0,0,0,-5,0,0,0,0,0,0,-61,0,0,0,0,0,-17,0,-17,-61,-61,-60,-85,-85,-60,-85,-85,-32,-78,-78,-69,-74,0,-99,-25,-74,-64,-72,-63,-32,-74,-57,-45,-95,-61,-36,-61,-36,27,-3,-32,-7,-19,0,-9,-3,-34,-10,-22,-30,-30,-61,-49,-52,-62,0,-1,-4,0,-4,-4,-4,-7,-4,-13,1,-4,-4,0,0,-4,-12,-75,-1,-51,-32,0,-76,0,-65,-48,-66,-142,-9,0,0,0,0,-5,0,0,0,22,0,-2,0,0,0,0,0,0,-11,-1,0,-16,-14,0,-20,-10,-62,-52,-43,-42,-76,-64,0,-52,-44,-69,-67,0,-62,-42,-11,-25,0,-42,-49,-75,-95,-1,-1,-1,-1,-1,-1,0,0,-4,-4,-4,-13,-13,-13,0,-4,0,0,0,-70,0,-1,-1,-1,-61,0,0,-9,-9,-9,-9,-9,-9,-8,0,0,0,0,0,0,0,0,0,-5,0,0,0,0,0,0,-61,0,0,0,0,0,-20,0,-20,-61,-61,-63,-83,-85,-63,-83,-85,-32,-83,-83,-69,-75,0,-100,-22,-74,-63,-75,-62,-35,-74,-54,-70,-99,-58,-52,-58,-54,-21,-3,-54,-17,-21,0,-8,-3,-27,-8,-22,-48,-45,-58,-56,-57,-65,0,-31,-6,0,-6,-6,0,-5,-6,-36,1,-6,-6,1,1,-6,-15,-79,-2,-39,-37,-38,-75,-16,-69,-69,-76,-142,-12,0,0,0,0,-5,0,0,0,0,0,0,-1,-1,0,-1,0,-1,-10,0,0,-16,-15,-24,-20,-24,-67,-77,-41,-40,-76,-63,0,-77,0,-67,-67,0,-67,-61,-9,-22,0,-25,-48,-90,-99,-31,-31,-31,-31,-31,-31,0,0,-6,-6,-6,-36,-36,-36,6,-6,1,1,1,-69,1,-2,-2,-2,-78,0,-1,-12,-12,-12,-12,-12,-12,-12,0,0,0,0,0,0,-1,0,0,-3,-1,0,0,0,0,0,-58,0,0,0,0,0,-23,-1,-23,-58,-58,-62,-80,-83,-62,-80,-83,-56,-88,-88,-67,-89,0,-100,-22,-74,-63,-75,-62,-35,-74,-54,-68,-99,-58,-52,-58,-54,-21,-3,-54,-17,-21,0,-8,-3,-27,-8,-22,-48,-45,-58,-56,-57,-65,0,-31,-6,0,-6,-6,0,-5,-6,-36,1,-6,-6,1,1,-6,-15,-79,-2,-39,-35,-38,-75,-16,-69,-68,-76,-142,-12,0,0,0,0,-5,0,0,0,0,0,0,-1,-1,0,-1,0,-1,-10,0,0,-16,-15,-24,-20,-24,-67,-74,-41,-40,-76,-63,0,-71,0,-67,-67,0,-67,-61,-9,-22,0,-25,-48,-90,-99,-31,-31,-31,-31,-31,-31,0,0,-6,-6,-6,-36,-36,-36,6,-6,1,1,1,-69,1,-2,-2,-2,-78,0,-1,-12,-12,-12,-12,-12,-12,-12,0,0,0,0,0,0,-1,0,0,-3,-1,0,0,0,0,0,-58,0,0,0,0,0,-23,-1,-23,-58,-58,-62,-80,-83,-62,-80,-83,-56,-88,-88,-67,-89,0,-100,-27,-80,-65,0,-65,-33,-80,-58,-41,-102,-62,-32,-62,-36,26,-6,-34,-8,-21,0,-11,-6,-43,-11,-26,-31,-31,-62,-53,-56,-69,-1,-1,-7,0,-7,-7,-7,-8,-7,-14,0,-7,-7,0,0,-7,-16,-94,-5,-54,-36,0,-77,0,-63,-40,-66,24,-11,-1,-1,-1,-1,-8,-1,-1,-1,21,-1,-5,-1,-1,-1,-1,-1,-1,-13,-2,-1,-21,-20,-1,-23,-11,-69,-44,-45,-44,-80,-65,0,-44,0,-70,0,-1,-69,-47,-13,-26,0,-44,0,-76,-102,-1,-1,-1,-1,-1,-1,0,0,-7,-7,-7,-14,-14,-14,0,-7,0,0,0,-72,0,-5,-5,-5,-77,0,-1,-11,-11,-11,-11,-11,-11,-9,-1,-1,-1,-1,-1,-1,-1,-1,-1,0,-1,-1,-1,-1,-1,-1,-62,-1,-1,-1,-1,-1,-23,-1,-23,-62,-62,-65,-86,-86,-65,-86,-86,-34,-90,-90,-70,-76,0,-102,-6,-41,-50,-54,-26,-27,-41,-36,-69,-71,-23,-180,-23,-180,-37,11,-79,-16,-14,-8,1,11,-5,0,-1,-21,-21,-23,-33,-36,-32,16,-42,6,16,6,6,6,7,6,-28,0,6,6,21,21,6,0,-55,12,-14,0,-75,-44,-61,-31,-69,-82,-209,-20,11,5,9,5,21,5,11,11,11,11,11,11,11,5,11,5,11,0,21,16,10,12,-8,6,-8,-32,-81,-19,-22,-41,-50,0,-81,-9,-38,-31,16,-32,0,0,0,0,-22,-11,-80,-71,-42,-42,-42,-42,-42,-42,0,16,6,6,6,-28,-28,-28,0,6,21,21,21,-63,21,12,12,12,-44,13,11,-20,-20,-20,-20,-20,-20,-18,5,5,5,5,5,11,11,11,11,0,11,5,5,5,5,5,-23,5,16,16,16,16,6,11,6,-23,-23,-26,-47,-47,-26,-47,-47,-168,-46,-46,-38,-80,0,-66,-31,-75,-55,-68,-60,-31,-75,-58,-67,-85,-68,-40,-68,-40,-10,-1,-41,-5,-6,3,-10,-1,-20,-4,-17,-35,-35,-73,-42,-43,-46,0,-16,-2,0,-2,-2,-2,-5,-2,-23,0,-2,-2,0,0,-2,-8,-60,0,-34,-33,-26,-65,-5,-61,-67,-67,-142,-4,0,-3,0,-3,0,-3,0,0,0,0,0,0,0,-3,0,-3,0,-17,4,0,-11,-10,-11,-14,-13,-46,-68,-40,-38,-78,-55,0,-68,0,-67,-66,0,-46,-57,-20,-43,0,-38,0,-87,-85,-16,-16,-16,-16,-16,-16,0,0,-2,-2,-2,-23,-23,-23,0,-2,0,0,0,-62,0,0,0,0,-65,0,0,-4,-4,-4,-4,-4,-4,-3,-3,-3,-3,-3,-3,0,0,0,0,-7,0,-3,-3,-3,-3,-3,-68,-3,0,0,0,0,-14,0,-14,-68,-68,-60,-79,-88,-60,-79,-88,-41,-70,-70,-67,-87,0,-99,-8,-50,-61,-56,-27,-44,-50,-54,-35,-47,-67,-27,-67,-27,12,0,-17,0,-4,-19,0,0,6,0,-1,-5,-5,-64,-40,-31,-10,-1,3,1,0,1,1,1,-4,1,0,-13,1,1,3,3,1,0,-11,0,-5,0,14,-16,11,-15,-35,-57,-142,-9,7,-15,-13,-15,18,-15,7,7,7,7,-1,7,7,-15,7,-15,7,-13,17,0,22,24,24,19,10,-10,-37,-99,-58,-50,-61,0,-37,-32,-99,-42,-1,-10,-34,-21,-23,0,-58,-18,-62,-47,3,3,3,3,3,3,0,0,1,1,1,0,0,0,0,1,3,3,3,-57,3,0,0,0,-16,0,7,-9,-9,-9,-9,-9,-9,-9,-15,-15,-15,-15,-15,7,7,8,7,-27,7,-15,-15,-15,-15,-15,-67,-15,0,0,0,0,19,7,19,-67,-67,-27,-42,-42,-27,-42,-42,-27,-43,-43,-99,-62,0,-67,-15,-39,-62,-61,-40,-33,-61,-48,-50,-66,-62,-32,-62,-36,15,-2,-33,-3,-9,0,-3,-2,-9,-2,-10,-20,-20,-62,-41,-40,-25,0,-1,-4,0,-4,-4,-4,-6,-4,-11,0,-4,-4,5,5,-4,-1,-26,-1,-19,-11,0,-35,0,-33,-50,-66,-142,-10,0,-1,0,-1,0,-1,0,0,2,0,0,0,0,-1,0,-1,0,-9,2,5,0,0,7,0,-1,-25,-50,-45,-44,-61,-62,0,-53,-38,-70,-62,0,-25,0,-9,-21,0,-17,0,-71,-66,-1,-1,-1,-1,-1,-1,0,0,-4,-4,-4,-11,-11,-11,0,-4,5,5,5,-68,5,-1,-1,-1,-35,0,0,-10,-10,-10,-10,-10,-10,-10,-1,-1,-1,-1,-1,0,0,1,0,-6,0,-1,-1,-1,-1,-1,-62,-1,5,5,5,5,0,0,0,-62,-62,-40,-38,-64,-40,-38,-64,-34,-65,-65,-70,-71,0,-70,-10,-31,-55,-42,-15,-59,-31,-46,-69,-27,-72,-110,-72,-110,-55,0,-22,0,0,-42,1,0,20,0,0,-9,-9,-65,-30,-25,0,0,-57,0,7,0,0,0,0,0,-5,-34,0,0,12,12,0,5,4,2,10,18,-27,-4,0,-1,-69,-90,-142,-35,0,-19,-14,-19,33,-19,0,0,0,0,0,0,0,-19,0,-19,0,-19,33,5,49,50,37,47,2,0,-72,0,-40,-31,-55,0,-72,0,-85,0,0,0,0,-1,-1,0,-40,0,-46,-27,-57,-57,-57,-57,-57,-57,0,7,0,0,0,-5,-5,-5,0,0,12,12,12,-44,12,2,2,2,-4,0,0,-35,-35,-35,-35,-35,-35,-35,-19,-19,-19,-19,-19,0,0,7,0,-36,0,-19,-19,-19,-19,-19,-72,-19,5,5,5,5,47,0,47,-72,-72,-15,-25,-25,-15,-25,-25,-110,-32,-32,-85,-46,0,-51,-10,-31,-55,-42,-15,-57,-31,-46,-69,-27,-70,-108,-70,-108,-52,2,-22,0,0,-40,2,2,20,0,0,-9,-9,-64,-30,-25,0,0,-56,0,8,0,0,0,0,0,-5,-34,0,0,13,13,0,6,4,3,10,18,-27,-3,0,-1,-69,-88,-142,-34,1,-17,-13,-17,33,-17,1,0,0,1,1,1,1,-17,1,-17,1,-18,33,5,50,50,37,48,2,0,-72,-71,-40,-31,-55,0,-72,0,-84,-34,0,0,0,0,-1,0,-40,0,-46,-27,-56,-56,-56,-56,-56,-56,0,8,0,0,0,-5,-5,-5,0,0,13,13,13,0,13,3,3,3,-3,0,1,-34,-34,-34,-34,-34,-34,-33,-17,-17,-17,-17,-17,0,0,8,0,0,1,-17,-17,-17,-17,-17,-70,-17,5,5,5,5,48,1,48,-70,-70,-15,-25,-25,-15,-25,-25,-108,-32,-32,-84,-46,0,-51,-7,-33,-59,-46,-22,-52,-33,-47,-14,-30,-97,-17,-97,-17,34,-2,-9,4,-3,-36,-3,-2,17,-3,-3,-5,-5,-93,-34,-29,0,-2,25,0,0,0,0,0,-5,0,0,-25,0,0,1,1,0,0,4,-2,0,5,42,-7,17,-7,-13,-50,-142,-15,4,-29,-22,-29,24,-29,4,4,4,4,-1,4,4,-29,4,-29,4,-21,24,0,36,36,49,36,8,0,-16,-105,-50,-33,-59,0,-16,0,-103,-45,-2,0,0,-8,-2,0,-50,-13,-34,-30,25,25,25,25,25,25,0,0,0,0,0,0,0,0,0,0,1,1,1,0,1,-2,-2,-2,-7,0,4,-15,-15,-15,-15,-15,-15,-15,-29,-29,-29,-29,-29,4,4,13,4,-44,4,-29,-29,-29,-29,-29,-97,-26,0,0,0,0,36,4,36,-97,-97,-22,-28,-28,-22,-28,-28,-17,-43,-43,-103,-34,0,-63,-12,-32,-55,-42,-15,-61,-125,-62,-62,-28,-75,-9,-75,-9,46,0,-22,0,0,-48,0,0,19,0,0,-9,0,-69,-31,-26,-103,0,-59,0,4,0,0,0,0,0,-5,-35,0,0,10,10,0,3,4,0,10,18,-27,-5,0,-1,-66,-93,-102,-34,0,-21,-16,-21,-8,-21,0,0,0,0,-19,0,2,-21,0,-21,0,-17,-30,-18,48,49,37,-60,5,-103,-73,-76,-43,-32,-55,0,-73,0,-87,-35,0,-103,0,-47,-65,0,-66,0,-35,-28,-59,-59,-59,-59,-59,-59,0,4,0,0,0,-5,-5,-5,0,0,10,10,10,-45,10,0,0,0,-5,0,0,-35,-35,-35,-35,-35,-35,-35,-21,-21,-21,-21,-21,0,0,6,0,-39,0,-21,-21,-21,-21,-21,-75,-21,3,3,3,3,45,0,45,-75,-75,-15,-22,-26,-15,-22,-26,-115,-32,-32,-87,-46,0,-51,-16,-63,-68,-67,-42,-49,-63,-59,-41,-62,-77,-34,-77,-34,5,-6,-25,-4,-14,-24,-6,-6,-1,-9,-6,-13,-13,-74,-46,-40,-20,-6,0,-2,-1,-2,-2,-2,-8,-2,-6,-18,-2,-2,0,0,-2,-1,-20,-5,-12,-7,7,-30,0,-28,-41,-62,-142,-19,0,-21,-17,-21,5,-21,0,0,0,0,-8,0,0,-21,0,-21,0,-17,4,-4,7,9,13,4,0,-20,-44,-98,-66,-63,-68,0,-44,0,-99,-58,-6,-20,-41,-28,-32,0,-66,0,-70,-62,0,0,0,0,0,0,0,-1,-2,-2,-2,-6,-6,-6,0,-2,0,0,0,0,0,-5,-5,-5,-30,0,0,-19,-19,-19,-19,-19,-19,-19,-21,-21,-21,-21,-21,0,0,0,0,0,0,-21,-21,-21,-21,-21,-77,-21,-4,-4,-4,-4,4,0,4,-77,-77,-42,-58,-58,-42,-58,-58,-33,-59,-59,-99,-69,0,-70,-61,-87,0,0,-100,0,-87,-100,-41,-102,-141,-69,-141,-69,0,-64,-66,-50,-69,-76,-49,-64,-46,-64,-69,-69,-69,-141,0,0,-88,-69,-21,-42,-61,-42,-42,-42,-66,-42,-35,-67,-45,-45,-57,-57,-42,-64,-31,-48,-11,-11,-8,-11,-26,-6,-40,-90,0,-64,-33,-77,-68,-77,-54,-74,-33,-33,0,-33,-44,-54,-54,-77,-44,-74,-54,-69,-60,-71,-73,-73,-15,-78,-47,-88,-43,0,0,-87,0,0,-43,0,-137,-135,-69,-85,0,-64,-61,0,0,0,-99,-102,-21,-21,-21,-21,-21,-21,0,-61,-42,-42,-42,-35,-35,-35,0,-45,-57,-57,-57,0,-57,-48,-48,-48,-11,0,-33,-64,-64,-64,-64,-64,-64,-64,-77,0,0,0,0,-33,-33,0,-33,0,-54,0,0,0,0,0,-141,-77,-71,-71,-71,-71,-78,-33,-78,-141,-141,-100,-77,-77,-100,-77,-77,-69,0,0,-137,0,0,0,0,-78,0,0,0,0,-78,-74,-86,-98,-71,-96,-71,-96,0,0,0,0,0,0,0,0,0,0,0,-65,-65,-71,-81,0,-40,0,-59,-31,-30,-31,-31,-31,-35,-31,-52,-37,-31,-31,-26,-26,-31,-39,-63,-29,-42,-33,-50,-60,-47,0,-86,-99,0,-61,-31,-29,-29,-29,-33,-29,-31,-31,-31,-31,0,-31,-31,-29,-31,-29,-31,-32,-32,-29,0,-34,-42,0,-61,-40,-88,0,0,-78,0,0,-88,0,-83,0,0,-40,0,0,0,0,0,0,-108,-98,-59,-59,-59,-59,-59,-59,0,-30,-31,-31,-31,-52,-52,-52,0,-31,-26,-26,-26,0,-26,-29,-29,-29,-60,0,-31,-61,-61,-61,-61,-61,-61,-61,-29,0,0,0,0,-31,-31,0,-31,0,-31,0,0,0,0,0,-71,-29,-29,-29,-29,-29,0,-31,0,-71,-71,0,-88,-88,0,-88,-88,0,0,0,-83,0,0,0,-66,-94,0,0,-95,0,-94,-95,-116,-112,-78,-129,-78,-129,-89,-42,-130,-78,-80,-48,-45,-42,-107,-59,-73,-90,-90,-78,0,0,-150,0,-92,-47,-37,-47,-47,-47,-46,-47,-92,-37,-47,-47,-34,-34,-47,-69,-142,-42,-89,-74,-121,-114,-105,0,-116,0,0,-76,-41,-37,-37,-37,-58,-37,-41,-41,-41,-41,-41,-41,-41,-37,-41,-37,-41,-40,-50,-37,-60,-57,-96,-63,-91,-150,0,0,0,-94,0,0,0,0,-86,0,0,-150,0,0,0,0,0,0,-144,-112,-92,-92,-92,-92,-92,-92,0,-37,-47,-47,-47,-92,-92,-92,0,-47,-34,-34,-34,0,-34,-42,-42,-42,-114,0,-41,-76,-76,-76,-76,-76,-76,-76,-37,-37,-37,-37,-37,-41,-41,0,-41,0,-41,-37,-37,-37,-37,-37,-78,-37,-37,-37,-37,-37,-63,-41,-63,-78,-78,-95,-105,-105,-95,-105,-105,0,0,0,-86,-144,0,0,0,-77,0,0,0,0,-77,0,-57,-31,0,0,0,0,0,-24,-43,-23,-31,-21,-25,-24,-16,-27,-36,0,0,0,0,0,0,0,-14,-22,-20,-22,-22,-22,-27,-22,-21,-16,-22,-22,-16,-16,-22,-29,-26,-22,-17,-13,-10,-26,-11,0,-57,0,0,-32,-22,-25,-24,-25,-21,-25,-22,-22,3,-22,-25,-23,-23,-25,-21,-25,-23,-37,-20,-22,-15,0,0,-15,-27,0,0,0,-38,-77,0,0,0,0,-87,0,0,0,0,0,0,0,-38,0,-88,-31,-14,-14,-14,-14,-14,-14,0,-20,-22,-22,-22,-21,-21,-21,0,-22,-16,-16,-16,0,-16,-22,-22,-22,-26,0,-22,-32,-32,-32,-32,-32,-32,-32,-25,-25,-25,-25,-25,-21,-21,0,-22,0,-23,-25,-25,-25,-25,-25,0,-25,-22,-22,-22,-22,-15,-22,-15,0,0,0,-73,-73,0,-73,-73,0,0,0,-87,-88,0,0,-92,-118,0,0,0,0,-118,0,-127,0,-116,-114,-116,-114,-93,-73,-111,-78,-77,-58,-76,-73,-66,-73,-80,-95,-95,-116,0,0,-85,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,-127,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,-85,0,0,-98,-118,0,0,0,0,0,0,0,-85,0,-81,-90,0,-98,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,-116,0,0,0,0,0,0,0,0,-116,-116,0,0,0,0,0,0,0,0,0,0,-128,0,0,-82,-116,0,0,0,0,-116,0,-94,0,-179,-93,-179,-93,-43,-85,-79,-73,-87,-83,-81,-85,-66,-86,-88,-88,-88,-179,0,0,-84,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,-94,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,-84,0,0,-106,-116,0,0,0,0,0,0,0,-84,0,-88,-81,0,-106,0,-123,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,-179,0,0,0,0,0,0,0,0,-179,-179,0,-106,-106,0,-106,-106,0,0,0,0,0,0,0,-91,-105,0,0,0,0,-105,0,-94,0,-158,-145,-158,-145,-113,-96,-108,-100,-102,-109,-76,-96,-80,-96,-109,-125,-125,-158,0,0,-109,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,-94,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,-109,0,0,-94,-105,0,0,0,0,0,0,0,-109,0,-97,-98,0,-94,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,-158,0,0,0,0,0,0,0,0,-158,-158,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,-44,-71,-48,-61,-54,-42,-44,-50,-51,-53,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,-24,-76,0,0,-48,0,-65,-63,-64,-64,-58,-54,-58,-54,-21,-3,-53,-17,-5,0,-8,-3,-41,-5,-24,-32,-32,-58,0,0,-28,0,-56,-5,0,-5,-5,-5,-5,-5,-40,-9,-5,-8,1,1,-5,-10,-42,0,-21,-11,12,-48,-36,0,-76,0,-124,-26,0,-3,-2,-3,-1,-3,0,-1,0,0,0,-33,-12,-3,0,-3,-1,-13,0,0,0,0,-7,0,-32,-21,0,0,-50,-65,0,0,0,0,-67,0,0,-21,0,-26,-28,0,-50,0,-75,-64,-24,-24,-24,-24,-24,-24,0,4,-3,-3,-3,-25,-25,-25,0,-3,9,9,9,0,9,0,0,0,-48,0,0,-26,-26,-26,-26,-26,-26,-26,-3,0,0,0,0,-1,-1,0,-1,0,-1,0,0,0,0,0,-58,-3,0,0,0,0,0,0,0,-58,-58,-48,-66,-65,-48,-66,-65,0,0,0,-67,-75,0,-83,0,-71,0,0,-56,0,-71,0,-72,-79,-77,-131,-77,-131,-77,0,0,0,0,0,0,0,0,0,0,-50,-50,-77,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,-71,0,0,0,0,0,0,0,0,0,0,0,0,0,0,-96,-79,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,-77,0,0,0,0,0,0,0,0,-77,-77,-56,-71,-71,-56,-71,-71,0,0,0,0,0,0,0,-90,-114,-121,-114,-103,-113,-114,-114,-96,-104,-151,-98,-151,-98,-49,-77,-96,-77,-78,-97,-77,-77,-63,-78,-78,-88,-88,-148,-111,0,-74,-75,-50,-74,-74,-74,-74,-74,-80,-74,-80,-90,-74,-74,-70,-70,-74,-75,-65,-77,-71,-65,-45,-83,-62,-83,-96,-111,0,-88,-71,-90,-85,-90,-58,-90,-71,-72,-63,-71,-76,-71,-71,-90,-71,-90,-71,-93,-58,-73,-46,-46,-34,-46,-72,-108,-98,-156,-89,-125,-118,0,-104,-108,-167,-115,-75,-95,0,-83,-75,0,-108,0,-112,-92,-50,-50,-50,-50,-50,-50,-53,-74,-74,-74,-74,-80,-80,-80,-70,-74,-70,-70,-70,-119,-69,-77,-77,-77,-83,0,-71,-88,-88,-88,-88,-88,-88,-88,-90,-90,-90,-90,-90,-72,-72,-52,-72,-80,-71,-90,-90,-90,-90,-90,-151,-90,-73,-73,-73,-73,-46,-71,-46,-151,-151,-103,-103,-103,-103,-103,-103,-98,-126,-126,-167,-112,-121,-108,0,0,0,0,0,0,0,-86,-105,0,0,0,-93,0,0,-36,-91,-55,-50,-34,-40,-36,-47,-41,-54,0,0,0,0,0,0,0,-69,-40,-33,-40,-40,-40,-39,-40,-68,-28,-40,-40,-28,-28,-40,-43,-69,0,-68,-62,-82,-89,-59,0,0,0,0,-58,-35,-36,-34,-36,-33,-36,-35,-35,-35,-35,-35,-35,-35,-36,-35,-36,-35,-53,-33,0,-35,-35,-44,-36,-62,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,-69,-69,-69,-69,-69,-69,0,-33,-40,-40,-40,-68,-68,-68,0,-40,-28,-28,-28,0,-28,0,0,0,-89,0,-35,-58,-58,-58,-58,-58,-58,-58,-36,0,0,0,0,-35,-35,0,-35,0,-35,0,0,0,0,0,0,-36,0,0,0,0,-36,-35,-36,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,-52,-73,0,0,-54,0,-73,0,-83,-79,-90,-180,-90,-180,-102,-24,-70,-45,-41,-89,-22,-24,-15,-34,-29,-47,-47,-90,0,0,-32,-34,-105,-27,-19,-27,-27,-27,-28,-27,-50,-83,-27,-27,-15,-15,-27,-24,-32,-22,-30,-21,-65,-42,-42,0,-83,0,0,-75,-25,-45,-44,-45,-11,-45,-25,-29,-29,-25,-25,-28,-28,-45,-28,-45,-28,-44,-11,-24,-8,0,-14,-8,-35,-32,0,0,-71,-61,0,0,0,0,-111,0,-34,-32,0,-45,-40,0,-71,0,-95,-79,-105,-105,-105,-105,-105,-105,0,-19,-27,-27,-27,-50,-50,-50,0,-27,-15,-15,-15,0,-15,-22,-22,-22,-42,0,-25,-75,-75,-75,-75,-75,-75,-75,-45,0,0,0,0,-29,-29,0,-29,0,-28,0,0,0,0,0,-90,-45,-24,-24,-24,-24,-8,-25,-8,-90,-90,-54,-72,-54,-54,-72,-54,0,0,0,-111,-94,0,0,-62,-102,-114,-95,-85,0,-80,-93,-88,-39,-105,-87,-101,-87,-88,-52,-76,-58,-43,-57,-52,-52,-52,-43,-46,-83,-83,-105,-72,0,-61,-9,-43,-46,-47,-46,-46,-46,-56,-46,-60,-52,-46,-46,-33,-33,-46,-60,-63,-42,-83,-61,-35,-85,-38,0,-88,0,0,-61,-41,-61,-54,-61,-40,-56,-41,-41,-41,-41,-51,-41,-41,-56,-41,-56,-41,-53,-33,-39,-45,-30,-36,-32,-48,-61,0,0,-66,-101,-114,-144,0,0,0,0,-9,-61,-91,-61,-53,0,-66,0,0,-39,-64,-64,-64,-64,-64,-64,0,-38,-46,-46,-46,-66,-66,-66,0,-46,-33,-33,-33,0,-33,-42,-42,-42,-85,0,-41,-54,-54,-54,-54,-54,-54,-54,-56,0,0,0,0,-41,-41,0,-41,0,-41,0,0,0,0,0,-105,-56,-39,-39,-39,-39,-32,-41,-32,-105,-105,-85,-98,-98,-85,-98,-98,0,0,0,0,-21,-101,0,-27,-59,0,0,0,0,-59,-58,-62,0,-58,-77,-58,-77,-39,0,0,0,0,0,0,0,0,0,0,-42,-42,-58,-59,0,-17,0,-45,-4,0,-4,-4,-4,-7,-4,-22,0,-6,-6,0,0,-4,-12,-9,0,0,0,-29,-9,-15,0,-62,0,0,-21,0,-12,-12,-12,0,-12,0,-7,0,0,0,-7,-7,-12,-7,-12,-7,-29,3,-5,0,0,0,0,0,-17,-63,0,-29,-59,0,0,-63,0,-61,0,0,-17,0,-8,-11,0,-29,0,-79,0,-45,-45,-45,-45,-45,-45,0,0,-4,-4,-4,-22,-22,-22,0,-6,0,0,0,0,0,0,0,0,-9,0,0,-21,-21,-21,-21,-21,-21,-21,-12,0,0,0,0,-2,-2,0,-7,0,-7,0,0,0,0,0,-58,-12,-5,-5,-5,-5,0,0,0,-58,-58,0,-53,-53,0,-53,-53,0,0,0,-61,-79,0,0,-28,-56,0,0,-52,0,-56,-61,-60,0,-63,-128,-63,-128,-77,0,0,0,0,0,0,0,0,0,0,-47,-47,-63,-66,0,-21,0,-78,-10,-5,-10,-10,-10,-11,-10,-26,0,-10,-10,0,0,-10,-18,-10,-2,-2,0,-31,-11,-20,0,-60,0,0,-55,-5,-21,-20,-21,0,-21,-5,-11,0,-5,-5,-10,-10,-21,-10,-21,-10,-22,0,0,0,0,0,0,-27,-21,-62,0,-52,-56,0,0,-62,0,-78,0,0,-21,-65,-12,-14,0,-52,0,-83,0,-78,-78,-78,-78,-78,-78,0,-5,-10,-10,-10,-26,-26,-26,0,-10,0,0,0,-72,0,-2,-2,-2,-11,0,-5,-55,-55,-55,-55,-55,-55,-55,-21,0,0,0,0,-8,-8,0,-11,0,-10,0,0,0,0,0,-63,-21,0,0,0,0,0,-5,0,-63,-63,-52,-57,-57,-52,-57,-57,0,0,0,-78,-83,0,0,-1,-61,0,0,0,0,-27,0,-49,0,-62,-142,-62,-143,-65,2,-23,-12,-9,-53,12,2,13,0,0,-23,-23,-62,0,0,-7,0,-1,-4,0,-4,0,-4,0,-4,0,0,-4,-4,5,0,0,-1,-26,0,-21,-11,0,0,0,0,0,0,0,-10,0,-1,0,-1,0,-1,0,0,0,0,0,0,0,-1,0,0,0,-9,2,0,0,0,7,0,0,-7,0,0,-22,-27,0,0,0,0,0,0,0,-7,0,-1,-21,0,-22,0,-71,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,-62,0,0,0,0,0,0,0,0,-62,-62,0,-64,-64,0,-64,-64,0,0,0,0,0,0,0,-59,-96,0,0,0,0,-96,0,-101,0,-78,-87,-78,-87,-63,0,0,0,0,0,0,0,0,0,0,-83,-83,-78,0,0,-90,0,-69,-34,-32,-34,-34,-34,-38,-34,-66,0,-34,-34,-27,-27,-34,-54,-70,-32,-52,-45,-67,-59,-63,0,0,0,0,0,-34,-31,0,-31,-46,-31,-34,-36,0,-34,0,-35,-35,-31,-35,-31,-35,-53,-42,0,0,-51,-63,0,0,-90,0,0,-54,-96,0,0,0,0,-82,0,0,-90,0,-32,-46,0,-54,0,-126,0,-69,-69,-69,-69,-69,-69,0,-32,-34,-34,-34,-66,-66,-66,0,-34,-27,-27,-27,0,-27,-32,-32,-32,-59,0,-34,0,0,0,0,0,0,0,-31,0,0,0,0,-36,-36,0,-36,0,-35,0,0,0,0,0,-78,-31,0,0,0,0,0,-34,0,-78,-78,0,-102,-102,0,-102,-102,0,0,0,-82,-126,0,0,0,-71,0,0,-56,0,-71,0,-75,-79,-90,-131,-90,-131,-77,0,0,0,0,0,0,0,0,0,0,-50,-50,-90,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,-71,0,0,0,0,0,0,0,0,0,0,0,0,0,0,-96,-79,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,-90,0,0,0,0,0,0,0,0,-90,-90,-56,-71,-71,-56,-71,-71,0,0,0,0,0,0,0,-92,-124,-110,-121,-128,-94,-124,-110,-132,-136,-103,-121,-103,-121,-91,-71,-122,-83,-82,-47,-77,-71,-120,-73,-88,-119,-119,-103,-109,-110,-144,-67,-95,-74,-67,-74,-74,-74,-73,-74,-103,-55,-74,-74,-64,-64,-74,-78,-156,-70,-111,-98,-115,-136,-94,-122,-131,0,0,-79,-70,-67,-67,-67,-81,-67,-70,-70,-70,-70,-70,-70,-70,-67,-70,-67,-70,-76,-76,-67,-87,-85,-101,-90,-102,-83,-137,-88,-87,-124,-110,0,-105,0,-106,-123,-67,-144,0,-67,-69,0,-89,0,-167,-83,-95,-95,-95,-95,-95,-95,-107,-67,-74,-74,-74,-103,-103,-103,-48,-74,-64,-64,-64,0,-64,-70,-70,-70,-136,0,-70,-79,-79,-79,-79,-79,-79,-77,-67,-67,-67,-67,-67,-70,-70,-70,-70,-67,-70,-67,-67,-67,-67,-67,-103,-67,-67,-67,-67,-67,-90,-70,-90,-103,-103,-122,-135,-125,-122,-135,-125,-121,-125,-125,-106,-166,-103,-148,0,-166,0,0,-159,0,-166,0,-55,-16,0,0,0,0,0,-35,-39,-21,-33,-16,-34,-35,-115,-35,-35,0,0,0,0,0,0,0,-9,-24,-30,-24,-24,-24,-37,-24,-18,-14,-24,-24,-25,-25,-24,-28,-118,-34,-106,-91,-9,-114,-7,0,-55,0,0,-20,-23,-31,-27,-31,-36,-31,-23,-23,-19,-23,-31,-23,-23,-31,-23,-31,-23,-25,-42,-31,-86,-83,-11,-93,-20,0,0,0,-42,-166,0,0,0,0,-106,0,0,0,0,0,0,0,-42,0,-93,-16,-9,-9,-9,-9,-9,-9,0,-30,-24,-24,-24,-18,-18,-18,0,-24,-25,-25,-25,0,-25,-34,-34,-34,-114,0,-23,-20,-20,-20,-20,-20,-20,-20,-31,0,0,0,0,-23,-23,0,-23,0,-23,0,0,0,0,0,0,-31,-31,-31,-31,-31,-93,-23,-93,0,0,-159,-163,-163,-159,-163,-163,0,0,0,-106,-92,0,0,-20,-130,-74,-87,-130,-52,-130,-69,-19,-141,-107,-15,-107,-15,35,-27,-12,-2,-27,-8,-28,-26,-84,-29,-31,-15,-15,-110,-66,-62,-108,-27,23,-3,-22,-3,-3,-3,-30,-3,0,-7,-3,-3,-17,-17,-3,-23,-90,-25,-64,-59,31,-90,20,-104,-19,-45,-142,-14,-1,-34,-29,-34,-12,-34,-1,-2,0,-1,-28,-1,-1,-34,-1,-34,-1,-25,-38,-29,-61,-59,25,-63,0,-111,-21,-87,-82,-130,-74,0,-21,-86,-98,-135,-27,-111,-43,-61,-81,0,-82,-83,-51,-141,23,23,23,23,23,23,17,-22,-3,-3,-3,0,0,0,0,-3,-17,-17,-17,-85,-9,-25,-25,-25,-90,-1,-1,-14,-14,-14,-14,-14,-14,-14,-34,-34,-34,-34,-34,-2,-2,-2,-2,-35,-1,-34,-34,-34,-34,-34,-107,-34,-27,-27,-27,-27,-63,-1,-63,-107,-107,-130,-140,-140,-130,-140,-140,-15,-138,-138,-98,-51,0,-129,-20,-130,-74,-87,-130,-52,-130,-69,-19,-141,-107,-15,-107,-15,35,-27,-12,-2,-27,-8,-28,-26,-84,-29,-31,-15,-15,-110,-66,-62,-110,-27,23,-3,-22,-3,-3,-3,-30,-3,0,-7,-3,-3,-17,-17,-3,-23,-90,-25,-68,-59,31,-88,20,-104,-19,-45,-142,-14,-1,-34,-29,-34,-12,-34,-1,-2,0,-1,-28,-1,-1,-34,-1,-34,-1,-25,-38,-29,-61,-59,25,-63,0,-110,-21,-87,-82,-130,-74,0,-21,-86,-98,-135,-27,-110,-43,-61,-81,0,-82,-83,-51,-141,23,23,23,23,23,23,17,-22,-3,-3,-3,0,0,0,0,-3,-17,-17,-17,-85,-9,-25,-25,-25,-88,-1,-1,-14,-14,-14,-14,-14,-14,-14,-34,-34,-34,-34,-34,-2,-2,-2,-2,-35,-1,-34,-34,-34,-34,-34,-107,-34,-27,-27,-27,-27,-63,-1,-63,-107,-107,-130,-140,-140,-130,-140,-140,-15,-138,-138,-98,-51,0,-129,-20,-130,-74,-87,-130,-52,-130,-69,-19,-141,-107,-15,-107,-15,35,-27,-12,-2,-27,-8,-28,-26,-84,-29,-31,-15,-15,-110,-66,-62,-108,-27,23,-3,-22,-3,-3,-3,-30,-3,0,-7,-3,-3,-17,-17,-3,-23,-88,-25,-64,-59,31,-83,20,-104,-19,-45,-142,-14,-1,-34,-29,-34,-12,-34,-1,-2,0,-1,-28,-1,-1,-34,-1,-34,-1,-25,-38,-29,-61,-59,25,-63,0,-111,-21,-87,-82,-130,-74,0,-21,-86,-98,-135,-27,-111,-43,-61,-81,0,-82,-83,-51,-141,23,23,23,23,23,23,17,-22,-3,-3,-3,0,0,0,0,-3,-17,-17,-17,-85,-9,-25,-25,-25,-83,-1,-1,-14,-14,-14,-14,-14,-14,-14,-34,-34,-34,-34,-34,-2,-2,-2,-2,-35,-1,-34,-34,-34,-34,-34,-107,-34,-27,-27,-27,-27,-63,-1,-63,-107,-107,-130,-140,-140,-130,-140,-140,-15,-138,-138,-98,-51,0,-129,0,-29,0,0,-36,0,-29,-40,-17,0,-85,-13,-85,-13,19,0,0,0,0,0,0,0,0,0,0,-8,-8,-85,0,0,-8,0,19,14,5,14,14,14,0,14,21,0,12,12,10,10,14,6,28,13,36,38,37,24,31,0,-17,0,0,0,18,-9,-5,-9,12,-9,18,18,0,18,10,10,10,-9,10,-9,10,-11,18,0,6,8,27,0,0,-8,0,0,-24,-29,0,0,0,0,-73,0,0,-8,0,-10,-9,0,-24,0,-62,0,19,19,19,19,19,19,10,5,14,14,14,21,21,21,14,12,10,10,10,0,10,13,13,13,24,20,18,0,0,0,0,0,0,0,-9,-9,-9,-9,-9,18,18,0,18,-11,10,-9,-9,-9,-9,-9,-85,-9,0,0,0,0,0,18,0,-85,-85,-36,-19,-19,-36,-19,-19,0,-50,-50,-73,-61,0,0,-19,-58,-65,-69,-51,-50,-58,-59,-32,-61,-99,-24,-106,-31,11,-9,-16,-6,-5,-17,0,-9,0,-7,-13,-25,-23,-100,-51,-39,-28,-17,1,-3,-10,-3,-3,-3,-18,-3,4,-13,-3,-3,-5,-5,-3,-11,6,-5,18,18,19,5,15,0,-31,-64,-142,-22,22,-36,-30,-36,-11,-36,22,-4,51,22,-7,-11,-11,-36,-5,-36,-11,-27,-14,-24,-5,-5,0,-6,-9,-18,-33,-72,-37,-47,-65,0,-33,-57,-103,-70,-17,-18,0,-25,-21,0,-37,-37,-80,-61,1,1,1,1,1,1,0,-10,-3,-3,-1,8,4,4,-1,-3,-5,-5,-5,-68,-5,-5,-5,-5,8,2,22,-13,-13,-13,-13,-13,-13,-13,-36,-21,-21,-36,-21,1,1,48,42,-22,-4,-21,-21,-21,-21,-21,-99,-21,-10,-10,-10,-10,-6,22,-6,-106,-106,-63,-40,-35,-63,-40,-35,-31,-65,-65,-103,-80,0,-25,-19,-58,-65,-69,-51,-50,-58,-59,-32,-61,-99,-24,-106,-31,11,-9,-16,-6,-5,-17,0,-9,0,-7,-13,-25,-23,-100,-51,-39,-28,-17,1,-3,-10,-3,-3,-3,-18,-3,4,-13,-3,-3,-5,-5,-3,-11,6,-5,18,18,19,5,15,0,-31,-64,-142,-22,22,-36,-30,-36,-11,-36,22,-4,2,22,-7,-11,-11,-36,-5,-36,-11,-27,-14,-24,-5,-5,0,-6,-9,-18,-33,-72,-37,-47,-65,0,-33,-57,-103,-70,-17,-18,0,-25,-21,0,-37,-37,-80,-61,1,1,1,1,1,1,0,-10,-3,-3,-1,8,4,4,-1,-3,-5,-5,-5,-68,-5,-5,-5,-5,8,2,22,-13,-13,-13,-13,-13,-13,-13,-36,-21,-21,-36,-21,1,1,48,42,-22,-4,-21,-21,-21,-21,-21,-99,-21,-10,-10,-10,-10,-6,22,-6,-106,-106,-63,-40,-35,-63,-40,-35,-31,-65,-65,-103,-80,0,-25,-19,-55,-69,-67,-63,-50,-55,-59,-30,-63,-106,-31,-106,-31,7,-16,-17,-6,-16,-17,-5,-16,-4,-16,-16,-25,-25,-106,-66,-64,-28,-25,0,0,-10,0,0,0,-18,0,3,-8,-1,-1,-5,-5,0,-11,6,0,17,18,19,5,15,0,-30,-64,-142,-22,0,-36,-30,-36,-11,-36,0,-1,11,0,-4,-11,-11,-36,-11,-36,-11,-27,-14,-24,-5,-5,0,-6,-9,-28,-35,-95,-38,-58,-69,0,-35,-58,-103,-88,-25,-28,0,-25,-22,0,-38,-47,-80,-63,0,0,0,0,0,0,0,-10,0,0,0,32,6,21,-2,-1,-5,-5,-5,-71,-5,0,0,-5,5,0,-6,-21,-22,-21,-22,-21,-22,-22,-36,-36,-36,-36,-36,21,21,47,71,-37,-11,-36,-36,-36,-36,-36,-106,-36,-24,-24,-24,-24,-6,0,-6,-106,-106,-63,-40,-40,-63,-40,-40,-31,-88,-88,-103,-80,0,-26,-19,-58,-65,-69,-51,-50,-58,-59,-25,-61,-99,-31,-106,-31,11,-9,-16,-6,-5,-17,0,-9,0,-7,-13,-25,-25,-100,-51,-39,-28,-17,1,-3,-10,-3,-3,-3,-18,-3,4,-13,-3,-3,-5,-5,-3,-11,6,-5,18,18,19,5,15,0,-25,-64,-142,-22,22,-36,-30,-36,-11,-36,22,-4,51,22,0,-11,-11,-36,-11,-36,-11,-27,-14,-24,-5,-5,0,-6,-9,-18,-33,-72,-37,-47,-65,0,-33,-57,-103,-70,-17,-18,0,-25,-21,0,-37,-37,-80,-61,1,1,1,1,1,1,0,-10,-3,-3,-1,8,4,4,-1,-3,-5,-5,-5,-68,-5,-5,-5,-5,8,2,22,-13,-13,-13,-13,-13,-13,-13,-36,-21,-21,-36,-21,1,1,48,42,-22,-11,-21,-21,-21,-21,-21,-99,-21,-10,-10,-10,-10,-6,22,-6,-106,-106,-63,-40,-35,-63,-40,-35,-31,-65,-65,-103,-80,0,-25,-19,-55,-69,-67,-63,-50,-55,-59,-20,-63,-106,-31,-106,-31,7,-16,-17,-6,-16,-17,-5,-16,-4,-16,-16,-25,-25,-106,-66,-64,-28,-25,0,0,-10,0,0,0,-18,0,28,-8,-1,-1,-5,-5,0,-11,6,0,17,18,19,5,15,0,-20,-64,-142,-22,0,-36,-30,-36,-11,-36,0,-1,11,0,-4,-11,-11,-36,-11,-36,-11,-27,-14,-24,-5,-5,0,-6,-9,-28,-35,-95,-38,-58,-69,0,-35,-58,-103,-88,-25,-28,0,-25,-22,0,-38,-47,-80,-63,0,0,0,0,0,0,0,-10,0,0,0,28,28,49,-2,-1,-5,-5,-5,-71,-5,0,0,-5,5,0,-6,-21,-22,-21,-22,-21,-22,-22,-36,-36,-36,-36,-36,21,21,47,71,-37,-11,-36,-36,-36,-36,-36,-106,-36,-24,-24,-24,-24,-6,0,-6,-106,-106,-63,-40,-40,-63,-40,-40,-31,-88,-88,-103,-80,0,-26,-20,-54,0,0,-33,0,-54,-50,-56,0,-54,-55,-54,-55,-19,0,-41,0,0,0,0,0,0,0,0,-24,-24,-54,0,0,-20,0,-15,-2,5,-2,-2,-2,-1,-2,-9,10,-2,-2,11,11,-2,0,-14,1,-1,4,-15,-18,0,0,-56,0,0,-12,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,-6,9,4,0,6,0,0,0,-20,0,0,-37,-54,0,0,0,0,-67,0,0,-20,0,-4,-15,0,-37,0,-74,0,-15,-15,-15,-15,-15,-15,-31,5,-2,-2,-2,-9,-9,-9,9,-2,11,11,11,0,11,1,1,1,-18,2,0,-12,-12,-12,-12,-12,-12,-12,0,0,0,0,0,0,0,0,0,-3,0,0,0,0,0,0,-54,0,4,4,4,4,0,0,0,-54,-54,-33,-61,-61,-33,-61,-61,-54,-62,-62,-67,0,0,0,-16,-50,-53,-53,-28,-27,-50,-47,-52,-60,-49,-30,-49,-30,0,4,-37,0,1,6,3,1,0,1,0,-14,-14,-49,-44,-37,-15,9,-10,0,10,0,0,0,1,0,-6,15,0,0,15,15,0,4,-8,5,3,8,-9,-15,2,-21,-52,-61,-9,-8,4,1,1,1,9,1,4,4,18,4,4,4,4,1,4,1,4,-3,14,9,10,11,1,8,-1,-16,-43,-38,-34,-50,-53,0,-57,-28,-66,-54,9,-16,-42,-2,-11,0,-32,-19,-69,-60,-6,-10,-6,-6,-6,-10,-23,10,0,0,0,9,-6,-6,14,0,15,15,15,-65,15,5,5,5,-15,6,4,-8,-8,-8,-8,-8,-8,-8,1,1,1,1,1,4,4,14,11,-1,4,1,1,1,1,1,-49,1,9,9,9,9,7,4,8,-49,-49,-28,-56,-56,-28,-56,-56,-30,-59,-59,-66,-68,0,-64,-86,-111,0,0,-102,0,-111,-107,-115,0,-119,-103,-134,-103,-79,-67,-94,-70,-68,-58,-69,-67,-58,-69,-71,-90,-90,-119,0,0,-73,0,-83,-69,-64,-69,-69,-69,-69,-69,-71,-57,-69,-69,-59,-59,-69,-66,-79,-66,-81,-69,-85,-95,-63,0,-104,0,0,-67,-65,-69,-68,-69,-51,-69,-65,-68,0,-65,-67,-68,-68,-69,-68,-69,-68,-70,-51,0,-45,-44,0,-46,-70,-73,0,0,-99,-111,0,0,0,0,-121,0,0,-73,0,-80,-79,0,-99,0,-122,0,-83,-83,-83,-83,-83,-83,0,-64,-69,-69,-69,-71,-71,-71,0,-69,-59,-59,-59,0,-59,-66,-66,-66,-95,0,-65,-67,-67,-67,-67,-67,-67,-67,-69,0,0,0,0,-68,-68,0,-68,0,-68,0,0,0,0,0,-119,-69,0,0,0,0,-46,-65,-46,-119,-119,-102,-106,-106,-98,-106,-106,0,0,0,-121,-122,0,0,-16,-50,-53,-53,-28,-27,-50,-47,-52,-60,-49,-30,-49,-30,0,4,-37,0,1,6,3,1,0,1,0,-14,-14,-49,-44,-37,-15,9,-10,0,10,0,0,0,1,0,-6,15,0,0,15,15,0,4,-8,5,3,8,-9,-6,2,-21,-52,-61,-9,-8,4,1,1,1,9,1,4,4,18,4,4,4,4,1,4,1,4,-3,14,9,10,11,1,8,-1,-16,-43,-38,-34,-50,-53,0,-57,-28,-66,-54,9,-16,-42,-2,-11,0,-32,-19,-69,-60,-6,-10,-6,-6,-6,-10,-23,10,0,0,0,9,-6,-6,14,0,15,15,15,-65,15,5,5,5,-6,6,4,-8,-8,-8,-8,-8,-8,-8,1,1,1,1,1,4,4,14,11,-1,4,1,1,1,1,1,-49,1,9,9,9,9,7,4,8,-49,-49,-28,-56,-56,-28,-56,-56,-30,-59,-59,-66,-68,0,-64,-9,-20,-94,-80,-53,-84,-20,-62,-10,-52,-124,-152,-124,-152,-90,-23,-14,-24,-22,-92,1,-23,13,-23,-23,-58,-58,-121,-86,-75,-21,-50,-79,0,-20,0,0,0,-26,0,5,-27,0,0,-15,-15,0,-21,25,2,51,55,35,48,12,38,-10,-136,-146,-83,0,-79,-77,-79,-1,-79,0,0,0,0,0,-37,-37,-79,-37,-79,-37,-77,-6,-33,-6,-5,-8,-6,-35,-21,-11,-127,-8,-20,-94,0,-11,0,-138,-90,-50,-21,0,-12,-7,0,-8,0,-84,-52,-79,-79,-79,-79,-79,-79,-106,-20,0,0,0,5,6,5,0,0,-15,-15,-15,-96,-15,2,2,2,48,4,0,-75,-75,-57,-83,-41,-75,-83,-78,-45,-45,-45,-45,37,7,83,0,-82,-36,-45,-45,-45,-45,-45,-124,-78,-33,-33,-31,-30,-6,0,-6,-124,-124,-54,-13,-13,-54,-13,-13,-152,-87,-87,-138,-84,0,0,-36,-83,0,0,-87,0,-83,-59,-62,0,-53,-50,-66,-50,-21,0,0,0,0,0,0,0,0,0,0,-50,-50,-53,0,0,-62,0,-20,-5,0,-5,-5,-5,-4,-5,-21,8,-5,-5,0,0,-5,-11,-22,-2,-8,-4,0,-14,-1,0,-61,0,0,-13,-5,-4,0,-4,0,-4,-5,-6,-6,-5,0,-5,-10,-4,-5,-4,-5,-17,0,-2,-8,0,0,-9,0,-48,0,0,-45,-70,0,0,0,0,-68,0,0,-48,0,-21,-29,0,-39,0,-97,0,-57,-57,-57,-57,-20,-57,-76,0,-5,-5,-5,-44,-44,-44,2,-5,5,5,0,0,5,-2,-2,-2,-60,-1,-5,-31,-31,-31,-31,-31,-31,-30,-4,-4,-4,-4,-4,-6,-6,0,-6,0,-5,-4,-4,-4,-4,-4,-53,-4,-2,-2,-2,-2,-9,-5,-9,-66,-53,-87,-76,-76,-87,-82,-76,0,-68,-68,-68,-96,0,0,-31,-77,0,0,-76,0,-77,-56,-61,0,-58,-44,-58,-44,-14,0,0,0,0,0,0,0,0,0,0,-43,-43,-58,0,0,-64,0,-21,-4,0,-4,-4,-4,0,-4,0,13,-4,-4,0,0,-4,-15,0,0,0,0,0,0,0,0,-61,0,0,-10,0,0,0,0,-12,0,0,0,0,0,0,0,0,0,0,0,0,-17,-7,0,-23,-21,0,-26,-23,-64,0,0,-32,-77,0,0,0,0,-62,0,0,-64,0,-11,-19,0,-32,0,-84,0,-21,-21,-21,-21,-21,-21,0,0,-4,-4,-4,0,0,0,0,-4,0,0,0,0,0,0,0,0,0,0,0,-10,-10,-10,-10,-10,-10,-10,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,-58,0,0,0,0,0,-26,0,-26,-58,-58,-76,-84,-84,-76,-84,-84,0,-100,-100,-62,-84,0,0,-23,-74,-63,-67,-62,-29,-74,-54,-37,-99,-58,-32,-58,-32,7,-1,-29,-3,-19,0,-8,-2,-41,-8,-22,-29,-29,-58,-48,-51,-65,0,0,-2,0,-2,-2,-2,-5,-2,-11,4,-2,-2,1,1,-2,-11,-80,0,-47,-32,2,-61,0,-61,-36,-64,-5,-7,0,0,0,0,-5,0,0,0,25,0,-1,0,0,0,0,0,0,-9,0,0,-17,-16,0,-21,-8,-67,-41,-41,-40,-76,-63,0,-49,-42,-67,-67,0,-67,-42,-9,-23,0,-40,-48,-73,-99,0,0,0,0,0,0,-2,0,-2,-2,-2,-11,-11,-11,0,-2,1,1,1,-68,1,0,0,0,-74,0,0,-7,-7,-7,-7,-7,-7,-6,0,0,0,0,0,0,0,0,0,-3,0,0,0,0,0,0,-58,0,0,0,0,0,-21,0,-21,-58,-58,-62,-82,-83,-62,-82,-83,-29,-88,-88,-67,-73,0,-100,-23,-74,-63,-67,-62,-29,-74,-54,-37,-99,-58,-32,-58,-32,7,-1,-29,-3,-19,0,-8,-2,-41,-8,-22,-29,-29,-58,-48,-51,-65,0,0,-2,0,-2,-2,-2,-5,-2,-11,4,-2,-2,1,1,-2,-11,-78,0,-30,-32,2,-61,0,-61,-36,-64,-5,-7,0,0,0,0,-5,0,0,0,25,0,-1,0,0,0,0,0,0,-9,0,0,-17,-16,0,-21,-8,-67,-41,-41,-40,-76,-63,0,-49,-42,-67,-67,0,-67,-42,-9,-23,0,-40,-48,-73,-99,0,0,0,0,0,0,-2,0,-2,-2,-2,-11,-11,-11,0,-2,1,1,1,-68,1,0,0,0,-74,0,0,-7,-7,-7,-7,-7,-7,-6,0,0,0,0,0,0,0,0,0,-3,0,0,0,0,0,0,-58,0,0,0,0,0,-21,0,-21,-58,-58,-62,-82,-83,-62,-82,-83,-29,-88,-88,-67,-73,0,-100,-23,-74,-63,-67,-62,-29,-74,-54,-37,-99,-58,-32,-58,-32,7,-1,-29,-3,-19,0,-8,-2,-41,-8,-22,-29,-29,-58,-48,-51,-65,0,0,-2,0,-2,-2,-2,-5,-2,-11,4,-2,-2,1,1,-2,-11,-67,0,-30,-32,2,-61,0,-61,-36,-64,-5,-7,0,0,0,0,-5,0,0,0,25,0,-1,0,0,0,0,0,0,-9,0,0,-17,-16,0,-21,-8,-67,-41,-41,-40,-76,-63,0,-49,-42,-67,-67,0,-67,-42,-9,-23,0,-40,-48,-73,-99,0,0,0,0,0,0,-2,0,-2,-2,-2,-11,-11,-11,0,-2,1,1,1,-68,1,0,0,0,-74,0,0,-7,-7,-7,-7,-7,-7,-6,0,0,0,0,0,0,0,0,0,-3,0,0,0,0,0,0,-58,0,0,0,0,0,-21,0,-21,-58,-58,-62,-80,-80,-62,-80,-80,-29,-88,-88,-67,-73,0,-100,-23,-74,-63,-67,-62,-29,-74,-54,-37,-99,-58,-32,-58,-32,7,-1,-29,-3,-19,0,-8,-2,-41,-8,-22,-29,-29,-58,-48,-51,-65,0,0,-2,0,-2,-2,-2,-5,-2,-11,4,-2,-2,1,1,-2,-11,-85,0,-30,-32,2,-61,0,-61,-36,-64,-5,-7,0,0,0,0,-5,0,0,0,25,0,-1,0,0,0,0,0,0,-9,0,0,-17,-16,0,-21,-8,-67,-41,-41,-40,-76,-63,0,-49,-42,-67,-67,0,-67,-42,-9,-23,0,-40,-48,-73,-99,0,0,0,0,0,0,-2,0,-2,-2,-2,-11,-11,-11,0,-2,1,1,1,-68,1,0,0,0,-74,0,0,-7,-7,-7,-7,-7,-7,-6,0,0,0,0,0,0,0,0,0,-3,0,0,0,0,0,0,-58,0,0,0,0,0,-21,0,-21,-58,-58,-62,-82,-83,-62,-82,-83,-29,-88,-88,-67,-73,0,-100,-23,-74,-63,-67,-62,-29,-74,-54,-37,-99,-58,-32,-58,-32,7,-1,-29,-3,-19,0,-8,-2,-41,-8,-22,-29,-29,-58,-48,-51,-65,0,0,-2,0,-2,-2,-2,-5,-2,-11,4,-2,-2,1,1,-2,-11,-65,0,-30,-32,2,-61,0,-61,-36,-64,-5,-7,0,0,0,0,-5,0,0,0,25,0,-1,0,0,0,0,0,0,-9,0,0,-17,-16,0,-21,-8,-67,-41,-41,-40,-76,-63,0,-49,-42,-67,-67,0,-67,-42,-9,-23,0,-40,-48,-73,-99,0,0,0,0,0,0,-2,0,-2,-2,-2,-11,-11,-11,0,-2,1,1,1,-68,1,0,0,0,-74,0,0,-7,-7,-7,-7,-7,-7,-6,0,0,0,0,0,0,0,0,0,-3,0,0,0,0,0,0,-58,0,0,0,0,0,-21,0,-21,-58,-58,-62,-80,-80,-62,-80,-80,-29,-88,-88,-67,-73,0,-100,-28,-70,0,0,-57,0,-70,-62,-65,0,-53,-62,-53,-62,-17,0,0,0,0,0,0,0,0,0,0,-45,-45,-53,0,0,-64,0,0,-5,0,-5,-5,-5,0,-5,0,0,-5,-5,0,0,-5,0,0,0,0,0,0,0,0,0,-65,0,0,-23,-4,-3,-1,-3,-3,-3,-4,-5,0,-4,-6,-4,-4,-3,-4,-3,-4,-8,0,-1,-15,-13,-17,-18,-25,-64,0,0,-37,-70,0,0,0,0,-63,0,0,-64,0,-5,-20,0,-37,0,-87,0,0,0,0,0,0,0,0,0,-5,-5,-5,0,0,0,0,-5,0,0,0,0,0,0,0,0,0,0,-4,-23,-23,-23,-23,-23,-23,-22,-3,-3,-3,-3,-3,-5,-5,0,-5,-7,-4,-3,-3,-3,-3,-3,-53,-3,-1,-1,-1,-1,-18,-4,-18,-53,-53,-57,-78,-78,-57,-78,-78,0,-83,-83,-63,-87,0,0,-28,-70,-65,-78,-57,-44,-70,-59,-63,-94,-53,-62,-53,-62,0,-3,-60,-25,-30,-4,-14,-3,-36,-19,-27,-47,-47,-53,-62,-63,-63,0,-24,-5,0,-5,-5,-5,-5,-5,-31,-6,-5,-4,0,0,-5,-21,-78,-2,-42,-27,-21,-64,-20,-65,-62,-77,-142,-23,-3,-1,0,-1,-2,-1,-3,-4,-1,0,0,-3,-3,-1,-3,-1,-3,-9,0,0,-15,-13,-18,-18,-26,-64,-67,-36,-36,-70,-65,0,-67,0,-63,-65,0,-64,0,-5,-20,0,-36,0,-88,-96,-24,-24,-24,-24,-24,-24,-29,0,-5,-5,-5,-34,-34,-34,0,-5,0,0,0,0,0,-2,-2,-2,-76,0,-3,-23,-23,-23,-23,-23,-23,-22,-1,-1,-1,-1,-1,-4,-4,0,-1,-8,-3,-1,-1,-1,-1,-1,-53,-1,0,0,0,0,-18,-3,-18,-53,-53,-57,-75,-78,-57,-75,-78,-62,-83,-83,-63,-87,0,-96,-28,-70,-65,-78,-57,-44,-70,-59,-60,-94,-53,-62,-53,-62,0,-3,-60,-25,-30,-4,-14,-3,-36,-19,-27,-47,-47,-53,-62,-63,-63,0,-24,-5,0,-5,-5,-5,-5,-5,-31,-6,-5,-4,0,0,-5,-21,-78,-2,-42,-27,-21,-64,-20,-65,-60,-77,-142,-23,-3,-1,0,-1,-2,-1,-3,-4,-1,0,0,-3,-3,-1,-3,-1,-3,-9,0,0,-15,-13,-18,-18,-26,-64,-67,-36,-36,-70,-65,0,-67,0,-63,-65,0,-64,0,-5,-20,0,-36,0,-88,-96,-24,-24,-24,-24,-24,-24,-29,0,-5,-5,-5,-34,-34,-34,0,-5,0,0,0,0,0,-2,-2,-2,-76,0,-3,-23,-23,-23,-23,-23,-23,-22,-1,-1,-1,-1,-1,-4,-4,0,-1,-8,-3,-1,-1,-1,-1,-1,-53,-1,0,0,0,0,-18,-3,-18,-53,-53,-57,-75,-78,-57,-75,-78,-62,-83,-83,-63,-87,0,-96,-28,-70,-65,-78,-57,-44,-70,-59,-60,-94,-53,-62,-53,-62,0,-3,-53,-25,-30,-4,-14,-3,-36,-19,-27,-47,-47,-53,-62,-63,-63,0,-24,-5,0,-5,-5,-5,-5,-5,-31,-6,-5,-4,0,0,-5,-18,-65,-2,-42,-21,-21,-64,-20,-65,-60,-77,-142,-23,-3,-1,0,-1,-2,-1,-3,-4,-1,0,0,-3,-3,-1,-3,-1,-3,-9,0,0,-15,-13,-18,-18,-26,-64,-67,-36,-36,-70,-65,0,-67,0,-63,-65,0,-64,0,-5,-20,0,-36,0,-88,-96,-24,-24,-24,-24,-24,-24,-29,0,-5,-5,-5,-34,-34,-34,0,-5,0,0,0,0,0,-2,-2,-2,-76,0,-3,-23,-23,-23,-23,-23,-23,-22,-1,-1,-1,-1,-1,-4,-4,0,-1,-8,-3,-1,-1,-1,-1,-1,-53,-1,0,0,0,0,-18,-3,-18,-53,-53,-57,-75,-78,-57,-75,-78,-62,-83,-83,-63,-87,0,-96,-28,-70,-65,-78,-57,-44,-70,-59,-60,-94,-53,-62,-53,-62,0,-3,-54,-25,-30,-4,-14,-3,-36,-19,-27,-47,-47,-53,-62,-63,-63,0,-24,-5,0,-5,-5,-5,-5,-5,-28,-6,-5,-4,0,0,-5,-18,-64,-2,-28,-27,-21,-64,-20,-65,-60,-77,-142,-23,-3,-1,0,-1,-2,-1,-3,-4,-1,0,0,-3,-3,-1,-3,-1,-3,-9,0,0,-15,-13,-18,-18,-26,-64,-67,-36,-36,-70,-65,0,-67,0,-63,-65,0,-64,0,-5,-20,0,-36,0,-88,-96,-24,-24,-24,-24,-24,-24,-29,0,-5,-5,-5,-28,-28,-28,0,-5,0,0,0,0,0,-2,-2,-2,-76,0,-3,-23,-23,-23,-23,-23,-23,-22,-1,-1,-1,-1,-1,-4,-4,0,-1,-8,-3,-1,-1,-1,-1,-1,-53,-1,0,0,0,0,-18,-3,-18,-53,-53,-57,-75,-78,-57,-75,-78,-62,-83,-83,-63,-87,0,-96,-16,-42,-60,0,-39,-34,-42,-49,-26,-59,-63,-36,-63,-36,17,-2,-21,-4,-8,0,0,-2,4,-3,-9,-20,-20,-63,-41,-40,-24,0,-2,0,0,0,0,0,-6,0,0,0,0,0,4,4,0,0,9,3,45,45,32,45,14,61,-26,-67,-14,-11,0,-2,0,-2,0,-2,0,0,21,0,0,0,0,-2,0,-2,0,-9,2,0,0,0,7,0,-2,-25,0,-45,-24,-42,-60,0,0,-32,-70,0,0,-25,0,-6,-13,0,-24,0,-72,-59,-2,-2,-2,-2,-2,-2,-5,0,0,0,0,0,28,0,0,0,4,4,4,0,4,3,3,3,45,0,0,-11,-11,-11,-11,-10,-11,-9,-2,-2,-2,-2,0,0,0,18,11,-6,0,-2,-2,-2,-2,0,-63,-2,0,0,0,0,0,0,0,-63,-63,-40,-36,-36,-40,-36,-36,-34,-65,-65,-70,-71,0,-1,-21,-52,-60,0,-39,-34,-52,-49,-1,-59,-63,-36,-63,-36,17,-2,-21,-4,-8,0,0,-2,4,-3,-9,-20,-20,-63,-41,-40,-24,0,-2,0,0,0,0,0,-6,0,0,0,0,0,4,4,0,0,9,3,45,45,32,45,14,61,-1,-67,-14,-11,0,-2,0,-2,0,-2,0,0,21,0,0,0,0,-2,0,-2,0,-9,2,0,0,0,7,0,-2,-25,0,-45,-13,-25,-60,0,0,-32,-70,0,0,-25,0,-6,-13,0,-28,0,-72,-59,-2,-2,-2,-2,-2,-2,-5,0,0,0,0,0,28,0,0,0,4,4,4,0,4,3,3,3,45,0,0,-11,-11,-11,-11,-10,-11,-9,-2,-2,-2,-2,0,0,0,18,11,-6,0,-2,-2,-2,-2,0,-63,-2,0,0,0,0,0,0,0,-63,-63,-40,-36,-20,-40,-54,-20,-34,-65,-65,-70,-71,0,-1,24,2,0,0,-10,0,2,-16,12,0,-63,-36,-63,-36,17,0,17,3,0,0,0,0,0,0,0,-15,-15,-63,0,0,0,0,-2,38,10,38,38,38,0,38,48,0,33,33,15,15,38,9,0,43,89,0,65,84,57,0,13,0,0,-9,18,-2,0,-2,13,-2,18,10,24,18,18,1,1,-2,1,-2,1,-9,16,2,5,7,15,0,0,0,0,0,21,2,0,0,0,-1,-70,0,0,0,0,19,23,0,21,0,-52,0,-2,-2,-2,-2,-2,-2,0,10,38,38,38,48,48,48,0,33,15,15,15,0,15,43,43,43,84,0,18,-9,-9,-3,-9,-6,-9,-9,-2,-2,-2,-2,-2,12,16,98,10,-6,1,-2,-2,-2,-2,-2,-63,-2,2,2,2,2,0,18,0,-63,-63,-10,15,15,-10,15,15,-34,-56,-56,-70,-52,0,0,8,0,-62,-61,-41,-34,0,-20,32,-67,-63,-33,-63,-36,23,-3,-34,-4,-9,0,-3,-3,-9,-3,-10,-19,-19,-63,-42,-40,0,0,-2,-5,0,-5,-5,-5,-7,-5,-7,0,-5,-5,4,4,-5,-1,-27,0,0,-11,7,-36,8,0,32,-67,-14,-11,3,-2,0,-2,5,-2,3,1,8,3,0,0,0,-2,0,-2,0,-9,6,0,0,0,7,0,0,-25,-37,-45,-37,-55,-62,0,-33,0,-70,-63,0,-25,0,11,19,0,7,-29,-72,-65,-2,-2,-2,-2,-2,-2,-5,0,-5,-5,-5,-1,0,70,2,-5,4,4,4,-68,4,0,0,0,-36,0,3,-11,-11,-8,-11,-7,-11,-9,-2,-2,-2,0,0,2,2,7,91,-6,0,-2,-2,0,-2,0,-63,-2,0,0,0,0,0,3,0,-63,-63,-16,0,-59,-16,0,-59,-34,-65,-65,-70,-71,0,-37,-30,-67,0,0,-55,0,-67,-56,-57,0,-63,-59,-63,-59,-24,0,-57,0,0,0,0,0,0,0,0,-37,-37,-63,0,0,-31,0,-28,-8,0,-8,-8,-8,-7,-8,0,0,0,0,0,0,-8,0,0,0,0,0,0,0,0,0,-57,0,0,-17,-1,-2,-2,-2,-3,-2,-1,-3,-2,-1,-3,-3,-3,-2,-3,-2,-3,-14,-1,0,-3,-2,0,-4,-18,-31,0,0,-45,-67,0,0,0,0,-70,0,0,-31,0,-14,-24,0,-45,0,0,0,-28,-28,-28,-28,-28,-28,0,0,-8,-8,-8,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,-1,-17,-17,-17,-17,-17,-17,-17,-2,-2,-2,-2,-2,0,-3,0,-3,-7,-3,-2,-2,-2,-2,-2,-63,-2,0,0,0,0,-4,-1,-4,-63,-63,-55,-68,-68,-55,-68,-68,-61,-68,-68,-70,0,0,0,-25,-74,-64,-72,-63,-32,-74,-57,-45,-95,-61,-36,-61,-36,27,-3,-32,-7,-19,0,-9,-3,-34,-10,-22,-30,-30,-61,-49,-52,-62,0,-1,-4,0,-4,-4,-4,-7,-4,-13,1,-4,-4,0,0,-4,-12,-75,-1,-51,-32,0,-76,0,-65,-39,-66,-142,-9,0,0,0,0,-5,0,0,0,22,0,-2,0,0,0,0,0,0,-11,-1,0,-16,-14,0,-20,-10,-62,-52,-43,-42,-76,-64,0,-52,-44,-69,-67,0,-62,-42,-11,-25,0,-42,-49,-75,-95,-1,-1,-1,-1,-1,-1,0,0,-4,-4,-4,-13,-13,-13,0,-4,0,0,0,-70,0,-1,-1,-1,-61,0,0,-9,-9,-9,-9,-9,-9,-8,0,0,0,0,0,0,0,0,0,-5,0,0,0,0,0,0,-61,0,0,0,0,0,-20,0,-20,-61,-61,-63,-83,-85,-63,-83,-85,-32,-83,-83,-69,-75,0,-100,-22,-74,-63,-75,-62,-35,-74,-54,-68,-99,-58,-52,-58,-54,-21,-3,-54,-17,-21,0,-8,-3,-27,-8,-22,-48,-45,-58,-56,-57,-65,0,-31,-6,0,-6,-6,0,-5,-6,-36,1,-6,-6,1,1,-6,-15,-89,-2,-39,-32,-38,-75,-16,-69,-68,-76,-142,-12,0,0,0,0,-5,0,0,0,0,0,0,-1,-1,0,-1,0,-1,-10,0,0,-16,-15,-24,-20,-24,-67,-74,-41,-40,-76,-63,0,-71,0,-67,-67,0,-67,-61,-9,-22,0,-25,-48,-90,-99,-31,-31,-31,-31,-31,-31,0,0,-6,-6,-6,-36,-36,-36,6,-6,1,1,1,-69,1,-2,-2,-2,-78,0,-1,-12,-12,-12,-12,-12,-12,-12,0,0,0,0,0,0,-1,0,0,-3,-1,0,0,0,0,0,-58,0,0,0,0,0,-23,-1,-23,-58,-58,-62,-80,-83,-62,-80,-83,-56,-88,-88,-67,-89,0,-100,-22,-74,-63,-75,-62,-35,-74,-54,-68,-99,-58,-52,-58,-54,-21,-3,-54,-17,-21,0,-8,-3,-27,-8,-22,-48,-45,-58,-56,-57,-65,0,-31,-6,0,-6,-6,0,-5,-6,-36,1,-6,-6,1,1,-6,-15,-73,-2,-39,-32,-38,-75,-16,-69,-68,-76,-142,-12,0,0,0,0,-5,0,0,0,0,0,0,-1,-1,0,-1,0,-1,-10,0,0,-16,-15,-24,-20,-24,-67,-74,-41,-40,-76,-63,0,-71,0,-67,-67,0,-67,-61,-9,-22,0,-25,-48,-90,-99,-31,-31,-31,-31,-31,-31,0,0,-6,-6,-6,-36,-36,-36,6,-6,1,1,1,-69,1,-2,-2,-2,-78,0,-1,-12,-12,-12,-12,-12,-12,-12,0,0,0,0,0,0,-1,0,0,-3,-1,0,0,0,0,0,-58,0,0,0,0,0,-23,-1,-23,-58,-58,-62,-80,-83,-62,-80,-83,-56,-88,-88,-67,-89,0,-100,-22,-74,-63,-75,-62,-35,-74,-54,-65,-99,-58,-52,-58,-54,-21,-3,-54,-17,-21,0,-8,-3,-27,-8,-22,-48,-45,-58,-56,-57,-65,0,-31,-6,0,-6,-6,0,-5,-6,-36,1,-6,-6,1,1,-6,-15,-79,-2,-39,-32,-38,-75,-16,-69,-65,-76,-142,-12,0,0,0,0,-5,0,0,0,0,0,0,-1,-1,0,-1,0,-1,-10,0,0,-16,-15,-24,-20,-24,-67,-74,-41,-40,-76,-63,0,-71,0,-67,-67,0,-67,-61,-9,-22,0,-25,-48,-90,-99,-31,-31,-31,-31,-31,-31,0,0,-6,-6,-6,-36,-36,-36,6,-6,1,1,1,-69,1,-2,-2,-2,-78,0,-1,-12,-12,-12,-12,-12,-12,-12,0,0,0,0,0,0,-1,0,0,-3,-1,0,0,0,0,0,-58,0,0,0,0,0,-23,-1,-23,-58,-58,-62,-80,-83,-62,-80,-83,-56,-88,-88,-67,-89,0,-100,-22,-74,-63,-75,-62,-35,-74,-54,-65,-99,-58,-52,-58,-54,-21,-3,-54,-17,-21,0,-8,-3,-27,-8,-22,-48,-45,-58,-56,-57,-65,0,-31,-6,0,-6,-6,0,-5,-6,-36,1,-6,-6,1,1,-6,-15,-73,-2,-39,-32,-38,-75,-16,-69,-65,-76,-142,-12,0,0,0,0,-5,0,0,0,0,0,0,-1,-1,0,-1,0,-1,-10,0,0,-16,-15,-24,-20,-24,-67,-74,-41,-40,-76,-63,0,-71,0,-67,-67,0,-67,-61,-9,-22,0,-25,-48,-90,-99,-31,-31,-31,-31,-31,-31,0,0,-6,-6,-6,-36,-36,-36,6,-6,1,1,1,-69,1,-2,-2,-2,-78,0,-1,-12,-12,-12,-12,-12,-12,-12,0,0,0,0,0,0,-1,0,0,-3,-1,0,0,0,0,0,-58,0,0,0,0,0,-23,-1,-23,-58,-58,-62,-80,-83,-62,-80,-83,-56,-88,-88,-67,-89,0,-100,-15,-39,-62,-61,-40,-33,-61,-48,-50,-66,-62,-32,-62,-36,15,-2,-33,-3,-9,0,-3,-2,-9,-2,-10,-20,-20,-62,-41,-40,-25,0,-1,-4,0,-4,-4,-4,-6,-4,-11,0,-4,-4,5,5,-4,-1,-26,-1,-16,-11,0,-35,0,-33,-50,-66,-142,-10,0,-1,0,-1,0,-1,0,0,2,0,0,0,0,-1,0,-1,0,-9,2,5,0,0,7,0,-1,-25,-50,-45,-44,-61,-62,0,-53,-38,-70,-62,0,-25,0,-9,-21,0,-17,0,-71,-66,-1,-1,-1,-1,-1,-1,0,0,-4,-4,-4,-11,-11,-11,0,-4,5,5,5,-68,5,-1,-1,-1,-35,0,0,-10,-10,-10,-10,-10,-10,-10,-1,-1,-1,-1,-1,0,0,1,0,-6,0,-1,-1,-1,-1,-1,-62,-1,5,5,5,5,0,0,0,-62,-62,-40,-38,-64,-40,-38,-64,-34,-65,-65,-70,-71,0,-70,-15,-39,-62,-61,-40,-33,-61,-48,-50,-66,-62,-32,-62,-36,15,-2,-33,-3,-9,0,-3,-2,-9,-2,-10,-20,-20,-62,-41,-40,-25,0,-1,-4,0,-4,-4,-4,-6,-4,-11,0,-4,-4,5,5,-4,-1,-26,-1,-15,-11,0,-35,0,-33,-50,-66,-142,-10,0,-1,0,-1,0,-1,0,0,2,0,0,0,0,-1,0,-1,0,-9,2,5,0,0,7,0,-1,-25,-50,-45,-44,-61,-62,0,-53,-38,-70,-62,0,-25,0,-9,-21,0,-17,0,-71,-66,-1,-1,-1,-1,-1,-1,0,0,-4,-4,-4,-11,-11,-11,0,-4,5,5,5,-68,5,-1,-1,-1,-35,0,0,-10,-10,-10,-10,-10,-10,-10,-1,-1,-1,-1,-1,0,0,1,0,-6,0,-1,-1,-1,-1,-1,-62,-1,5,5,5,5,0,0,0,-62,-62,-40,-38,-64,-40,-38,-64,-34,-65,-65,-70,-71,0,-70,-12,-32,-55,-42,-15,-61,-125,-62,-62,-28,-75,-9,-75,-9,46,0,-22,0,0,-48,0,0,19,0,0,-9,0,-69,-31,-26,-103,0,-59,0,4,0,0,0,0,0,-5,-35,0,0,10,10,0,3,4,0,10,18,-27,-5,0,-1,-62,-93,-102,-34,0,-21,-16,-21,-8,-21,0,0,0,0,-19,0,2,-21,0,-21,0,-17,-30,-18,48,49,37,-60,5,-103,-73,-76,-43,-32,-55,0,-73,0,-87,-35,0,-103,0,-47,-65,0,-66,0,-35,-28,-59,-59,-59,-59,-59,-59,0,4,0,0,0,-5,-5,-5,0,0,10,10,10,-45,10,0,0,0,-5,0,0,-35,-35,-35,-35,-35,-35,-35,-21,-21,-21,-21,-21,0,0,6,0,-39,0,-21,-21,-21,-21,-21,-75,-21,3,3,3,3,45,0,45,-75,-75,-15,-22,-26,-15,-22,-26,-115,-32,-32,-87,-46,0,-51,-12,-32,-55,-42,-15,-61,-125,-62,-54,-28,-75,-9,-75,-9,46,0,-22,0,0,-48,0,0,19,0,0,-9,0,-69,-31,-26,-103,0,-59,0,4,0,0,0,0,0,-5,-35,0,0,10,10,0,3,4,0,10,18,-27,-5,0,-1,-54,-93,-102,-34,0,-21,-16,-21,-8,-21,0,0,0,0,-19,0,2,-21,0,-21,0,-17,-30,-18,48,49,37,-60,5,-103,-73,-76,-40,-32,-55,0,-73,0,-87,-35,0,-103,0,-47,-65,0,-40,0,-35,-28,-59,-59,-59,-59,-59,-59,0,4,0,0,0,-5,-5,-5,0,0,10,10,10,-45,10,0,0,0,-5,0,0,-35,-35,-35,-35,-35,-35,-35,-21,-21,-21,-21,-21,0,0,6,0,-39,0,-21,-21,-21,-21,-21,-75,-21,3,3,3,3,45,0,45,-75,-75,-15,-22,-26,-15,-22,-26,-115,-32,-32,-87,-46,0,-51,-68,-85,-103,-97,-72,-117,-85,-95,-94,-90,-99,-180,-99,-180,-122,-40,-83,-57,-49,-111,-40,-40,-29,-46,-41,-60,-60,-99,-85,0,-46,-48,-125,-44,-36,-44,-44,-44,-43,-44,-64,-104,-44,-44,-30,-30,-44,-37,-42,-40,-29,-25,-47,-32,-56,0,-93,0,0,-87,-40,-62,-60,-62,-20,-62,-40,-41,-41,-40,-40,-40,-40,-62,-40,-62,-40,-60,-20,-38,-15,-15,-22,-16,-47,-46,-97,-118,-76,-85,-114,0,-88,0,-122,-87,-48,-55,0,-63,-58,0,-90,0,-103,-149,-125,-125,-125,-125,-125,-125,-145,-36,-44,-44,-44,-64,-64,-64,-36,-44,-30,-30,-30,-98,-30,-40,-40,-40,-32,-39,-40,-87,-87,-87,-87,-87,-87,-87,-62,-62,-62,-62,-62,-36,-38,-11,-41,0,-40,-62,-62,-62,-62,-62,-99,-62,-38,-38,-38,-38,-16,-40,-16,-99,-99,-70,-82,-82,-70,-82,-199,-199,-91,-91,-122,-103,0,0,-63,-80,-115,0,-78,0,-80,-98,-74,-88,-138,-180,-138,-180,-139,-63,-71,-63,-62,-155,-37,-63,-27,-63,-63,-81,-81,-138,-98,0,-52,-64,-143,-42,-61,-42,-42,-42,-65,-42,-40,-91,-57,-57,-55,-55,-42,-61,-20,-37,-9,-9,-26,-13,-31,0,-73,0,0,-102,-46,-102,-97,-102,-34,-102,-46,-59,-59,-46,-46,-64,-64,-102,-64,-102,-64,-97,-34,-62,-25,-24,-28,-25,-64,-52,-77,-164,-70,-80,-115,0,-77,0,-169,0,-64,-52,0,-58,-49,0,-70,0,-103,-186,-142,-143,-141,-140,-136,-143,-171,-61,-42,-42,-42,-40,-40,-40,-42,-57,-55,-55,-55,0,-55,-37,-37,-37,-13,0,-46,-102,-102,-93,-102,-95,-102,-102,-102,-100,-102,-93,-93,-27,-41,15,0,0,-64,-102,-102,-94,-96,-94,-138,-103,-62,-62,-62,-62,-25,-46,-22,-138,-138,-80,-70,-199,-80,-70,-199,-199,0,0,-169,-103,-114,0,-65,0,-96,-108,-214,-80,0,-104,0,-196,-145,-60,-150,-60,-8,-66,-64,-40,-65,-47,-65,-66,-146,-66,-66,-60,-60,-150,-93,0,-156,-62,-24,-44,-63,-44,-44,-44,-67,-44,-40,-41,-44,-44,-58,-58,-44,-63,-147,-65,-137,-122,-16,-155,-22,0,0,0,0,-51,-40,-62,-60,-62,-58,-62,-40,-41,-9,-40,-64,-40,-40,-62,-39,-62,-40,-58,-73,-62,-119,-116,-21,-121,-43,-156,-90,0,0,0,-98,0,-90,0,-125,0,-62,-156,0,0,0,0,0,0,-103,-196,-24,-24,-24,-24,-24,-24,-27,-63,-44,-44,-44,-40,-40,-40,-44,-44,-58,-58,-58,-98,-58,-65,-65,-65,-155,-39,-40,-51,-51,-51,-51,-51,-51,-51,-62,-62,-62,-62,-62,-41,-41,-41,-41,0,-40,-62,-62,-62,-62,-62,-144,-62,-62,-62,-62,-62,-121,-39,-121,-150,-150,-199,-199,-70,-343,-343,-70,-60,0,0,-125,-103,-129,0,-67,-84,-103,-97,-72,-116,-84,-94,-93,-90,-99,-180,-99,-180,-122,-40,-83,-56,-48,-111,-39,-40,-28,-45,-40,-59,-59,-96,-84,0,-45,-47,-125,-43,-35,-43,-43,-43,-42,-43,-63,-104,-43,-43,-29,-29,-43,-36,-42,-39,-28,-25,-46,-31,-55,-37,-93,-147,-325,-86,-39,-61,-59,-61,-20,-61,-39,-40,-40,-39,-39,-39,-39,-61,-39,-61,-39,-59,-20,-37,-14,-14,-21,-15,-46,-74,-96,-118,-75,-84,-113,0,-87,-72,-121,0,-47,-54,0,-63,-57,0,-90,-56,-102,-148,-125,-125,-125,-125,-125,-125,-144,-35,-43,-43,-43,-63,-63,-63,-35,-43,-29,-29,-29,-98,-29,-39,-39,-39,-31,-38,-39,-86,-86,-86,-86,-86,-86,-86,-61,-61,-61,-61,-61,-35,-38,-11,-4,-71,-39,-61,-61,-61,-61,-61,-99,-61,-37,-37,-37,-37,-15,-39,-15,-99,-99,-68,-81,-81,-68,-81,-343,-341,-93,-90,-121,-102,-96,-81,-56,-272,0,0,-341,0,-188,-99,-67,-192,-142,-53,-142,-53,-10,-61,-55,-34,-59,-41,-60,-61,-141,-61,-61,-53,-53,-142,0,0,-152,0,-15,-39,-55,-39,-39,-39,-63,-39,-32,-35,-39,-39,-50,-50,-39,-55,-143,-60,-137,-117,-13,-151,-15,0,-66,0,0,-41,-34,-57,-53,-57,-53,-57,-34,-35,-20,-34,-58,-34,-34,-57,-34,-57,-34,-50,-67,-57,-114,-111,-16,-120,-35,-152,-69,0,-100,-272,0,0,-69,0,-121,0,0,-152,0,-80,-123,0,-100,0,-98,-192,-15,-15,-15,-15,-15,-15,0,-55,-39,-39,-39,-32,-32,-32,-39,-39,-50,-50,-50,0,-50,-60,-60,-60,-151,0,-34,-41,-41,-41,-41,-41,-41,-41,-57,-57,-57,-57,-57,-35,-35,0,-35,0,-34,-57,-57,-57,-57,-57,-142,-57,-57,-57,-57,-57,-120,-34,-120,-142,-142,-199,-199,-341,-341,-341,-341,-55,-206,-206,-121,-98,0,0,-75,-103,0,0,-74,0,-71,0,-111,-97,-110,-126,-110,-126,-124,-50,-64,-60,-58,-109,-29,-50,-16,-55,-53,-85,-87,-110,0,0,-60,0,-69,0,-56,0,-62,0,0,-62,0,0,0,-62,-51,0,0,-57,0,0,0,0,0,0,0,0,0,0,0,-59,0,-62,0,-62,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,-83,0,0,-94,-103,0,0,0,0,-156,0,0,-83,0,-69,-68,0,-94,0,-114,-97,0,0,0,0,0,-69,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,-59,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,-110,0,0,0,0,0,0,0,0,-110,-110,-74,-63,-100,-90,-63,-100,0,-81,-81,-156,-114,0,0,-75,-103,0,0,-74,0,-71,0,-111,-97,-110,-126,-110,-126,-120,-50,-64,-60,-58,-109,-29,-50,-16,-55,-53,-72,-72,-110,0,0,-60,0,-69,0,-56,0,-62,0,0,-62,0,0,0,-62,-51,0,0,-57,0,0,0,0,0,0,0,0,0,0,0,-59,0,-62,0,-62,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,-83,0,0,-94,-103,0,0,0,0,-156,0,0,-83,0,-69,-68,0,-94,0,-114,-97,0,0,0,0,0,-69,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,-59,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,-110,0,0,0,0,0,0,0,0,-110,-110,-74,-63,-100,-90,-63,-100,0,-81,-81,-156,-114,0,0,-92,-125,-110,0,-128,-94,-125,-111,-132,-136,-104,-121,-104,-121,-92,-71,-123,-83,-82,-48,-77,-71,-120,-74,-88,-119,-119,-104,-110,0,-144,-67,-96,-74,-68,-74,-74,-74,-73,-74,-103,-55,-74,-74,-64,-64,-74,-79,-156,-71,-111,-98,-115,-136,-95,-122,-132,0,0,-79,-70,-67,-67,-67,-81,-67,-70,-70,-70,-70,-70,-70,-70,-67,-70,-67,-70,-76,-76,-67,-87,-86,-102,-91,-103,-144,-105,-88,-87,-125,-110,0,-105,0,-106,0,-67,-144,0,-68,-69,0,-89,0,-167,-83,-96,-96,-96,-96,-96,-96,-107,-68,-74,-74,-74,-103,-103,-103,-49,-74,-64,-64,-64,0,-64,-71,-71,-71,-136,0,-70,-79,-79,-79,-79,-79,-79,-78,-67,-67,-67,-67,-67,-70,-70,-70,-70,0,-70,-67,-67,-67,-67,-67,-104,-67,-67,-67,-67,-67,-91,-70,-91,-104,-104,-122,-135,-125,-122,-135,-125,-121,-125,-125,-106,-167,-103,-148]}},{"family":"MPLUS Code Latin","families":["MPLUS Code Latin"],"weight":400,"source":"MPLUSCodeLatin-VariableFont_wdth,wght.ttf","ascent":1000,"descent":235,"fallback":500,"chars":" !\"#$%&'()*+,-./0123456789:;<=>?@ABCDEFGHIJKLMNOPQRSTUVWXYZ[\\]^_`abcdefghijklmnopqrstuvwxyz{|}~ ¡¢£¤¥¦§¨©ª«¬­®¯°±²³´µ¶·¸¹º»¼½¾¿ÀÁÂÃÄÅÆÇÈÉÊËÌÍÎÏÐÑÒÓÔÕÖ×ØÙÚÛÜÝÞßàáâãäåæçèéêëìíîïðñòóôõö÷øùúûüýþÿ–—‘’‚“”„•…‹›€™","advances":500,"kern":{"left":[],"right":[],"values":[]}},{"family":"MPLUS Code Latin","families":["MPLUS Code Latin"],"weight":700,"source":"MPLUSCodeLatin-VariableFont_wdth,wght.ttf","ascent":1000,"descent":235,"fallback":500,"chars":" !\"#$%&'()*+,-./0123456789:;<=>?@ABCDEFGHIJKLMNOPQRSTUVWXYZ[\\]^_`abcdefghijklmnopqrstuvwxyz{|}~ ¡¢£¤¥¦§¨©ª«¬­®¯°±²³´µ¶·¸¹º»¼½¾¿ÀÁÂÃÄÅÆÇÈÉÊËÌÍÎÏÐÑÒÓÔÕÖ×ØÙÚÛÜÝÞßàáâãäåæçèéêëìíîïðñòóôõö÷øùúûüýþÿ–—‘’‚“”„•…‹›€™","advances":500,"kern":{"left":[],"right":[],"values":[]}},{"family":"CODE Bold","families":["CODE Bold"],"weight":700,"source":"CODE Bold.otf","ascent":800,"descent":230,"fallback":483,"chars":" !\"$&',.0123456789:;?ABCDEFGHIJKLMNOPQRSTUVWXYZ`abcdefghijklmnopqrstuvwxyz ¡¥¨´·¿ÀÁÂÃÄÅÆÇÈÉÊËÌÍÎÏÑÒÓÔÕÖØÙÚÛÜÝàáâãäåæçèéêëìíîïñòóôõöøùúûüýÿ…€","advances":[352,205,288,550,600,141,214,156,552,269,531,519,529,534,542,507,533,548,149,140,510,588,570,710,651,468,449,725,563,389,404,525,470,707,588,758,527,766,527,554,534,589,602,851,601,567,533,246,588,562,710,651,468,449,725,563,374,412,525,478,707,588,758,533,774,531,554,534,589,602,851,601,567,533,200,202,567,395,246,165,514,588,588,588,588,588,594,840,699,468,468,468,468,379,374,374,374,588,758,758,758,758,758,760,589,589,589,589,567,588,588,588,588,588,594,840,699,468,468,468,468,379,374,374,374,588,758,758,758,758,758,760,589,589,589,589,567,567,469,738],"kern":{"left":["AÀÁÂÃÄÅ","B","CÇ","D","EÈÉÊË","F","G","H","IÌÍÎÏ","J","K","L","NÑ","OÒÓÔÕÖØ","P","Q","R","S","T","UÙÚÛÜ","V","W","X","Y","Z","aàáâãäå","b","cç","d","eèéêë","f","g","h","iìíîï","j","k","l","m","n","oòóôõöø","p","q","r","s","t","u","v","w","x","yÿ","z","Æ","æ","ñ","ùúûü"],"right":[",.",":;","A","C","D","E","G","H","I","J","L","O","P","Q","S","T","U","V","W","X","Y","Z","a","b","c","d","e","g","h","i","j","k","l","m","nr","o","p","q","s","t","u","v","w","x","y","z"],"values":[0,0,41,-10,21,0,-20,0,42,73,0,-21,0,-21,-10,-83,0,-73,-63,10,-84,0,42,0,-32,10,0,0,0,52,42,0,0,21,0,-10,0,-10,0,-63,0,-52,-42,0,-62,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,-11,-21,0,-31,0,0,11,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,-31,0,-10,-11,0,-21,0,0,0,0,0,0,0,0,0,-10,-41,0,0,0,0,0,-31,0,-20,-11,0,-21,-21,0,10,0,0,0,0,0,0,-21,0,0,0,0,0,0,0,0,-21,10,0,0,0,0,0,0,0,-31,0,0,0,0,0,-42,-63,0,0,0,0,0,-73,0,-32,-21,-31,-41,-31,-21,0,0,0,0,0,0,0,-31,0,0,0,0,0,0,0,0,-31,0,-21,-20,-32,-31,0,0,0,10,0,0,0,0,0,0,0,0,0,0,0,0,32,0,10,11,31,11,21,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,-67,-67,-52,-21,0,0,-21,0,0,-73,0,0,0,0,-20,31,0,0,32,21,31,11,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,-21,0,0,0,0,0,-21,-42,10,0,0,0,0,-32,0,0,0,-21,-11,-21,-10,0,0,0,0,0,0,0,-21,0,0,0,0,0,0,0,0,-32,0,0,0,-10,0,0,0,0,0,0,0,0,0,0,0,0,0,21,0,0,0,0,0,21,0,21,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,31,-11,0,0,-31,0,0,0,0,-31,0,-32,-10,21,0,32,0,21,31,21,0,0,0,0,0,0,0,21,21,0,0,0,0,-11,0,-20,0,31,0,21,11,0,0,0,0,0,-11,0,0,0,0,0,0,-21,0,0,10,0,0,0,0,21,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,21,0,0,0,0,0,0,0,-42,0,0,-41,0,0,0,0,-31,0,-42,-10,0,0,0,0,0,0,42,0,0,-42,0,21,-42,0,31,31,0,0,0,0,0,0,0,-21,0,0,0,0,0,0,0,0,0,10,-63,0,0,-73,0,0,0,0,-73,0,-73,-42,-166,-31,-146,-125,0,-135,20,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,21,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,-40,0,-33,0,0,0,0,0,-31,-41,0,0,0,0,0,-63,0,-21,-21,-31,-32,0,-10,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,-52,21,-21,-21,-31,-31,0,0,0,-63,0,0,0,0,0,-31,-105,0,0,0,0,0,-11,0,0,0,-21,-11,-21,-52,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,-73,0,-21,-10,0,-32,31,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,10,-11,0,0,0,0,0,0,0,0,0,0,0,11,0,-21,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,-10,0,0,0,0,0,-21,0,0,0,0,0,0,-52,0,-11,-11,-11,-31,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,-20,0,0,0,0,-10,0,-40,-40,-83,-52,0,0,-32,0,11,-63,0,-42,0,-63,-53,31,0,11,0,0,0,0,-83,0,-31,0,0,-52,0,32,-62,0,0,0,0,-42,0,-52,0,42,0,31,21,0,21,0,0,0,0,0,0,0,0,0,0,-31,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,-40,-40,-73,-21,0,0,-21,0,31,-63,0,-32,0,-21,-11,10,0,0,0,0,0,0,-73,10,-31,0,0,0,0,21,-73,0,0,0,0,-31,0,-31,0,31,0,0,0,0,0,0,-40,-40,-73,-31,0,0,-32,-20,0,-52,0,-31,10,-31,-20,0,0,0,0,0,0,0,-73,0,-31,0,0,-32,0,0,-73,0,0,0,0,-31,0,-31,-21,0,0,0,0,0,0,0,0,0,0,-42,0,0,-41,0,0,0,0,-42,0,-32,-21,0,0,0,0,0,0,0,0,0,-52,0,0,-42,0,21,21,0,0,0,0,-52,0,0,-21,0,0,0,0,0,0,0,-67,-67,-84,-52,0,0,-41,0,21,-63,0,-42,0,-52,-21,0,0,0,0,0,0,0,-83,0,-52,11,0,-41,0,42,-52,0,0,0,0,-41,0,0,-11,31,0,0,0,0,0,0,0,0,0,-31,0,0,-31,0,20,31,0,0,0,-41,0,0,0,0,0,0,21,0,0,0,-31,0,0,-31,0,31,31,0,0,0,0,-21,0,-42,-10,0,0,31,0,21,0,31,0,0,0,-21,0,0,0,0,0,41,0,0,0,0,0,-83,0,-73,-73,0,-83,0,32,0,-32,31,0,-10,21,42,52,21,21,21,21,-10,31,-21,-11,-83,0,-52,-52,0,-93,0,0,0,20,0,0,0,0,0,0,0,0,0,0,0,0,0,11,0,-10,0,0,0,21,0,0,0,0,0,0,0,0,0,0,11,0,0,21,0,0,-21,11,0,0,0,0,0,0,0,0,0,0,0,0,0,0,-21,0,0,0,0,0,-31,0,0,0,-10,-21,0,-10,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,-21,0,-11,0,-32,-11,0,0,0,-21,0,0,0,0,0,0,0,0,0,0,0,0,-42,0,-10,-21,-32,-32,-21,-21,0,0,0,0,0,0,-10,-21,0,0,0,0,21,0,0,0,-52,0,-21,-21,-20,-32,0,0,0,0,0,0,0,0,0,0,-21,0,0,0,0,0,-31,0,32,11,-10,-21,21,-10,0,0,0,0,0,0,32,32,0,0,20,0,0,0,0,0,-21,0,-11,0,-32,-11,0,0,0,-52,0,0,0,0,0,21,-41,0,0,0,0,0,41,0,31,32,31,21,10,-42,0,0,0,0,0,0,31,-52,0,0,0,0,0,0,-11,-10,31,0,31,21,10,31,0,0,0,0,0,0,0,0,0,-10,-21,0,11,0,0,0,-31,0,0,0,-10,-21,-31,-10,0,0,0,0,0,0,-10,-20,0,0,0,0,0,0,0,0,-21,10,-11,0,-32,-11,0,0,0,0,21,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,10,0,0,21,0,0,0,0,10,0,0,0,0,0,0,0,0,0,0,0,0,10,0,0,0,0,0,0,0,42,-21,0,0,-10,0,10,32,0,0,0,0,0,31,0,31,10,21,32,32,31,0,-31,0,0,-31,0,21,21,0,0,0,0,-32,0,-31,0,21,0,21,21,21,21,0,0,0,0,0,0,0,31,0,0,0,0,0,0,0,0,11,0,31,0,10,41,0,0,0,0,11,0,10,10,0,0,21,0,0,0,21,21,0,0,0,0,11,0,0,0,0,0,0,0,-42,0,0,-42,0,20,21,0,-31,0,0,-11,0,0,0,0,0,0,31,0,0,-42,0,0,-41,0,42,32,0,0,0,0,-42,0,-42,-11,0,-11,0,0,0,0,0,0,0,20,-42,0,0,-21,0,21,41,0,-20,0,0,0,-115,0,-125,-83,0,0,21,21,0,-52,0,0,-31,0,31,42,0,0,0,0,-42,0,0,-10,-135,-21,-115,-114,0,-125,0,0,0,0,-21,0,0,0,0,0,41,0,0,0,0,0,-83,0,-73,-73,0,-83,0,11,0,-32,31,0,-10,21,42,52,21,21,21,21,-10,10,-21,-11,-83,0,-52,-52,0,-93,0,0,0,0,-21,0,0,0,0,0,41,0,0,0,0,0,-83,0,-73,-73,10,-83,0,32,0,-32,31,0,-10,21,42,52,21,21,21,21,-10,31,-21,-11,-83,0,-52,-52,0,-93,0,0,0,20,0,0,0,0,0,-21,-21,0,0,0,0,0,-31,11,-21,-10,-10,-21,-32,21,0,0,0,0,0,0,-42,-62,0,0,11,0,0,21,0,0,-21,11,-11,-21,-32,-11,0,0,0,-52,-21,0,0,0,0,-10,41,0,0,0,0,0,-83,11,-73,-73,0,-83,-31,-42,0,-32,31,0,-10,21,42,-94,21,-10,21,21,-10,31,-21,-11,-83,11,-52,-52,-20,-10,0,0,0,0,-10,0,0,0,0,0,31,0,0,0,0,0,-62,0,0,-21,-10,-52,0,-10,0,0,0,0,0,0,21,0,11,0,0,0,0,0,-11,0,-63,0,-32,-32,-32,-42,0,0,0,0,-21,0,0,0,0,0,41,0,20,0,0,0,-83,0,-73,-73,32,-83,0,32,0,-32,31,11,-10,21,42,52,21,21,21,21,-10,31,-21,-11,-83,0,-52,-52,0,-93,0,0,0,0,-21,0,0,0,0,0,41,0,0,0,0,0,-83,0,-73,-73,0,-83,0,32,0,-32,31,0,-10,21,42,52,21,21,21,21,-10,31,-21,-11,-83,0,-52,-52,-10,-93,0,0,0,-83,-52,0,0,-52,0,21,0,0,-52,0,0,-21,31,0,42,0,0,32,0,-94,0,-42,0,0,-52,0,21,-63,0,0,0,0,-62,0,-62,-10,21,0,21,20,10,21,0,0,0,0,-21,0,0,21,0,0,41,0,21,0,0,0,-83,0,-73,-73,0,-83,0,32,0,-32,31,0,-10,21,42,52,21,21,21,21,-10,31,-21,-11,-83,0,-52,-52,0,-93,0,0,0,-62,-31,0,0,-31,0,21,-53,0,-32,0,0,-11,0,0,0,0,0,0,11,-63,0,-32,0,0,-31,0,21,-53,0,0,0,0,-31,0,-42,-11,31,0,10,0,0,0,0,0,0,-73,-31,0,0,-21,0,0,-73,0,-42,0,0,-10,0,0,0,0,0,0,0,-73,0,-21,0,0,-31,0,10,-73,0,-21,0,0,-31,0,-42,-21,10,0,0,0,0,0,0,0,0,0,-31,0,0,-21,0,0,0,0,-21,0,0,-10,0,0,0,0,0,0,10,0,0,-42,0,0,-52,0,10,0,0,0,0,0,-42,0,-52,-10,0,0,0,0,0,0,0,0,0,-73,-42,0,0,-31,0,0,-63,0,-32,0,0,-10,31,0,0,0,0,0,0,-83,0,-42,0,0,-41,0,21,-53,0,0,0,0,-31,0,-53,-21,21,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,-10,0,0,0,0,0,31,0,0,0,32,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,41,-10,21,0,-20,0,42,73,0,-21,0,-21,-10,-83,0,-73,-63,10,-84,21,42,0,-32,10,0,0,0,52,42,0,0,21,0,-10,0,-10,0,-63,0,-52,-42,0,-62,0,0,0,0,-21,0,0,0,0,0,31,0,0,0,0,0,31,0,32,11,31,-83,21,31,0,-32,31,0,-10,21,32,32,21,21,20,21,-10,31,-21,-11,21,0,10,-52,21,20,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,10,21,0,21,0,0,0,0,0,0,0,0,0,0,10,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,20,0,0,21,0,0,0,0,21,0,0,0,0,0,0,0,0,0,0,10,0,10,0,0,0,0,0,-21,0,0,0,0,10,11,0,0,0,0,0,0,0,0,0]}},{"family":"NewComicTitle","families":["NewComicTitle"],"weight":900,"source":"newcomictitle.ttf","ascent":877,"descent":160,"fallback":500,"chars":" !\"#$%&'()*+,-./0123456789:;<=>?@ABCDEFGHIJKLMNOPQRSTUVWXYZ[\\]^_`abcdefghijklmnopqrstuvwxyz{|}~ ¡¢£¤¥¦§¨©ª«¬­®¯°±²³´µ¶·¸¹º»¼½¾¿ÀÁÂÃÄÅÆÇÈÉÊËÌÍÎÏÐÑÒÓÔÕÖ×ØÙÚÛÜÝÞßàáâãäåæçèéêëìíîïðñòóôõö÷øùúûüýþÿ–—‘’‚“”„•…‹›€™","advances":[244,203,382,612,432,635,548,203,300,300,227,376,203,294,203,418,514,267,432,434,466,465,465,428,537,465,203,203,338,376,338,430,645,552,507,398,465,397,387,465,515,407,434,431,336,613,439,465,465,515,479,432,435,515,552,613,418,418,432,300,418,300,552,336,183,552,507,398,465,397,387,465,515,203,374,431,336,613,439,465,465,515,479,432,435,515,552,671,418,418,432,388,203,388,354,244,203,398,479,418,418,203,418,300,233,465,311,376,263,233,336,165,376,286,294,183,1069,203,203,154,188,284,311,687,557,609,430,552,552,552,552,552,552,719,398,339,339,339,339,407,407,407,407,537,439,465,465,465,465,465,358,514,515,515,515,515,418,465,503,552,552,552,552,552,552,719,398,339,339,339,339,203,203,203,203,465,439,465,465,465,465,465,376,465,515,515,515,515,418,465,418,294,376,203,203,203,382,382,382,465,585,168,168,486,323],"kern":{"left":["3","7","8","A","B","F","L","P","T","V","Y","a","b","f","l","p","t","v","w","y"],"right":["8","A","T","V","Y","a","j","t","v","w","y"],"values":[0,0,-40,0,0,0,0,-40,0,0,0,0,0,0,0,0,0,-97,0,0,0,0,0,0,-39,0,0,0,0,-39,0,0,0,0,0,-106,-127,-96,0,0,-106,-127,-96,-95,0,0,-51,-51,-51,0,0,-51,-50,-40,-51,0,-70,0,0,0,-70,-112,0,0,0,0,0,0,-109,-108,-98,0,0,-108,-109,-99,-99,0,-61,0,0,0,-60,-123,0,0,0,0,-41,-104,0,0,0,-103,-104,0,0,0,0,0,-127,0,0,0,-127,-137,0,0,0,0,0,-97,0,0,0,-97,-97,0,0,0,0,0,0,-107,-127,-96,0,0,-107,-127,-96,-96,0,0,-51,-51,-51,0,0,-50,-51,-40,-51,0,-70,0,0,0,-71,-112,0,0,0,0,0,0,-109,-109,-99,0,0,-109,-109,-99,-99,0,-61,0,0,0,-61,-124,0,0,0,0,-42,-104,0,0,0,-103,-104,0,0,0,0,0,-127,0,0,0,-127,-138,0,0,0,0,0,-89,0,0,0,-90,-121,0,0,0,0,0,-98,0,0,0,-97,-97,0,0,0,0]}}]};
+
+if (typeof module !== 'undefined') module.exports = FONT_METRICS;
+else window.FONT_METRICS = FONT_METRICS;
@@ -4,6 +4,9 @@
  * Defines per-template and per-field layout constraints:
  * maxChars, maxWords, maxLines, minFontSize, and safe-zone geometry.
  * Consumed by TextFitter, ContentValidator, and SafeZoneManager.
+ * textBox() adds the role, font and width a field is set in, for fitting
+ * with FontMetrics before rendering. The width follows the canvas (its
+ * width minus the SafeZoneManager margins) unless an override sets one.
  */
 
 class LayoutConstraints {
@@ -167,6 +170,51 @@ class LayoutConstraints {
         label: { min: 24, default: 30, max: 38 },
     };
 
+    /**
+     * Element role of fields that are not body text (see FONT_TIERS).
+     */
+    static FIELD_ROLES = {
+        TITLE: 'title', CHAPTER_TITLE: 'title', TERM: 'title', TOOL_NAME: 'title', COMMAND_NAME: 'title',
+        SUBTITLE: 'subtitle', CHAPTER_SUBTITLE: 'subtitle', WARNING_TITLE: 'subtitle',
+        TIP_TITLE: 'subtitle', NOTE_TITLE: 'subtitle',
+        COMMAND: 'mono', CMD: 'mono', COMMAND_STRUCTURE: 'mono', SYNTAX: 'mono', EXAMPLE_CMD: 'mono',
+        EXAMPLE_OUTPUT: 'mono', ERROR_CMD: 'mono', ERROR_OUTPUT: 'mono', INSTALL_CMD: 'mono',
+        USAGE_CMD: 'mono', SOLUTION_OUTPUT: 'mono', SOLUTION_CMD: 'mono', LINE: 'mono', COMMENT: 'mono',
+        FILENAME: 'mono', FILE_EXAMPLE: 'mono', ROOT_PATH: 'mono', IP: 'mono', PERMS: 'mono',
+        COMMAND_NUMBER: 'label', TOTAL_COMMANDS: 'label', CATEGORY: 'label', STEP_NUMBER: 'label',
+        TOTAL_STEPS: 'label', TIP_NUMBER: 'label', TIME_ESTIMATE: 'label', LANGUAGE: 'label',
+        TOOL_CATEGORY: 'label', GITHUB_STARS: 'label', FLAG: 'label', LABEL: 'label', STATUS: 'label',
+        HIGHLIGHT: 'label', GROUP: 'label',
+    };
+
+    /**
+     * Bundled font each role is set in (BrandingSystem: BlackOpsOne titles,
+     * MPLUS Code Latin text). Must have FontMetrics tables to be fitted.
+     */
+    static ROLE_FONTS = {
+        title: { fontFamily: 'BlackOpsOne', fontWeight: 400 },
+        subtitle: { fontFamily: 'MPLUS Code Latin', fontWeight: 700 },
+        body: { fontFamily: 'MPLUS Code Latin', fontWeight: 400 },
+        mono: { fontFamily: 'MPLUS Code Latin', fontWeight: 400 },
+        label: { fontFamily: 'MPLUS Code Latin', fontWeight: 700 },
+    };
+
+    /**
+     * Canvas the templates are designed on, and its lateral margin
+     * (SafeZoneManager.DEFAULTS.marginX).
+     */
+    static DESIGN_WIDTH = 1080;
+    static MARGIN_X = 60;
+
+    /**
+     * Width of the safe content area of a canvas.
+     * @param {number} [canvasWidth=1080]
+     * @returns {number}
+     */
+    static contentWidth(canvasWidth = this.DESIGN_WIDTH) {
+        return canvasWidth - 2 * this.MARGIN_X;
+    }
+
     /**
      * Get constraints for a specific field in a specific template.
      * @param {string} templateId - e.g. 'kr-clidn-34'
@@ -211,6 +259,32 @@ class LayoutConstraints {
         return result;
     }
 
+    /**
+     * Constraints plus the box a field is laid out in, ready for
+     * TextFitter.fitWithMetrics(). Per-template overrides may set
+     * fontFamily, fontWeight or maxWidth as well; an override's maxWidth is
+     * measured on the 1080px design canvas and scales with canvasWidth.
+     * @param {string} templateId
+     * @param {string} fieldName
+     * @param {number} [canvasWidth=1080] - width of the format being rendered
+     * @returns {{ maxChars: number, maxWords: number, maxLines: number, minFontSize: number,
+     *            role: string, fontFamily: string, fontWeight: number, maxWidth: number, defaultFontSize: number }}
+     */
+    static textBox(templateId, fieldName, canvasWidth = this.DESIGN_WIDTH) {
+        const constraints = this.forField(templateId, fieldName);
+        const role = this.FIELD_ROLES[fieldName] || 'body';
+        const maxWidth = constraints.maxWidth
+            ? Math.round(constraints.maxWidth * canvasWidth / this.DESIGN_WIDTH)
+            : this.contentWidth(canvasWidth);
+        return {
+            role,
+            ...this.ROLE_FONTS[role],
+            defaultFontSize: this.fontTier(role).default,
+            ...constraints,
+            maxWidth,
+        };
+    }
+
     /**
      * Get font tier bounds for an element role.
      * @param {'title'|'subtitle'|'body'|'mono'|'label'} role
@@ -7,6 +7,7 @@
  * 3. Line-height Compression — reduces lineHeight as last resort
  * 
  * Works with both Canvas (TextEngine) and HTML (getAutoFitScript) pipelines.
+ * Without a canvas, bundled fonts are measured with FontMetrics tables.
  */
 
 class TextFitter {
@@ -172,6 +173,10 @@ class TextFitter {
         let lines = 1;
         let wasScaled = false;
 
+        if (!ctx && constraints.maxLines && this._metricsFace(fontOptions)) {
+            return this.fitWithMetrics(text, constraints, fontOptions);
+        }
+
         if (ctx && constraints.maxLines) {
             const scaleResult = this.adaptiveFontScale(fittedText, {
                 ctx,
@@ -207,6 +212,81 @@ class TextFitter {
         return { fittedText, fontSize, lineHeight, lines, wasTruncated, wasScaled };
     }
 
+    /**
+     * Hybrid fit without a canvas: truncation, then the largest font size that
+     * fits maxLines according to the precomputed FontMetrics tables, then a
+     * line-based cut at minFontSize if it still overflows.
+     *
+     * @param {string} text - Original text
+     * @param {Object} constraints - From LayoutConstraints.forField() / textBox()
+     * @param {Object} fontOptions - { fontFamily, fontWeight, maxWidth, defaultFontSize, lineHeight, letterSpacing }
+     * @returns {{ fittedText: string, fontSize: number, lineHeight: number, lines: number, wasTruncated: boolean, wasScaled: boolean }|null}
+     *   null if the font has no metrics
+     */
+    static fitWithMetrics(text, constraints, fontOptions = {}) {
+        const FontMetrics = this._getFontMetrics();
+        if (!FontMetrics || !this._metricsFace(fontOptions)) return null;
+
+        const defaultFontSize = fontOptions.defaultFontSize || 42;
+        const lineHeight = fontOptions.lineHeight || 1.5;
+        const truncResult = this.smartTruncate(text || '', constraints);
+        let fittedText = truncResult.text;
+        let wasTruncated = truncResult.wasTruncated;
+        if (!fittedText) {
+            return { fittedText, fontSize: defaultFontSize, lineHeight, lines: 0, wasTruncated, wasScaled: false };
+        }
+
+        const options = {
+            fontFamily: fontOptions.fontFamily,
+            fontWeight: fontOptions.fontWeight || 400,
+            letterSpacing: fontOptions.letterSpacing || 0,
+            maxWidth: fontOptions.maxWidth || 960,
+            maxLines: constraints.maxLines || Infinity,
+            defaultFontSize,
+            minFontSize: Math.min(constraints.minFontSize || 28, defaultFontSize),
+        };
+        const fit = FontMetrics.fit(fittedText, options);
+        let lines = fit.lines;
+
+        if (!fit.fits) {
+            const cut = FontMetrics.truncateToLines(fittedText, fit.fontSize, options.maxWidth, options.maxLines, options);
+            fittedText = cut.text;
+            wasTruncated = true;
+            lines = options.maxLines;
+        }
+
+        return {
+            fittedText,
+            fontSize: fit.fontSize,
+            lineHeight,
+            lines,
+            wasTruncated,
+            wasScaled: fit.fontSize < defaultFontSize,
+        };
+    }
+
+    /**
+     * FontMetrics face for fontOptions, or null.
+     * @private
+     */
+    static _metricsFace(fontOptions = {}) {
+        const FontMetrics = this._getFontMetrics();
+        return FontMetrics ? FontMetrics.face(fontOptions.fontFamily, fontOptions.fontWeight || 400) : null;
+    }
+
+    /**
+     * Get FontMetrics module (handle browser vs Node).
+     * @private
+     */
+    static _getFontMetrics() {
+        if (typeof window !== 'undefined' && window.FontMetrics) return window.FontMetrics;
+        try {
+            return require('./FontMetrics');
+        } catch (e) {
+            return null;
+        }
+    }
+
     /**
      * Count how many lines a text occupies at the current font settings.
      * @private
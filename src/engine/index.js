@@ -13,11 +13,13 @@
   Load Order:
   1. LayoutConstraints.js (no dependencies — constraint definitions)
   2. SafeZoneManager.js   (no dependencies — safe zone geometry)
-  3. TextFitter.js        (depends on LayoutConstraints)
-  4. TextEngine.js        (depends on TextFitter)
-  5. EffectsEngine.js     (no dependencies)
-  6. BrandingSystem.js    (no dependencies)
-  7. CanvasRenderer.js    (depends on TextEngine, EffectsEngine, SafeZoneManager)
+  3. FontMetricsData.js  (generated by `python -m packtools metrics`)
+  4. FontMetrics.js       (depends on FontMetricsData)
+  5. TextFitter.js        (depends on LayoutConstraints, optionally FontMetrics)
+  6. TextEngine.js        (depends on TextFitter)
+  7. EffectsEngine.js     (no dependencies)
+  8. BrandingSystem.js    (no dependencies)
+  9. CanvasRenderer.js    (depends on TextEngine, EffectsEngine, SafeZoneManager)
 */
 
 /**
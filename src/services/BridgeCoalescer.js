@@ -0,0 +1,140 @@
+/**
+ * BridgeCoalescer - Agrupa y deduplica los eventos del puente TikTok antes del IPC
+ *
+ * Al hacer scroll, la extensión manda ráfagas de VIDEO_DATA (uno por vídeo de cada
+ * página de la API) y repite los mismos vídeos y perfiles una y otra vez. En lugar
+ * de un IPC por mensaje, los eventos se acumulan durante `windowMs` y se entregan en
+ * un lote por tipo, donde cada vídeo (id de la URL) o perfil (username) aparece una
+ * sola vez con los datos más recientes, combinados con los que ya había.
+ *
+ * Los tipos sin clave (VIRAL_VIDEO, GENERATE_REQUEST, ...) no se agrupan: vacían lo
+ * pendiente y se entregan enseguida, así el orden entre tipos se mantiene.
+ * Con windowMs = 0 todo se entrega al momento, mensaje a mensaje.
+ *
+ *   deliver(type, items)  -> un lote (array) por tipo
+ *   onFlush(tags)         -> los `tag` de push() entregados en ese vaciado
+ */
+
+class BridgeCoalescer {
+    /**
+     * @param {function} deliver - (type, items)
+     * @param {object} [options]
+     * @param {number} [options.windowMs=100] - espera máxima de un evento antes de entregarse
+     * @param {number} [options.maxBatch=500] - eventos distintos pendientes que fuerzan el vaciado
+     * @param {function} [options.onFlush] - (tags) tras cada vaciado con tags
+     */
+    constructor(deliver, options = {}) {
+        this.deliver = deliver;
+        this.windowMs = options.windowMs === undefined ? 100 : options.windowMs;
+        this.maxBatch = options.maxBatch || 500;
+        this.onFlush = options.onFlush || null;
+        this.pending = new Map(); // type -> Map(key -> mensaje)
+        this.size = 0;
+        this.tags = [];
+        this.timer = null;
+        this.stats = { received: 0, delivered: 0, duplicates: 0, batches: 0 };
+    }
+
+    /**
+     * Clave de deduplicación del mensaje, o null si su tipo no se agrupa.
+     */
+    static keyOf(msg) {
+        switch (msg.type) {
+            case 'VIDEO_DATA': {
+                const match = /\/video\/(\d+)/.exec(msg.url || '');
+                return match ? match[1] : (msg.url || null);
+            }
+            case 'PROFILE_DATA':
+                return msg.username ? String(msg.username).toLowerCase() : null;
+            case 'TREND_DATA':
+                return msg.url || 'trend';
+            default:
+                return null;
+        }
+    }
+
+    /**
+     * Campos nuevos sobre los anteriores, sin borrar los que el mensaje nuevo no trae
+     * (el interceptor de la API y el extractor del DOM rellenan campos distintos).
+     */
+    static merge(previous, msg) {
+        const merged = { ...previous };
+        for (const [field, value] of Object.entries(msg)) {
+            if (value !== undefined && value !== null && value !== '') merged[field] = value;
+        }
+        return merged;
+    }
+
+    /**
+     * @param {object} msg - mensaje ya parseado de la extensión
+     * @param {*} [tag] - se devuelve en onFlush cuando el mensaje (o su duplicado) se entrega
+     */
+    push(msg, tag) {
+        this.stats.received++;
+        const key = BridgeCoalescer.keyOf(msg);
+        if (key === null || this.windowMs <= 0) {
+            this.flush();
+            this._deliver(msg.type, [msg]);
+            if (tag !== undefined) this.tags.push(tag);
+            this._flushTags();
+            return;
+        }
+        if (tag !== undefined) this.tags.push(tag);
+
+        let group = this.pending.get(msg.type);
+        if (!group) {
+            group = new Map();
+            this.pending.set(msg.type, group);
+        }
+        const previous = group.get(key);
+        if (previous) {
+            this.stats.duplicates++;
+            group.set(key, BridgeCoalescer.merge(previous, msg));
+        } else {
+            group.set(key, msg);
+            this.size++;
+        }
+
+        if (this.size >= this.maxBatch) {
+            this.flush();
+        } else if (!this.timer) {
+            this.timer = setTimeout(() => this.flush(), this.windowMs);
+        }
+    }
+
+    /** Entrega todo lo pendiente. */
+    flush() {
+        if (this.timer) {
+            clearTimeout(this.timer);
+            this.timer = null;
+        }
+        const pending = this.pending;
+        this.pending = new Map();
+        this.size = 0;
+        for (const [type, group] of pending) {
+            this._deliver(type, Array.from(group.values()));
+        }
+        this._flushTags();
+    }
+
+    close() {
+        this.flush();
+    }
+
+    /** @private */
+    _deliver(type, items) {
+        this.stats.batches++;
+        this.stats.delivered += items.length;
+        this.deliver(type, items);
+    }
+
+    /** @private */
+    _flushTags() {
+        if (this.tags.length === 0) return;
+        const tags = this.tags;
+        this.tags = [];
+        if (this.onFlush) this.onFlush(tags);
+    }
+}
+
+module.exports = BridgeCoalescer;
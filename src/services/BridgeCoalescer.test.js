@@ -0,0 +1,91 @@
+/**
+ * Test del BridgeCoalescer (sin Electron ni WebSocket)
+ * Ejecutar con: node src/services/BridgeCoalescer.test.js
+ */
+
+const assert = require('assert');
+const BridgeCoalescer = require('./BridgeCoalescer');
+
+const sleep = (ms) => new Promise(resolve => setTimeout(resolve, ms));
+
+const video = (id, extra = {}) => ({
+    type: 'VIDEO_DATA',
+    url: `https://www.tiktok.com/@autor/video/${id}`,
+    ...extra
+});
+
+function collector() {
+    const batches = [];
+    return { batches, deliver: (type, items) => batches.push({ type, items }) };
+}
+
+async function testDeduplica() {
+    console.log('📝 Test 1: una ráfaga con vídeos repetidos sale en un solo lote...');
+    const { batches, deliver } = collector();
+    const coalescer = new BridgeCoalescer(deliver, { windowMs: 20 });
+
+    for (let round = 0; round < 5; round++) {
+        for (let id = 1; id <= 30; id++) coalescer.push(video(id, { metrics: { likes: round } }));
+    }
+    coalescer.push({ type: 'PROFILE_DATA', username: 'Autor', followers: 10 });
+    coalescer.push({ type: 'PROFILE_DATA', username: 'autor', bio: 'hola' });
+    assert.strictEqual(batches.length, 0, 'nada se entrega antes de la ventana');
+
+    await sleep(40);
+    assert.deepStrictEqual(batches.map(b => b.type), ['VIDEO_DATA', 'PROFILE_DATA']);
+    const videos = batches[0].items;
+    assert.strictEqual(videos.length, 30);
+    assert.ok(videos.every(v => v.metrics.likes === 4), 'gana el dato más reciente');
+    assert.deepStrictEqual(videos.map(v => v.url.split('/').pop()), Array.from({ length: 30 }, (_, i) => String(i + 1)));
+    // Los campos que el mensaje nuevo no trae se conservan
+    assert.deepStrictEqual(batches[1].items, [{ type: 'PROFILE_DATA', username: 'autor', followers: 10, bio: 'hola' }]);
+    assert.deepStrictEqual(coalescer.stats, { received: 152, delivered: 31, duplicates: 121, batches: 2 });
+    console.log('✅ OK\n');
+}
+
+async function testOrdenYTags() {
+    console.log('📝 Test 2: tipos sin clave vacían lo pendiente y los tags se devuelven...');
+    const { batches, deliver } = collector();
+    const flushed = [];
+    const coalescer = new BridgeCoalescer(deliver, { windowMs: 1000, onFlush: tags => flushed.push(tags) });
+
+    coalescer.push(video(1), 'a');
+    coalescer.push(video(1), 'b');
+    coalescer.push({ type: 'GENERATE_REQUEST', topic: 'x' }, 'c');
+    assert.deepStrictEqual(batches.map(b => [b.type, b.items.length]), [['VIDEO_DATA', 1], ['GENERATE_REQUEST', 1]]);
+    assert.deepStrictEqual(flushed, [['a', 'b'], ['c']]);
+
+    // maxBatch vacía sin esperar a la ventana
+    const small = new BridgeCoalescer(deliver, { windowMs: 1000, maxBatch: 3 });
+    [1, 2, 3].forEach(id => small.push(video(id)));
+    assert.strictEqual(batches.length, 3);
+    assert.strictEqual(batches[2].items.length, 3);
+    coalescer.close();
+    small.close();
+    console.log('✅ OK\n');
+}
+
+async function testSinAgrupar() {
+    console.log('📝 Test 3: windowMs = 0 entrega cada mensaje al momento...');
+    const { batches, deliver } = collector();
+    const coalescer = new BridgeCoalescer(deliver, { windowMs: 0 });
+    coalescer.push(video(1));
+    coalescer.push(video(1));
+    assert.deepStrictEqual(batches.map(b => b.items.length), [1, 1]);
+    assert.strictEqual(BridgeCoalescer.keyOf({ type: 'VIRAL_VIDEO' }), null);
+    assert.strictEqual(BridgeCoalescer.keyOf({ type: 'PROFILE_DATA' }), null);
+    console.log('✅ OK\n');
+}
+
+async function main() {
+    console.log('🚀 Iniciando test del BridgeCoalescer...\n');
+    await testDeduplica();
+    await testOrdenYTags();
+    await testSinAgrupar();
+    console.log('🎉 Todos los tests pasaron');
+}
+
+main().catch(error => {
+    console.error('❌ Error en el test:', error);
+    process.exit(1);
+});
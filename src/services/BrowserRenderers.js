@@ -0,0 +1,178 @@
+/**
+ * BrowserRenderers - Renderers de ExportScheduler sobre un navegador real
+ *
+ * SlideRenderer: una página de Puppeteer por worker; cada trabajo es un slide
+ *   ({ html, outputPath }) que se captura a disco.
+ * FrameRenderer: una página de Playwright por worker con el HTML del video ya
+ *   cargado; cada trabajo es un bloque de frames ({ start, count }) y devuelve sus
+ *   PNG en memoria. En lugar de esperar 1/fps entre capturas, las animaciones CSS
+ *   se pausan y se llevan al instante exacto de cada frame, así que cualquier
+ *   página puede renderizar cualquier tramo del video.
+ *   Los efectos con requestAnimationFrame y canvas (matrix rain de TemplateUtils,
+ *   CodeEffects) acumulan estado frame a frame: la página corre sobre un reloj
+ *   virtual (performance.now, Date, rAF y un Math.random con semilla fija) y antes
+ *   de cada bloque avanza sin capturar desde el frame 0, así todas las páginas
+ *   llegan al mismo estado en el mismo frame.
+ */
+
+class SlideRenderer {
+    /**
+     * @param {object} browser - navegador de Puppeteer ya lanzado
+     * @param {object} options - { width, height, format, settleMs, firstSettleMs }
+     */
+    constructor(browser, { width, height, format, settleMs = 500, firstSettleMs = 3000 }) {
+        this.browser = browser;
+        this.width = width;
+        this.height = height;
+        this.format = format;
+        this.settleMs = settleMs;
+        this.firstSettleMs = firstSettleMs;
+    }
+
+    async createWorker() {
+        const page = await this.browser.newPage();
+        await page.setViewport({ width: this.width, height: this.height, deviceScaleFactor: 1 });
+        let first = true;
+
+        return {
+            render: async ({ html, outputPath }) => {
+                await page.setContent(html, { waitUntil: 'domcontentloaded', timeout: 30000 });
+                // Fuentes locales como data URI: document.fonts.ready basta
+                await page.evaluate(() => document.fonts.ready).catch(() => { });
+                // Primer slide de cada página: margen para Iconify (CDN) si el slide aún lo usa
+                const wait = first && html.includes('iconify.min.js') ? this.firstSettleMs : this.settleMs;
+                first = false;
+                await new Promise(resolve => setTimeout(resolve, wait));
+
+                await page.screenshot({
+                    path: outputPath,
+                    type: this.format === 'jpg' ? 'jpeg' : this.format,
+                    quality: this.format === 'png' ? undefined : 100,
+                    omitBackground: false
+                });
+                return outputPath;
+            },
+            close: () => page.close().catch(() => { })
+        };
+    }
+}
+
+/**
+ * Se inyecta con addInitScript, antes que los scripts de la página: el tiempo solo
+ * avanza con __virtualClock.step(t), que ejecuta una ronda de callbacks de rAF.
+ * Se serializa al navegador, así que no puede usar nada de fuera de la función.
+ */
+function installVirtualClock({ epoch, seed }) {
+    let now = 0;
+    let callbacks = new Map();
+    let nextId = 1;
+
+    // mulberry32: la misma secuencia en todas las páginas
+    let state = seed >>> 0;
+    Math.random = () => {
+        state = (state + 0x6D2B79F5) >>> 0;
+        let t = state;
+        t = Math.imul(t ^ (t >>> 15), t | 1);
+        t ^= t + Math.imul(t ^ (t >>> 7), t | 61);
+        return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+    };
+
+    performance.now = () => now;
+    const RealDate = Date;
+    function VirtualDate(...args) {
+        if (!new.target) return new RealDate(epoch + now).toString();
+        return args.length ? new RealDate(...args) : new RealDate(epoch + now);
+    }
+    VirtualDate.prototype = RealDate.prototype;
+    VirtualDate.now = () => epoch + now;
+    VirtualDate.parse = RealDate.parse;
+    VirtualDate.UTC = RealDate.UTC;
+    window.Date = VirtualDate;
+
+    window.requestAnimationFrame = (callback) => {
+        callbacks.set(nextId, callback);
+        return nextId++;
+    };
+    window.cancelAnimationFrame = (id) => callbacks.delete(id);
+
+    window.__virtualClock = {
+        step(t) {
+            now = t;
+            // Los que se registren durante la ronda van a la siguiente, como en rAF
+            const due = callbacks;
+            callbacks = new Map();
+            for (const callback of due.values()) {
+                try {
+                    callback(t);
+                } catch (e) {
+                    console.error(e);
+                }
+            }
+        }
+    };
+}
+
+class FrameRenderer {
+    /**
+     * @param {object} context - BrowserContext de Playwright con el viewport del video
+     * @param {object} options - { url, fps, loadMs, seed }
+     */
+    constructor(context, { url, fps, loadMs = 2000, seed = 1 }) {
+        this.context = context;
+        this.url = url;
+        this.fps = fps;
+        this.loadMs = loadMs;
+        this.seed = seed;
+        // Mismo Date.now() en el frame 0 de todas las páginas
+        this.epoch = Date.now();
+    }
+
+    async _openPage() {
+        const page = await this.context.newPage();
+        await page.addInitScript(installVirtualClock, { epoch: this.epoch, seed: this.seed });
+        await page.goto(this.url, { waitUntil: 'networkidle' });
+        // Congelar las animaciones antes de la espera de carga: si no, las que duran
+        // menos que loadMs terminarían y ya no se podrían llevar al frame 0
+        await page.evaluate(() => document.getAnimations().forEach(animation => animation.pause()));
+        await page.waitForTimeout(this.loadMs);
+        return page;
+    }
+
+    async createWorker() {
+        let page = await this._openPage();
+        let nextFrame = 0; // primer frame que el reloj virtual de la página aún no ha dado
+
+        return {
+            render: async ({ start, count }) => {
+                // El estado de rAF no se puede rebobinar: un bloque anterior necesita página nueva
+                if (start < nextFrame) {
+                    await page.close().catch(() => { });
+                    page = await this._openPage();
+                    nextFrame = 0;
+                }
+                // Avanzar sin capturar hasta el inicio del bloque
+                await page.evaluate(({ from, to, fps }) => {
+                    for (let frame = from; frame < to; frame++) window.__virtualClock.step(frame * 1000 / fps);
+                }, { from: nextFrame, to: start, fps: this.fps });
+
+                const frames = [];
+                for (let frame = start; frame < start + count; frame++) {
+                    const timeMs = frame * 1000 / this.fps;
+                    await page.evaluate((t) => {
+                        window.__virtualClock.step(t);
+                        for (const animation of document.getAnimations()) {
+                            animation.pause();
+                            animation.currentTime = t;
+                        }
+                    }, timeMs);
+                    frames.push(await page.screenshot({ type: 'png' }));
+                }
+                nextFrame = start + count;
+                return frames;
+            },
+            close: () => page.close().catch(() => { })
+        };
+    }
+}
+
+module.exports = { SlideRenderer, FrameRenderer, installVirtualClock };
@@ -0,0 +1,72 @@
+/**
+ * Test del reloj virtual de FrameRenderer (sin navegador: cada "página" es un contexto vm)
+ * Ejecutar con: node src/services/BrowserRenderers.test.js
+ */
+
+const assert = require('assert');
+const vm = require('vm');
+const { installVirtualClock } = require('./BrowserRenderers');
+
+const FPS = 30;
+
+// Página falsa con un efecto como el matrix rain: estado acumulado por rAF y Math.random
+function openPage() {
+    const context = vm.createContext({ console, performance: {}, Math: Object.create(Math), Date });
+    context.window = context;
+    vm.runInContext(`(${installVirtualClock})({ epoch: 1700000000000, seed: 1 });`, context);
+    vm.runInContext(`
+        var drops = Array.from({ length: 40 }, () => Math.random() * -50);
+        var seen = [];
+        function draw(t) {
+            for (let i = 0; i < drops.length; i++) {
+                if (drops[i] > 60 && Math.random() > 0.975) drops[i] = 0;
+                drops[i]++;
+            }
+            seen.push([t, performance.now(), Date.now(), new Date().getTime()]);
+            requestAnimationFrame(draw);
+        }
+        requestAnimationFrame(draw);
+    `, context);
+    return {
+        step: (frame) => vm.runInContext(`__virtualClock.step(${frame * 1000 / FPS})`, context),
+        state: () => vm.runInContext('JSON.stringify({ drops, last: seen[seen.length - 1] })', context)
+    };
+}
+
+function renderChunk(page, from, start, count) {
+    for (let frame = from; frame < start; frame++) page.step(frame);
+    const states = [];
+    for (let frame = start; frame < start + count; frame++) {
+        page.step(frame);
+        states.push(page.state());
+    }
+    return states;
+}
+
+function main() {
+    console.log('🚀 Iniciando test del reloj virtual...\n');
+
+    console.log('📝 Test 1: un bloque renderizado en otra página continúa sin saltos...');
+    const single = renderChunk(openPage(), 0, 0, 60);
+    const first = renderChunk(openPage(), 0, 0, 30);
+    const second = renderChunk(openPage(), 0, 30, 30);
+    assert.deepStrictEqual(first.concat(second), single);
+    console.log('✅ OK\n');
+
+    console.log('📝 Test 2: performance.now, Date.now y new Date() siguen al frame...');
+    const [t, perf, now, date] = JSON.parse(single[45]).last;
+    assert.strictEqual(t, 1500);
+    assert.strictEqual(perf, 1500);
+    assert.strictEqual(now, 1700000001500);
+    assert.strictEqual(date, 1700000001500);
+    console.log('✅ OK\n');
+
+    console.log('🎉 Todos los tests pasaron');
+}
+
+try {
+    main();
+} catch (error) {
+    console.error('❌ Error en el test:', error);
+    process.exit(1);
+}
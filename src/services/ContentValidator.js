@@ -5,6 +5,12 @@
  * the rendering pipeline. Enforces LayoutConstraints on every field,
  * truncates overflows, and logs warnings for debugging.
  * 
+ * When FontMetrics tables are loaded, string fields are also measured in their
+ * box (LayoutConstraints.textBox): text that overflows maxLines even at
+ * minFontSize is cut at a line boundary, which character limits alone miss.
+ * The box is as wide as the slide's canvas allows (slide.canvas, or the
+ * canvas passed to validate(); 1080px by default).
+ * 
  * Sits between the AI response and the TemplateEngine/CanvasRenderer.
  */
 
@@ -15,9 +21,11 @@ class ContentValidator {
      * Each slide has { templateId, content: { FIELD: value, ... } }
      * 
      * @param {Array} slides - Array of slide objects from AI
+     * @param {Object} [options]
+     * @param {{ width: number, height: number }} [options.canvas] - format being rendered
      * @returns {{ valid: boolean, slides: Array, warnings: string[] }}
      */
-    static validate(slides) {
+    static validate(slides, options = {}) {
         if (!Array.isArray(slides)) {
             console.warn('[ContentValidator] Input is not an array, wrapping.');
             slides = [slides];
@@ -25,7 +33,7 @@ class ContentValidator {
 
         const warnings = [];
         const sanitizedSlides = slides.map((slide, idx) => {
-            return this.validateSlide(slide, idx, warnings);
+            return this.validateSlide(slide, idx, warnings, options.canvas);
         });
 
         if (warnings.length > 0) {
@@ -45,9 +53,10 @@ class ContentValidator {
      * @param {Object} slide - { templateId, content: { ... } }
      * @param {number} slideIndex - For logging
      * @param {string[]} warnings - Warnings array to push to
+     * @param {{ width: number }} [canvas] - used when the slide has no canvas of its own
      * @returns {Object} Sanitized slide
      */
-    static validateSlide(slide, slideIndex, warnings) {
+    static validateSlide(slide, slideIndex, warnings, canvas) {
         if (!slide || !slide.content) {
             warnings.push(`Slide ${slideIndex + 1}: No content found.`);
             return slide;
@@ -62,13 +71,14 @@ class ContentValidator {
             return slide; // Module not available, skip validation
         }
         const TextFitter = this._getTextFitter();
+        const canvasWidth = (slide.canvas && slide.canvas.width) || (canvas && canvas.width) || undefined;
 
         // Iterate all content fields
         for (const [field, value] of Object.entries(content)) {
             if (typeof value === 'string') {
                 // Validate string fields
                 content[field] = this._validateStringField(
-                    value, field, templateId, slideIndex, warnings, LayoutConstraints, TextFitter
+                    value, field, templateId, slideIndex, warnings, LayoutConstraints, TextFitter, canvasWidth
                 );
             } else if (Array.isArray(value)) {
                 // Validate array fields (COMPONENTS, KEY_FLAGS, etc.)
@@ -86,12 +96,23 @@ class ContentValidator {
      * Validate and truncate a string field.
      * @private
      */
-    static _validateStringField(value, fieldName, templateId, slideIndex, warnings, LayoutConstraints, TextFitter) {
+    static _validateStringField(value, fieldName, templateId, slideIndex, warnings, LayoutConstraints, TextFitter, canvasWidth) {
         const constraints = LayoutConstraints.forField(templateId, fieldName);
 
         // Strip common AI artifacts
         let cleaned = this._cleanText(value);
 
+        // Measure in the field's box with font metrics (bundled fonts only)
+        const box = TextFitter && TextFitter.fitWithMetrics && LayoutConstraints.textBox
+            ? LayoutConstraints.textBox(templateId, fieldName, canvasWidth) : null;
+        const fit = box && cleaned ? TextFitter.fitWithMetrics(cleaned, box, box) : null;
+        if (fit) {
+            if (fit.wasTruncated) {
+                warnings.push(`Slide ${slideIndex + 1} [${templateId}]: ${fieldName} truncated from ${cleaned.length} to ${fit.fittedText.length} chars (limit: ${box.maxChars} chars / ${box.maxWords} words / ${box.maxLines} lines at ${box.minFontSize}px)`);
+            }
+            return fit.fittedText;
+        }
+
         // Check and truncate
         if (TextFitter) {
             const result = TextFitter.smartTruncate(cleaned, constraints);
@@ -179,11 +200,7 @@ class ContentValidator {
         if (typeof window !== 'undefined' && window.LayoutConstraints) {
             return window.LayoutConstraints;
         }
-        try {
-            return require('./LayoutConstraints') || require('../engine/LayoutConstraints');
-        } catch (e) {
-            return null;
-        }
+        return this._require('LayoutConstraints');
     }
 
     /**
@@ -194,11 +211,22 @@ class ContentValidator {
         if (typeof window !== 'undefined' && window.TextFitter) {
             return window.TextFitter;
         }
-        try {
-            return require('./TextFitter') || require('../engine/TextFitter');
-        } catch (e) {
-            return null;
+        return this._require('TextFitter');
+    }
+
+    /**
+     * Node: load an engine module from next to this file or from ../engine.
+     * @private
+     */
+    static _require(name) {
+        for (const modulePath of [`./${name}`, `../engine/${name}`]) {
+            try {
+                return require(modulePath);
+            } catch (e) {
+                // Try the next location
+            }
         }
+        return null;
     }
 
     /**
@@ -247,10 +275,28 @@ class ContentValidator {
                 const fallback = { maxChars: 200, maxWords: 35, maxLines: 5, minFontSize: 28 };
                 const constraints = (LayoutConstraints.FIELD_DEFAULTS && LayoutConstraints.FIELD_DEFAULTS[role])
                     || (LayoutConstraints.forField && LayoutConstraints.forField('', role)) || fallback;
-                const result = TextFitter.smartTruncate(layer.content, constraints);
-                if (result.wasTruncated) {
-                    warnings.push(`Page ${pageIndex+1}, Layer ${layerIdx}: text truncated (${role})`);
-                    layer = Object.assign({}, layer, { content: result.text });
+                const font = layer.font || {};
+                const fit = typeof layer.width === 'number' && TextFitter.fitWithMetrics
+                    ? TextFitter.fitWithMetrics(layer.content, constraints, {
+                        fontFamily: font.family, fontWeight: font.weight, maxWidth: layer.width,
+                        defaultFontSize: font.size || 42, lineHeight: layer.lineHeight,
+                    })
+                    : null;
+                if (fit) {
+                    if (fit.wasTruncated) {
+                        warnings.push(`Page ${pageIndex+1}, Layer ${layerIdx}: text truncated to ${fit.lines} lines (${role})`);
+                        layer = Object.assign({}, layer, { content: fit.fittedText });
+                    }
+                    if (fit.wasScaled) {
+                        warnings.push(`Page ${pageIndex+1}, Layer ${layerIdx}: font ${font.size}px → ${fit.fontSize}px to fit ${constraints.maxLines} lines (${role})`);
+                        layer = Object.assign({}, layer, { font: Object.assign({}, font, { size: fit.fontSize }) });
+                    }
+                } else {
+                    const result = TextFitter.smartTruncate(layer.content, constraints);
+                    if (result.wasTruncated) {
+                        warnings.push(`Page ${pageIndex+1}, Layer ${layerIdx}: text truncated (${role})`);
+                        layer = Object.assign({}, layer, { content: result.text });
+                    }
                 }
             }
 
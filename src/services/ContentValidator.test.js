@@ -0,0 +1,63 @@
+/**
+ * Test del ajuste por métricas de fuente en ContentValidator
+ * Ejecutar con: node src/services/ContentValidator.test.js
+ */
+
+const assert = require('assert');
+const ContentValidator = require('./ContentValidator');
+const TextFitter = require('../engine/TextFitter');
+const LayoutConstraints = require('../engine/LayoutConstraints');
+
+function main() {
+    console.log('🚀 Iniciando test del ContentValidator...\n');
+    const box = LayoutConstraints.textBox('intro', 'TITLE');
+
+    console.log('📝 Test 1: un título que cabe no se toca...');
+    const short = 'Docker en 5 minutos';
+    let result = ContentValidator.validate([{ templateId: 'intro', content: { TITLE: short } }]);
+    assert.strictEqual(result.slides[0].content.TITLE, short);
+    assert.strictEqual(result.warnings.length, 0);
+    assert.ok(!('fit' in result.slides[0]), 'no se añaden campos al slide');
+    console.log('✅ OK\n');
+
+    console.log('📝 Test 2: texto ancho dentro del límite de caracteres se recorta por líneas...');
+    const wide = 'WWWWWW MMMMMM WWWWWW MMMMMM WWWWWW MMMMMM';
+    assert.ok(wide.length <= box.maxChars, 'cabe por caracteres');
+    assert.strictEqual(TextFitter.smartTruncate(wide, box).wasTruncated, false, 'la heurística no lo detecta');
+    result = ContentValidator.validate([{ templateId: 'intro', content: { TITLE: wide } }]);
+    const fitted = result.slides[0].content.TITLE;
+    assert.ok(fitted.length < wide.length && fitted.endsWith('…'), `recortado: ${fitted}`);
+    const check = TextFitter.fitWithMetrics(fitted, box, box);
+    assert.strictEqual(check.wasTruncated, false, 'el resultado cabe a minFontSize');
+    assert.ok(check.lines <= box.maxLines);
+    assert.strictEqual(result.warnings.length, 1);
+    assert.ok(result.warnings[0].includes(`${box.maxLines} lines at ${box.minFontSize}px`), result.warnings[0]);
+    console.log('✅ OK\n');
+
+    console.log('📝 Test 3: sin métricas para la fuente se usa la heurística de caracteres...');
+    assert.strictEqual(TextFitter.fitWithMetrics(wide, box, { ...box, fontFamily: 'NoSuchFont' }), null);
+    const long = 'Aprende Kubernetes desde cero con ejemplos prácticos reales';
+    result = ContentValidator.validate([{ templateId: 'intro', content: { TITLE: long } }]);
+    assert.ok(result.slides[0].content.TITLE.length <= box.maxChars);
+    console.log('✅ OK\n');
+
+    console.log('📝 Test 4: el ancho de la caja sigue al formato del slide...');
+    assert.strictEqual(LayoutConstraints.textBox('intro', 'TITLE', 1920).maxWidth, 1800);
+    result = ContentValidator.validate([{ templateId: 'intro', canvas: { width: 1920, height: 1080 }, content: { TITLE: wide } }]);
+    assert.strictEqual(result.slides[0].content.TITLE, wide, 'en 16:9 cabe entero');
+    assert.strictEqual(result.warnings.length, 0);
+    result = ContentValidator.validate([{ templateId: 'intro', content: { TITLE: wide } }], { canvas: { width: 720, height: 1280 } });
+    const narrow = result.slides[0].content.TITLE;
+    assert.ok(narrow.length < fitted.length, `más estrecho, más corto: ${narrow}`);
+    assert.strictEqual(TextFitter.fitWithMetrics(narrow, box, { ...box, maxWidth: 600 }).wasTruncated, false);
+    console.log('✅ OK\n');
+
+    console.log('🎉 Todos los tests pasaron');
+}
+
+try {
+    main();
+} catch (error) {
+    console.error('❌ Error en el test:', error);
+    process.exit(1);
+}
@@ -0,0 +1,118 @@
+/**
+ * ExportScheduler - Reparte trabajos de render entre N workers (páginas de navegador)
+ *
+ * Los slides de export-batch y los bloques de frames de export-video se renderizan
+ * en paralelo, pero los resultados se entregan en el orden original: `onResult` se
+ * llama para el trabajo 0, luego el 1, etc., así se puede escribir directamente en
+ * ffmpeg o en disco sin reordenar. Ningún worker se adelanta más de `window`
+ * trabajos al último entregado, de modo que la memoria queda acotada.
+ *
+ * Interfaz del renderer (cualquier objeto que la cumpla; ver BrowserRenderers.js y
+ * el renderer falso de ExportScheduler.test.js):
+ *   renderer.createWorker(id)  -> Promise<worker>
+ *   worker.render(task, index) -> Promise<resultado>
+ *   worker.close()             -> Promise
+ */
+
+const os = require('os');
+
+class ExportScheduler {
+    /**
+     * @param {object} renderer
+     * @param {object} [options]
+     * @param {number} [options.concurrency] - workers (por defecto: CPUs - 1, máximo 4)
+     * @param {number} [options.window] - trabajos en vuelo por delante del último entregado
+     * @param {function} [options.onProgress] - ({ worker, index, done, total, workerDone }) por trabajo terminado
+     */
+    constructor(renderer, options = {}) {
+        this.renderer = renderer;
+        this.concurrency = Math.max(1, options.concurrency || ExportScheduler.defaultConcurrency());
+        this.window = Math.max(this.concurrency, options.window || this.concurrency * 2);
+        this.onProgress = options.onProgress || null;
+    }
+
+    static defaultConcurrency() {
+        return Math.max(1, Math.min(4, os.cpus().length - 1));
+    }
+
+    /**
+     * Renderiza `tasks` y llama a `onResult(resultado, index)` en orden.
+     * Si un trabajo falla, no se empiezan más, se cierran los workers y se rechaza.
+     * @param {Array} tasks
+     * @param {function} [onResult]
+     * @returns {Promise<{ total: number, perWorker: number[] }>}
+     */
+    async run(tasks, onResult = null) {
+        const total = tasks.length;
+        const workerCount = Math.min(this.concurrency, total);
+        const perWorker = new Array(workerCount).fill(0);
+        if (total === 0) return { total, perWorker };
+
+        const results = new Map();      // index -> resultado aún sin entregar
+        let nextTask = 0;               // siguiente trabajo a repartir
+        let nextEmit = 0;               // siguiente trabajo a entregar
+        let done = 0;
+        let failure = null;
+        let emitting = Promise.resolve();
+        let wakeUp = [];                // workers esperando a que avance la ventana
+
+        const wake = () => {
+            const waiting = wakeUp;
+            wakeUp = [];
+            waiting.forEach(resolve => resolve());
+        };
+
+        // Entrega en orden todo lo contiguo que ya esté listo
+        const drain = async () => {
+            while (!failure && results.has(nextEmit)) {
+                const result = results.get(nextEmit);
+                results.delete(nextEmit);
+                if (onResult) await onResult(result, nextEmit);
+                nextEmit++;
+                wake();
+            }
+        };
+
+        const fail = (error) => {
+            if (!failure) failure = error;
+            wake();
+        };
+
+        const runWorker = async (id) => {
+            const worker = await this.renderer.createWorker(id);
+            try {
+                while (!failure && nextTask < total) {
+                    if (nextTask >= nextEmit + this.window) {
+                        await new Promise(resolve => wakeUp.push(resolve));
+                        continue;
+                    }
+                    const index = nextTask++;
+                    const result = await worker.render(tasks[index], index);
+                    if (failure) break;
+                    results.set(index, result);
+                    perWorker[id]++;
+                    done++;
+                    if (this.onProgress) {
+                        this.onProgress({ worker: id, index, done, total, workerDone: perWorker[id] });
+                    }
+                    emitting = emitting.then(drain).catch(fail);
+                }
+            } catch (error) {
+                fail(error);
+            } finally {
+                await worker.close();
+            }
+        };
+
+        const workers = [];
+        for (let id = 0; id < workerCount; id++) {
+            workers.push(runWorker(id).catch(fail));
+        }
+        await Promise.all(workers);
+        await emitting;
+        if (failure) throw failure;
+        return { total, perWorker };
+    }
+}
+
+module.exports = ExportScheduler;
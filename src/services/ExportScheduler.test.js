@@ -0,0 +1,134 @@
+/**
+ * Test del ExportScheduler (sin navegador: renderer falso con retardos aleatorios)
+ * Ejecutar con: node src/services/ExportScheduler.test.js
+ */
+
+const assert = require('assert');
+const ExportScheduler = require('./ExportScheduler');
+
+const sleep = (ms) => new Promise(resolve => setTimeout(resolve, ms));
+
+// Renderer falso: cada trabajo tarda entre 0 y maxDelay ms y devuelve `task * 10`
+function fakeRenderer({ maxDelay = 15, failAt = -1 } = {}) {
+    const stats = { created: 0, closed: 0, active: 0, maxActive: 0 };
+    return {
+        stats,
+        async createWorker(id) {
+            stats.created++;
+            return {
+                render: async (task, index) => {
+                    stats.active++;
+                    stats.maxActive = Math.max(stats.maxActive, stats.active);
+                    await sleep(Math.random() * maxDelay);
+                    stats.active--;
+                    if (index === failAt) throw new Error(`fallo en ${index}`);
+                    return task * 10;
+                },
+                close: async () => { stats.closed++; }
+            };
+        }
+    };
+}
+
+async function testOrdenYProgreso() {
+    console.log('📝 Test 1: entrega en orden y progreso por worker...');
+    const renderer = fakeRenderer();
+    const tasks = Array.from({ length: 40 }, (_, i) => i);
+    const progress = [];
+    const scheduler = new ExportScheduler(renderer, { concurrency: 4, onProgress: p => progress.push(p) });
+
+    const received = [];
+    const { total, perWorker } = await scheduler.run(tasks, (result, index) => received.push([index, result]));
+
+    assert.deepStrictEqual(received, tasks.map(i => [i, i * 10]));
+    assert.strictEqual(total, 40);
+    assert.strictEqual(perWorker.reduce((a, b) => a + b, 0), 40);
+    assert.strictEqual(progress.length, 40);
+    assert.deepStrictEqual(progress.map(p => p.done), tasks.map(i => i + 1));
+    for (let id = 0; id < 4; id++) {
+        const own = progress.filter(p => p.worker === id).map(p => p.workerDone);
+        assert.deepStrictEqual(own, own.map((_, i) => i + 1));
+    }
+    assert.ok(renderer.stats.maxActive <= 4, `maxActive=${renderer.stats.maxActive}`);
+    assert.strictEqual(renderer.stats.closed, renderer.stats.created);
+    console.log(`✅ OK (trabajos por worker: ${perWorker.join(', ')})\n`);
+}
+
+async function testVentana() {
+    console.log('📝 Test 2: ningún worker se adelanta más de `window` trabajos...');
+    const renderer = fakeRenderer({ maxDelay: 3 });
+    const scheduler = new ExportScheduler(renderer, { concurrency: 3, window: 5 });
+    let emitted = 0;
+    let maxAhead = 0;
+    const started = [];
+    const original = renderer.createWorker.bind(renderer);
+    renderer.createWorker = async (id) => {
+        const worker = await original(id);
+        const render = worker.render;
+        worker.render = (task, index) => {
+            started.push(index);
+            maxAhead = Math.max(maxAhead, index - emitted);
+            return render(task, index);
+        };
+        return worker;
+    };
+
+    // El consumidor es lento: sin la ventana, los workers terminarían todo antes
+    await scheduler.run(Array.from({ length: 30 }, (_, i) => i), async () => {
+        await sleep(5);
+        emitted++;
+    });
+    assert.strictEqual(started.length, 30);
+    assert.ok(maxAhead < 5, `maxAhead=${maxAhead}`);
+    console.log(`✅ OK (máximo adelanto: ${maxAhead})\n`);
+}
+
+async function testErrores() {
+    console.log('📝 Test 3: un fallo se propaga y cierra los workers...');
+    const renderer = fakeRenderer({ failAt: 7 });
+    const scheduler = new ExportScheduler(renderer, { concurrency: 3 });
+    const received = [];
+    await assert.rejects(
+        scheduler.run(Array.from({ length: 50 }, (_, i) => i), (_, index) => received.push(index)),
+        /fallo en 7/
+    );
+    assert.ok(received.every(index => index < 7), `entregados: ${received}`);
+    assert.strictEqual(renderer.stats.closed, renderer.stats.created);
+
+    // Un error en onResult también detiene el scheduler
+    const second = fakeRenderer();
+    await assert.rejects(
+        new ExportScheduler(second, { concurrency: 2 }).run([1, 2, 3, 4], (_, index) => {
+            if (index === 1) throw new Error('disco lleno');
+        }),
+        /disco lleno/
+    );
+    assert.strictEqual(second.stats.closed, second.stats.created);
+    console.log('✅ OK\n');
+}
+
+async function testBordes() {
+    console.log('📝 Test 4: lista vacía y más workers que trabajos...');
+    const renderer = fakeRenderer();
+    assert.deepStrictEqual(await new ExportScheduler(renderer).run([]), { total: 0, perWorker: [] });
+    assert.strictEqual(renderer.stats.created, 0);
+
+    const { perWorker } = await new ExportScheduler(renderer, { concurrency: 8 }).run([1, 2]);
+    assert.strictEqual(perWorker.length, 2);
+    assert.ok(ExportScheduler.defaultConcurrency() >= 1);
+    console.log('✅ OK\n');
+}
+
+async function main() {
+    console.log('🚀 Iniciando test del ExportScheduler...\n');
+    await testOrdenYProgreso();
+    await testVentana();
+    await testErrores();
+    await testBordes();
+    console.log('🎉 Todos los tests pasaron');
+}
+
+main().catch(error => {
+    console.error('❌ Error en el test:', error);
+    process.exit(1);
+});
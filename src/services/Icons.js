@@ -214,6 +214,30 @@ class IconsClass {
         `;
     }
 
+    /**
+     * Sprite con un <symbol id="kr-i-nombre"> por icono, para los templates que el pass
+     * icon_sprite (python -m packtools icons) pasó a <svg><use href="#kr-i-nombre">.
+     * Mismos ids que assets/icons/sprite.svg: nombre en minúsculas y "-" → "_".
+     */
+    spriteSVG() {
+        const lucideAttrs = 'fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"';
+        const symbols = Object.keys(this.icons).map(name => {
+            const id = 'kr-i-' + name.toLowerCase().replace(/-/g, '_');
+            const attrs = MATERIAL_ICONS[name] ? '' : ' ' + lucideAttrs;
+            return `<symbol id="${id}" viewBox="0 0 24 24"${attrs}>${this.icons[name]}</symbol>`;
+        });
+        return `<svg xmlns="http://www.w3.org/2000/svg" style="display:none" aria-hidden="true">${symbols.join('')}</svg>`;
+    }
+
+    mountSprite(doc = document) {
+        if (doc.getElementById('kr-icon-sprite')) return;
+        const holder = doc.createElement('div');
+        holder.id = 'kr-icon-sprite';
+        holder.style.display = 'none';
+        holder.innerHTML = this.spriteSVG();
+        doc.body.appendChild(holder);
+    }
+
     replaceIconsInHTML(html) {
         return html.replace(/<i class="material-icons">([^<]+)<\/i>/g, (match, iconName) => {
             const name = iconName.trim();
@@ -232,4 +256,6 @@ export { Icons as default, Icons };
 // Support Node and Browser formats seamlessly
 if (typeof window !== 'undefined') {
     window.Icons = Icons;
+    if (document.body) Icons.mountSprite();
+    else document.addEventListener('DOMContentLoaded', () => Icons.mountSprite());
 }
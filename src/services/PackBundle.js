@@ -0,0 +1,90 @@
+/**
+ * PackBundle - Lector del bundle indexado de packs (src/packs.bundle)
+ * Lo genera `python -m packtools bundle` (start.sh lo ejecuta en cada arranque).
+ *
+ * Formato: "PKBUNDLE 1\n" + longitud del índice + "\n" + índice JSON + código de
+ * los templates uno tras otro. El índice trae la metadata de cada pack, los
+ * manifiestos ya parseados y el [offset, length] del código de cada template.
+ *
+ * Al cargar solo se comprueban los directorios de packs (unos pocos stat). Un
+ * template editado en su sitio no cambia el mtime de su directorio: eso lo detecta
+ * `python -m packtools bundle`, que compara tamaño y mtime de cada archivo y
+ * recompila. `packtools rewrite` escribe con archivo temporal + rename, así que
+ * sus cambios sí invalidan el bundle al cargar.
+ */
+
+const fs = require('fs');
+const path = require('path');
+
+const MAGIC = 'PKBUNDLE 1\n';
+const BUNDLE_VERSION = 2;
+
+class PackBundle {
+    constructor(buffer, index, payloadStart) {
+        this.buffer = buffer;
+        this.index = index;
+        this.payloadStart = payloadStart;
+    }
+
+    /**
+     * Lee el bundle con una sola lectura. Devuelve null si no existe, no es válido
+     * o un directorio de packs cambió después de generarlo (archivos añadidos,
+     * borrados o reemplazados). En ese caso hay que escanear src/packs como antes.
+     * @param {string} bundlePath
+     * @param {string} packsDir
+     * @returns {PackBundle|null}
+     */
+    static load(bundlePath, packsDir) {
+        let buffer;
+        try {
+            buffer = fs.readFileSync(bundlePath);
+        } catch (e) {
+            return null;
+        }
+        if (buffer.toString('latin1', 0, MAGIC.length) !== MAGIC) return null;
+
+        const lengthEnd = buffer.indexOf(0x0a, MAGIC.length);
+        const indexLength = parseInt(buffer.toString('latin1', MAGIC.length, lengthEnd), 10);
+        const indexStart = lengthEnd + 1;
+        let index;
+        try {
+            index = JSON.parse(buffer.toString('utf8', indexStart, indexStart + indexLength));
+        } catch (e) {
+            return null;
+        }
+        if (index.version !== BUNDLE_VERSION) return null;
+
+        // mtime en ns como string (> 2^53)
+        try {
+            for (const [dir, mtimeNs] of Object.entries(index.dirs)) {
+                const stat = fs.statSync(path.join(packsDir, dir), { bigint: true });
+                if (stat.mtimeNs.toString() !== mtimeNs) return null;
+            }
+        } catch (e) {
+            return null;
+        }
+        return new PackBundle(buffer, index, indexStart + indexLength);
+    }
+
+    /** Packs con el mismo formato que devolvía el escaneo de directorios. */
+    packs() {
+        return this.index.packs.map(pack => ({
+            id: pack.id,
+            name: pack.name,
+            description: pack.description,
+            icon: pack.icon,
+            templates: pack.templates.map(t => ({
+                id: t.id,
+                manifest: t.manifest,
+                code: this._slice(t.code)
+            }))
+        }));
+    }
+
+    _slice([offset, length]) {
+        const start = this.payloadStart + offset;
+        return this.buffer.toString('utf8', start, start + length);
+    }
+}
+
+module.exports = PackBundle;
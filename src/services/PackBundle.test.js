@@ -0,0 +1,79 @@
+/**
+ * Test del PackBundle contra un bundle real generado con packtools
+ * Ejecutar con: node src/services/PackBundle.test.js  (necesita python3)
+ */
+
+const assert = require('assert');
+const fs = require('fs');
+const os = require('os');
+const path = require('path');
+const { execFileSync } = require('child_process');
+const PackBundle = require('./PackBundle');
+
+const ROOT = path.join(__dirname, '..', '..');
+
+function buildBundle(packsDir, bundlePath, force = true) {
+    const args = ['-m', 'packtools', 'bundle', '--packs-dir', packsDir, '-o', bundlePath];
+    execFileSync('python3', force ? [...args, '--force'] : args, { cwd: ROOT, stdio: 'ignore' });
+}
+
+function codeOf(bundle) {
+    return bundle.packs()[0].templates[0].code;
+}
+
+function makePacks(dir) {
+    const pack = path.join(dir, 'kr-test-pack');
+    fs.mkdirSync(pack, { recursive: true });
+    fs.writeFileSync(path.join(pack, 'pack.json'), JSON.stringify({ id: 'kr-test-pack', name: 'Test' }));
+    fs.writeFileSync(path.join(pack, 'kr-a.json'), JSON.stringify({ id: 'kr-a', name: 'A' }));
+    fs.writeFileSync(path.join(pack, 'kr-a.js'), 'render(d) { return `<p>${d.TEXT}</p>`; }');
+    return pack;
+}
+
+function main() {
+    console.log('🚀 Iniciando test del PackBundle...\n');
+    const dir = fs.mkdtempSync(path.join(os.tmpdir(), 'packbundle-'));
+    try {
+        const packsDir = path.join(dir, 'packs');
+        const bundlePath = path.join(dir, 'packs.bundle');
+        const pack = makePacks(packsDir);
+        buildBundle(packsDir, bundlePath);
+
+        console.log('📝 Test 1: el bundle recién generado se carga...');
+        const bundle = PackBundle.load(bundlePath, packsDir);
+        assert.ok(bundle, 'bundle válido');
+        assert.strictEqual(codeOf(bundle), 'render(d) { return `<p>${d.TEXT}</p>`; }');
+        console.log('✅ OK\n');
+
+        console.log('📝 Test 2: un template editado en su sitio lo recompila `packtools bundle`...');
+        const dirStat = fs.statSync(pack);
+        const file = path.join(pack, 'kr-a.js');
+        const fd = fs.openSync(file, 'r+');
+        fs.writeSync(fd, 'R', 0);  // mismo tamaño, sin tocar el directorio
+        fs.closeSync(fd);
+        const later = new Date(Date.now() + 2000);
+        fs.utimesSync(file, later, later);
+        assert.strictEqual(fs.statSync(pack).mtimeMs, dirStat.mtimeMs, 'el directorio no cambia');
+        assert.ok(PackBundle.load(bundlePath, packsDir), 'al cargar solo se miran los directorios');
+        buildBundle(packsDir, bundlePath, false);
+        assert.ok(codeOf(PackBundle.load(bundlePath, packsDir)).startsWith('Render(d)'));
+        console.log('✅ OK\n');
+
+        console.log('📝 Test 3: un template reemplazado como hace `rewrite` invalida el bundle...');
+        Atomics.wait(new Int32Array(new SharedArrayBuffer(4)), 0, 0, 20);  // otro tick del reloj del FS
+        fs.writeFileSync(file + '.tmp', 'render(d) { return `<b>${d.TEXT}</b>`; }');
+        fs.renameSync(file + '.tmp', file);
+        assert.strictEqual(PackBundle.load(bundlePath, packsDir), null);
+        console.log('✅ OK\n');
+    } finally {
+        fs.rmSync(dir, { recursive: true, force: true });
+    }
+    console.log('🎉 Todos los tests pasaron');
+}
+
+try {
+    main();
+} catch (error) {
+    console.error('❌ Error en el test:', error);
+    process.exit(1);
+}
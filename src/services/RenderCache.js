@@ -0,0 +1,181 @@
+/**
+ * RenderCache - Caché de exportación direccionada por contenido
+ *
+ * Clave: sha256 del HTML que sale de prepareExportHTML (con assets, fuentes e iconos
+ * ya incrustados) + ancho, alto y formato. Valor: el PNG/JPG que produjo Puppeteer.
+ * Re-exportar un carrusel con un slide editado solo renderiza ese slide; el resto se
+ * copia de la caché.
+ *
+ * Estructura (la misma que lee `python -m packtools export-cache`):
+ *   <dir>/index.json               { version, entries: { clave: { file, size, ..., lastUsed } } }
+ *   <dir>/objects/<ab>/<clave>.<ext>
+ *
+ * El tamaño total está acotado (LRU por lastUsed). Directorio por defecto:
+ * $CYBERCANVAS_RENDER_CACHE o $XDG_CACHE_HOME/cyber-canvas/render-cache
+ * (~/.cache/... si no está definido). Límite: $CYBERCANVAS_RENDER_CACHE_MB (500 MB).
+ */
+
+const crypto = require('crypto');
+const fs = require('fs');
+const os = require('os');
+const path = require('path');
+
+const CACHE_VERSION = 1;
+const DEFAULT_MAX_MB = 500;
+
+class RenderCache {
+    constructor(dir, maxBytes) {
+        this.dir = dir;
+        this.maxBytes = maxBytes;
+        this.entries = {};
+        this.dirty = false;
+        this.clock = 0;
+    }
+
+    static defaultDir() {
+        if (process.env.CYBERCANVAS_RENDER_CACHE) return process.env.CYBERCANVAS_RENDER_CACHE;
+        const base = process.env.XDG_CACHE_HOME || path.join(os.homedir(), '.cache');
+        return path.join(base, 'cyber-canvas', 'render-cache');
+    }
+
+    /**
+     * Abre (o crea) la caché. Un index.json ilegible o de otra versión se trata
+     * como caché vacía: lo peor que pasa es volver a renderizar.
+     * @param {string} [dir]
+     * @param {number} [maxBytes]
+     * @returns {RenderCache}
+     */
+    static open(dir = RenderCache.defaultDir(), maxBytes = null) {
+        if (maxBytes === null) {
+            const mb = parseFloat(process.env.CYBERCANVAS_RENDER_CACHE_MB);
+            maxBytes = (Number.isFinite(mb) && mb >= 0 ? mb : DEFAULT_MAX_MB) * 1024 * 1024;
+        }
+        const cache = new RenderCache(dir, maxBytes);
+        try {
+            const index = JSON.parse(fs.readFileSync(cache.indexPath, 'utf8'));
+            if (index.version === CACHE_VERSION && index.entries) {
+                cache.entries = index.entries;
+                cache.clock = Math.max(0, ...Object.values(cache.entries).map(entry => entry.lastUsed || 0));
+            }
+        } catch (e) {
+            // Sin índice todavía
+        }
+        return cache;
+    }
+
+    /**
+     * @param {string} finalHTML - salida de prepareExportHTML
+     * @returns {string} sha256 hex
+     */
+    static key(finalHTML, width, height, format) {
+        return crypto.createHash('sha256')
+            .update(`${CACHE_VERSION}\0${width}x${height}\0${format}\0`)
+            .update(finalHTML)
+            .digest('hex');
+    }
+
+    get indexPath() {
+        return path.join(this.dir, 'index.json');
+    }
+
+    objectPath(entry) {
+        return path.join(this.dir, 'objects', entry.file);
+    }
+
+    /**
+     * Marca de tiempo estrictamente creciente (ms): dos usos en el mismo milisegundo
+     * siguen ordenados para el LRU.
+     */
+    tick() {
+        this.clock = Math.max(Date.now(), this.clock + 1);
+        return this.clock;
+    }
+
+    totalBytes() {
+        return Object.values(this.entries).reduce((sum, entry) => sum + entry.size, 0);
+    }
+
+    /**
+     * Ruta del render cacheado para `key`, o null. Marca la entrada como usada.
+     */
+    get(key) {
+        const entry = this.entries[key];
+        if (!entry) return null;
+        const objectPath = this.objectPath(entry);
+        if (!fs.existsSync(objectPath)) {
+            // Borrado a mano o por un prune: simplemente es un fallo de caché
+            delete this.entries[key];
+            this.dirty = true;
+            return null;
+        }
+        entry.lastUsed = this.tick();
+        entry.hits = (entry.hits || 0) + 1;
+        this.dirty = true;
+        return objectPath;
+    }
+
+    /**
+     * Guarda una copia de `sourcePath` (el archivo recién exportado) bajo `key`.
+     */
+    put(key, sourcePath, { width, height, format }) {
+        const ext = format === 'jpeg' ? 'jpg' : format;
+        const file = path.join(key.slice(0, 2), `${key}.${ext}`);
+        const objectPath = path.join(this.dir, 'objects', file);
+        fs.mkdirSync(path.dirname(objectPath), { recursive: true });
+        const tmpPath = `${objectPath}.${process.pid}.tmp`;
+        fs.copyFileSync(sourcePath, tmpPath);
+        fs.renameSync(tmpPath, objectPath);
+
+        const now = this.tick();
+        this.entries[key] = {
+            file,
+            size: fs.statSync(objectPath).size,
+            width,
+            height,
+            format: ext,
+            created: now,
+            lastUsed: now,
+            hits: 0
+        };
+        this.dirty = true;
+        this.evict();
+    }
+
+    /**
+     * Borra las entradas menos usadas recientemente hasta quedar en maxBytes.
+     * @returns {number} entradas eliminadas
+     */
+    evict(maxBytes = this.maxBytes) {
+        let total = this.totalBytes();
+        if (total <= maxBytes) return 0;
+        const byAge = Object.entries(this.entries).sort((a, b) => a[1].lastUsed - b[1].lastUsed);
+        let removed = 0;
+        for (const [key, entry] of byAge) {
+            if (total <= maxBytes) break;
+            try {
+                fs.unlinkSync(this.objectPath(entry));
+            } catch (e) {
+                // Ya no estaba
+            }
+            delete this.entries[key];
+            total -= entry.size;
+            removed++;
+        }
+        this.dirty = true;
+        return removed;
+    }
+
+    /**
+     * Escribe index.json de forma atómica (tmp + rename).
+     */
+    save() {
+        if (!this.dirty) return;
+        fs.mkdirSync(this.dir, { recursive: true });
+        const tmpPath = `${this.indexPath}.${process.pid}.tmp`;
+        fs.writeFileSync(tmpPath, JSON.stringify({ version: CACHE_VERSION, entries: this.entries }));
+        fs.renameSync(tmpPath, this.indexPath);
+        this.dirty = false;
+    }
+}
+
+module.exports = RenderCache;
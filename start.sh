@@ -3,5 +3,16 @@
 export GTK_MODULES=""
 export NO_AT_BRIDGE=1
 
+# Recompilar src/packs.bundle si algún template cambió (load-packs lo lee de una vez)
+if command -v python3 >/dev/null 2>&1; then
+    python3 -m packtools bundle >/dev/null || echo "packtools bundle falló; se escanearán los packs"
+    # Sprite SVG de iconos que incrusta la exportación
+    python3 -m packtools icons >/dev/null || echo "packtools icons falló; los iconos del sprite saldrán vacíos al exportar"
+    # Subsets WOFF2 de las fuentes (solo si hay caracteres nuevos; necesita fonttools y brotli)
+    if python3 -c "import fontTools, brotli" >/dev/null 2>&1; then
+        python3 -m packtools fonts >/dev/null || echo "packtools fonts falló; se usarán las fuentes completas"
+    fi
+fi
+
 # Ejecutar Electron
 npx electron .
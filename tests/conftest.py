@@ -0,0 +1,5 @@
+import os
+import sys
+
+# ``python -m pytest`` and a bare ``pytest`` both import packtools from the checkout
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
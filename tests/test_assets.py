@@ -0,0 +1,64 @@
+import base64
+import os
+
+import pytest
+
+from packtools.assets import AssetStore
+from packtools.engine import Document, get_passes, rewrite_file
+from packtools.passes import deinline_assets
+
+PNG = b'\x89PNG\r\n\x1a\n' + bytes(range(64))
+PNG_URI = 'data:image/png;base64,' + base64.b64encode(PNG).decode()
+
+
+@pytest.fixture
+def store_dir(tmp_path, monkeypatch):
+    root = str(tmp_path / 'store')
+    monkeypatch.setattr(AssetStore.__init__, '__defaults__', (root, '../assets/store'))
+    return root
+
+
+def _template(*uris):
+    return 'render(d) { return `' + ''.join(f'<img src="{uri}">' for uri in uris) + '`; }'
+
+
+def test_same_payload_is_stored_once(tmp_path, store_dir):
+    svg_uri = 'data:image/svg+xml;charset=utf-8;base64,' + base64.b64encode(b'<svg/>').decode()
+    paths = []
+    for name, text in (('kr-a.js', _template(PNG_URI, svg_uri)), ('kr-b.js', _template(PNG_URI, PNG_URI))):
+        path = tmp_path / name
+        path.write_text(text)
+        paths.append(path)
+        result = rewrite_file(str(path), get_passes(['deinline_assets']))
+        assert result.changed
+
+    name = AssetStore.name_for(PNG, 'image/png')
+    assert sorted(os.listdir(store_dir)) == sorted([name, AssetStore.name_for(b'<svg/>', 'image/svg+xml')])
+    with open(os.path.join(store_dir, name), 'rb') as f:
+        assert f.read() == PNG
+    assert paths[1].read_text() == _template(f'../assets/store/{name}', f'../assets/store/{name}')
+    assert 'base64' not in paths[0].read_text()
+
+
+def test_invalid_base64_is_left_inline(store_dir):
+    broken = 'data:image/png;base64,abc'
+    doc = Document('kr-a.js', _template(broken))
+
+    assert deinline_assets(doc) == 0
+    assert doc.text == _template(broken)
+    assert not os.path.exists(store_dir)
+
+
+def test_dry_run_does_not_touch_the_store(tmp_path, store_dir):
+    path = tmp_path / 'kr-a.js'
+    path.write_text(_template(PNG_URI))
+
+    result = rewrite_file(str(path), get_passes(['deinline_assets']), dry_run=True)
+
+    assert result.changed
+    assert path.read_text() == _template(PNG_URI)
+    assert not os.path.exists(store_dir)
+
+
+def test_not_part_of_the_default_pipeline():
+    assert 'deinline_assets' not in [p.name for p in get_passes()]
@@ -0,0 +1,95 @@
+import asyncio
+import base64
+import hashlib
+import json
+import struct
+
+import pytest
+
+from packtools.bridgeload import (WS_GUID, WebSocket, _mask, encode_frame, load_payloads, percentile, run_load,
+                                  synthetic_payloads)
+
+
+def _server_frame(text):
+    payload = text.encode('utf-8')
+    if len(payload) < 126:
+        return struct.pack('!BB', 0x81, len(payload)) + payload
+    return struct.pack('!BBH', 0x81, 126, len(payload)) + payload
+
+
+async def _bridge(received, batch=4):
+    """A stand-in for main.js: acks probes every ``batch`` messages of a connection."""
+
+    async def handle(reader, writer):
+        head = (await reader.readuntil(b'\r\n\r\n')).decode('latin-1')
+        key = next(line.split(':', 1)[1].strip() for line in head.split('\r\n')
+                   if line.lower().startswith('sec-websocket-key:'))
+        accept = base64.b64encode(hashlib.sha1((key + WS_GUID).encode('ascii')).digest()).decode('ascii')
+        writer.write(('HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n'
+                      f'Sec-WebSocket-Accept: {accept}\r\n\r\n').encode('ascii'))
+        ws = WebSocket(reader, writer)
+        pending = []
+        count = 0
+        while True:
+            text = await ws.recv()
+            if text is None:
+                break
+            msg = json.loads(text)
+            received.append(msg)
+            count += 1
+            if 'probeId' in msg:
+                pending.append(msg['probeId'])
+            if count % batch == 0 and pending:
+                writer.write(_server_frame(json.dumps({'type': 'BRIDGE_ACK', 'probeIds': pending})))
+                pending = []
+        writer.close()
+
+    return await asyncio.start_server(handle, '127.0.0.1', 0)
+
+
+def test_mask_and_frames_round_trip():
+    key = b'\x01\x02\x03\x04'
+    data = bytes(range(256)) * 3
+    assert _mask(_mask(data, key), key) == data
+    assert _mask(b'', key) == b''
+    frame = encode_frame(b'x' * 70000)
+    assert frame[:2] == b'\x81\xff' and struct.unpack('!Q', frame[2:10]) == (70000,)
+    assert _mask(frame[14:], frame[10:14]) == b'x' * 70000
+
+
+def test_payload_files(tmp_path):
+    path = tmp_path / 'session.jsonl'
+    path.write_text('{"type":"EXTENSION_HELLO"}\n\n{"type":"VIDEO_DATA","url":"u"}\n[1]\n')
+    assert load_payloads(str(path)) == [{'type': 'VIDEO_DATA', 'url': 'u'}]
+    path.write_text('{"type":"VIDEO_DATA"}\n{oops\n')
+    with pytest.raises(ValueError, match='session.jsonl:2'):
+        load_payloads(str(path))
+    path.write_text('{"type":"EXTENSION_HELLO"}\n')
+    with pytest.raises(ValueError, match='No extension messages'):
+        load_payloads(str(path))
+
+    payloads = synthetic_payloads(500, videos=20, profiles=5, seed=1)
+    assert payloads == synthetic_payloads(500, videos=20, profiles=5, seed=1)
+    assert {p['type'] for p in payloads} == {'VIDEO_DATA', 'PROFILE_DATA', 'TREND_DATA'}
+    assert len({p['url'] for p in payloads if p['type'] == 'VIDEO_DATA'}) <= 20
+    assert percentile([], 0.5) is None and percentile([1, 2, 3, 4], 0.99) == 4
+
+
+def test_run_load_counts_acked_probes():
+    received = []
+
+    async def main():
+        server = await _bridge(received)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            return await run_load(f'ws://127.0.0.1:{port}', synthetic_payloads(30), rate=0, count=40,
+                                  connections=2, probe_every=5, timeout=2.0)
+
+    report = asyncio.run(main())
+
+    assert report['sent'] == 40 and len(received) == 40
+    assert sorted(msg['probeId'] for msg in received if 'probeId' in msg) == list(range(0, 40, 5))
+    assert report['probes'] == 8 and report['acked'] == 8 and report['lost'] == 0
+    assert report['latency_ms']['max'] >= report['latency_ms']['p50'] >= 0
+    assert report['bytes'] == sum(len(json.dumps(msg, ensure_ascii=False, separators=(',', ':')).encode('utf-8'))
+                                  for msg in received)
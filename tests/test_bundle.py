@@ -0,0 +1,40 @@
+import json
+import os
+import stat
+
+from packtools.bundle import build_bundle, is_stale, scan_sources
+from packtools.engine import Pass, rewrite_file
+
+
+def _pack(packs_dir):
+    pack = packs_dir / 'demo'
+    pack.mkdir(parents=True)
+    (pack / 'pack.json').write_text(json.dumps({'id': 'demo', 'name': 'Demo'}))
+    (pack / 'kr-a.json').write_text(json.dumps({'id': 'kr-a'}))
+    (pack / 'kr-a.js').write_text('render(d) { return `<p style="color:#00ff41">${d.TITLE}</p>`; }')
+    return pack
+
+
+def _accent(doc):
+    doc.text = doc.text.replace('#00ff41', 'var(--accent)')
+    return 1
+
+
+def test_a_rewrite_moves_the_pack_directory_mtime(tmp_path):
+    packs_dir = tmp_path / 'packs'
+    pack = _pack(packs_dir)
+    bundle_path = str(tmp_path / 'packs.bundle')
+    assert build_bundle(bundle_path, str(packs_dir)).built
+    template = str(pack / 'kr-a.js')
+    os.chmod(template, 0o640)
+    os.utime(pack, ns=(0, 0))
+    before = scan_sources(str(packs_dir))[0]['demo']
+
+    result = rewrite_file(template, [Pass('accent', _accent)])
+
+    assert result.changed
+    # main.js only compares directory mtimes, so an in-place write would go unseen
+    assert scan_sources(str(packs_dir))[0]['demo'] != before
+    assert stat.S_IMODE(os.stat(template).st_mode) == 0o640
+    assert [name for name in os.listdir(pack) if name.endswith('.tmp')] == []
+    assert is_stale(bundle_path, str(packs_dir))
@@ -0,0 +1,49 @@
+from packtools.colours import GREYS_TO_WHITE, ColourMap, canonical
+from packtools.engine import Document
+from packtools.passes import whitewash
+
+
+def _sub(mapping, text):
+    return ColourMap(mapping).sub(text)
+
+
+def test_hex_and_rgb_match_by_colour():
+    text = 'a{color:#888}b{color:#888888FF}c{color:rgb(136 136 136 / 100%)}d{color:#8888aa}'
+
+    new, count = _sub({'#888888': '#fff'}, text)
+
+    assert count == 3
+    assert new == 'a{color:#fff}b{color:#fff}c{color:#fff}d{color:#8888aa}'
+    assert canonical('RGBA(136, 136, 136, .5)') == (136, 136, 136, 0.5)
+
+
+def test_hex_boundaries():
+    text = '<p>&#888; a#888 #888-x #8880</p><i style="color:#888">'
+
+    new, count = _sub({'#888': '#fff'}, text)
+
+    assert count == 1
+    assert new == '<p>&#888; a#888 #888-x #8880</p><i style="color:#fff">'
+
+
+def test_named_colours_only_in_css_values():
+    text = ('render(d) { return `<style>.t { color: red; border: 1px solid Red; } '
+            '.q::after { content: "tired red"; }</style>'
+            '<h1>Red Team</h1><p>tired red</p>'
+            '<span style="color: red" title="red" class="red">Nota: red</span>'
+            '<svg><path fill="red" stroke="dark red"/></svg>`; }\nconst label = \'red\';')
+
+    new, count = _sub({'red': 'blue'}, text)
+
+    assert count == 4
+    assert new == text.replace('color: red;', 'color: blue;').replace('solid Red', 'solid blue') \
+        .replace('style="color: red"', 'style="color: blue"').replace('fill="red"', 'fill="blue"')
+    assert 'Red Team' in new and '<p>tired red</p>' in new and 'Nota: red' in new
+
+
+def test_whitewash_pass_leaves_text_nodes_alone():
+    text = '`<style>p { color: gray }</style><p>gray area</p><i style="color:#94a3b8">x</i>`'
+    doc = Document('kr-a.js', text)
+
+    assert whitewash(doc, dict(GREYS_TO_WHITE, gray='white')) == 2
+    assert doc.text == '`<style>p { color: white }</style><p>gray area</p><i style="color:#ffffff">x</i>`'
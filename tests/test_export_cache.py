@@ -0,0 +1,80 @@
+import json
+import os
+import time
+
+from packtools import cli
+from packtools.export_cache import ORPHAN_GRACE, RenderCache
+
+DAY_MS = 86400 * 1000
+
+
+def _put(root, key, size, last_used):
+    path = os.path.join(root, 'objects', key[:2], f'{key}.png')
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(b'x' * size)
+    return {'file': os.path.join(key[:2], f'{key}.png'), 'size': size, 'lastUsed': last_used}
+
+
+def _make_cache(root, entries):
+    with open(os.path.join(root, 'index.json'), 'w') as f:
+        json.dump({'version': 1, 'entries': entries}, f)
+    return RenderCache(root)
+
+
+def _age(path, seconds):
+    then = time.time() - seconds
+    os.utime(path, (then, then))
+
+
+def test_prune_by_age_then_lru(tmp_path):
+    root = str(tmp_path)
+    now = time.time() * 1000
+    cache = _make_cache(root, {
+        'aa01': _put(root, 'aa01', 100, now - 40 * DAY_MS),
+        'bb02': _put(root, 'bb02', 100, now - 2 * DAY_MS),
+        'cc03': _put(root, 'cc03', 100, now - DAY_MS),
+        'dd04': _put(root, 'dd04', 100, now),
+    })
+
+    removed = cache.prune(max_bytes=150, older_than=30 * 86400)
+
+    assert [key for key, _ in removed] == ['aa01', 'bb02', 'cc03']
+    assert list(cache.entries) == ['dd04']
+    assert not os.path.exists(os.path.join(root, 'objects', 'aa', 'aa01.png'))
+
+
+def test_repair_keeps_fresh_unindexed_files(tmp_path):
+    root = str(tmp_path)
+    cache = _make_cache(root, {
+        'aa01': _put(root, 'aa01', 10, 0),
+        'bb02': {'file': 'bb/bb02.png', 'size': 10, 'lastUsed': 0},
+    })
+    # Renamed into place by an export that has not saved the index yet
+    fresh = _put(root, 'cc03', 10, 0)
+    old = _put(root, 'dd04', 10, 0)
+    _age(os.path.join(root, 'objects', old['file']), ORPHAN_GRACE + 60)
+    tmp = os.path.join(root, 'objects', 'ee', 'ee05.png.123.tmp')
+    os.makedirs(os.path.dirname(tmp))
+    open(tmp, 'wb').close()
+
+    missing, orphans = cache.repair()
+
+    assert missing == ['bb02']
+    assert orphans == [os.path.join(root, 'objects', old['file'])]
+    assert os.path.isfile(os.path.join(root, 'objects', fresh['file']))
+    assert os.path.isfile(tmp)
+    assert list(cache.entries) == ['aa01']
+
+
+def test_prune_command_spares_an_export_in_progress(tmp_path, capsys):
+    root = str(tmp_path)
+    _make_cache(root, {'aa01': _put(root, 'aa01', 10, 0)})
+    fresh = os.path.join(root, 'objects', _put(root, 'bb02', 10, 0)['file'])
+
+    assert cli.main(['export-cache', '--dir', root, '--older-than', '1']) == 0
+
+    assert 'Pruned 1 entries' in capsys.readouterr().out
+    assert os.path.isfile(fresh)
+    with open(os.path.join(root, 'index.json')) as f:
+        assert json.load(f)['entries'] == {}
@@ -0,0 +1,95 @@
+import json
+import os
+
+import pytest
+
+from packtools import fonts
+from packtools.fonts import FontSource, build_fonts, from_ranges, plan_fonts, scan_usage, to_ranges, unicode_range
+
+BASE = {ord(c) for c in fonts.BASE_TEXT}
+
+
+@pytest.fixture
+def font_dir(tmp_path, monkeypatch):
+    font_dir = tmp_path / 'fonts'
+    font_dir.mkdir()
+    (font_dir / 'Title.ttf').write_bytes(b'title font')
+    (font_dir / 'Body.ttf').write_bytes(b'body font')
+    monkeypatch.setattr(fonts, 'FONT_DIR', str(font_dir))
+    return font_dir
+
+
+FONTS = [FontSource('Title.ttf', ('TitleFace',)), FontSource('Body.ttf', ('BodyFace',), weight='100 900')]
+
+
+def _write(path, text):
+    path.write_text(text, encoding='utf-8')
+    return str(path)
+
+
+def test_ranges_round_trip():
+    codepoints = {0x41, 0x42, 0x43, 0xe9, 0x2192}
+    assert to_ranges(codepoints) == [[0x41, 0x43], [0xe9, 0xe9], [0x2192, 0x2192]]
+    assert from_ranges(to_ranges(codepoints)) == codepoints
+    assert unicode_range(to_ranges(codepoints)) == 'U+41-43, U+E9, U+2192'
+
+
+def test_scan_usage_splits_by_family(tmp_path):
+    paths = [
+        _write(tmp_path / 'a.js', "font-family: 'TitleFace'; `Ω`"),
+        _write(tmp_path / 'b.js', "font-family: 'BodyFace'; `ñ`"),
+        _write(tmp_path / 'data.json', '{"TITLE": "→"}'),
+    ]
+    usage = scan_usage(paths, FONTS)
+
+    assert ord('Ω') in usage['Title.ttf'] and ord('Ω') not in usage['Body.ttf']
+    assert ord('ñ') in usage['Body.ttf'] and ord('ñ') not in usage['Title.ttf']
+    # Slide data names no font, so it counts for every used one
+    assert all(ord('→') in codepoints for codepoints in usage.values())
+
+
+def test_plan_reasons(tmp_path, font_dir):
+    out_dir = tmp_path / 'subset'
+    out_dir.mkdir()
+    (out_dir / FONTS[0].output).write_bytes(b'woff2')
+    usage = {'Title.ttf': {ord('Ω')}, 'Body.ttf': {ord('ñ')}}
+    plans = {plan.font.filename: plan for plan in plan_fonts(usage, str(out_dir), FONTS, {'fonts': {}})}
+    assert plans['Title.ttf'].reason == 'new'
+    title_sha = plans['Title.ttf'].source_sha
+
+    entry = {'output': FONTS[0].output, 'source_sha256': title_sha, 'requested': to_ranges(BASE | {ord('Ω')})}
+    manifest = {'fonts': {'Title.ttf': entry, 'Body.ttf': dict(entry, output=FONTS[1].output)}}
+    plans = {plan.font.filename: plan for plan in plan_fonts(usage, str(out_dir), FONTS, manifest)}
+    assert plans['Title.ttf'].reason is None
+    assert plans['Body.ttf'].reason == 'source changed'
+    # A changed font starts over from what is needed now
+    assert ord('Ω') not in plans['Body.ttf'].codepoints
+
+    usage['Title.ttf'].add(ord('Ж'))
+    plan, = plan_fonts({'Title.ttf': usage['Title.ttf']}, str(out_dir), FONTS, manifest)
+    assert plan.reason == '1 new codepoints' and plan.missing == {ord('Ж')}
+
+    os.remove(out_dir / FONTS[0].output)
+    plan, = plan_fonts({'Title.ttf': {ord('Ω')}}, str(out_dir), FONTS, manifest)
+    assert plan.reason == 'output missing'
+
+
+def test_manifest_records_the_full_font_coverage(tmp_path, font_dir, monkeypatch):
+    # The full font has Ω but no emoji; the subset only keeps what was asked for
+    def subset_font(path, codepoints):
+        available = BASE | {ord('Ω'), ord('Ж')}
+        return b'woff2', codepoints & available, available
+
+    monkeypatch.setattr(fonts, 'subset_font', subset_font)
+    source = _write(tmp_path / 'a.js', "font-family: 'TitleFace'; `Ω 🔥`")
+    out_dir = tmp_path / 'subset'
+
+    result = build_fonts([source], str(out_dir), fonts=FONTS[:1])
+
+    assert [plan.reason for plan in result.built] == ['new']
+    with open(out_dir / fonts.MANIFEST_NAME, encoding='utf-8') as f:
+        entry = json.load(f)['fonts']['Title.ttf']
+    assert ord('🔥') in from_ranges(entry['requested'])
+    assert ord('🔥') not in from_ranges(entry['ranges'])
+    assert from_ranges(entry['font_ranges']) == BASE | {ord('Ω'), ord('Ж')}
+    assert build_fonts([source], str(out_dir), fonts=FONTS[:1]).built == []
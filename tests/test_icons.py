@@ -0,0 +1,97 @@
+from packtools import icons
+from packtools.engine import Document
+from packtools.icons import Icon, build_sprite, load_icons, resolve, scan_usage
+from packtools.passes import icon_sprite
+
+ICONS_JS = """const MATERIAL_ICONS = {
+    'check': `<path d="M9 16.17L4.83 12z"/>`,
+    'done': `<path d="M9 16.17L4.83 12z"/>`,
+    'star': `<path d="M12 17.27L18.18 21z"/>`,
+};
+
+const LUCIDE_ICONS = {
+            'check': '<path d="M20 6 9 17l-5-5"/>',
+            'shield': '<path d="M12 22s8-4 8-10V5z"/>',
+};
+"""
+
+
+def _icons(tmp_path):
+    icons_js = tmp_path / 'Icons.js'
+    icons_js.write_text(ICONS_JS)
+    local = tmp_path / 'local'
+    local.mkdir()
+    (local / 'Brand-Logo.svg').write_text('<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32" '
+                                          'fill="none" width="32"><circle r="4"/></svg>')
+    (local / 'star.svg').write_text('<svg viewBox="0 0 24 24"><path d="M0 0"/></svg>')
+    return load_icons(str(icons_js), str(local))
+
+
+def test_icon_tables_and_local_svgs(tmp_path):
+    table = _icons(tmp_path)
+
+    # Material wins over Lucide and over local files of the same name
+    assert table['check'].source == 'MATERIAL_ICONS' and table['check'].body == '<path d="M9 16.17L4.83 12z"/>'
+    assert table['star'].source == 'MATERIAL_ICONS'
+    assert table['shield'].attrs['stroke'] == 'currentColor'
+    assert table['brand_logo'].attrs == {'viewBox': '0 0 32 32', 'fill': 'none'}
+    assert resolve('material-symbols:Check-Outlined', table) == 'check'
+    assert resolve('mdi:nothing', table) is None
+
+
+def test_identical_drawings_are_stored_once(tmp_path):
+    table = _icons(tmp_path)
+
+    sprite = build_sprite({'check', 'done', 'star'}, table)
+
+    assert sprite.count('M9 16.17L4.83 12z') == 1
+    assert '<symbol id="kr-i-done" viewBox="0 0 24 24"><use href="#kr-i-check"/></symbol>' in sprite
+    assert sprite.count('<symbol ') == 3
+    # The same body with different attributes draws differently
+    table = dict(table, other=Icon('other', '<path d="M9 16.17L4.83 12z"/>', {'viewBox': '0 0 48 48'}, 'x'))
+    assert build_sprite({'check', 'other'}, table).count('M9 16.17L4.83 12z') == 2
+
+
+def test_usage_counts_static_dynamic_and_unknown_icons(tmp_path):
+    table = _icons(tmp_path)
+    static = tmp_path / 'kr-a.js'
+    static.write_text('`<span class="iconify" data-icon="material-symbols:check"></span>'
+                      '<i class="material-icons">star</i><svg><use href="#kr-i-check"></use></svg>'
+                      '<span class="iconify" data-icon="mdi:unicorn"></span>`')
+    dynamic = tmp_path / 'kr-b.js'
+    dynamic.write_text('`<i class="material-icons">${d.ICON}</i>`')
+
+    usage = scan_usage([str(static), str(dynamic)], table)
+
+    assert dict(usage.static) == {'check': 2, 'star': 1}
+    assert dict(usage.unresolved) == {'mdi:unicorn': {str(static)}}
+    assert usage.dynamic == [str(dynamic)]
+
+
+def test_compile_sprite_rewrites_only_on_change(tmp_path, monkeypatch):
+    table = _icons(tmp_path)
+    monkeypatch.setattr(icons, 'load_icons', lambda: table)
+    template = tmp_path / 'kr-a.js'
+    template.write_text('`<i class="material-icons">done</i><i class="material-icons">check</i>`')
+    out = str(tmp_path / 'sprite' / 'sprite.svg')
+
+    first = icons.compile_sprite([str(template)], out)
+    again = icons.compile_sprite([str(template)], out)
+
+    assert first.written and not again.written
+    assert first.names == {'check', 'done'}
+    template.write_text('`<i class="material-icons">${d.ICON}</i>`')
+    assert icons.compile_sprite([str(template)], out, check=True).names == set(table)
+
+
+def test_icon_sprite_pass_is_idempotent():
+    text = ('<head>\n    <link href="https://fonts.googleapis.com/icon?family=Material+Icons" rel="stylesheet">\n'
+            '</head>`<i class="material-icons big">check_circle</i>'
+            '<i class="material-icons">${d.ICON}</i>`')
+    doc = Document('kr-a.js', text)
+
+    assert icon_sprite(doc) == 4
+    assert '<svg class="kr-icon material-icons big"><use href="#kr-i-check_circle"></use></svg>' in doc.text
+    assert "href=\"#kr-i-${String(d.ICON).split(':').pop()" in doc.text
+    assert 'fonts.googleapis.com' not in doc.text and 'id="kr-icons"' in doc.text
+    assert icon_sprite(Document('kr-a.js', doc.text)) == 0
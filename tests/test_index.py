@@ -0,0 +1,46 @@
+import os
+
+from packtools.engine import get_passes, iter_templates, run_packs
+from packtools.index import TemplateIndex, pass_candidates
+from packtools.synth import generate_pack
+
+
+def _contents(pack_dir):
+    contents = {}
+    for path in iter_templates(pack_dir):
+        with open(path, 'rb') as f:
+            contents[os.path.basename(path)] = f.read()
+    return contents
+
+
+def _indexed_run(pack_dir, passes, db_path):
+    with TemplateIndex(db_path) as index:
+        index.update([pack_dir])
+        candidates = pass_candidates(index, passes)
+    return list(run_packs([pack_dir], passes, use_cache=False, candidates=candidates))
+
+
+def test_use_index_matches_a_plain_run(tmp_path, monkeypatch):
+    # Relative pack dirs, as typed on the command line
+    monkeypatch.chdir(tmp_path)
+    generate_pack('plain', 30, seed=3)
+    generate_pack('indexed', 30, seed=3)
+    passes = get_passes()
+
+    list(run_packs(['plain'], passes, use_cache=False))
+    _indexed_run('indexed', passes, 'index.sqlite')
+
+    plain = _contents('plain')
+    assert plain == _contents('indexed')
+    # add_brand_header injects a 16px font-size the index could not have seen
+    assert all(b'font-size: 16px' not in data for data in plain.values())
+
+
+def test_use_index_skips_templates_it_rules_out(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    generate_pack('pack', 10, seed=1)
+    passes = get_passes(['whitewash', 'fix_min_fonts'])
+    list(run_packs(['pack'], passes, use_cache=False))
+
+    results = _indexed_run('pack', passes, 'index.sqlite')
+    assert results and all(result.filtered for result in results)
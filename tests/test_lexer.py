@@ -0,0 +1,109 @@
+import random
+import time
+
+from packtools.lexer import ATTR, CSS, INTERP, SCRIPT, TAG, TEXT, VOID_ELEMENTS, Tag, lex, match_elements
+
+
+def _tags(lexed):
+    return [('/' if tag.closing else '') + tag.name for tag in lexed.tags]
+
+
+def _texts(lexed, kind):
+    return [lexed.text[span.start:span.end] for span in lexed.spans if span.kind == kind]
+
+
+def test_regex_literal_with_a_backtick_does_not_open_a_template():
+    src = 'const tick = /`+/g;\nfunction f(s) { return /`/.test(s) ? `<b>x</b>` : s; }\n'
+    lexed = lex(src)
+
+    assert _tags(lexed) == ['b', '/b']
+    assert _texts(lexed, TEXT) == ['x']
+
+
+def test_division_is_not_read_as_a_regex_literal():
+    # As a regex, '/ 2 + `<p>a</' would swallow the backtick
+    src = 'const half = total / 2 + `<p>a</p>`;\nconst ratio = (a) / (b) / 2;\n'
+    lexed = lex(src)
+
+    assert _tags(lexed) == ['p', '/p']
+    assert _texts(lexed, TEXT) == ['a']
+
+
+def test_interpolations_inside_attributes_and_tags():
+    src = ('render(d) { return `<div class="card ${d.on ? \'on\' : \'off\'}" '
+           'data-n=${d.a > d.b ? 1 : 2}>${d.items.map(i => `<i>${i}</i>`).join(\'\')}</div>`; }')
+    lexed = lex(src)
+
+    assert _tags(lexed) == ['div', 'i', '/i', '/div']
+    div = lexed.tags[0]
+    assert src[div.start:div.end].endswith('? 1 : 2}>')
+    assert [span.context for span in lexed.interpolations()] == [ATTR, TAG, TEXT, TEXT]
+    assert _texts(lexed, ATTR) == ['card ']
+    # The nested literal is its own literal, one level deeper
+    inner = lexed.tags[1]
+    assert inner.literal != div.literal
+    assert [span.depth for span in lexed.spans if span.kind == INTERP] == [1, 1, 1, 2]
+
+
+def test_style_and_script_contents_end_at_their_close_tag():
+    src = ('`<style>.a > b { color: red; } /* <div> */</STYLE>'
+           '<p>x</p>'
+           '<script>if (a < b) { s = "<div>"; }</script ><hr>`')
+    lexed = lex(src)
+
+    assert _tags(lexed) == ['style', '/style', 'p', '/p', 'script', '/script', 'hr']
+    assert _texts(lexed, CSS) == ['.a > b { color: red; } /* <div> */']
+    assert _texts(lexed, SCRIPT) == ['if (a < b) { s = "<div>"; }']
+    assert [e.name for e in lexed.elements] == ['style', 'p', 'script']
+
+
+def test_match_elements_tolerates_stray_and_unclosed_tags():
+    src = '`<div><span>a</b></span><p>b</div>` + `</div>`'
+    lexed = lex(src)
+
+    assert _tags(lexed) == ['div', 'span', '/b', '/span', 'p', '/div', '/div']
+    pairs = [(e.name, src[e.start:e.end]) for e in lexed.elements]
+    # </b> has no opener, <p> is closed by its parent, and the close tag in
+    # the second literal does not pair with the first one
+    assert pairs == [('div', '<div><span>a</b></span><p>b</div>'), ('span', '<span>a</b></span>')]
+
+
+def _reference_match(tags):
+    # The straightforward walk back through the stack, for comparison
+    elements = []
+    stacks = {}
+    for tag in tags:
+        if tag.name in VOID_ELEMENTS:
+            continue
+        stack = stacks.setdefault(tag.literal, [])
+        if not tag.closing:
+            stack.append(tag)
+            continue
+        for k in range(len(stack) - 1, -1, -1):
+            if stack[k].name == tag.name:
+                elements.append((stack[k].start, tag.start))
+                del stack[k:]
+                break
+    return sorted(elements)
+
+
+def test_match_elements_agrees_with_a_stack_walk():
+    rng = random.Random(5)
+    for _ in range(200):
+        tags = []
+        for i in range(rng.randrange(40)):
+            tags.append(Tag(rng.choice('abcd'), i, i + 1, rng.random() < 0.45, rng.randrange(2)))
+        assert [(e.open.start, e.close.start) for e in match_elements(tags)] == _reference_match(tags)
+
+
+def test_stray_closers_against_a_deep_stack_are_linear():
+    n = 20000
+    tags = [Tag('div', i, i + 1, False, 0) for i in range(n)]
+    tags += [Tag('span', n + i, n + i + 1, True, 0) for i in range(n)]
+    tags.append(Tag('div', 2 * n, 2 * n + 1, True, 0))
+
+    start = time.perf_counter()
+    elements = match_elements(tags)
+
+    assert time.perf_counter() - start < 1.0
+    assert [(e.start, e.end) for e in elements] == [(n - 1, 2 * n + 1)]
@@ -0,0 +1,87 @@
+import shutil
+
+from packtools.engine import Haystack, Pass, _read_template, get_passes, icase, iter_templates, rewrite_file
+
+TEMPLATE = b'render(d) { return `<p style="FONT-SIZE: 9px">hi</p>`; }'
+
+# One template per kind of content the default passes look for, and one with none of it
+PACK = {
+    'kr-clidn-00.js': 'render(d) { return `<h1>${d.TITLE}</h1>`; }',
+    'kr-clidn-01.js': ('render(d) { return `<style>p { color: #94a3b8; font-size: 20px; }</style>'
+                       '<p>${d.TEXT}</p>`; }'),
+    'kr-clidn-02.js': ('render(d) { return `<div class="content">x</div>\n    <!-- Footer -->\n'
+                       '    <div style="margin-top: auto; opacity:0.5">y</div>\n</div>`; }'),
+    'kr-clidn-03.js': ('render(d) { return `<span style="opacity:.6">CYBER-CANVAS // v2</span>'
+                       '<p style="Font-Size: 12PX; color: rgb(136, 136, 136)">z</p>`; }'),
+    'other.js': 'render(d) { return `<p style="color:#888">${d.TEXT}</p>`; }',
+}
+
+
+def _calls(name, triggers):
+    calls = []
+
+    def func(doc):
+        calls.append(doc.path)
+        doc.text = doc.text.replace('hi', 'ho')
+        return 1
+
+    return Pass(name, func, triggers=triggers), calls
+
+
+def test_haystack_matches_bytes_and_text_alike():
+    for buffer in (TEMPLATE, TEMPLATE.decode()):
+        haystack = Haystack(buffer)
+        assert haystack.contains(b'<p style=')
+        assert not haystack.contains(b'font-size')
+        assert haystack.contains(icase(b'font-size'))
+        assert not haystack.contains(icase(b'margin-top'))
+
+
+def test_a_file_without_triggers_is_never_decoded(tmp_path):
+    path = tmp_path / 'kr-a.js'
+    path.write_bytes(TEMPLATE)
+    quiet, calls = _calls('quiet', (b'swipe-arrows', icase(b'margin-top')))
+
+    *_, raw, triggered = _read_template(str(path), [quiet], None, True)
+    assert raw is None and triggered == set()
+
+    result = rewrite_file(str(path), [quiet])
+    assert calls == [] and not result.changed and result.applied == []
+    assert path.read_bytes() == TEMPLATE
+
+
+def test_only_triggered_passes_run(tmp_path):
+    path = tmp_path / 'kr-a.js'
+    path.write_bytes(TEMPLATE)
+    loud, loud_calls = _calls('loud', (icase(b'font-size'),))
+    quiet, quiet_calls = _calls('quiet', (b'swipe-arrows',))
+    always, always_calls = _calls('always', None)
+
+    *_, raw, triggered = _read_template(str(path), [loud, quiet, always], None, True)
+    assert raw == TEMPLATE and triggered == {'loud', 'always'}
+    *_, triggered = _read_template(str(path), [loud, quiet, always], None, False)
+    assert triggered == {'loud', 'quiet', 'always'}
+
+    rewrite_file(str(path), [loud, quiet, always])
+    assert len(loud_calls) == 1 and quiet_calls == [] and len(always_calls) == 1
+    assert path.read_bytes() == TEMPLATE.replace(b'hi', b'ho')
+
+
+def test_prefilter_does_not_change_the_output(tmp_path):
+    filtered = tmp_path / 'filtered'
+    filtered.mkdir()
+    for filename, text in PACK.items():
+        (filtered / filename).write_text(text)
+    plain = tmp_path / 'plain'
+    shutil.copytree(filtered, plain)
+    passes = get_passes()
+
+    changed = 0
+    for path in iter_templates(str(filtered)):
+        changed += rewrite_file(path, passes, prefilter=True).changed
+    for path in iter_templates(str(plain)):
+        rewrite_file(path, passes, prefilter=False)
+
+    assert changed >= 3
+    for filename in PACK:
+        assert (filtered / filename).read_bytes() == (plain / filename).read_bytes(), filename
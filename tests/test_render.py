@@ -0,0 +1,98 @@
+import os
+
+from packtools import cli
+from packtools.engine import REPO_ROOT
+from packtools.render import CompiledTemplate, render_rows
+
+MODULE_CARD = os.path.join(REPO_ROOT, 'templates', 'instagram', 'modern-module-card', 'template.html')
+
+CARDS_ROW = {
+    'id': 'modulo-4',
+    'CATEGORIA': 'MÓDULO 4',
+    'TITULO': 'MANIPULA',
+    'SUBTITULO': 'CIÓN',
+    'CARDS': [
+        {'icono': 'lock', 'nombre': 'Cifrado', 'descripcion': 'AES & <RSA>'},
+        {'icono': 'wifi', 'nombre': 'Redes', 'descripcion': 'Sniffing'},
+        {'icono': 'bug_report', 'nombre': 'Exploits', 'descripcion': 'CVE del mes'},
+    ],
+}
+
+
+def test_cards_render_through_the_item_template():
+    template = CompiledTemplate.load(MODULE_CARD)
+    page, missing, unknown, errors = template.render(CARDS_ROW)
+
+    assert (missing, unknown, errors) == ([], ['id'], [])
+    assert page.count('class="command-card"') == 3
+    assert '<div class="command-name">Cifrado</div>' in page
+    assert '<i class="material-icons">bug_report</i>' in page
+    assert 'AES &amp; &lt;RSA&gt;' in page
+    assert "{'icono'" not in page and '{{' not in page
+
+
+def test_invalid_array_items_are_row_errors():
+    template = CompiledTemplate('<ul>{{CARDS}}</ul><h1>{{TITLE}}</h1>', {
+        'slots': {
+            'CARDS': {'type': 'array', 'itemTemplate': '<li>{{nombre}}</li>'},
+            'TITLE': {'type': 'text'},
+        },
+    })
+    rows = [
+        {'CARDS': [{'nombre': 'ok'}, 'plain string', {'otro': 1}], 'TITLE': 'x'},
+        {'CARDS': [], 'TITLE': {'nested': True}},
+    ]
+    first, second = render_rows(template, rows)
+
+    assert first.html == '<ul><li>ok</li><li></li></ul><h1>x</h1>'
+    assert first.errors == ['CARDS[1]: expected an object, got str', 'CARDS[2]: missing nombre']
+    assert not first.ok
+    assert second.html == '<ul></ul><h1></h1>'
+    assert second.errors == ['TITLE: expected text, got an object']
+
+
+def test_array_without_item_template_rejects_objects():
+    template = CompiledTemplate('{{CARDS}}', {'slots': {'CARDS': {'type': 'array'}}})
+    page, _, _, errors = template.render({'CARDS': ['<b>a</b>', {'nombre': 'N'}]})
+
+    assert page == '<b>a</b>'
+    assert errors == ['CARDS[1]: dict item, but the slot has no itemTemplate']
+
+
+def test_csv_extra_and_blank_cells(tmp_path, capsys):
+    template = tmp_path / 'post.html'
+    template.write_text('<h1>{{TITLE}}</h1><p>{{BODY}}</p>')
+    rows = tmp_path / 'rows.csv'
+    rows.write_text('id,TITLE,BODY\na,Hola,Mundo\nb,Hola,Mundo,sobra\nc,Solo\nd, ,x\n')
+
+    assert cli.main(['render', str(template), str(rows), '-o', str(tmp_path / 'out'), '--strict']) == 1
+
+    out = capsys.readouterr().out
+    assert 'Row 1' not in out
+    assert 'Row 2 (b): 1 cell(s) beyond the header' in out
+    assert 'Row 3 (c): missing BODY' in out
+    assert 'Row 4 (d): missing TITLE' in out
+    assert (tmp_path / 'out' / 'b.html').read_text() == '<h1>Hola</h1><p>Mundo</p>'
+
+
+def test_colliding_file_names_are_kept_apart(tmp_path):
+    template = CompiledTemplate('<p>{{TEXT}}</p>')
+    rows = [{'id': 'a/b', 'TEXT': '1'}, {'id': 'a_b', 'TEXT': '2'}, {'id': 'A_B', 'TEXT': '3'},
+            {'TEXT': '4'}, {'id': '00003', 'TEXT': '5'}]
+    out_dir = tmp_path / 'out'
+    results = list(render_rows(template, rows, out_dir=str(out_dir), jobs=2, batch_size=2))
+
+    assert [r.name for r in results] == ['a_b', 'a_b-00001', 'A_B-00002', '00003', '00003-00004']
+    assert results[0].ok and results[3].ok
+    assert results[1].errors == ['file name a_b.html is already used by row 1; written as a_b-00001.html']
+    assert results[4].errors == ['file name 00003.html is already used by row 4; written as 00003-00004.html']
+    assert sorted(p.read_text() for p in out_dir.iterdir()) == [f'<p>{n}</p>' for n in '12345']
+
+
+def test_unknown_item_fields_are_reported():
+    template = CompiledTemplate('{{CARDS}}', {'slots': {'CARDS': {'type': 'array', 'itemTemplate': '{{nombre}}'}}})
+    page, missing, unknown, errors = template.render({'CARDS': [{'nombre': 'a', 'icon': 'x'}], 'EXTRA': 1})
+
+    assert page == 'a'
+    assert (missing, errors) == ([], [])
+    assert unknown == ['EXTRA', 'CARDS[0].icon']
@@ -0,0 +1,87 @@
+import itertools
+import os
+import time
+
+import pytest
+
+from packtools import cli
+from packtools.engine import PASSES, Pass, get_passes, iter_templates, run_packs
+from packtools.snapshots import ObjectStore, SnapshotStore
+from packtools.synth import generate_pack
+from packtools.watch import Watcher
+
+
+def _contents(pack_dir):
+    contents = {}
+    for path in iter_templates(pack_dir):
+        with open(path, 'rb') as f:
+            contents[path] = f.read()
+    return contents
+
+
+@pytest.fixture
+def pack(tmp_path):
+    pack_dir = str(tmp_path / 'pack')
+    generate_pack(pack_dir, 10, seed=2)
+    return pack_dir
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    root = str(tmp_path / 'snapshots')
+    # cmd_rewrite builds its own SnapshotStore()
+    monkeypatch.setattr(ObjectStore.__init__, '__defaults__', (root,))
+    return SnapshotStore(root)
+
+
+def test_rewrite_that_fails_midway_can_be_rolled_back(pack, store, monkeypatch):
+    original = _contents(pack)
+
+    def explode(doc):
+        if doc.filename == 'kr-clidn-05.js':
+            raise ValueError('pass bug')
+        return 0
+
+    monkeypatch.setitem(PASSES, 'explode', Pass('explode', explode, default=False))
+    with pytest.raises(ValueError, match='pass bug'):
+        cli.main(['rewrite', pack, '--passes', 'whitewash,fix_min_fonts,explode', '--no-cache'])
+
+    run = store.runs()[-1]
+    assert run['complete'] and len(run['files']) == 5
+    assert _contents(pack) != original
+    store.rollback(run['id'])
+    assert _contents(pack) == original
+
+
+def test_killed_run_is_read_from_its_journal(pack, store):
+    original = _contents(pack)
+    store.begin(command='rewrite', passes=['whitewash'])
+    # Three files written, then the process "dies": finish never runs
+    results = run_packs([pack], get_passes(['whitewash', 'fix_min_fonts']), use_cache=False, store=store)
+    written = [result for result in itertools.islice(results, 3) if result.written]
+    assert len(written) == 3
+
+    reopened = SnapshotStore(store.root)
+    run = reopened.runs()[-1]
+    assert run['complete'] is False and len(run['files']) == 3
+    reopened.rollback('last')
+    assert _contents(pack) == original
+
+
+def test_watch_batches_are_recorded(pack, store):
+    path = next(iter_templates(pack))
+    with open(path, 'rb') as f:
+        saved = f.read()
+
+    watcher = Watcher([pack], get_passes(), poll=True, store=store)
+    try:
+        events = watcher.process({path: time.monotonic()})
+    finally:
+        watcher.close()
+    assert events[0].result.written and watcher.runs == 1
+
+    run = store.runs()[-1]
+    assert run['command'] == 'watch' and list(run['files']) == [os.path.abspath(path)]
+    store.rollback(run['id'])
+    with open(path, 'rb') as f:
+        assert f.read() == saved
@@ -0,0 +1,95 @@
+import copy
+import json
+import os
+import time
+
+import pytest
+
+from packtools.engine import get_passes, iter_templates, run_packs
+from packtools.state import STATE_FILENAME, PackState
+
+
+TEMPLATE = ("window.KR_TEMPLATES['{name}'] = {{ render(d) {{ return `<!DOCTYPE html>\n<html><head><style>"
+            "h1 {{ color: #94a3b8; font-size: 20px; }} p {{ color: #00d9ff; font-size: 36px; }}</style></head>"
+            "<body><h1>${{d.TITLE}}</h1><p>{i}</p></body></html>`; }} }};\n")
+
+
+@pytest.fixture
+def pack(tmp_path):
+    pack_dir = tmp_path / 'pack'
+    pack_dir.mkdir()
+    for i in range(6):
+        name = f'kr-clidn-{i:02d}'
+        (pack_dir / f'{name}.js').write_text(TEMPLATE.format(name=name, i=i))
+    return str(pack_dir)
+
+
+def _run(pack, passes=None, **kwargs):
+    return {os.path.basename(r.path): r for r in run_packs([pack], passes or get_passes(), **kwargs)}
+
+
+def _bump_mtime(path):
+    later = time.time() + 5
+    os.utime(path, (later, later))
+
+
+def test_second_run_skips_everything(pack):
+    first = _run(pack)
+    assert any(r.changed for r in first.values())
+    assert os.path.isfile(os.path.join(pack, STATE_FILENAME))
+
+    second = _run(pack)
+    assert all(r.skipped and not r.changed for r in second.values())
+
+
+def test_edited_template_is_rewritten_again(pack):
+    _run(pack)
+    path = next(iter_templates(pack))
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write('\n// <span style="color:#888">x</span>\n')
+
+    results = _run(pack)
+
+    edited = results.pop(os.path.basename(path))
+    assert not edited.skipped and edited.changed
+    assert all(r.skipped for r in results.values())
+
+
+def test_same_bytes_with_a_new_mtime_are_skipped_by_hash(pack):
+    _run(pack)
+    path = next(iter_templates(pack))
+    _bump_mtime(path)
+
+    result = _run(pack)[os.path.basename(path)]
+
+    # Not fresh by stat, so it was hashed in the worker and found unchanged
+    assert result.skipped and result.sha256 is not None and not result.changed
+    assert _run(pack)[os.path.basename(path)].sha256 is None
+
+
+def test_changed_pass_options_invalidate(pack):
+    _run(pack)
+    passes = [copy.copy(p) for p in get_passes()]
+    fix = next(p for p in passes if p.name == 'fix_min_fonts')
+    fix.options = dict(fix.options, min_size=40)
+
+    results = _run(pack, passes)
+
+    assert not any(r.skipped for r in results.values())
+    assert any(r.changed for r in results.values())
+    assert all(r.skipped for r in _run(pack, passes).values())
+
+
+def test_subset_of_recorded_passes_stays_fresh(pack):
+    _run(pack)
+    assert all(r.skipped for r in _run(pack, get_passes(['whitewash'])).values())
+
+
+def test_dry_run_and_unreadable_state(pack):
+    _run(pack, dry_run=True)
+    assert not os.path.exists(os.path.join(pack, STATE_FILENAME))
+
+    with open(os.path.join(pack, STATE_FILENAME), 'w') as f:
+        json.dump({'version': 0, 'files': {'kr-x.js': {}}}, f)
+    assert PackState.load(pack).files == {}
+    assert not any(r.skipped for r in _run(pack).values())
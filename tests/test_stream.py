@@ -0,0 +1,41 @@
+import hashlib
+
+from packtools.engine import Pass, _StreamReplace, rewrite_stream
+
+OLD = b'#00ff41'
+NEW = b'var(--accent)'
+DATA = b'a{color:#00ff41}b{border:1px solid #00ff41}#00ff4#00ff41'
+
+
+def _feed(stage, data, cuts):
+    out = []
+    pos = 0
+    for cut in cuts:
+        out.append(stage.feed(data[pos:cut]))
+        pos = cut
+    out.append(stage.feed(data[pos:]))
+    out.append(stage.feed(b'', final=True))
+    return b''.join(out)
+
+
+def test_literal_straddling_a_chunk_boundary_is_replaced_once():
+    expected = DATA.replace(OLD, NEW)
+    first = DATA.index(OLD)
+    for cut in range(first, first + len(OLD) + 1):
+        stage = _StreamReplace(OLD, NEW)
+        assert _feed(stage, DATA, [cut]) == expected, cut
+        assert stage.matches == 3
+
+
+def test_tiny_chunks_match_a_whole_file_replace(tmp_path):
+    path = tmp_path / 'kr-a.js'
+    path.write_bytes(DATA * 3)
+    accent = Pass('accent', lambda doc: doc.replace(OLD.decode(), NEW.decode()), stream=[(OLD, NEW)])
+
+    result = rewrite_stream(str(path), [accent], chunk_size=3)
+
+    expected = (DATA * 3).replace(OLD, NEW)
+    assert path.read_bytes() == expected
+    assert result.applied == [('accent', 9)]
+    assert result.sha256 == hashlib.sha256(expected).hexdigest()
+    assert result.new_size == len(expected)
@@ -0,0 +1,79 @@
+from packtools.engine import Pass
+from packtools.state import PackState, sha256_bytes
+from packtools.watch import PollingSource, Watcher
+
+BEFORE = 'render(d) { return `<p style="color:#00ff41">${d.TITLE}</p>`; }'
+AFTER = BEFORE.replace('#00ff41', 'var(--accent)')
+
+
+def _accent(calls):
+    def func(doc):
+        calls.append(doc.filename)
+        return doc.replace('#00ff41', 'var(--accent)')
+
+    return Pass('accent', func, triggers=(b'#00ff41',))
+
+
+def _watcher(tmp_path, calls):
+    pack = tmp_path / 'pack'
+    pack.mkdir()
+    path = pack / 'kr-a.js'
+    path.write_text(BEFORE)
+    watcher = Watcher([str(pack)], [_accent(calls)], poll=True)
+    return watcher, str(path)
+
+
+def test_our_own_write_is_dropped_before_any_pass_runs(tmp_path):
+    calls = []
+    watcher, path = _watcher(tmp_path, calls)
+    assert isinstance(watcher.source, PollingSource)
+
+    events = watcher.process({path: 0.0})
+    assert [event.result.written for event in events] == [True]
+    assert watcher.written == {path: sha256_bytes(AFTER.encode())}
+    assert calls == ['kr-a.js']
+
+    # The rewrite shows up as a save of its own
+    assert watcher.process({path: 0.0}) == []
+    assert watcher.ignored == 1
+    assert calls == ['kr-a.js']
+    watcher.close()
+
+
+def test_a_real_save_after_our_write_is_processed(tmp_path):
+    calls = []
+    watcher, path = _watcher(tmp_path, calls)
+    watcher.process({path: 0.0})
+
+    with open(path, 'w') as f:
+        f.write(BEFORE.replace('${d.TITLE}', '${d.TEXT}'))
+    events = watcher.process({path: 0.0})
+
+    assert [event.result.written for event in events] == [True]
+    assert watcher.ignored == 0
+    assert len(calls) == 2
+    with open(path) as f:
+        assert f.read() == AFTER.replace('${d.TITLE}', '${d.TEXT}')
+
+    # A save that needs nothing is recorded, not written, and not remembered as ours
+    with open(path, 'w') as f:
+        f.write(AFTER)
+    events = watcher.process({path: 0.0})
+    assert [(event.result.changed, event.result.written) for event in events] == [(False, False)]
+    assert path not in watcher.written
+    watcher.close()
+
+
+def test_processed_files_are_recorded_in_the_pack_state(tmp_path):
+    calls = []
+    watcher, path = _watcher(tmp_path, calls)
+    passes = watcher.passes
+    watcher.process({path: 0.0, str(tmp_path / 'pack' / 'gone.js'): 0.0, str(tmp_path / 'other.js'): 0.0})
+    watcher.close()
+
+    state = PackState.load(str(tmp_path / 'pack'))
+    assert state.known_hash(path, passes) == sha256_bytes(AFTER.encode())
+    # A fresh watcher skips the file from the state alone
+    events = Watcher([str(tmp_path / 'pack')], passes, poll=True).process({path: 0.0})
+    assert [event.result.skipped for event in events] == [True]
+    assert calls == ['kr-a.js']